@@ -0,0 +1,44 @@
+import io
+import time
+import random
+import argparse
+from contextlib import redirect_stdout
+from fake_geocoder import FakeGeocodingClient
+from rate_limiter import TokenBucket
+from process_locations import geocode_coordinates
+
+# Benchmark the geocoding engine against a local fake client (no network, no API key).
+# Usage: python benchmark_geocoding.py --rows 500 --latency 0.05 --qps 50 --workers 1 4 8 16
+
+def random_coords(n, seed=42):
+    rnd = random.Random(seed)
+    # Rough bounding box of Belém
+    return [(rnd.uniform(-1.48, -1.35), rnd.uniform(-48.50, -48.42)) for _ in range(n)]
+
+def run(coords, workers, qps, latency):
+    client = FakeGeocodingClient(latency=latency)
+    start = time.perf_counter()
+    with redirect_stdout(io.StringIO()):
+        results = geocode_coordinates(client, coords, cache=None, workers=workers, limiter=TokenBucket(qps))
+    return results, time.perf_counter() - start
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark process_locations.geocode_coordinates with a fake client.")
+    parser.add_argument('--rows', type=int, default=500)
+    parser.add_argument('--latency', type=float, default=0.05, help="simulated API latency in seconds")
+    parser.add_argument('--qps', type=float, default=50)
+    parser.add_argument('--workers', type=int, nargs='+', default=[1, 4, 8, 16])
+    args = parser.parse_args()
+
+    coords = random_coords(args.rows)
+    baseline = None
+    print(f"{args.rows} rows, latency={args.latency}s, qps={args.qps}")
+    for workers in args.workers:
+        results, elapsed = run(coords, workers, args.qps, args.latency)
+        if baseline is None:
+            baseline = results
+        ordered = "ok" if results == baseline else "MISMATCH"
+        print(f"workers={workers:>3}  {elapsed:7.2f}s  {len(coords) / elapsed:8.1f} rows/s  order={ordered}")
+
+if __name__ == '__main__':
+    main()
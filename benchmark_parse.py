@@ -0,0 +1,78 @@
+import os
+import time
+import random
+import argparse
+import pandas as pd
+from fake_geocoder import build_result
+from parse_addresses import parse_address, parse_address_column, PARSED_COL_NAMES
+
+# Compare parse_address (row-wise apply) with parse_address_column (vectorized)
+# on synthetic Google-style addresses, and check that both give the same output.
+# Usage: python benchmark_parse.py --rows 100000
+
+REAL_FILE = 'output_enderecos_tratado.xlsx'
+
+# Less common shapes seen in Google results and in the pipeline placeholders
+ODD_ADDRESSES = [
+    "Ananindeua - PA, Brazil",
+    "Belém - State of Pará, Brazil",
+    "Rodovia Mário Covas, 208, Ananindeua - PA, 67000-000, Brasil",
+    "Shopping - Castanheira, Belém - PA, 66645-000",
+    "Psg. Dois, Outeiro - PA",
+    "AV: Tucano QUADRA: 43 N: - Icoaraci",
+    "Mosqueiro",
+    "R. Sem Nome - Marco, Belém - PA, 66093 020, Brazil",
+    "No address found",
+    "No results",
+    "Error: OVER_QUERY_LIMIT",
+    "Mock Address (No API Key)",
+    "Invalid Coordinates",
+    "Empty/Zero Coordinates",
+    "",
+    None,
+]
+
+def synthetic_addresses(n, seed=7):
+    rnd = random.Random(seed)
+    out = []
+    for _ in range(n):
+        if rnd.random() < 0.1:
+            out.append(rnd.choice(ODD_ADDRESSES))
+        else:
+            result = build_result(rnd.uniform(-1.48, -1.35), rnd.uniform(-48.50, -48.42), seed)
+            out.append(result['formatted_address'])
+    return pd.Series(out, dtype=object)
+
+def normalized(df):
+    # Compare values only: None/NaN and str/object dtypes are equivalent in the Excel output
+    return df.astype(object).where(df.notna(), None)
+
+def compare(label, addresses):
+    start = time.perf_counter()
+    rowwise = addresses.apply(parse_address)
+    rowwise.columns = PARSED_COL_NAMES
+    t_rowwise = time.perf_counter() - start
+
+    start = time.perf_counter()
+    vectorized = parse_address_column(addresses)
+    t_vectorized = time.perf_counter() - start
+
+    same = normalized(rowwise).equals(normalized(vectorized))
+    print(f"{label:<12} {len(addresses):>8} rows  apply: {t_rowwise:7.2f}s  vectorized: {t_vectorized:7.2f}s  "
+          f"speedup: {t_rowwise / t_vectorized:5.1f}x  identical: {same}")
+    return same
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark the vectorized address parser.")
+    parser.add_argument('--rows', type=int, default=100000)
+    args = parser.parse_args()
+
+    ok = True
+    if os.path.exists(REAL_FILE):
+        ok &= compare("dataset", pd.read_excel(REAL_FILE)['Endereço_Google'])
+    ok &= compare("synthetic", synthetic_addresses(args.rows))
+    if not ok:
+        raise SystemExit("Vectorized parser output differs from parse_address.")
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,132 @@
+import io
+import os
+import sys
+import json
+import time
+import shutil
+import resource
+import argparse
+import platform
+import tempfile
+import subprocess
+from contextlib import redirect_stdout
+
+# Benchmark the three pipeline stages (process_data, parse_addresses.main,
+# generate_html, plus the map data) on synthetic KoBo exports of growing size.
+# Every stage runs in its own subprocess, in a scratch directory, so its peak
+# RSS is measured alone. Geocoding uses the fake client (no network, no quota).
+# Results are written as JSON to compare versions.
+# Usage: python benchmark_pipeline.py --rows 1000 10000 100000 1000000 --latency 0 --error-rate 0.01
+
+REPO_DIR = os.path.dirname(os.path.abspath(__file__))
+RESULTS_FILE = 'benchmark_results.json'
+STAGES = ['geocode', 'parse', 'site', 'map']
+
+def peak_rss_mb():
+    # ru_maxrss is in KiB on Linux and in bytes on macOS
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return peak / (1024 * 1024) if sys.platform == 'darwin' else peak / 1024
+
+def run_stage(stage, latency, error_rate, workers, excel):
+    """
+    Run one stage in the current directory (called in the child process).
+    """
+    import process_locations
+    from fake_geocoder import FakeGeocodingClient
+
+    start = time.perf_counter()
+    with redirect_stdout(io.StringIO()):
+        if stage == 'geocode':
+            process_locations.API_KEY = 'benchmark'
+            process_locations.create_client = lambda: FakeGeocodingClient(latency=latency, error_rate=error_rate)
+            process_locations.process_data(workers=workers, qps=1e9)
+        elif stage == 'parse':
+            import parse_addresses
+            parse_addresses.main(export_excel=excel)
+        elif stage == 'site':
+            import generate_site
+            generate_site.generate_html()
+        elif stage == 'map':
+            import generate_site
+            generate_site.generate_map_data()
+    return {"wall_s": round(time.perf_counter() - start, 3), "peak_rss_mb": round(peak_rss_mb(), 1)}
+
+def git_revision():
+    try:
+        return subprocess.run(['git', 'rev-parse', '--short', 'HEAD'], cwd=REPO_DIR,
+                              capture_output=True, text=True, check=True).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+def benchmark_size(rows, args):
+    """
+    Generate an export of `rows` submissions and time every stage on it.
+    """
+    from synthetic_kobo import generate_kobo_csv
+    from process_locations import INPUT_CSV
+    from generate_site import MARKDOWN_FILE
+
+    workdir = tempfile.mkdtemp(prefix=f'acai_bench_{rows}_', dir=args.workdir)
+    start = time.perf_counter()
+    generate_kobo_csv(os.path.join(workdir, INPUT_CSV), rows, seed=args.seed)
+    print(f"{rows:>9} rows: synthetic export generated in {time.perf_counter() - start:.1f}s")
+    shutil.copy(os.path.join(REPO_DIR, MARKDOWN_FILE), workdir)
+
+    env = dict(os.environ, PYTHONPATH=REPO_DIR + os.pathsep + os.environ.get('PYTHONPATH', ''))
+    results = []
+    for stage in args.stages:
+        cmd = [sys.executable, os.path.abspath(__file__), '--run-stage', stage,
+               '--latency', str(args.latency), '--error-rate', str(args.error_rate),
+               '--workers', str(args.workers)] + (['--excel'] if args.excel else [])
+        proc = subprocess.run(cmd, cwd=workdir, env=env, capture_output=True, text=True)
+        if proc.returncode != 0:
+            print(f"Error: stage {stage} failed at {rows} rows:\n{proc.stderr[-2000:]}")
+            break
+        measured = json.loads(proc.stdout.strip().splitlines()[-1])
+        measured.update(stage=stage, rows=rows, rows_per_s=round(rows / measured['wall_s'], 1) if measured['wall_s'] else None)
+        results.append(measured)
+        print(f"{rows:>9} rows: {stage:<8} {measured['wall_s']:9.2f}s  {measured['rows_per_s'] or 0:12.1f} rows/s  "
+              f"peak RSS {measured['peak_rss_mb']:8.1f} MB")
+
+    if not args.keep:
+        shutil.rmtree(workdir, ignore_errors=True)
+    return results
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark the pipeline stages on synthetic KoBo exports.")
+    parser.add_argument('--rows', type=int, nargs='+', default=[1000, 10000])
+    parser.add_argument('--stages', nargs='+', choices=STAGES, default=STAGES)
+    parser.add_argument('--latency', type=float, default=0.0, help="simulated reverse_geocode latency in seconds")
+    parser.add_argument('--error-rate', type=float, default=0.0, help="share of fake API calls that fail")
+    parser.add_argument('--workers', type=int, default=8)
+    parser.add_argument('--seed', type=int, default=0)
+    parser.add_argument('--excel', action='store_true', help="include the .xlsx export in the parse stage")
+    parser.add_argument('--workdir', default=None, help="where scratch directories are created (default: system temp)")
+    parser.add_argument('--keep', action='store_true', help="keep the scratch directories")
+    parser.add_argument('--output', default=RESULTS_FILE)
+    parser.add_argument('--run-stage', choices=STAGES, help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.run_stage:
+        # Child process: run a single stage and report on the last stdout line
+        print(json.dumps(run_stage(args.run_stage, args.latency, args.error_rate, args.workers, args.excel)))
+        return
+
+    report = {
+        "revision": git_revision(),
+        "timestamp": time.strftime('%Y-%m-%dT%H:%M:%S%z'),
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "config": {"latency": args.latency, "error_rate": args.error_rate, "workers": args.workers,
+                   "seed": args.seed, "excel": args.excel},
+        "results": [],
+    }
+    for rows in args.rows:
+        report["results"].extend(benchmark_size(rows, args))
+
+    with open(args.output, 'w', encoding='utf-8') as f:
+        json.dump(report, f, indent=2)
+    print(f"Saved {args.output}.")
+
+if __name__ == '__main__':
+    main()
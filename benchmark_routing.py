@@ -0,0 +1,52 @@
+import time
+import argparse
+import numpy as np
+from routing import plan_routes, STOPS_PER_ROUTE, DENSE_LIMIT
+
+# Time the route planner on synthetic points shaped like the survey (dense
+# clusters around markets and ports plus scattered points), and report how
+# much 2-opt/or-opt and the moves between routes shorten the sweep routes.
+# Usage: python benchmark_routing.py --points 500 2000 5000
+
+def synthetic_points(n, seed=3):
+    rng = np.random.default_rng(seed)
+    centres = rng.uniform([-1.48, -48.50], [-1.36, -48.42], size=(12, 2))
+    clustered = int(n * 0.7)
+    which = rng.integers(0, len(centres), clustered)
+    pts = centres[which] + rng.normal(0, 0.004, size=(clustered, 2))
+    scattered = rng.uniform([-1.48, -48.50], [-1.36, -48.42], size=(n - clustered, 2))
+    pts = np.vstack([pts, scattered])
+    return pts[:, 0], pts[:, 1]
+
+def run(n, capacity):
+    lats, lngs = synthetic_points(n)
+
+    start = time.perf_counter()
+    base = plan_routes(lats, lngs, capacity=capacity, improve=False)
+    t_base = time.perf_counter() - start
+
+    start = time.perf_counter()
+    routes = plan_routes(lats, lngs, capacity=capacity)
+    t_full = time.perf_counter() - start
+
+    visited = np.sort(np.concatenate([stops for stops, _ in routes]))
+    assert np.array_equal(visited, np.arange(n)), "every point must be visited exactly once"
+    assert max(len(stops) for stops, _ in routes) <= capacity
+
+    km_base = sum(d for _, d in base) / 1000
+    km_full = sum(d for _, d in routes) / 1000
+    matrix = "dense" if n + 1 <= DENSE_LIMIT else "k-nearest"
+    print(f"{n:>7} points ({matrix:>9})  routes: {len(routes):4d}  "
+          f"construction: {t_base:6.2f}s {km_base:8.1f} km  "
+          f"improved: {t_full:6.2f}s {km_full:8.1f} km  ({(1 - km_full / km_base) * 100:4.1f}% shorter)")
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark the inspection route planner.")
+    parser.add_argument('--points', type=int, nargs='+', default=[500, 2000, 5000])
+    parser.add_argument('--stops', type=int, default=STOPS_PER_ROUTE)
+    args = parser.parse_args()
+    for n in args.points:
+        run(n, args.stops)
+
+if __name__ == '__main__':
+    main()
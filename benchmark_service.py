@@ -0,0 +1,96 @@
+import json
+import time
+import random
+import asyncio
+import argparse
+from fake_geocoder import FakeGeocodingClient
+from geocode_cache import GeocodeCache
+from rate_limiter import TokenBucket
+from geocode_service import GeocodeService, start_server
+
+# End-to-end check of geocode_service.py against the local stub geocoder:
+# many concurrent clients ask for a small set of popular points and addresses
+# over HTTP, and the number of stub API calls is compared with the number of
+# requests. With coalescing (and the cache) the API is called about once per
+# distinct lookup, however many clients there are.
+# Usage: python benchmark_service.py --clients 200 --requests 20 --distinct 50 --latency 0.05
+
+async def http_request(host, port, method, path, payload=None):
+    reader, writer = await asyncio.open_connection(host, port)
+    body = json.dumps(payload).encode('utf-8') if payload is not None else b''
+    writer.write(f"{method} {path} HTTP/1.1\r\nHost: {host}\r\nConnection: close\r\n"
+                 f"Content-Type: application/json\r\nContent-Length: {len(body)}\r\n\r\n".encode('latin-1') + body)
+    await writer.drain()
+    status_line = await reader.readline()
+    headers = {}
+    while True:
+        line = await reader.readline()
+        if line in (b'\r\n', b'\n', b''):
+            break
+        name, _, value = line.decode('latin-1').partition(':')
+        headers[name.strip().lower()] = value.strip()
+    data = await reader.readexactly(int(headers.get('content-length', 0)))
+    writer.close()
+    return int(status_line.split()[1]), json.loads(data) if data else None
+
+def workload(distinct, seed):
+    rnd = random.Random(seed)
+    points = [(round(rnd.uniform(-1.48, -1.35), 6), round(rnd.uniform(-48.50, -48.42), 6)) for _ in range(distinct)]
+    addresses = [f"Tv. Mauriti, {rnd.randint(1, 3000)}, Belém - PA" for _ in range(distinct)]
+    return points, addresses
+
+async def run(args):
+    client = FakeGeocodingClient(latency=args.latency)
+    cache = GeocodeCache(':memory:') if args.cache else None
+    service = GeocodeService(client, cache, TokenBucket(args.qps), workers=args.workers)
+    server = await start_server(service, '127.0.0.1', 0)
+    host, port = server.sockets[0].getsockname()[:2]
+    points, addresses = workload(args.distinct, args.seed)
+    rnd = random.Random(args.seed + 1)
+    latencies = []
+    statuses = {}
+
+    async def one_client():
+        for _ in range(args.requests):
+            kind = rnd.random()
+            if kind < 0.6:
+                lat, lng = rnd.choice(points)
+                path, method, payload = f"/reverse?lat={lat}&lng={lng}", 'GET', None
+            elif kind < 0.9:
+                path, method, payload = f"/forward?address={rnd.choice(addresses).replace(' ', '+')}", 'GET', None
+            else:
+                path, method, payload = '/bulk', 'POST', {"reverse": rnd.sample(points, 5),
+                                                          "forward": rnd.sample(addresses, 5)}
+            start = time.perf_counter()
+            status, _ = await http_request(host, port, method, path, payload)
+            latencies.append(time.perf_counter() - start)
+            statuses[status] = statuses.get(status, 0) + 1
+
+    start = time.perf_counter()
+    async with server:
+        await asyncio.gather(*[one_client() for _ in range(args.clients)])
+        _, health = await http_request(host, port, 'GET', '/health')
+    elapsed = time.perf_counter() - start
+    service.close()
+
+    latencies.sort()
+    requests = len(latencies)
+    print(f"{requests} HTTP requests from {args.clients} clients in {elapsed:.2f}s ({requests / elapsed:.0f} req/s), "
+          f"statuses {statuses}")
+    print(f"Latency p50 {latencies[requests // 2] * 1000:.1f} ms, p95 {latencies[int(requests * 0.95)] * 1000:.1f} ms")
+    print(f"Lookups started: {health['lookups']}, coalesced: {health['coalesced']}, "
+          f"cache hits: {health['cache_hits']}")
+    print(f"Stub API calls: {client.calls} for {2 * args.distinct} distinct lookups "
+          f"(cache {'on' if args.cache else 'off'}).")
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description="Load-test geocode_service.py against the stub geocoder.")
+    parser.add_argument('--clients', type=int, default=200)
+    parser.add_argument('--requests', type=int, default=20, help="requests per client")
+    parser.add_argument('--distinct', type=int, default=50, help="distinct points (and addresses) asked for")
+    parser.add_argument('--latency', type=float, default=0.05, help="stub API latency in seconds")
+    parser.add_argument('--workers', type=int, default=8)
+    parser.add_argument('--qps', type=float, default=1000.0)
+    parser.add_argument('--no-cache', dest='cache', action='store_false')
+    parser.add_argument('--seed', type=int, default=0)
+    asyncio.run(run(parser.parse_args()))
@@ -0,0 +1,97 @@
+import os
+import json
+import hashlib
+
+# Content-hash build cache for generate_site.py: every output records the hash
+# of its inputs (data files, generator code and options) and is rebuilt only
+# when that hash changes. File digests are memoised by size and mtime, so an
+# unchanged input is not read again on the next run.
+
+# Configuration
+CACHE_FILE = '.build_cache.json'
+BLOCK_SIZE = 1 << 20
+
+def file_digest(path):
+    """
+    SHA-256 of a file's content, or None if it does not exist.
+    """
+    if not os.path.exists(path):
+        return None
+    h = hashlib.sha256()
+    with open(path, 'rb') as f:
+        for block in iter(lambda: f.read(BLOCK_SIZE), b''):
+            h.update(block)
+    return h.hexdigest()
+
+class BuildCache:
+    """
+    Persistent {target: input hash} map. `force=True` reports every target as
+    stale, so everything is rebuilt (and the new hashes recorded).
+    """
+
+    def __init__(self, path=CACHE_FILE, force=False):
+        self.path = path
+        self.force = force
+        self.targets = {}
+        self.files = {}     # path -> [size, mtime_ns, digest]
+        self._load()
+
+    def _load(self):
+        try:
+            with open(self.path, 'r', encoding='utf-8') as f:
+                state = json.load(f)
+        except (OSError, ValueError):
+            return
+        self.targets.update(state.get('targets', {}))
+        self.files.update(state.get('files', {}))
+
+    def digest(self, path):
+        """
+        file_digest(), reusing the stored digest while size and mtime are unchanged.
+        """
+        try:
+            st = os.stat(path)
+        except OSError:
+            return None
+        known = self.files.get(path)
+        if known and known[0] == st.st_size and known[1] == st.st_mtime_ns:
+            return known[2]
+        digest = file_digest(path)
+        self.files[path] = [st.st_size, st.st_mtime_ns, digest]
+        return digest
+
+    def key(self, files=(), **params):
+        """
+        Hash of the content of `files` (missing files count too) and of the
+        JSON-serialisable `params`.
+        """
+        h = hashlib.sha256()
+        for path in files:
+            h.update(f"{path}\0{self.digest(path)}\n".encode('utf-8'))
+        h.update(json.dumps(params, sort_keys=True, default=str).encode('utf-8'))
+        return h.hexdigest()
+
+    def fresh(self, target, key, outputs=()):
+        """
+        True if `target` was last built from the same inputs and its outputs still exist.
+        """
+        if self.force or self.targets.get(target) != key:
+            return False
+        return all(os.path.exists(path) for path in outputs)
+
+    def record(self, target, key):
+        """
+        Store the input hash of a target that was just built. Other targets
+        recorded by another process since this one started are kept.
+        """
+        self.targets[target] = key
+        latest = BuildCache(self.path)
+        latest.targets[target] = key
+        latest.files.update(self.files)
+        latest.save()
+
+    def save(self):
+        tmp = self.path + '.tmp'
+        with open(tmp, 'w', encoding='utf-8') as f:
+            json.dump({"targets": self.targets, "files": self.files}, f, indent=1, sort_keys=True)
+        os.replace(tmp, self.path)
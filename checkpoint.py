@@ -0,0 +1,113 @@
+import os
+import json
+import time
+import threading
+import pandas as pd
+from retry import is_failed
+
+# Configuration
+JOURNAL_FILE = 'geocode_journal.jsonl'
+COORD_PRECISION = 6  # Coordinates are compared at this precision to detect moved points
+
+def is_final(addr):
+    """
+    Results that should not be retried on the next run, including permanent
+    errors (denied key, invalid request). Retryable errors (quota, timeouts),
+    circuit-breaker skips and a missing key are journaled but retried.
+    """
+    return isinstance(addr, str) and not is_failed(addr) and addr != "API_KEY_ERROR"
+
+class GeocodeJournal:
+    """
+    Append-only JSONL journal of geocoded submissions, keyed by KoBo _uuid (or _id).
+    Every result is flushed to disk as soon as it is known, so an interrupted
+    run can be resumed and a new export only pays for new or moved points.
+    """
+
+    def __init__(self, path=JOURNAL_FILE):
+        self.path = path
+        self.lock = threading.Lock()
+        self.entries = self._load()
+        self.file = open(path, 'a', encoding='utf-8')
+        if self.file.tell() > 0 and not self._ends_with_newline():
+            # Terminate a line left half-written by an interrupted run
+            self.file.write('\n')
+
+    def _load(self):
+        entries = {}
+        if not os.path.exists(self.path):
+            return entries
+        with open(self.path, 'r', encoding='utf-8') as f:
+            for line in f:
+                try:
+                    entry = json.loads(line)
+                except json.JSONDecodeError:
+                    # Truncated last line from an interrupted run
+                    continue
+                # Later lines override earlier ones
+                entries[entry['key']] = entry
+        return entries
+
+    def _ends_with_newline(self):
+        with open(self.path, 'rb') as f:
+            f.seek(-1, os.SEEK_END)
+            return f.read(1) == b'\n'
+
+    def lookup(self, key, lat, lng):
+        """
+        Address journaled for this submission, or None if it is new,
+        its coordinates changed, or the previous attempt failed.
+        """
+        entry = self.entries.get(key)
+        if entry is None or not is_final(entry['address']):
+            return None
+        if round(entry['lat'], COORD_PRECISION) != round(lat, COORD_PRECISION) or \
+           round(entry['lng'], COORD_PRECISION) != round(lng, COORD_PRECISION):
+            return None
+        return entry['address']
+
+    def record(self, key, lat, lng, address):
+        entry = {'key': key, 'lat': lat, 'lng': lng, 'address': address, 'ts': time.time()}
+        with self.lock:
+            self.file.write(json.dumps(entry, ensure_ascii=False) + '\n')
+            self.file.flush()
+            self.entries[key] = entry
+
+    def __len__(self):
+        return len(self.entries)
+
+    def close(self):
+        self.file.close()
+
+def submission_key(row, index):
+    """
+    Stable identifier of a KoBo submission: _uuid, then _id, then the row position.
+    """
+    for col in ('_uuid', '_id'):
+        value = row.get(col)
+        if value is None or pd.isna(value) or value == '':
+            continue
+        if isinstance(value, float) and value.is_integer():
+            value = int(value)
+        return str(value)
+    return f"row:{index}"
+
+def submission_keys(df):
+    """
+    submission_key for every row of a DataFrame, as a list in row order.
+    """
+    keys = pd.Series([f"row:{index}" for index in df.index], index=df.index, dtype=object)
+    # Lowest priority first, so _uuid overwrites _id where both are present
+    for col in ('_id', '_uuid'):
+        if col not in df.columns:
+            continue
+        values = df[col]
+        present = values.notna() & (values.astype(str) != '')
+        if pd.api.types.is_float_dtype(values):
+            integral = present & (values % 1 == 0)
+            text = values.astype(str)
+            text[integral] = values[integral].astype('int64').astype(str)
+        else:
+            text = values.astype(str)
+        keys[present] = text[present]
+    return keys.tolist()
@@ -0,0 +1 @@
+window.densityData = {"sizes":[250,500,1000,2000],"degPerMetre":[8.98311174991017e-06,8.98598917122132e-06],"districts":["DAENT","DAGUA","DASAC","DAICO","DABEL","DABEN","DAOUT","DAMOS","Outros"],"months":["2025-03","2025-04","2025-07","2025-08","2025-09","2025-10"],"layers":{"250":{"lat":[-1.2363,-1.22283,-1.2363,-1.25988,-1.22956,-1.26325,-1.25988,-1.25651,-1.24304,-1.26325,-1.25988,-1.25651,-1.25314,-1.27336,-1.26999,-1.26662,-1.26325,-1.16556,-1.15208,-1.14872,-1.14198,-1.16556,-1.16219,-1.15208,-1.14535,-1.13861,-1.15208,-1.14535,-1.13187,-1.1285,-1.13187,-1.12513,-1.13187,-1.12177,-1.13524,-1.12177,-1.10155,-1.09819,-1.09482,-1.08808,-1.10829,-1.09819,-1.0746,-1.10155,-1.09819,-1.10829,-1.27336,-1.26999,-1.30031,-1.28346,-1.27672,-1.27336,-1.26999,-1.25988,-1.25651,-1.08471,-1.30367,-1.29694,-1.29357,-1.28683,-1.27672,-1.26999,-1.25988,-1.25651,-1.25314,-1.24978,-1.31041,-1.30031,-1.29694,-1.29357,-1.28009,-1.25314,-1.24978,-1.24641,-1.31378,-1.31041,-1.30031,-1.29694,-1.28346,-1.25988,-1.25651,-1.31715,-1.30704,-1.30367,-1.30031,-1.29357,-1.26662,-1.26325,-1.25988,-1.25651,-1.25314,-1.0645,-1.32052,-1.31041,-1.30704,-1.30367,-1.29357,-1.2902,-1.26325,-1.25988,-1.0645,-1.31041,-1.30704,-1.30367,-1.33062,-1.31378,-1.31041,-1.30031,-1.07124,-1.33062,-1.30704,-1.30367,-1.30031,-1.31378,-1.31041,-1.30031,-1.26999,-1.3441,-1.26999,-1.3542,-1.34747,-1.33736,-1.27336,-1.3542,-1.35084,-1.34747,-1.33399,-1.37778,-1.37442,-1.35757,-1.35084,-1.34747,-1.33062,-1.32725,-1.31378,-1.38115,-1.37778,-1.37442,-1.36768,-1.36431,-1.36094,-1.35757,-1.35084,-1.33399,-1.33062,-1.32725,-1.32389,-1.31715,-1.29694,-1.40137,-1.37105,-1.36768,-1.36431,-1.36094,-1.35757,-1.33062,-1.32389,-1.32052,-1.40137,-1.398,-1.37105,-1.36431,-1.3542,-1.34073,-1.33399,-1.33062,-1.31715,-1.40473,-1.40137,-1.398,-1.37442,-1.37105,-1.36094,-1.35757,-1.3542,-1.34747,-1.3441,-1.34073,-1.33399,-1.33062,-1.32052,-1.42495,-1.42158,-1.41821,-1.41484,-1.41147,-1.4081,-1.40473,-1.40137,-1.398,-1.37778,-1.37442,-1.37105,-1.36768,-1.35757,-1.3542,-1.35084,-1.34747,-1.34073,-1.33062,-1.32725,-1.32389,-1.32052,-1.4519,-1.42831,-1.42495,-1.42158,-1.41821,-1.41484,-1.41147,-1.40473,-1.40137,-1.37778,-1.37442,-1.37105,-1.36768,-1.36094,-1.35757,-1.35084,-1.32052,-1.45863,-1.4519,-1.44853,-1.43842,-1.43505,-1.42831,-1.42495,-1.42158,-1.41821,-1.41484,-1.4081,-1.38115,-1.37778,-1.37442,-1.36094,-1.35757,-1.34747,-1.3441,-1.33399,-1.16893,-1.46874,-1.462,-1.45526,-1.4519,-1.44853,-1.44179,-1.43842,-1.43505,-1.43168,-1.42831,-1.42495,-1.42158,-1.41821,-1.41484,-1.41147,-1.40473,-1.38452,-1.38115,-1.37442,-1.36094,-1.35757,-1.3542,-1.35084,-1.47211,-1.46874,-1.46537,-1.462,-1.45863,-1.45526,-1.43842,-1.43505,-1.43168,-1.42831,-1.42495,-1.42158,-1.41821,-1.41484,-1.41147,-1.40473,-1.40137,-1.39463,-1.38452,-1.38115,-1.37778,-1.37105,-1.36768,-1.36094,-1.35757,-1.3542,-1.47211,-1.46874,-1.46537,-1.45863,-1.45526,-1.43505,-1.43168,-1.42831,-1.42495,-1.42158,-1.41821,-1.41147,-1.40473,-1.39463,-1.38452,-1.37778,-1.37442,-1.37105,-1.36768,-1.36431,-1.36094,-1.35757,-1.47548,-1.47211,-1.46874,-1.46537,-1.462,-1.45863,-1.43505,-1.43168,-1.42831,-1.42495,-1.42158,-1.40473,-1.40137,-1.398,-1.37105,-1.36768,-1.36431,-1.36094,-1.47548,-1.47211,-1.46874,-1.46537,-1.462,-1.45863,-1.43842,-1.43505,-1.43168,-1.42831,-1.42495,-1.42158,-1.4081,-1.40473,-1.40137,-1.398,-1.38115,-1.37778,-1.37442,-1.37105,-1.36768,-1.36431,-1.47548,-1.47211,-1.46874,-1.46537,-1.462,-1.45863,-1.45526,-1.44853,-1.44179,-1.43842,-1.40473,-1.40137,-1.398,-1.38452,-1.38115,-1.37778,-1.37442,-1.36768,-1.47548,-1.47211,-1.46874,-1.46537,-1.462,-1.45863,-1.44853,-1.44516,-1.43842,-1.43168,-1.4081,-1.40473,-1.398,-1.38115,-1.37442,-1.47884,-1.47548,-1.47211,-1.46874,-1.46537,-1.462,-1.45863,-1.45526,-1.4519,-1.44853,-1.42831,-1.40473,-1.40137,-1.47548,-1.47211,-1.46874,-1.46537,-1.462,-1.45863,-1.4519,-1.44853,-1.43505,-1.42831,-1.42495,-1.42158,-1.41484,-1.41147,-1.4081,-1.40473,-1.40137,-1.39463,-1.47211,-1.46874,-1.46537,-1.462,-1.45863,-1.45526,-1.4519,-1.44853,-1.43842,-1.43505,-1.43168,-1.42831,-1.41484,-1.47211,-1.46874,-1.46537,-1.462,-1.45863,-1.4519,-1.44853,-1.44516,-1.44179,-1.43168,-1.42831,-1.41147,-1.4081,-1.40473,-1.47548,-1.47211,-1.46874,-1.46537,-1.462,-1.45863,-1.45526,-1.4519,-1.44853,-1.44516,-1.41147,-1.4081,-1.47548,-1.47211,-1.46874,-1.46537,-1.462,-1.45863,-1.45526,-1.4519,-1.47548,-1.47211,-1.46874,-1.46537,-1.462,-1.45863,-1.45526,-1.4519,-1.47211,-1.46874,-1.46537,-1.462,-1.46874,-1.46537,-1.398,-1.39463,-1.39126,-1.398,-1.39463,-1.41147,-1.4081,-1.40473,-1.40137,-1.41821,-1.41484,-1.41147,-1.4081,-1.40473,-1.41821,-1.41484,-1.41147,-1.4081],"lng":[-48.55833,-48.55054,-48.55444,-48.56416,-48.54665,-48.56222,-48.56027,-48.55833,-48.55054,-48.55833,-48.55638,-48.55444,-48.55249,-48.56027,-48.55833,-48.55638,-48.55444,-48.47467,-48.46689,-48.46494,-48.46105,-48.47078,-48.46883,-48.463,-48.4591,-48.45521,-48.4591,-48.45521,-48.44743,-48.44549,-48.44354,-48.43965,-48.43965,-48.43381,-48.4377,-48.42992,-48.41436,-48.41241,-48.41047,-48.40658,-48.41436,-48.40463,-48.39101,-48.40268,-48.40074,-48.39879,-48.47856,-48.47661,-48.49023,-48.48051,-48.47661,-48.47467,-48.47272,-48.46689,-48.46494,-48.36572,-48.48829,-48.4844,-48.48245,-48.47856,-48.47272,-48.46883,-48.463,-48.46105,-48.4591,-48.45716,-48.48829,-48.48245,-48.48051,-48.47856,-48.47078,-48.45521,-48.45327,-48.45132,-48.48634,-48.4844,-48.47856,-48.47661,-48.46883,-48.45521,-48.45327,-48.4844,-48.47856,-48.47661,-48.47467,-48.47078,-48.45521,-48.45327,-48.45132,-48.44938,-48.44743,-48.33848,-48.48245,-48.47661,-48.47467,-48.47272,-48.46689,-48.46494,-48.44938,-48.44743,-48.33459,-48.47272,-48.47078,-48.46883,-48.48051,-48.47078,-48.46883,-48.463,-48.3307,-48.47661,-48.463,-48.46105,-48.4591,-48.463,-48.46105,-48.45521,-48.4377,-48.47661,-48.43381,-48.47856,-48.47467,-48.46883,-48.43187,-48.47467,-48.47272,-48.47078,-48.463,-48.4844,-48.48245,-48.47272,-48.46883,-48.46689,-48.45716,-48.45521,-48.44743,-48.48245,-48.48051,-48.47856,-48.47467,-48.47272,-48.47078,-48.46883,-48.46494,-48.45521,-48.45327,-48.45132,-48.44938,-48.44549,-48.43381,-48.49023,-48.47272,-48.47078,-48.46883,-48.46689,-48.46494,-48.44938,-48.44549,-48.44354,-48.48634,-48.4844,-48.46883,-48.46494,-48.4591,-48.45132,-48.44743,-48.44549,-48.4377,-48.4844,-48.48245,-48.48051,-48.46689,-48.46494,-48.4591,-48.45716,-48.45521,-48.45132,-48.44938,-48.44743,-48.44354,-48.4416,-48.43576,-48.49218,-48.49023,-48.48829,-48.48634,-48.4844,-48.48245,-48.48051,-48.47856,-48.47661,-48.46494,-48.463,-48.46105,-48.4591,-48.45327,-48.45132,-48.44938,-48.44743,-48.44354,-48.4377,-48.43576,-48.43381,-48.43187,-48.50385,-48.49023,-48.48829,-48.48634,-48.4844,-48.48245,-48.48051,-48.47661,-48.47467,-48.46105,-48.4591,-48.45716,-48.45521,-48.45132,-48.44938,-48.44549,-48.42798,-48.50385,-48.49996,-48.49802,-48.49218,-48.49023,-48.48634,-48.4844,-48.48245,-48.48051,-48.47856,-48.47467,-48.4591,-48.45716,-48.45521,-48.44743,-48.44549,-48.43965,-48.4377,-48.43187,-48.33654,-48.5058,-48.50191,-48.49802,-48.49607,-48.49412,-48.49023,-48.48829,-48.48634,-48.4844,-48.48245,-48.48051,-48.47856,-48.47661,-48.47467,-48.47272,-48.46883,-48.45716,-48.45521,-48.45132,-48.44354,-48.4416,-48.43965,-48.4377,-48.50385,-48.50191,-48.49996,-48.49802,-48.49607,-48.49412,-48.4844,-48.48245,-48.48051,-48.47856,-48.47661,-48.47467,-48.47272,-48.47078,-48.46883,-48.46494,-48.463,-48.4591,-48.45327,-48.45132,-48.44938,-48.44549,-48.44354,-48.43965,-48.4377,-48.43576,-48.49996,-48.49802,-48.49607,-48.49218,-48.49023,-48.47856,-48.47661,-48.47467,-48.47272,-48.47078,-48.46883,-48.46494,-48.46105,-48.45521,-48.44938,-48.44549,-48.44354,-48.4416,-48.43965,-48.4377,-48.43576,-48.43381,-48.49802,-48.49607,-48.49412,-48.49218,-48.49023,-48.48829,-48.47467,-48.47272,-48.47078,-48.46883,-48.46689,-48.45716,-48.45521,-48.45327,-48.4377,-48.43576,-48.43381,-48.43187,-48.49412,-48.49218,-48.49023,-48.48829,-48.48634,-48.4844,-48.47272,-48.47078,-48.46883,-48.46689,-48.46494,-48.463,-48.45521,-48.45327,-48.45132,-48.44938,-48.43965,-48.4377,-48.43576,-48.43381,-48.43187,-48.42992,-48.49023,-48.48829,-48.48634,-48.4844,-48.48245,-48.48051,-48.47856,-48.47467,-48.47078,-48.46883,-48.44938,-48.44743,-48.44549,-48.4377,-48.43576,-48.43381,-48.43187,-48.42798,-48.48634,-48.4844,-48.48245,-48.48051,-48.47856,-48.47661,-48.47078,-48.46883,-48.46494,-48.46105,-48.44743,-48.44549,-48.4416,-48.43187,-48.42798,-48.4844,-48.48245,-48.48051,-48.47856,-48.47661,-48.47467,-48.47272,-48.47078,-48.46883,-48.46689,-48.45521,-48.4416,-48.43965,-48.47856,-48.47661,-48.47467,-48.47272,-48.47078,-48.46883,-48.46494,-48.463,-48.45521,-48.45132,-48.44938,-48.44743,-48.44354,-48.4416,-48.43965,-48.4377,-48.43576,-48.43187,-48.47272,-48.47078,-48.46883,-48.46689,-48.46494,-48.463,-48.46105,-48.4591,-48.45327,-48.45132,-48.44938,-48.44743,-48.43965,-48.46883,-48.46689,-48.46494,-48.463,-48.46105,-48.45716,-48.45521,-48.45327,-48.45132,-48.44549,-48.44354,-48.43381,-48.43187,-48.42992,-48.46689,-48.46494,-48.463,-48.46105,-48.4591,-48.45716,-48.45521,-48.45327,-48.45132,-48.44938,-48.42992,-48.42798,-48.463,-48.46105,-48.4591,-48.45716,-48.45521,-48.45327,-48.45132,-48.44938,-48.4591,-48.45716,-48.45521,-48.45327,-48.45132,-48.44938,-48.44743,-48.44549,-48.45327,-48.45132,-48.44938,-48.44743,-48.44743,-48.44549,-48.39879,-48.39685,-48.3949,-48.3949,-48.39296,-48.39879,-48.39685,-48.3949,-48.39296,-48.39879,-48.39685,-48.3949,-48.39296,-48.39101,-48.3949,-48.39296,-48.39101,-48.38907],"count":[1,1,1,1,1,1,1,1,1,6,1,6,1,2,5,2,2,2,1,1,1,1,2,1,1,1,1,1,1,3,1,1,1,1,2,1,8,2,4,1,3,3,1,5,2,1,1,1,2,1,2,2,4,2,1,3,2,4,1,1,2,1,2,3,3,2,1,1,2,3,1,6,1,2,3,3,1,2,1,1,4,1,1,1,1,3,1,2,2,5,1,1,1,3,2,3,2,3,2,2,2,2,4,3,1,2,2,2,4,1,1,1,1,4,2,1,1,5,2,1,7,2,1,4,3,2,1,1,3,3,8,1,3,5,1,2,10,1,1,4,9,5,3,1,1,2,3,1,1,2,1,2,5,14,1,1,1,2,4,1,1,1,1,4,1,2,6,2,11,2,1,1,1,4,1,3,1,1,1,3,8,4,2,4,13,13,3,4,3,3,4,2,1,3,1,5,1,1,2,4,1,1,1,1,4,4,8,3,9,12,3,3,5,2,5,4,1,2,1,1,4,1,2,1,1,2,2,1,1,1,1,3,3,3,1,2,1,1,1,1,1,4,2,2,3,1,1,1,1,3,1,3,6,1,1,3,1,3,2,3,8,2,6,1,7,5,4,3,1,1,1,6,4,1,4,1,2,3,2,2,1,1,1,1,2,2,7,6,2,15,15,8,1,1,1,1,1,3,3,1,1,2,1,5,2,1,1,2,5,7,2,1,6,12,3,1,1,6,1,2,2,1,1,7,4,5,5,3,1,16,22,3,1,1,5,5,2,1,1,5,1,1,2,2,1,3,1,3,7,5,1,17,27,10,4,4,2,1,2,1,2,2,3,1,2,3,3,2,4,5,17,3,15,2,4,2,1,1,2,1,2,1,1,1,1,10,11,7,4,5,1,3,3,1,1,1,2,5,10,7,10,3,1,2,2,1,1,1,2,1,1,1,5,1,1,8,12,3,1,5,2,5,2,1,3,6,2,1,9,7,12,5,6,3,3,4,2,1,8,1,3,1,1,9,3,8,4,6,2,1,7,5,1,2,3,6,13,17,10,5,9,4,1,1,11,15,8,4,1,1,2,2,11,4,1,1,5,8,1,3,1,2,4,5,4,2,1,3,12,4,3,2,2,2],"district":[[0,0,0,0,0,0,1,0,0],[0,0,0,0,0,0,1,0,0],[0,0,0,0,0,0,1,0,0],[0,0,0,0,0,0,1,0,0],[0,0,0,0,0,0,1,0,0],[0,0,0,0,0,0,1,0,0],[0,0,0,0,0,0,1,0,0],[0,0,0,0,0,0,1,0,0],[0,0,0,0,0,0,1,0,0],[0,0,0,0,0,0,2,0,4],[0,0,0,0,0,0,1,0,0],[0,0,0,0,0,0,5,0,1],[0,0,0,0,0,0,1,0,0],[0,0,0,0,0,0,2,0,0],[0,0,0,0,0,0,5,0,0],[0,0,0,0,0,0,2,0,0],[0,0,0,0,0,0,2,0,0],[0,0,0,0,0,0,0,2,0],[0,0,0,0,0,0,0,1,0],[0,0,0,0,0,0,0,1,0],[0,0,0,0,0,0,0,1,0],[0,0,0,0,0,0,0,1,0],[0,0,0,0,0,0,0,2,0],[0,0,0,0,0,0,0,1,0],[0,0,0,0,0,0,0,1,0],[0,0,0,0,0,0,0,1,0],[0,0,0,0,0,0,0,1,0],[0,0,0,0,0,0,0,1,0],[0,0,0,0,0,0,0,1,0],[0,0,0,0,0,0,0,3,0],[0,0,0,0,0,0,0,1,0],[0,0,0,0,0,0,0,1,0],[0,0,0,0,0,0,0,1,0],[0,0,0,0,0,0,0,1,0],[0,0,0,0,0,0,0,2,0],[0,0,0,0,0,0,0,1,0],[0,0,0,0,0,0,0,7,1],[0,0,0,0,0,0,0,2,0],[0,0,0,0,0,0,0,4,0],[0,0,0,0,0,0,0,0,1],[0,0,0,0,0,0,0,3,0],[0,0,0,0,0,0,0,3,0],[0,0,0,0,0,0,0,1,0],[0,0,0,0,0,0,0,5,0],[0,0,0,0,0,0,0,2,0],[0,0,0,0,0,0,0,1,0],[0,0,0,0,0,0,1,0,0],[0,0,0,0,0,0,1,0,0],[0,0,0,2,0,0,0,0,0],[0,0,0,0,0,0,1,0,0],[0,0,0,0,0,0,2,0,0],[0,0,0,0,0,0,2,0,0],[0,0,0,0,0,0,4,0,0],[0,0,0,0,0,0,1,0,1],[0,0,0,0,0,0,0,0,1],[0,0,0,0,0,0,0,3,0],[0,0,0,2,0,0,0,0,0],[0,0,0,4,0,0,0,0,0],[0,0,0,1,0,0,0,0,0],[0,0,0,0,0,0,1,0,0],[0,0,0,0,0,0,2,0,0],[0,0,0,0,0,0,1,0,0],[0,0,0,0,0,0,2,0,0],[0,0,0,0,0,0,0,0,3],[0,0,0,0,0,0,2,0,1],[0,0,0,0,0,0,2,0,0],[0,0,0,1,0,0,0,0,0],[0,0,0,0,0,0,0,0,1],[0,0,0,2,0,0,0,0,0],[0,0,0,2,1,0,0,0,0],[0,0,0,0,0,0,1,0,0],[0,0,0,0,0,0,5,0,1],[0,0,0,0,0,0,1,0,0],[0,0,0,0,0,0,2,0,0],[0,0,0,3,0,0,0,0,0],[0,0,0,3,0,0,0,0,0],[0,0,0,0,0,0,0,0,1],[0,0,0,2,0,0,0,0,0],[0,0,0,0,0,0,1,0,0],[0,0,0,0,0,0,1,0,0],[0,0,0,0,0,0,0,0,4],[0,0,0,1,0,0,0,0,0],[0,0,0,1,0,0,0,0,0],[0,0,0,1,0,0,0,0,0],[0,0,0,1,0,0,0,0,0],[0,0,0,0,0,0,0,0,3],[0,0,0,0,0,0,1,0,0],[0,0,0,0,0,0,1,0,1],[0,0,0,0,0,0,2,0,0],[0,0,0,0,0,0,4,0,1],[0,0,0,0,0,0,0,0,1],[0,0,0,0,0,0,0,1,0],[0,0,0,1,0,0,0,0,0],[0,0,0,3,0,0,0,0,0],[0,0,0,1,0,0,0,0,1],[0,0,0,2,0,0,0,0,1],[0,0,0,2,0,0,0,0,0],[0,0,0,3,0,0,0,0,0],[0,0,0,0,0,0,2,0,0],[0,0,0,0,0,0,2,0,0],[0,0,0,0,0,0,0,2,0],[0,0,0,2,0,0,0,0,0],[0,0,0,1,0,0,0,0,3],[0,0,0,2,0,0,0,0,1],[0,0,0,0,0,1,0,0,0],[0,0,0,2,0,0,0,0,0],[0,0,0,2,0,0,0,0,0],[0,0,0,2,0,0,0,0,0],[0,0,0,0,0,0,0,4,0],[0,0,0,0,0,1,0,0,0],[0,0,0,1,0,0,0,0,0],[0,0,0,0,0,0,0,0,1],[0,0,0,1,0,0,0,0,0],[0,0,0,0,0,0,0,0,4],[0,0,0,2,0,0,0,0,0],[0,0,0,1,0,0,0,0,0],[0,0,0,0,0,0,0,0,1],[0,0,0,0,0,4,0,0,1],[0,0,0,0,0,0,1,0,1],[0,0,0,0,0,1,0,0,0],[0,0,0,0,0,7,0,0,0],[0,0,0,0,0,2,0,0,0],[0,0,0,0,0,0,1,0,0],[0,0,0,0,0,3,0,0,1],[0,0,0,0,0,3,0,0,0],[0,0,0,0,0,1,0,0,1],[0,0,0,0,0,0,0,0,1],[0,0,0,0,0,1,0,0,0],[0,0,0,0,0,1,0,0,2],[0,0,0,0,0,3,0,0,0],[0,0,0,0,0,4,0,0,4],[0,0,0,0,0,0,0,0,1],[0,0,0,3,0,0,0,0,0],[0,0,0,5,0,0,0,0,0],[0,0,0,1,0,0,0,0,0],[0,0,0,0,0,2,0,0,0],[0,0,0,0,0,9,0,0,1],[0,0,0,0,0,1,0,0,0],[0,0,0,0,0,1,0,0,0],[0,0,0,0,0,4,0,0,0],[0,0,0,0,0,9,0,0,0],[0,0,0,0,0,5,0,0,0],[0,0,0,0,0,1,0,0,2],[0,0,0,1,0,0,0,0,0],[0,0,0,1,0,0,0,0,0],[0,0,0,2,0,0,0,0,0],[0,0,0,3,0,0,0,0,0],[0,0,0,1,0,0,0,0,0],[0,0,0,1,0,0,0,0,0],[0,0,2,0,0,0,0,0,0],[0,0,0,0,0,1,0,0,0],[0,0,0,0,0,2,0,0,0],[0,0,0,0,0,5,0,0,0],[0,0,0,0,0,14,0,0,0],[0,0,0,0,0,1,0,0,0],[0,0,0,1,0,0,0,0,0],[0,0,0,1,0,0,0,0,0],[0,0,0,0,0,0,0,0,2],[0,0,2,0,0,0,0,0,2],[0,0,1,0,0,0,0,0,0],[0,0,0,0,0,1,0,0,0],[0,0,0,0,0,1,0,0,0],[0,0,0,0,0,1,0,0,0],[0,0,0,0,0,3,0,0,1],[0,0,0,1,0,0,0,0,0],[0,0,0,2,0,0,0,0,0],[0,0,0,6,0,0,0,0,0],[0,0,2,0,0,0,0,0,0],[0,0,11,0,0,0,0,0,0],[0,0,2,0,0,0,0,0,0],[0,0,0,0,0,1,0,0,0],[0,0,0,0,0,0,0,0,1],[0,0,0,0,0,1,0,0,0],[0,0,0,0,0,4,0,0,0],[0,0,0,0,0,1,0,0,0],[0,0,0,0,0,1,0,0,2],[0,0,0,0,0,1,0,0,0],[0,0,0,0,0,0,0,0,1],[0,0,0,1,0,0,0,0,0],[0,0,0,3,0,0,0,0,0],[0,0,0,8,0,0,0,0,0],[0,0,4,0,0,0,0,0,0],[0,0,2,0,0,0,0,0,0],[0,0,1,0,0,0,0,0,3],[0,0,8,0,0,0,0,0,5],[0,0,10,0,0,0,0,0,3],[0,0,1,0,0,0,0,0,2],[0,0,4,0,0,0,0,0,0],[0,0,1,0,0,0,0,0,2],[0,0,3,0,0,0,0,0,0],[0,0,0,0,0,4,0,0,0],[0,0,0,0,0,2,0,0,0],[0,0,0,0,0,1,0,0,0],[0,0,0,0,0,3,0,0,0],[0,0,0,0,0,1,0,0,0],[0,0,0,0,0,1,0,0,4],[0,0,0,0,0,0,0,0,1],[0,0,0,0,0,0,0,0,1],[0,0,0,0,0,1,0,0,1],[0,0,0,4,0,0,0,0,0],[0,0,0,1,0,0,0,0,0],[0,0,0,1,0,0,0,0,0],[0,0,0,0,0,0,0,0,1],[0,0,0,0,1,0,0,0,0],[0,0,4,0,0,0,0,0,0],[0,0,4,0,0,0,0,0,0],[0,0,4,0,0,0,0,0,4],[0,0,3,0,0,0,0,0,0],[0,0,9,0,0,0,0,0,0],[0,0,9,0,0,0,0,0,3],[0,0,2,0,0,0,0,0,1],[0,0,2,0,0,0,0,0,1],[0,0,0,0,0,5,0,0,0],[0,0,0,0,0,2,0,0,0],[0,0,0,0,0,2,0,0,3],[0,0,0,0,0,4,0,0,0],[0,0,0,0,0,1,0,0,0],[0,0,0,0,0,2,0,0,0],[0,0,0,0,0,1,0,0,0],[0,0,0,0,0,0,0,0,1],[0,1,0,0,3,0,0,0,0],[0,0,0,0,1,0,0,0,0],[0,0,0,0,1,0,0,1,0],[0,0,1,0,0,0,0,0,0],[0,0,1,0,0,0,0,0,0],[0,0,0,0,0,0,0,0,2],[0,0,2,0,0,0,0,0,0],[0,0,1,0,0,0,0,0,0],[0,0,1,0,0,0,0,0,0],[0,0,1,0,0,0,0,0,0],[0,0,0,0,0,0,0,0,1],[0,0,0,0,0,3,0,0,0],[0,0,0,0,0,1,0,0,2],[0,0,0,0,0,2,0,0,1],[0,0,0,0,0,1,0,0,0],[0,0,0,0,0,2,0,0,0],[0,0,0,0,0,1,0,0,0],[0,0,0,0,0,1,0,0,0],[0,0,0,0,0,0,0,0,1],[0,0,0,0,0,0,0,1,0],[0,1,0,0,0,0,0,0,0],[0,0,0,0,4,0,0,0,0],[0,0,0,0,2,0,0,0,0],[0,0,0,0,1,0,0,0,1],[0,0,0,0,3,0,0,0,0],[0,0,1,0,0,0,0,0,0],[0,0,1,0,0,0,0,0,0],[0,0,1,0,0,0,0,0,0],[0,0,1,0,0,0,0,0,0],[0,0,3,0,0,0,0,0,0],[0,0,1,0,0,0,0,0,0],[0,0,3,0,0,0,0,0,0],[0,0,5,0,0,0,0,0,1],[0,0,1,0,0,0,0,0,0],[0,0,1,0,0,0,0,0,0],[0,0,2,0,0,0,0,0,1],[0,0,0,0,0,1,0,0,0],[0,0,0,0,0,3,0,0,0],[0,0,0,0,0,2,0,0,0],[0,0,0,0,0,3,0,0,0],[0,0,0,0,0,8,0,0,0],[0,0,0,0,0,2,0,0,0],[0,0,0,0,0,6,0,0,0],[0,1,0,0,0,0,0,0,0],[0,6,0,0,0,0,0,0,1],[0,3,0,0,2,0,0,0,0],[0,0,0,0,4,0,0,0,0],[0,1,0,0,2,0,0,0,0],[0,0,0,0,1,0,0,0,0],[0,0,0,0,0,0,0,0,1],[0,0,0,0,1,0,0,0,0],[0,0,6,0,0,0,0,0,0],[0,0,4,0,0,0,0,0,0],[0,0,1,0,0,0,0,0,0],[0,0,2,0,0,0,0,0,2],[0,0,1,0,0,0,0,0,0],[0,0,2,0,0,0,0,0,0],[0,0,3,0,0,0,0,0,0],[2,0,0,0,0,0,0,0,0],[2,0,0,0,0,0,0,0,0],[1,0,0,0,0,0,0,0,0],[0,0,0,0,0,0,0,0,1],[0,0,0,0,0,1,0,0,0],[0,0,0,0,0,1,0,0,0],[0,0,0,0,0,2,0,0,0],[0,0,0,0,0,2,0,0,0],[0,0,0,0,1,6,0,0,0],[0,0,0,0,0,6,0,0,0],[0,0,0,0,0,2,0,0,0],[0,15,0,0,0,0,0,0,0],[0,11,0,0,0,0,0,0,4],[0,7,0,1,0,0,0,0,0],[0,0,0,0,1,0,0,0,0],[0,0,0,0,1,0,0,0,0],[0,0,1,0,0,0,0,0,0],[0,0,0,0,0,0,0,0,1],[0,0,1,0,0,0,0,0,0],[0,0,1,0,0,0,0,0,2],[0,0,3,0,0,0,0,0,0],[0,0,0,0,0,0,0,0,1],[0,0,1,0,0,0,0,0,0],[2,0,0,0,0,0,0,0,0],[1,0,0,0,0,0,0,0,0],[0,0,0,0,0,5,0,0,0],[0,0,0,0,0,2,0,0,0],[0,0,0,0,0,1,0,0,0],[0,0,0,0,0,0,0,0,1],[0,0,0,0,0,2,0,0,0],[0,0,0,0,0,4,0,0,1],[0,0,0,0,0,7,0,0,0],[0,0,0,0,0,2,0,0,0],[0,1,0,0,0,0,0,0,0],[0,6,0,0,0,0,0,0,0],[0,10,0,0,0,0,0,0,2],[0,1,0,0,0,0,0,0,2],[0,0,0,0,1,0,0,0,0],[0,0,0,0,0,0,0,0,1],[0,0,5,0,0,0,0,0,1],[0,0,0,0,0,0,0,0,1],[0,0,1,0,0,0,0,0,1],[0,0,2,0,0,0,0,0,0],[0,0,1,0,0,0,0,0,0],[1,0,0,0,0,0,0,0,0],[7,0,0,0,0,0,0,0,0],[2,0,1,0,0,0,0,0,1],[0,0,0,0,0,4,0,0,1],[0,0,0,0,0,5,0,0,0],[0,0,0,0,0,2,0,0,1],[0,0,0,0,0,1,0,0,0],[0,15,0,0,0,0,0,0,1],[0,21,0,0,0,0,0,0,1],[0,2,0,0,0,0,0,0,1],[0,0,0,0,1,0,0,0,0],[0,0,0,0,1,0,0,0,0],[0,1,0,0,0,0,0,0,4],[0,0,4,0,0,0,0,0,1],[0,0,1,0,0,0,0,0,1],[0,0,0,0,0,0,0,0,1],[0,0,1,0,0,0,0,0,0],[0,0,5,0,0,0,0,0,0],[0,0,1,0,0,0,0,0,0],[1,0,0,0,0,0,0,0,0],[2,0,0,0,0,0,0,0,0],[1,0,0,0,0,0,0,0,1],[1,0,0,0,0,0,0,0,0],[0,0,1,0,0,0,0,0,2],[0,0,0,0,0,1,0,0,0],[0,0,0,0,0,3,0,0,0],[0,0,0,0,1,2,0,0,4],[0,0,0,0,0,5,0,0,0],[0,0,0,0,0,1,0,0,0],[0,17,0,0,0,0,0,0,0],[0,25,0,0,0,0,0,0,2],[0,6,0,0,0,0,0,0,4],[0,2,0,0,2,0,0,0,0],[0,2,0,0,0,0,0,0,2],[0,2,0,0,0,0,0,0,0],[0,0,0,0,0,0,0,0,1],[0,0,0,0,2,0,0,0,0],[0,0,1,0,0,0,0,0,0],[0,0,0,0,0,0,0,0,2],[2,0,0,0,0,0,0,0,0],[2,0,0,0,0,0,0,0,1],[1,0,0,0,0,0,0,0,0],[0,0,0,0,0,2,0,0,0],[0,0,0,0,0,3,0,0,0],[0,0,0,0,0,3,0,0,0],[0,0,0,0,0,2,0,0,0],[0,0,0,0,0,2,0,0,2],[0,3,0,0,0,0,0,0,2],[0,17,0,0,0,0,0,0,0],[0,2,0,0,0,0,0,0,1],[0,15,0,0,0,0,0,0,0],[0,2,0,0,0,0,0,0,0],[0,4,0,0,0,0,0,0,0],[0,0,0,0,1,0,0,0,1],[0,0,0,0,0,0,0,0,1],[0,0,0,0,0,0,0,0,1],[0,0,0,0,0,0,0,0,2],[0,0,0,0,0,0,0,0,1],[2,0,0,0,0,0,0,0,0],[1,0,0,0,0,0,0,0,0],[0,0,0,0,0,1,0,0,0],[0,0,0,0,0,1,0,0,0],[0,1,0,0,0,0,0,0,0],[0,9,0,0,0,0,0,0,1],[0,10,0,0,0,0,0,0,1],[0,7,0,0,0,0,0,0,0],[0,2,0,0,0,0,0,0,2],[0,5,0,0,0,0,0,0,0],[0,1,0,0,0,0,0,0,0],[0,3,0,0,0,0,0,0,0],[0,0,0,0,3,0,0,0,0],[0,0,0,0,1,0,0,0,0],[0,0,0,0,0,0,0,0,1],[0,0,0,0,0,0,0,0,1],[1,0,0,0,0,0,0,0,1],[0,4,0,0,0,0,0,0,1],[0,4,0,0,0,0,0,0,6],[0,4,0,0,0,0,0,0,3],[0,7,0,0,0,0,0,0,3],[0,3,0,0,0,0,0,0,0],[0,1,0,0,0,0,0,0,0],[0,0,0,0,2,0,0,0,0],[0,0,0,0,1,0,0,0,1],[0,0,0,0,1,0,0,0,0],[1,0,0,0,0,0,0,0,0],[1,0,0,0,0,0,0,0,0],[1,0,1,0,0,0,0,0,0],[0,0,0,0,0,0,0,0,1],[0,0,0,0,0,0,0,0,1],[1,0,0,0,0,0,0,0,0],[4,0,0,0,0,1,0,0,0],[1,0,0,0,0,0,0,0,0],[0,0,0,0,0,0,0,0,1],[0,3,0,0,0,0,0,0,5],[0,9,0,0,0,0,0,0,3],[0,2,0,0,0,0,0,0,1],[0,0,0,0,0,0,0,0,1],[0,1,0,0,0,0,0,0,4],[0,0,0,0,2,0,0,0,0],[0,2,0,0,3,0,0,0,0],[0,0,0,0,1,0,0,0,1],[0,0,0,0,1,0,0,0,0],[1,0,0,0,2,0,0,0,0],[4,0,0,0,0,0,0,0,2],[2,0,0,0,0,0,0,0,0],[0,0,0,0,0,0,0,0,1],[0,8,0,0,0,0,0,0,1],[0,7,0,0,0,0,0,0,0],[0,8,0,0,0,0,0,0,4],[0,2,0,0,0,0,0,0,3],[0,1,0,0,0,0,0,0,5],[0,0,0,0,0,0,0,0,3],[0,0,0,0,0,0,0,0,3],[0,0,0,0,0,0,0,0,4],[2,0,0,0,0,0,0,0,0],[1,0,0,0,0,0,0,0,0],[8,0,0,0,0,0,0,0,0],[1,0,0,0,0,0,0,0,0],[3,0,0,0,0,0,0,0,0],[0,0,0,0,0,0,0,0,1],[0,0,0,0,0,0,0,0,1],[0,4,0,0,0,0,0,0,5],[0,3,0,0,0,0,0,0,0],[0,8,0,0,0,0,0,0,0],[0,1,0,0,0,0,0,0,3],[0,1,0,0,0,0,0,0,5],[0,1,0,0,0,0,0,0,1],[0,0,0,0,0,0,0,0,1],[0,4,0,0,0,0,0,0,3],[0,2,0,0,0,0,0,0,3],[1,0,0,0,0,0,0,0,0],[1,0,0,0,0,0,0,0,1],[0,2,0,0,0,0,0,0,1],[0,3,0,0,0,0,0,0,3],[0,10,0,0,0,0,0,0,3],[0,16,0,0,0,0,0,0,1],[0,9,0,0,0,0,0,0,1],[0,5,0,0,0,0,0,0,0],[0,6,0,0,0,0,0,0,3],[0,3,0,0,0,0,0,0,1],[0,1,0,0,0,0,0,0,0],[0,0,0,0,0,0,0,0,1],[0,9,0,0,0,0,0,0,2],[0,15,0,0,0,0,0,0,0],[0,8,0,0,0,0,0,0,0],[0,1,0,0,0,0,0,0,3],[0,1,0,0,0,0,0,0,0],[0,1,0,0,0,0,0,0,0],[0,1,0,0,0,0,0,0,1],[0,2,0,0,0,0,0,0,0],[0,11,0,0,0,0,0,0,0],[0,4,0,0,0,0,0,0,0],[0,1,0,0,0,0,0,0,0],[0,1,0,0,0,0,0,0,0],[3,0,0,0,0,0,0,0,2],[2,0,0,0,0,0,0,0,6],[0,0,0,0,0,0,0,0,1],[3,0,0,0,0,0,0,0,0],[1,0,0,0,0,0,0,0,0],[2,0,0,0,0,0,0,0,0],[4,0,0,0,0,0,0,0,0],[4,0,0,0,0,0,0,0,1],[4,0,0,0,0,0,0,0,0],[2,0,0,0,0,0,0,0,0],[1,0,0,0,0,0,0,0,0],[3,0,0,0,0,0,0,0,0],[12,0,0,0,0,0,0,0,0],[4,0,0,0,0,0,0,0,0],[1,0,0,0,0,0,0,0,2],[2,0,0,0,0,0,0,0,0],[2,0,0,0,0,0,0,0,0],[0,0,0,0,0,0,0,0,2]],"month":[[0,4,1],[1,4,1],[2,4,1],[3,4,1],[4,4,1],[5,4,1],[6,4,1],[7,4,1],[8,4,1],[9,4,6],[10,4,1],[11,4,6],[12,4,1],[13,4,2],[14,4,5],[15,4,2],[16,4,2],[17,4,2],[18,4,1],[19,4,1],[20,4,1],[21,4,1],[22,4,2],[23,4,1],[24,4,1],[25,4,1],[26,4,1],[27,4,1],[28,4,1],[29,4,3],[30,4,1],[31,4,1],[32,4,1],[33,4,1],[34,4,2],[35,4,1],[36,4,8],[37,4,2],[38,4,4],[39,4,1],[40,4,3],[41,4,3],[42,4,1],[43,4,5],[44,4,2],[45,4,1],[46,4,1],[47,4,1],[48,4,2],[49,4,1],[50,4,2],[51,4,2],[52,4,4],[53,4,2],[54,4,1],[55,4,3],[56,4,2],[57,4,4],[58,4,1],[59,4,1],[60,4,2],[61,4,1],[62,4,2],[63,4,3],[64,4,3],[65,4,2],[66,4,1],[67,4,1],[68,4,2],[69,4,3],[70,4,1],[71,4,6],[72,4,1],[73,4,2],[74,4,3],[75,4,3],[76,4,1],[77,4,2],[78,4,1],[79,4,1],[80,4,4],[81,4,1],[82,4,1],[83,4,1],[84,4,1],[85,4,3],[86,4,1],[87,4,2],[88,4,2],[89,4,5],[90,4,1],[91,4,1],[92,4,1],[93,4,3],[94,4,2],[95,1,1],[95,4,2],[96,4,2],[97,4,3],[98,4,2],[99,4,2],[100,4,2],[101,4,2],[102,4,4],[103,4,3],[104,4,1],[105,4,2],[106,4,2],[107,4,2],[108,4,4],[109,4,1],[110,4,1],[111,4,1],[112,4,1],[113,4,4],[114,4,2],[115,4,1],[116,4,1],[117,4,5],[118,4,2],[119,4,1],[120,4,7],[121,4,2],[122,4,1],[123,4,4],[124,4,3],[125,4,2],[126,4,1],[127,4,1],[128,4,3],[129,4,3],[130,4,8],[131,4,1],[132,4,3],[133,4,5],[134,3,1],[135,4,2],[136,3,1],[136,4,9],[137,4,1],[138,4,1],[139,4,4],[140,4,9],[141,4,5],[142,4,3],[143,4,1],[144,4,1],[145,4,2],[146,4,3],[147,4,1],[148,4,1],[149,3,2],[150,4,1],[151,4,2],[152,4,5],[153,4,14],[154,4,1],[155,4,1],[156,4,1],[157,4,2],[158,3,4],[159,3,1],[160,4,1],[161,4,1],[162,4,1],[163,1,1],[163,4,3],[164,4,1],[165,4,2],[166,4,6],[167,4,2],[168,3,6],[168,4,5],[169,3,2],[170,4,1],[171,4,1],[172,4,1],[173,4,4],[174,4,1],[175,4,3],[176,4,1],[177,0,1],[178,4,1],[179,4,3],[180,4,8],[181,3,4],[182,3,2],[183,3,4],[184,3,13],[185,3,10],[185,4,3],[186,3,2],[186,4,1],[187,4,4],[188,3,2],[188,4,1],[189,3,3],[190,4,4],[191,3,1],[191,4,1],[192,4,1],[193,4,3],[194,4,1],[195,4,5],[196,4,1],[197,4,1],[198,4,2],[199,4,4],[200,4,1],[201,4,1],[202,4,1],[203,4,1],[204,3,4],[205,3,4],[206,3,7],[206,4,1],[207,3,3],[208,3,9],[209,3,10],[209,4,2],[210,4,3],[211,3,2],[211,4,1],[212,3,2],[212,4,3],[213,4,2],[214,4,5],[215,4,4],[216,4,1],[217,4,2],[218,4,1],[219,4,1],[220,4,4],[221,4,1],[222,4,2],[223,3,1],[224,3,1],[225,3,2],[226,3,2],[227,3,1],[228,3,1],[229,3,1],[230,4,1],[231,4,3],[232,4,3],[233,4,3],[234,4,1],[235,4,2],[236,4,1],[237,3,1],[238,4,1],[239,4,1],[240,4,1],[241,4,4],[242,4,2],[243,0,1],[243,4,1],[244,4,3],[245,3,1],[246,3,1],[247,3,1],[248,3,1],[249,3,3],[250,3,1],[251,3,3],[252,0,1],[252,3,5],[253,3,1],[254,3,1],[255,3,3],[256,4,1],[257,3,3],[258,4,2],[259,3,2],[259,4,1],[260,3,4],[260,4,4],[261,3,2],[262,3,6],[263,4,1],[264,4,7],[265,4,5],[266,4,4],[267,3,1],[267,4,2],[268,4,1],[269,0,1],[270,4,1],[271,3,6],[272,3,4],[273,3,1],[274,3,4],[275,3,1],[276,3,1],[276,4,1],[277,3,3],[278,4,2],[279,4,2],[280,4,1],[281,3,1],[282,4,1],[283,4,1],[284,4,2],[285,4,2],[286,3,3],[286,4,4],[287,3,2],[287,4,4],[288,3,2],[289,4,15],[290,4,15],[291,4,8],[292,4,1],[293,4,1],[294,3,1],[295,1,1],[296,3,1],[297,3,3],[298,3,3],[299,3,1],[300,3,1],[301,4,2],[302,4,1],[303,4,5],[304,4,2],[305,4,1],[306,1,1],[307,4,2],[308,4,5],[309,4,6],[309,5,1],[310,4,2],[311,4,1],[312,4,6],[313,4,12],[314,4,3],[315,4,1],[316,0,1],[317,3,5],[317,4,1],[318,3,1],[319,0,1],[319,4,1],[320,3,2],[321,3,1],[322,4,1],[323,3,1],[323,4,6],[324,4,4],[325,4,5],[326,4,5],[327,4,3],[328,4,1],[329,0,1],[329,4,15],[330,4,22],[331,4,3],[332,4,1],[333,4,1],[334,0,1],[334,4,4],[335,1,1],[335,3,4],[336,3,2],[337,3,1],[338,3,1],[339,3,5],[340,3,1],[341,4,1],[342,4,2],[343,3,1],[343,4,1],[344,4,1],[345,3,2],[345,4,1],[346,3,1],[347,4,3],[348,4,7],[349,4,5],[350,4,1],[351,4,17],[352,4,27],[353,4,10],[354,4,4],[355,0,1],[355,4,3],[356,4,2],[357,1,1],[358,4,2],[359,3,1],[360,3,2],[361,4,2],[362,3,2],[362,4,1],[363,4,1],[364,4,2],[365,4,3],[366,4,3],[367,4,2],[368,3,2],[368,4,2],[369,0,1],[369,4,4],[370,3,2],[370,4,15],[371,3,1],[371,4,2],[372,4,15],[373,4,2],[374,4,4],[375,1,1],[375,4,1],[376,0,1],[377,0,1],[378,0,2],[379,0,1],[380,4,2],[381,4,1],[382,4,1],[383,4,1],[384,4,1],[385,4,8],[385,5,2],[386,0,1],[386,3,5],[386,4,5],[387,3,3],[387,4,4],[388,1,1],[388,4,3],[389,4,5],[390,4,1],[391,4,3],[392,4,3],[393,4,1],[394,3,1],[395,1,1],[396,4,2],[397,3,1],[397,4,4],[398,0,2],[398,1,2],[398,3,4],[398,4,2],[399,0,1],[399,3,2],[399,4,4],[400,4,10],[401,4,3],[402,4,1],[403,4,2],[404,0,1],[404,4,1],[405,4,1],[406,4,1],[407,4,1],[408,3,1],[408,4,1],[409,4,1],[410,4,1],[411,4,1],[412,4,5],[413,4,1],[414,4,1],[415,3,1],[415,4,7],[416,4,12],[417,4,3],[418,4,1],[419,2,1],[419,4,4],[420,4,2],[421,4,5],[422,3,1],[422,4,1],[423,4,1],[424,4,3],[425,4,5],[425,5,1],[426,4,2],[427,0,1],[428,0,1],[428,4,8],[429,4,7],[430,2,1],[430,4,11],[431,2,2],[431,4,3],[432,0,1],[432,2,4],[432,4,1],[433,3,3],[434,3,3],[435,1,2],[435,3,2],[436,4,2],[437,4,1],[438,4,8],[439,4,1],[440,4,3],[441,1,1],[442,4,1],[443,1,1],[443,4,8],[444,4,3],[445,4,8],[446,2,2],[446,4,2],[447,2,5],[447,4,1],[448,3,2],[449,4,1],[450,1,2],[450,3,4],[450,4,1],[451,3,5],[452,4,1],[453,1,1],[453,3,1],[454,4,3],[455,1,2],[455,4,4],[456,4,13],[457,4,17],[458,4,10],[459,3,3],[459,4,2],[460,3,7],[460,4,2],[461,3,3],[461,4,1],[462,4,1],[463,4,1],[464,4,11],[465,4,15],[466,4,8],[467,3,1],[467,4,3],[468,3,1],[469,3,1],[470,3,1],[470,4,1],[471,4,2],[472,4,11],[473,4,4],[474,4,1],[475,4,1],[476,4,5],[477,4,8],[478,4,1],[479,4,3],[480,4,1],[481,4,2],[482,4,4],[483,4,5],[484,4,4],[485,4,2],[486,4,1],[487,3,1],[487,4,2],[488,4,12],[489,4,4],[490,4,3],[491,4,2],[492,4,2],[493,4,2]]},"500":{"lat":[-1.23293,-1.21946,-1.25988,-1.25314,-1.23967,-1.23293,-1.26662,-1.25988,-1.25314,-1.27336,-1.26662,-1.13861,-1.16556,-1.15882,-1.15208,-1.14535,-1.13861,-1.13187,-1.12513,-1.15208,-1.13187,-1.12513,-1.13187,-1.12513,-1.1184,-1.09819,-1.11166,-1.10492,-1.09819,-1.09145,-1.07124,-1.10492,-1.09819,-1.10492,-1.27336,-1.26662,-1.25988,-1.08471,-1.30031,-1.29357,-1.28683,-1.28009,-1.27336,-1.25988,-1.25314,-1.31378,-1.30704,-1.30031,-1.29357,-1.28009,-1.25988,-1.25314,-1.24641,-1.32052,-1.31378,-1.30704,-1.30031,-1.29357,-1.28683,-1.26662,-1.25988,-1.0645,-1.32725,-1.31378,-1.30704,-1.30031,-1.07124,-1.31378,-1.30704,-1.30031,-1.26662,-1.3542,-1.34747,-1.34073,-1.33399,-1.27336,-1.38115,-1.37442,-1.36768,-1.36094,-1.3542,-1.34747,-1.33399,-1.32725,-1.32052,-1.31378,-1.40137,-1.38115,-1.36768,-1.36094,-1.3542,-1.34073,-1.32725,-1.32052,-1.31378,-1.30031,-1.41484,-1.4081,-1.40137,-1.39463,-1.37442,-1.36768,-1.36094,-1.3542,-1.34747,-1.34073,-1.33399,-1.32725,-1.32052,-1.45526,-1.44853,-1.42831,-1.42158,-1.41484,-1.4081,-1.40137,-1.38115,-1.37442,-1.36768,-1.36094,-1.3542,-1.34747,-1.34073,-1.33399,-1.32052,-1.46874,-1.462,-1.45526,-1.44853,-1.44179,-1.43505,-1.42831,-1.42158,-1.41484,-1.4081,-1.40137,-1.38115,-1.37442,-1.36768,-1.36094,-1.3542,-1.34747,-1.1723,-1.47548,-1.46874,-1.462,-1.45526,-1.44179,-1.43505,-1.42831,-1.42158,-1.41484,-1.4081,-1.40137,-1.39463,-1.38789,-1.38115,-1.37442,-1.36768,-1.36094,-1.47548,-1.46874,-1.462,-1.45526,-1.44853,-1.44179,-1.43505,-1.42831,-1.42158,-1.4081,-1.40137,-1.38115,-1.37442,-1.36768,-1.47548,-1.46874,-1.462,-1.45526,-1.44853,-1.44179,-1.42831,-1.4081,-1.40137,-1.39463,-1.38115,-1.37442,-1.47548,-1.46874,-1.462,-1.45526,-1.44853,-1.43505,-1.42831,-1.42158,-1.41484,-1.4081,-1.40137,-1.39463,-1.47548,-1.46874,-1.462,-1.45526,-1.44853,-1.44179,-1.43505,-1.42831,-1.41484,-1.4081,-1.40137,-1.47548,-1.46874,-1.462,-1.45526,-1.44853,-1.4081,-1.47548,-1.46874,-1.462,-1.39463,-1.38789,-1.40137,-1.39463,-1.41484,-1.4081,-1.40137,-1.41484,-1.4081],"lng":[-48.55638,-48.5486,-48.56416,-48.56027,-48.55249,-48.5486,-48.56027,-48.55638,-48.55249,-48.55638,-48.55249,-48.463,-48.47078,-48.46689,-48.463,-48.4591,-48.45521,-48.45132,-48.44743,-48.45521,-48.44354,-48.43965,-48.43576,-48.43187,-48.42798,-48.4163,-48.4163,-48.41241,-48.40852,-48.40463,-48.39296,-48.40463,-48.40074,-48.39685,-48.47856,-48.47467,-48.47078,-48.36961,-48.48634,-48.48245,-48.47856,-48.47467,-48.47078,-48.463,-48.4591,-48.48634,-48.48245,-48.47856,-48.47467,-48.46689,-48.45521,-48.45132,-48.44743,-48.48245,-48.47856,-48.47467,-48.47078,-48.46689,-48.463,-48.45132,-48.44743,-48.33459,-48.47856,-48.47078,-48.46689,-48.463,-48.3307,-48.463,-48.4591,-48.45521,-48.43576,-48.47856,-48.47467,-48.47078,-48.46689,-48.43187,-48.48634,-48.48245,-48.47856,-48.47467,-48.47078,-48.46689,-48.4591,-48.45521,-48.45132,-48.44743,-48.49023,-48.47856,-48.47078,-48.46689,-48.463,-48.45521,-48.44743,-48.44354,-48.43965,-48.43187,-48.49023,-48.48634,-48.48245,-48.47856,-48.46689,-48.463,-48.4591,-48.45521,-48.45132,-48.44743,-48.44354,-48.43965,-48.43576,-48.5058,-48.50191,-48.49023,-48.48634,-48.48245,-48.47856,-48.47467,-48.463,-48.4591,-48.45521,-48.45132,-48.44743,-48.44354,-48.43965,-48.43576,-48.42798,-48.5058,-48.50191,-48.49802,-48.49412,-48.49023,-48.48634,-48.48245,-48.47856,-48.47467,-48.47078,-48.46689,-48.45521,-48.45132,-48.44743,-48.44354,-48.43965,-48.43576,-48.33459,-48.50191,-48.49802,-48.49412,-48.49023,-48.48245,-48.47856,-48.47467,-48.47078,-48.46689,-48.463,-48.4591,-48.45521,-48.45132,-48.44743,-48.44354,-48.43965,-48.43576,-48.49412,-48.49023,-48.48634,-48.48245,-48.47856,-48.47467,-48.47078,-48.46689,-48.463,-48.45521,-48.45132,-48.43965,-48.43576,-48.43187,-48.48634,-48.48245,-48.47856,-48.47467,-48.47078,-48.46689,-48.4591,-48.44743,-48.44354,-48.43965,-48.43187,-48.42798,-48.47856,-48.47467,-48.47078,-48.46689,-48.463,-48.45521,-48.45132,-48.44743,-48.44354,-48.43965,-48.43576,-48.43187,-48.47078,-48.46689,-48.463,-48.4591,-48.45521,-48.45132,-48.44743,-48.44354,-48.43576,-48.43187,-48.42798,-48.463,-48.4591,-48.45521,-48.45132,-48.44743,-48.42409,-48.45521,-48.45132,-48.44743,-48.40074,-48.39685,-48.39685,-48.39296,-48.39685,-48.39296,-48.38907,-48.38907,-48.38518],"count":[2,1,2,1,1,1,8,11,2,4,1,1,4,1,3,2,1,1,3,1,1,1,3,1,1,6,1,6,6,1,1,3,5,1,3,5,1,3,4,7,2,1,4,5,10,6,2,6,3,2,5,11,2,1,1,10,3,6,2,2,6,3,2,3,5,3,4,6,1,2,1,3,14,1,2,3,2,13,1,10,8,13,2,9,3,1,4,2,4,26,1,1,2,4,1,1,3,4,21,3,5,3,1,9,5,5,6,6,15,1,2,9,20,40,14,5,6,12,7,4,5,1,1,1,1,1,13,7,4,3,2,14,13,4,3,3,9,4,2,12,15,4,1,5,49,10,2,1,7,5,10,4,2,3,3,2,4,4,11,22,40,37,6,4,2,2,11,4,5,2,17,7,13,15,40,38,21,3,2,3,2,5,4,1,4,2,21,28,18,8,6,2,5,3,1,3,5,1,6,35,29,9,12,6,8,9,1,6,1,10,33,44,18,10,1,2,16,21,6,1,7,6,12,24,6,1,1],"district":[[0,0,0,0,0,0,2,0,0],[0,0,0,0,0,0,1,0,0],[0,0,0,0,0,0,2,0,0],[0,0,0,0,0,0,1,0,0],[0,0,0,0,0,0,1,0,0],[0,0,0,0,0,0,1,0,0],[0,0,0,0,0,0,5,0,3],[0,0,0,0,0,0,9,0,2],[0,0,0,0,0,0,2,0,0],[0,0,0,0,0,0,4,0,0],[0,0,0,0,0,0,1,0,0],[0,0,0,0,0,0,0,1,0],[0,0,0,0,0,0,0,4,0],[0,0,0,0,0,0,0,1,0],[0,0,0,0,0,0,0,3,0],[0,0,0,0,0,0,0,2,0],[0,0,0,0,0,0,0,1,0],[0,0,0,0,0,0,0,1,0],[0,0,0,0,0,0,0,3,0],[0,0,0,0,0,0,0,1,0],[0,0,0,0,0,0,0,1,0],[0,0,0,0,0,0,0,1,0],[0,0,0,0,0,0,0,3,0],[0,0,0,0,0,0,0,1,0],[0,0,0,0,0,0,0,1,0],[0,0,0,0,0,0,0,5,1],[0,0,0,0,0,0,0,1,0],[0,0,0,0,0,0,0,6,0],[0,0,0,0,0,0,0,6,0],[0,0,0,0,0,0,0,0,1],[0,0,0,0,0,0,0,1,0],[0,0,0,0,0,0,0,3,0],[0,0,0,0,0,0,0,5,0],[0,0,0,0,0,0,0,1,0],[0,0,0,0,0,0,3,0,0],[0,0,0,0,0,0,5,0,0],[0,0,0,0,0,0,1,0,0],[0,0,0,0,0,0,0,3,0],[0,0,0,4,0,0,0,0,0],[0,0,0,7,0,0,0,0,0],[0,0,0,0,0,0,2,0,0],[0,0,0,0,0,0,1,0,0],[0,0,0,0,0,0,4,0,0],[0,0,0,0,0,0,2,0,3],[0,0,0,0,0,0,7,0,3],[0,0,0,6,0,0,0,0,0],[0,0,0,2,0,0,0,0,0],[0,0,0,4,0,0,0,0,2],[0,0,0,2,1,0,0,0,0],[0,0,0,0,0,0,2,0,0],[0,0,0,0,0,0,3,0,2],[0,0,0,0,0,0,5,0,6],[0,0,0,0,0,0,2,0,0],[0,0,0,1,0,0,0,0,0],[0,0,0,1,0,0,0,0,0],[0,0,0,6,0,0,0,0,4],[0,0,0,2,0,0,0,0,1],[0,0,0,3,0,0,0,0,3],[0,0,0,2,0,0,0,0,0],[0,0,0,0,0,0,2,0,0],[0,0,0,0,0,0,6,0,0],[0,0,0,0,0,0,0,3,0],[0,0,0,0,0,2,0,0,0],[0,0,0,3,0,0,0,0,0],[0,0,0,4,0,0,0,0,1],[0,0,0,2,0,0,0,0,1],[0,0,0,0,0,0,0,4,0],[0,0,0,2,0,0,0,0,4],[0,0,0,1,0,0,0,0,0],[0,0,0,2,0,0,0,0,0],[0,0,0,0,0,0,0,0,1],[0,0,0,0,0,3,0,0,0],[0,0,0,0,0,13,0,0,1],[0,0,0,0,0,1,0,0,0],[0,0,0,0,0,1,0,0,1],[0,0,0,0,0,0,2,0,1],[0,0,0,0,0,2,0,0,0],[0,0,0,0,0,10,0,0,3],[0,0,0,0,0,1,0,0,0],[0,0,0,0,0,10,0,0,0],[0,0,0,0,0,7,0,0,1],[0,0,0,0,0,5,0,0,8],[0,0,0,2,0,0,0,0,0],[0,0,0,9,0,0,0,0,0],[0,0,0,3,0,0,0,0,0],[0,0,0,1,0,0,0,0,0],[0,0,2,0,0,0,0,0,2],[0,0,0,0,0,2,0,0,0],[0,0,0,0,0,4,0,0,0],[0,0,0,0,0,26,0,0,0],[0,0,0,0,0,1,0,0,0],[0,0,0,0,0,0,0,0,1],[0,0,0,2,0,0,0,0,0],[0,0,0,2,0,0,0,0,2],[0,0,0,1,0,0,0,0,0],[0,0,0,1,0,0,0,0,0],[0,0,2,0,0,0,0,0,1],[0,0,2,0,0,0,0,0,2],[0,0,19,0,0,0,0,0,2],[0,0,3,0,0,0,0,0,0],[0,0,0,0,0,5,0,0,0],[0,0,0,0,0,2,0,0,1],[0,0,0,0,0,1,0,0,0],[0,0,0,0,0,7,0,0,2],[0,0,0,0,0,2,0,0,3],[0,0,0,0,0,3,0,0,2],[0,0,0,6,0,0,0,0,0],[0,0,0,6,0,0,0,0,0],[0,0,0,14,0,0,0,0,1],[0,0,0,0,1,0,0,0,0],[0,0,0,0,1,0,0,1,0],[0,0,8,0,0,0,0,0,1],[0,0,14,0,0,0,0,0,6],[0,0,32,0,0,0,0,0,8],[0,0,9,0,0,0,0,0,5],[0,0,4,0,0,0,0,0,1],[0,0,0,0,0,6,0,0,0],[0,0,0,0,0,9,0,0,3],[0,0,0,0,0,7,0,0,0],[0,0,0,0,0,4,0,0,0],[0,0,0,0,0,2,0,0,3],[0,0,0,0,0,1,0,0,0],[0,0,0,0,0,1,0,0,0],[0,0,0,0,0,0,0,0,1],[0,0,0,0,0,0,0,0,1],[0,1,0,0,0,0,0,0,0],[0,2,0,0,11,0,0,0,0],[0,1,0,0,5,0,0,0,1],[0,0,0,0,4,0,0,0,0],[0,0,3,0,0,0,0,0,0],[0,0,2,0,0,0,0,0,0],[0,0,13,0,0,0,0,0,1],[0,0,11,0,0,0,0,0,2],[0,0,3,0,0,0,0,0,1],[0,0,2,0,0,0,0,0,1],[2,0,1,0,0,0,0,0,0],[0,0,0,0,0,6,0,0,3],[0,0,0,0,0,3,0,0,1],[0,0,0,0,0,2,0,0,0],[0,0,0,0,0,12,0,0,0],[0,0,0,0,0,15,0,0,0],[0,0,0,0,0,4,0,0,0],[0,0,0,0,0,0,0,1,0],[0,5,0,0,0,0,0,0,0],[0,43,0,1,0,0,0,0,5],[0,4,0,0,4,0,0,0,2],[0,0,0,0,1,0,0,0,1],[0,0,0,0,0,0,0,0,1],[0,0,4,0,1,0,0,0,2],[0,0,4,0,0,0,0,0,1],[0,0,7,0,0,0,0,0,3],[0,0,4,0,0,0,0,0,0],[2,0,0,0,0,0,0,0,0],[3,0,0,0,0,0,0,0,0],[3,0,0,0,0,0,0,0,0],[0,0,0,0,0,2,0,0,0],[0,0,0,0,0,4,0,0,0],[0,0,0,0,0,3,0,0,1],[0,0,0,0,0,11,0,0,0],[0,0,0,0,1,19,0,0,2],[0,38,0,0,0,0,0,0,2],[0,32,0,0,1,0,0,0,4],[0,1,0,0,2,0,0,0,3],[0,1,0,0,0,0,0,0,3],[0,0,0,0,2,0,0,0,0],[0,0,1,0,0,0,0,0,1],[0,0,7,0,0,0,0,0,4],[0,0,3,0,0,0,0,0,1],[0,0,5,0,0,0,0,0,0],[2,0,0,0,0,0,0,0,0],[13,0,1,0,0,0,0,0,3],[0,0,1,0,0,4,0,0,2],[0,0,0,0,1,9,0,0,3],[0,0,0,0,0,11,0,0,4],[0,36,0,0,0,0,0,0,4],[0,32,0,0,2,0,0,0,4],[0,19,0,0,0,0,0,0,2],[0,2,0,0,0,0,0,0,1],[0,0,0,0,1,0,0,0,1],[0,0,1,0,0,0,0,0,2],[0,0,0,0,0,0,0,0,2],[4,0,0,0,0,0,0,0,1],[2,0,0,0,0,0,0,0,2],[1,0,0,0,0,0,0,0,0],[0,0,0,0,0,4,0,0,0],[0,0,0,0,0,2,0,0,0],[0,18,0,0,0,0,0,0,3],[0,13,0,0,0,0,0,0,15],[0,15,0,0,0,0,0,0,3],[0,2,0,0,6,0,0,0,0],[0,1,0,0,4,0,0,0,1],[0,0,0,0,2,0,0,0,0],[3,0,0,0,0,0,0,0,2],[2,0,1,0,0,0,0,0,0],[0,0,0,0,0,0,0,0,1],[2,0,0,0,0,0,0,0,1],[4,0,0,0,0,1,0,0,0],[0,0,0,0,0,0,0,0,1],[0,3,0,0,0,0,0,0,3],[0,32,0,0,0,0,0,0,3],[0,14,0,0,0,0,0,0,15],[0,1,0,0,2,0,0,0,6],[0,0,0,0,1,0,0,0,11],[2,1,0,0,0,0,0,0,3],[5,0,0,0,2,0,0,0,1],[9,0,0,0,0,0,0,0,0],[0,0,0,0,0,0,0,0,1],[5,0,0,0,0,0,0,0,1],[0,0,0,0,0,0,0,0,1],[0,5,0,0,0,0,0,0,5],[0,27,0,0,0,0,0,0,6],[0,36,0,0,0,0,0,0,8],[0,12,0,0,0,0,0,0,6],[0,8,0,0,0,0,0,0,2],[1,0,0,0,0,0,0,0,0],[0,0,0,0,0,0,0,0,2],[0,14,0,0,0,0,0,0,2],[0,19,0,0,0,0,0,0,2],[2,0,0,0,0,0,0,0,4],[0,0,0,0,0,0,0,0,1],[6,0,0,0,0,0,0,0,1],[3,0,0,0,0,0,0,0,3],[10,0,0,0,0,0,0,0,2],[22,0,0,0,0,0,0,0,2],[6,0,0,0,0,0,0,0,0],[1,0,0,0,0,0,0,0,0],[0,0,0,0,0,0,0,0,1]],"month":[[0,4,2],[1,4,1],[2,4,2],[3,4,1],[4,4,1],[5,4,1],[6,4,8],[7,4,11],[8,4,2],[9,4,4],[10,4,1],[11,4,1],[12,4,4],[13,4,1],[14,4,3],[15,4,2],[16,4,1],[17,4,1],[18,4,3],[19,4,1],[20,4,1],[21,4,1],[22,4,3],[23,4,1],[24,4,1],[25,4,6],[26,4,1],[27,4,6],[28,4,6],[29,4,1],[30,4,1],[31,4,3],[32,4,5],[33,4,1],[34,4,3],[35,4,5],[36,4,1],[37,4,3],[38,4,4],[39,4,7],[40,4,2],[41,4,1],[42,4,4],[43,4,5],[44,4,10],[45,4,6],[46,4,2],[47,4,6],[48,4,3],[49,4,2],[50,4,5],[51,4,11],[52,4,2],[53,4,1],[54,4,1],[55,4,10],[56,1,1],[56,4,2],[57,4,6],[58,4,2],[59,4,2],[60,4,6],[61,4,3],[62,4,2],[63,4,3],[64,4,5],[65,4,3],[66,4,4],[67,4,6],[68,4,1],[69,4,2],[70,4,1],[71,4,3],[72,4,14],[73,4,1],[74,4,2],[75,4,3],[76,4,2],[77,3,1],[77,4,12],[78,4,1],[79,4,10],[80,4,8],[81,4,13],[82,4,2],[83,4,9],[84,4,3],[85,3,1],[86,3,4],[87,4,2],[88,4,4],[89,4,26],[90,4,1],[91,1,1],[92,4,2],[93,4,4],[94,4,1],[95,4,1],[96,3,3],[97,3,2],[97,4,2],[98,3,11],[98,4,10],[99,3,3],[100,3,1],[100,4,4],[101,4,3],[102,4,1],[103,4,9],[104,4,5],[105,0,1],[105,4,4],[106,4,6],[107,4,6],[108,4,15],[109,4,1],[110,4,2],[111,3,9],[112,3,19],[112,4,1],[113,3,37],[113,4,3],[114,3,7],[114,4,7],[115,3,4],[115,4,1],[116,3,1],[116,4,5],[117,3,1],[117,4,11],[118,4,7],[119,4,4],[120,4,5],[121,4,1],[122,4,1],[123,4,1],[124,4,1],[125,4,1],[126,4,13],[127,0,1],[127,3,1],[127,4,5],[128,4,4],[129,3,3],[130,3,2],[131,3,14],[132,3,13],[133,0,1],[133,3,2],[133,4,1],[134,3,3],[135,3,1],[135,4,2],[136,3,4],[136,4,5],[137,4,4],[138,4,2],[139,3,8],[139,4,4],[140,3,11],[140,4,4],[141,3,3],[141,4,1],[142,4,1],[143,4,5],[144,4,49],[145,4,10],[146,0,1],[146,4,1],[147,0,1],[148,1,1],[148,3,4],[148,4,2],[149,0,1],[149,3,3],[149,4,1],[150,3,10],[151,3,4],[152,4,2],[153,4,3],[154,4,3],[155,4,2],[156,4,4],[157,1,1],[157,4,3],[158,4,11],[159,4,21],[159,5,1],[160,0,1],[160,4,39],[161,4,37],[162,0,1],[162,4,5],[163,0,1],[163,4,3],[164,4,2],[165,1,1],[165,3,1],[166,3,11],[167,3,4],[168,3,5],[169,4,2],[170,3,4],[170,4,13],[171,3,2],[171,4,5],[172,3,1],[172,4,12],[173,3,2],[173,4,13],[174,0,1],[174,4,37],[174,5,2],[175,3,7],[175,4,31],[176,1,1],[176,4,20],[177,1,1],[177,4,2],[178,1,1],[178,4,1],[179,0,2],[179,3,1],[180,0,2],[181,0,1],[181,4,4],[182,1,1],[182,4,3],[183,4,1],[184,4,4],[185,4,2],[186,0,1],[186,3,6],[186,4,14],[187,0,3],[187,1,2],[187,3,6],[187,4,17],[188,4,18],[189,4,8],[190,0,1],[190,4,5],[191,4,2],[192,3,1],[192,4,3],[192,5,1],[193,3,1],[193,4,2],[194,4,1],[195,4,3],[196,4,5],[197,4,1],[198,4,6],[199,0,1],[199,1,1],[199,4,33],[200,0,1],[200,2,6],[200,4,22],[201,2,4],[201,3,2],[201,4,3],[202,1,4],[202,3,7],[202,4,1],[203,3,4],[203,4,2],[204,4,8],[205,4,9],[206,0,1],[207,1,1],[207,4,5],[208,1,1],[209,4,10],[210,1,2],[210,4,31],[211,2,5],[211,4,39],[212,3,14],[212,4,4],[213,3,8],[213,4,2],[214,3,1],[215,4,2],[216,3,1],[216,4,15],[217,3,1],[217,4,20],[218,4,6],[219,4,1],[220,4,7],[221,4,6],[222,3,1],[222,4,11],[223,4,24],[224,4,6],[225,4,1],[226,4,1]]},"1000":{"lat":[-1.23967,-1.22619,-1.26662,-1.25314,-1.23967,-1.1723,-1.15882,-1.14535,-1.13187,-1.13187,-1.1184,-1.10492,-1.09145,-1.10492,-1.07797,-1.26662,-1.30704,-1.29357,-1.28009,-1.26662,-1.25314,-1.23967,-1.09145,-1.32052,-1.30704,-1.29357,-1.26662,-1.25314,-1.0645,-1.34747,-1.33399,-1.32052,-1.30704,-1.26662,-1.07797,-1.40137,-1.37442,-1.36094,-1.34747,-1.33399,-1.32052,-1.30704,-1.29357,-1.28009,-1.42831,-1.41484,-1.40137,-1.37442,-1.36094,-1.34747,-1.33399,-1.32052,-1.46874,-1.45526,-1.44179,-1.42831,-1.41484,-1.40137,-1.38789,-1.37442,-1.36094,-1.34747,-1.33399,-1.1723,-1.48221,-1.46874,-1.45526,-1.44179,-1.42831,-1.41484,-1.40137,-1.38789,-1.37442,-1.36094,-1.48221,-1.46874,-1.45526,-1.44179,-1.42831,-1.41484,-1.40137,-1.37442,-1.48221,-1.46874,-1.45526,-1.44179,-1.42831,-1.41484,-1.46874,-1.40137,-1.38789,-1.41484,-1.40137],"lng":[-48.56027,-48.55249,-48.56027,-48.55249,-48.54471,-48.47467,-48.46689,-48.4591,-48.45132,-48.43576,-48.42798,-48.42019,-48.41241,-48.40463,-48.38907,-48.48245,-48.49023,-48.48245,-48.47467,-48.46689,-48.4591,-48.45132,-48.36572,-48.48245,-48.47467,-48.46689,-48.45132,-48.44354,-48.33459,-48.48245,-48.47467,-48.46689,-48.4591,-48.43576,-48.32681,-48.49802,-48.48245,-48.47467,-48.46689,-48.4591,-48.45132,-48.44354,-48.43576,-48.42798,-48.49802,-48.49023,-48.48245,-48.46689,-48.4591,-48.45132,-48.44354,-48.43576,-48.5058,-48.49802,-48.49023,-48.48245,-48.47467,-48.46689,-48.4591,-48.45132,-48.44354,-48.43576,-48.42798,-48.33459,-48.49802,-48.49023,-48.48245,-48.47467,-48.46689,-48.4591,-48.45132,-48.44354,-48.43576,-48.42798,-48.48245,-48.47467,-48.46689,-48.4591,-48.45132,-48.44354,-48.43576,-48.42019,-48.46689,-48.4591,-48.45132,-48.44354,-48.43576,-48.42798,-48.44354,-48.40463,-48.39685,-48.39685,-48.38907],"count":[2,2,21,8,1,2,4,6,6,4,2,11,7,11,1,2,8,15,9,9,21,2,3,5,24,8,8,7,4,11,4,4,8,3,3,1,17,42,18,10,9,1,1,1,6,46,38,20,18,17,14,19,37,28,5,35,38,11,9,22,41,11,1,1,2,162,17,19,23,2,28,10,39,15,14,110,35,10,22,4,15,1,2,120,58,7,2,5,18,5,10,23,26],"district":[[0,0,0,0,0,0,2,0,0],[0,0,0,0,0,0,2,0,0],[0,0,0,0,0,0,17,0,4],[0,0,0,0,0,0,7,0,1],[0,0,0,0,0,0,1,0,0],[0,0,0,0,0,0,0,2,0],[0,0,0,0,0,0,0,4,0],[0,0,0,0,0,0,0,6,0],[0,0,0,0,0,0,0,6,0],[0,0,0,0,0,0,0,4,0],[0,0,0,0,0,0,0,2,0],[0,0,0,0,0,0,0,10,1],[0,0,0,0,0,0,0,6,1],[0,0,0,0,0,0,0,11,0],[0,0,0,0,0,0,0,1,0],[0,0,0,0,0,0,2,0,0],[0,0,0,8,0,0,0,0,0],[0,0,0,11,1,0,1,0,2],[0,0,0,0,0,0,9,0,0],[0,0,0,0,0,0,8,0,1],[0,0,0,0,0,0,11,0,10],[0,0,0,0,0,0,2,0,0],[0,0,0,0,0,0,0,3,0],[0,0,0,5,0,0,0,0,0],[0,0,0,18,0,0,0,0,6],[0,0,0,5,0,0,0,0,3],[0,0,0,0,0,0,7,0,1],[0,0,0,0,0,0,5,0,2],[0,0,0,0,0,0,0,4,0],[0,0,0,0,0,10,0,0,1],[0,0,0,0,0,4,0,0,0],[0,0,0,0,0,0,0,0,4],[0,0,0,7,0,0,0,0,1],[0,0,0,0,0,0,1,0,2],[0,0,0,0,0,0,0,3,0],[0,0,1,0,0,0,0,0,0],[0,0,0,0,0,14,0,0,3],[0,0,0,0,0,41,0,0,1],[0,0,0,0,0,10,0,0,8],[0,0,0,9,0,0,0,0,1],[0,0,0,8,0,0,0,0,1],[0,0,0,1,0,0,0,0,0],[0,0,0,1,0,0,0,0,0],[0,0,0,0,0,0,1,0,0],[0,0,6,0,0,0,0,0,0],[0,0,32,0,0,0,0,0,14],[0,0,31,0,0,0,0,0,7],[0,0,0,0,0,19,0,0,1],[0,0,0,0,0,18,0,0,0],[0,0,0,0,0,7,0,0,10],[0,0,0,12,0,1,0,0,1],[0,0,0,16,0,0,0,0,3],[0,30,0,0,3,0,0,0,4],[0,2,0,0,24,0,0,1,1],[0,0,4,0,0,0,0,0,1],[0,0,30,0,1,0,0,0,4],[0,0,30,0,0,0,0,0,8],[6,0,3,0,0,0,0,0,2],[1,0,0,0,0,7,0,0,1],[0,0,0,0,0,16,0,0,6],[0,0,0,0,1,39,0,0,1],[0,0,0,0,0,11,0,0,0],[0,0,0,0,0,0,0,0,1],[0,0,0,0,0,0,0,1,0],[0,2,0,0,0,0,0,0,0],[0,139,0,1,5,0,0,0,17],[0,9,0,0,0,0,0,0,8],[0,0,12,0,2,0,0,0,5],[0,0,15,0,0,0,0,0,8],[0,0,2,0,0,0,0,0,0],[23,0,1,0,0,0,0,0,4],[0,0,1,0,0,7,0,0,2],[0,0,0,0,1,32,0,0,6],[0,0,0,0,0,12,0,0,3],[0,13,0,0,0,0,0,0,1],[0,84,0,0,0,0,0,0,26],[0,11,0,0,13,0,0,0,11],[0,0,0,0,3,0,0,0,7],[16,0,1,0,2,0,0,0,3],[1,0,0,0,0,0,0,0,3],[10,0,0,0,0,1,0,0,4],[0,0,0,0,0,1,0,0,0],[0,0,0,0,0,0,0,0,2],[0,93,0,0,0,0,0,0,27],[0,35,0,0,0,0,0,0,23],[2,2,0,0,0,0,0,0,3],[2,0,0,0,0,0,0,0,0],[4,0,0,0,0,0,0,0,1],[0,18,0,0,0,0,0,0,0],[3,0,0,0,0,0,0,0,2],[3,0,0,0,0,0,0,0,7],[21,0,0,0,0,0,0,0,2],[23,0,0,0,0,0,0,0,3]],"month":[[0,4,2],[1,4,2],[2,4,21],[3,4,8],[4,4,1],[5,4,2],[6,4,4],[7,4,6],[8,4,6],[9,4,4],[10,4,2],[11,4,11],[12,4,7],[13,4,11],[14,4,1],[15,4,2],[16,4,8],[17,4,15],[18,4,9],[19,4,9],[20,4,21],[21,4,2],[22,4,3],[23,4,5],[24,1,1],[24,4,23],[25,4,8],[26,4,8],[27,4,7],[28,4,4],[29,4,11],[30,4,4],[31,4,4],[32,4,8],[33,4,3],[34,4,3],[35,3,1],[36,3,1],[36,4,16],[37,4,42],[38,4,18],[39,4,10],[40,4,9],[41,3,1],[42,4,1],[43,4,1],[44,3,6],[45,3,43],[45,4,3],[46,3,22],[46,4,16],[47,3,3],[47,4,17],[48,4,18],[49,0,1],[49,1,1],[49,4,15],[50,4,14],[51,4,19],[52,4,37],[53,0,1],[53,3,1],[53,4,26],[54,0,1],[54,3,4],[55,1,1],[55,3,32],[55,4,2],[56,0,1],[56,3,33],[56,4,4],[57,3,4],[57,4,7],[58,3,4],[58,4,5],[59,4,22],[60,3,12],[60,4,29],[61,3,10],[61,4,1],[62,4,1],[63,4,1],[64,4,2],[65,0,2],[65,3,3],[65,4,157],[66,0,3],[66,1,1],[66,4,13],[67,0,1],[67,1,1],[67,3,14],[67,4,3],[68,0,3],[68,3,19],[68,4,1],[69,3,2],[70,0,1],[70,3,4],[70,4,23],[71,3,2],[71,4,8],[72,1,1],[72,3,1],[72,4,37],[73,3,2],[73,4,12],[73,5,1],[74,4,12],[74,5,2],[75,0,5],[75,1,3],[75,3,16],[75,4,86],[76,0,1],[76,1,1],[76,2,5],[76,4,28],[77,0,2],[77,1,2],[77,3,3],[77,4,3],[78,3,2],[78,4,19],[78,5,1],[79,0,1],[79,4,3],[80,1,2],[80,4,13],[81,4,1],[82,4,2],[83,1,3],[83,2,5],[83,3,1],[83,4,111],[84,1,2],[84,2,5],[84,3,28],[84,4,23],[85,3,5],[85,4,2],[86,4,2],[87,1,1],[87,3,1],[87,4,3],[88,4,18],[89,4,5],[90,4,10],[91,3,1],[91,4,22],[92,4,26]]},"2000":{"lat":[-1.26662,-1.23967,-1.21272,-1.26662,-1.15882,-1.13187,-1.15882,-1.13187,-1.10492,-1.07797,-1.29357,-1.26662,-1.23967,-1.10492,-1.07797,-1.32052,-1.29357,-1.26662,-1.23967,-1.07797,-1.05102,-1.40137,-1.37442,-1.34747,-1.32052,-1.29357,-1.26662,-1.48221,-1.45526,-1.42831,-1.40137,-1.37442,-1.34747,-1.32052,-1.15882,-1.48221,-1.45526,-1.42831,-1.40137,-1.37442,-1.48221,-1.45526,-1.40137,-1.42831,-1.40137],"lng":[-48.57584,-48.56027,-48.54471,-48.54471,-48.48245,-48.46689,-48.45132,-48.43576,-48.42019,-48.40463,-48.49802,-48.48245,-48.46689,-48.38907,-48.3735,-48.48245,-48.46689,-48.45132,-48.43576,-48.34237,-48.32681,-48.49802,-48.48245,-48.46689,-48.45132,-48.43576,-48.42019,-48.51358,-48.49802,-48.48245,-48.46689,-48.45132,-48.43576,-48.42019,-48.32681,-48.48245,-48.46689,-48.45132,-48.43576,-48.42019,-48.45132,-48.43576,-48.40463,-48.38907,-48.3735],"count":[3,6,1,24,5,2,6,11,19,2,8,14,4,9,3,19,44,36,2,6,1,22,27,85,48,1,3,5,106,144,63,83,71,8,1,191,233,42,34,30,41,40,55,8,1],"district":[[0,0,0,0,0,0,3,0,0],[0,0,0,0,0,0,6,0,0],[0,0,0,0,0,0,1,0,0],[0,0,0,0,0,0,19,0,5],[0,0,0,0,0,0,0,5,0],[0,0,0,0,0,0,0,2,0],[0,0,0,0,0,0,0,6,0],[0,0,0,0,0,0,0,11,0],[0,0,0,0,0,0,0,18,1],[0,0,0,0,0,0,0,1,1],[0,0,0,8,0,0,0,0,0],[0,0,0,0,0,0,14,0,0],[0,0,0,0,0,0,4,0,0],[0,0,0,0,0,0,0,9,0],[0,0,0,0,0,0,0,3,0],[0,0,0,17,0,2,0,0,0],[0,0,0,27,1,0,4,0,12],[0,0,0,0,0,0,21,0,15],[0,0,0,0,0,0,2,0,0],[0,0,0,0,0,0,0,6,0],[0,0,0,0,0,0,0,1,0],[0,0,18,0,0,0,0,0,4],[0,0,0,0,0,24,0,0,3],[0,0,0,0,0,71,0,0,14],[0,0,0,42,0,0,0,0,6],[0,0,0,1,0,0,0,0,0],[0,0,0,0,0,0,2,0,1],[0,5,0,0,0,0,0,0,0],[0,57,0,1,30,0,0,1,17],[0,0,110,0,1,0,0,0,33],[21,0,31,0,0,0,0,0,11],[0,0,1,0,0,70,0,0,12],[0,0,0,0,1,59,0,0,11],[0,0,0,6,0,0,0,0,2],[0,0,0,0,0,0,0,1,0],[0,162,0,0,2,0,0,0,27],[0,155,1,0,16,0,0,0,61],[21,1,8,0,4,0,0,0,8],[23,0,0,0,0,1,0,0,10],[0,0,0,0,1,23,0,0,6],[0,26,0,0,0,0,0,0,15],[0,32,0,0,0,0,0,0,8],[44,0,0,0,0,0,0,0,11],[6,0,0,0,0,0,0,0,2],[0,0,0,0,0,0,0,0,1]],"month":[[0,4,3],[1,4,6],[2,4,1],[3,4,24],[4,4,5],[5,4,2],[6,4,6],[7,4,11],[8,4,19],[9,4,2],[10,4,8],[11,4,14],[12,4,4],[13,4,9],[14,4,3],[15,4,19],[16,1,1],[16,4,43],[17,4,36],[18,4,2],[19,4,6],[20,4,1],[21,3,13],[21,4,9],[22,3,1],[22,4,26],[23,1,1],[23,4,84],[24,3,1],[24,4,47],[25,4,1],[26,4,3],[27,4,5],[28,0,4],[28,3,1],[28,4,101],[29,0,3],[29,1,2],[29,3,132],[29,4,7],[30,3,29],[30,4,34],[31,1,1],[31,3,10],[31,4,72],[32,0,1],[32,3,22],[32,4,47],[32,5,1],[33,4,8],[34,4,1],[35,0,5],[35,1,2],[35,3,19],[35,4,163],[35,5,2],[36,0,6],[36,1,8],[36,2,15],[36,3,17],[36,4,187],[37,0,2],[37,3,13],[37,4,26],[37,5,1],[38,0,2],[38,1,3],[38,3,3],[38,4,26],[39,3,2],[39,4,28],[40,1,2],[40,3,1],[40,4,38],[41,3,16],[41,4,24],[42,3,1],[42,4,54],[43,4,8],[44,4,1]]}},"gaps":null,"coverage":{"total":1567,"expected":8000,"coverage":19.6,"missing":6433,"undated":0,"cellSize":500,"districts":[{"district":"DAENT","points":115,"share":7.3,"cells":25},{"district":"DAGUA","points":438,"share":28.0,"cells":31},{"district":"DASAC","points":169,"share":10.8,"cells":29},{"district":"DAICO","points":102,"share":6.5,"cells":30},{"district":"DABEL","points":56,"share":3.6,"cells":22},{"district":"DABEN","points":250,"share":16.0,"cells":45},{"district":"DAOUT","points":76,"share":4.9,"cells":26},{"district":"DAMOS","points":64,"share":4.1,"cells":27},{"district":"Outros","points":297,"share":19.0,"cells":111}],"groups":["DAENT","DAGUA","DASAC","DAICO","DABEL","DABEN","DAOUT","DAMOS","Outros"],"months":[{"month":"2025-03","counts":[0,0,0,0,0,0,0,0,23],"total":23,"cumulative":23,"coverage":0.3},{"month":"2025-04","counts":[0,0,0,0,0,0,0,0,20],"total":20,"cumulative":43,"coverage":0.5},{"month":"2025-07","counts":[0,0,0,0,0,0,0,0,15],"total":15,"cumulative":58,"coverage":0.7},{"month":"2025-08","counts":[5,37,145,1,0,30,0,0,63],"total":281,"cumulative":339,"coverage":4.2},{"month":"2025-09","counts":[109,399,24,101,56,219,76,64,176],"total":1224,"cumulative":1563,"coverage":19.5},{"month":"2025-10","counts":[1,2,0,0,0,1,0,0,0],"total":4,"cumulative":1567,"coverage":19.6}]}};
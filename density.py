@@ -0,0 +1,208 @@
+import os
+import math
+import numpy as np
+import pandas as pd
+from spatial_index import METERS_PER_DEG_LAT
+from map_tiles import DISTRICTS, decode_column
+from districts import load_index, DISTRICTS_GEOJSON, DISTRICT_NAME_KEYS
+
+# Precomputed point density for the map heatmap and the coverage tables of the
+# report: points are binned into hexagons of several sizes with NumPy and
+# counted per cell, health district and submission month, so the browser only
+# draws ready-made cells. With the district boundaries (districts.py) the
+# empty hexagons inside each district are listed as coverage gaps.
+
+# Configuration
+HEX_SIZES_M = (250, 500, 1000, 2000)        # Hexagon side (centre to corner), finest first
+REF_LAT = -1.45                             # Latitude of the local projection (Belém)
+COVERAGE_SIZE_M = 500                       # Hexagon size of the area coverage and gap layer
+EXPECTED_ESTABLISHMENTS = 8000              # Project estimate of artisanal açaí stalls in Belém
+EXPECTED_FILE = 'estimativa_distritos.csv'  # Optional per-district estimate ("distrito;estimativa", like the KoBo CSV)
+OTHER = 'Outros'                            # Points without one of the DISTRICTS
+
+SQRT3 = math.sqrt(3.0)
+DLAT = 1.0 / METERS_PER_DEG_LAT                                  # Degrees per metre
+DLNG = 1.0 / (METERS_PER_DEG_LAT * math.cos(math.radians(REF_LAT)))
+
+def hex_cells(lats, lngs, size_m):
+    """
+    Axial coordinates (q, r) of the pointy-top hexagon of side `size_m`
+    containing each point, on a local equirectangular projection.
+    """
+    x = np.asarray(lngs, dtype=float) / DLNG
+    y = np.asarray(lats, dtype=float) / DLAT
+    q = (SQRT3 / 3 * x - y / 3) / size_m
+    r = (2.0 / 3 * y) / size_m
+    # Cube rounding: round all three coordinates and fix the one that moved most
+    s = -q - r
+    rq, rr, rs = np.rint(q), np.rint(r), np.rint(s)
+    dq, dr, ds = np.abs(rq - q), np.abs(rr - r), np.abs(rs - s)
+    fix_q = (dq > dr) & (dq > ds)
+    fix_r = ~fix_q & (dr > ds)
+    rq = np.where(fix_q, -rr - rs, rq)
+    rr = np.where(fix_r, -rq - rs, rr)
+    return rq.astype(np.int64), rr.astype(np.int64)
+
+def hex_centres(q, r, size_m):
+    """
+    Latitude and longitude of the centres of axial cells (q, r).
+    """
+    x = size_m * SQRT3 * (q + r / 2.0)
+    y = size_m * 1.5 * r
+    return y * DLAT, x * DLNG
+
+def hex_area_km2(size_m):
+    return 1.5 * SQRT3 * size_m ** 2 / 1e6
+
+def density_layer(lats, lngs, district_idx, month_idx, size_m):
+    """
+    One heatmap layer: occupied cells with their centre, total count, counts
+    per district (DISTRICTS + OTHER) and sparse [cell, month, count] triples.
+    """
+    q, r = hex_cells(lats, lngs, size_m)
+    # One int64 key per cell: a 1-D unique is much faster than unique(axis=0)
+    r0, width = r.min(), int(np.ptp(r)) + 1
+    keys, inverse, counts = np.unique((q - q.min()) * width + (r - r0), return_inverse=True, return_counts=True)
+    first = np.zeros(len(keys), dtype=np.int64)
+    first[inverse] = np.arange(len(inverse))
+    n_cells = len(keys)
+    by_district = np.zeros((n_cells, len(DISTRICTS) + 1), dtype=np.int64)
+    np.add.at(by_district, (inverse, district_idx), 1)
+
+    dated = month_idx >= 0
+    n_months = int(month_idx.max()) + 1 if dated.any() else 1
+    pairs, month_counts = np.unique(inverse[dated] * n_months + month_idx[dated], return_counts=True)
+    centre_lat, centre_lng = hex_centres(q[first], r[first], size_m)
+    return {
+        "lat": np.round(centre_lat, 5).tolist(),
+        "lng": np.round(centre_lng, 5).tolist(),
+        "count": counts.tolist(),
+        "district": by_district.tolist(),
+        "month": [[int(c), int(m), int(n)] for c, m, n in zip(pairs // n_months, pairs % n_months, month_counts)],
+    }
+
+def district_cells(size_m, path=DISTRICTS_GEOJSON):
+    """
+    Every hexagon whose centre lies inside a district boundary, as
+    (q, r, district name) arrays. None when the boundary file is missing.
+    """
+    index = load_index(path, DISTRICT_NAME_KEYS)
+    if index is None or not len(index.edges):
+        return None
+    corners_q, corners_r = hex_cells([index.y0, index.y0, index.y1, index.y1],
+                                     [index.x0, index.x1, index.x0, index.x1], size_m)
+    # q and r are linear in lat/lng, so the bbox corners bound the cell range
+    q_range = np.arange(corners_q.min() - 1, corners_q.max() + 2)
+    r_range = np.arange(corners_r.min() - 1, corners_r.max() + 2)
+    q, r = (a.ravel() for a in np.meshgrid(q_range, r_range))
+    lats, lngs = hex_centres(q, r, size_m)
+    inside = (lats >= index.y0) & (lats <= index.y1) & (lngs >= index.x0) & (lngs <= index.x1)
+    q, r, lats, lngs = q[inside], r[inside], lats[inside], lngs[inside]
+    names = index.names_for(lats, lngs)
+    keep = pd.notna(names)
+    return q[keep], r[keep], np.array([str(n).strip().upper() for n in names[keep]], dtype=object)
+
+def load_expected(path=EXPECTED_FILE):
+    """
+    Per-district estimate of establishments ({district: count}), if provided.
+    """
+    if not os.path.exists(path):
+        return {}
+    df = pd.read_csv(path, sep=';', dtype={'distrito': str})
+    values = pd.to_numeric(df['estimativa'], errors='coerce')
+    return {d.strip().upper(): int(v) for d, v in zip(df['distrito'], values) if pd.notna(v)}
+
+def coverage_tables(lats, lngs, district_idx, month_idx, months, area=None,
+                    expected_total=EXPECTED_ESTABLISHMENTS):
+    """
+    Tables for the report: overall coverage of the estimate, one row per
+    district and one row per submission month (counts per district).
+    `area` is the output of district_cells(COVERAGE_SIZE_M), if available.
+    """
+    groups = DISTRICTS + [OTHER]
+    total = len(district_idx)
+    per_district = np.bincount(district_idx, minlength=len(groups))
+    expected = load_expected()
+
+    q, r = hex_cells(lats, lngs, COVERAGE_SIZE_M)
+    occupied = {}
+    for d in range(len(groups)):
+        mask = district_idx == d
+        occupied[groups[d]] = len(set(zip(q[mask].tolist(), r[mask].tolist())))
+
+    area_cells = {}
+    if area is not None:
+        point_cells = set(zip(q.tolist(), r.tolist()))
+        for cq, cr, name in zip(*area):
+            seen, covered = area_cells.get(name, (0, 0))
+            area_cells[name] = (seen + 1, covered + ((int(cq), int(cr)) in point_cells))
+
+    districts = []
+    for d, name in enumerate(groups):
+        row = {
+            "district": name, "points": int(per_district[d]),
+            "share": round(100.0 * float(per_district[d]) / total, 1) if total else 0.0,
+            "cells": occupied[name],
+        }
+        if name in area_cells:
+            cells, covered = area_cells[name]
+            row["area_km2"] = round(cells * hex_area_km2(COVERAGE_SIZE_M), 1)
+            row["area_covered"] = round(100.0 * covered / cells, 1)
+        if name in expected:
+            row["expected"] = expected[name]
+            row["coverage"] = round(100.0 * per_district[d] / expected[name], 1) if expected[name] else None
+        districts.append(row)
+
+    by_month = np.zeros((len(months), len(groups)), dtype=np.int64)
+    dated = month_idx >= 0
+    np.add.at(by_month, (month_idx[dated], district_idx[dated]), 1)
+    cumulative = np.cumsum(by_month.sum(axis=1))
+    monthly = [{
+        "month": month, "counts": by_month[m].tolist(), "total": int(by_month[m].sum()),
+        "cumulative": int(cumulative[m]),
+        "coverage": round(100.0 * cumulative[m] / expected_total, 1) if expected_total else None,
+    } for m, month in enumerate(months)]
+
+    return {
+        "total": total, "expected": expected_total,
+        "coverage": round(100.0 * total / expected_total, 1) if expected_total else None,
+        "missing": max(expected_total - total, 0),
+        "undated": int((~dated).sum()),
+        "cellSize": COVERAGE_SIZE_M,
+        "districts": districts, "groups": groups, "months": monthly,
+    }
+
+def build_density(data, sizes=HEX_SIZES_M):
+    """
+    Heatmap layers and coverage tables for a columnar map payload
+    (generate_site.build_map_data).
+    """
+    lats = np.asarray(data['lat'], dtype=float)
+    lngs = np.asarray(data['lng'], dtype=float)
+    lookup = {d: i for i, d in enumerate(DISTRICTS)}
+    district_idx = np.array([lookup.get(d, len(DISTRICTS)) for d in decode_column(data, 'district')], dtype=np.int64)
+    month_keys = np.array([d[:7] if d and len(d) >= 7 else '' for d in decode_column(data, 'date')], dtype=object)
+    months = sorted(set(month_keys) - {''})
+    month_lookup = {m: i for i, m in enumerate(months)}
+    month_idx = np.array([month_lookup.get(m, -1) for m in month_keys], dtype=np.int64)
+
+    layers = {str(size): density_layer(lats, lngs, district_idx, month_idx, size) for size in sizes} if len(lats) else {}
+
+    gaps = None
+    area = district_cells(COVERAGE_SIZE_M)
+    if area is not None:
+        q, r, _ = area
+        point_cells = set(zip(*(a.tolist() for a in hex_cells(lats, lngs, COVERAGE_SIZE_M))))
+        empty = np.array([(cq, cr) not in point_cells for cq, cr in zip(q.tolist(), r.tolist())], dtype=bool)
+        gap_lat, gap_lng = hex_centres(q[empty], r[empty], COVERAGE_SIZE_M)
+        gaps = {"size": COVERAGE_SIZE_M, "lat": np.round(gap_lat, 5).tolist(), "lng": np.round(gap_lng, 5).tolist()}
+
+    return {
+        "sizes": [s for s in sizes if str(s) in layers],
+        "degPerMetre": [DLAT, DLNG],
+        "districts": DISTRICTS + [OTHER],
+        "months": months,
+        "layers": layers,
+        "gaps": gaps,
+        "coverage": coverage_tables(lats, lngs, district_idx, month_idx, months, area),
+    }
@@ -0,0 +1,194 @@
+import os
+import json
+import numpy as np
+import pandas as pd
+
+# Assign health district and official bairro to every point by point-in-polygon
+# tests against local boundary files (no API calls).
+
+# Configuration
+DISTRICTS_GEOJSON = 'distritos_saude.geojson'
+BAIRROS_GEOJSON = 'bairros_belem.geojson'
+DISTRICT_COLUMN = 'Qual o distrito de saúde?'
+OFFICIAL_DISTRICT_COLUMN = 'Distrito_Oficial'
+OFFICIAL_BAIRRO_COLUMN = 'Bairro_Oficial'
+# Feature properties tried, in order, for the polygon name
+DISTRICT_NAME_KEYS = ('sigla', 'SIGLA', 'distrito', 'DISTRITO', 'nome', 'NOME', 'name')
+BAIRRO_NAME_KEYS = ('nome', 'NOME', 'bairro', 'BAIRRO', 'NM_BAIRRO', 'name')
+N_BANDS = 512  # Horizontal bands of the edge index
+
+def _feature_name(props, keys):
+    for key in keys:
+        if props.get(key):
+            return str(props[key]).strip()
+    return None
+
+class PolygonIndex:
+    """
+    Vectorized point-in-polygon lookup for a set of named (multi)polygons.
+
+    Every ring edge is stored in the horizontal bands its latitude range
+    covers. A point is tested only against the edges of its band with the
+    even-odd ray-casting rule, so holes and multipolygons need no special case.
+    """
+
+    def __init__(self, names, polygons, n_bands=N_BANDS):
+        # polygons: list (one per name) of lists of rings, each ring an (n, 2) array of (lng, lat)
+        self.names = np.array(list(names) + [None], dtype=object)
+        self.n_bands = n_bands
+        edges, owners = [], []
+        for pid, rings in enumerate(polygons):
+            for ring in rings:
+                ring = np.asarray(ring, dtype=float)
+                if len(ring) < 3:
+                    continue
+                nxt = np.roll(ring, -1, axis=0)
+                edges.append(np.hstack([ring, nxt]))
+                owners.append(np.full(len(ring), pid))
+        self.n_polygons = len(polygons)
+        if not edges:
+            self.edges = np.empty((0, 4))
+            self.owners = np.empty(0, dtype=np.int64)
+            self.y0 = self.y1 = 0.0
+            self.bands = []
+            return
+
+        self.edges = np.vstack(edges)            # x1, y1, x2, y2
+        self.owners = np.concatenate(owners)
+        ys = self.edges[:, [1, 3]]
+        self.y0, self.y1 = float(ys.min()), float(ys.max())
+        self.x0, self.x1 = float(self.edges[:, [0, 2]].min()), float(self.edges[:, [0, 2]].max())
+        self.band_height = (self.y1 - self.y0) / n_bands or 1.0
+        lo = self._band(ys.min(axis=1))
+        hi = self._band(ys.max(axis=1))
+        self.bands = [[] for _ in range(n_bands)]
+        for e, (a, b) in enumerate(zip(lo, hi)):
+            for band in range(a, b + 1):
+                self.bands[band].append(e)
+        self.bands = [np.asarray(b, dtype=np.int64) for b in self.bands]
+
+    def _band(self, y):
+        band = ((np.asarray(y) - self.y0) / self.band_height).astype(np.int64)
+        return np.clip(band, 0, self.n_bands - 1)
+
+    @classmethod
+    def from_geojson(cls, path, name_keys):
+        with open(path, 'r', encoding='utf-8') as f:
+            collection = json.load(f)
+        names, polygons = [], []
+        for feature in collection.get('features', []):
+            geom = feature.get('geometry') or {}
+            if geom.get('type') == 'Polygon':
+                rings = geom['coordinates']
+            elif geom.get('type') == 'MultiPolygon':
+                rings = [ring for poly in geom['coordinates'] for ring in poly]
+            else:
+                continue
+            names.append(_feature_name(feature.get('properties') or {}, name_keys))
+            polygons.append([np.asarray(r, dtype=float)[:, :2] for r in rings])
+        return cls(names, polygons)
+
+    def locate(self, lats, lngs):
+        """
+        Index of the polygon containing each point (-1 if none), as a NumPy array.
+        """
+        py = np.asarray(lats, dtype=float)
+        px = np.asarray(lngs, dtype=float)
+        result = np.full(len(py), -1, dtype=np.int64)
+        if not len(self.edges):
+            return result
+
+        inside_bbox = (py >= self.y0) & (py <= self.y1) & (px >= self.x0) & (px <= self.x1)
+        candidates = np.nonzero(inside_bbox)[0]
+        bands = self._band(py[candidates])
+        order = np.argsort(bands, kind='stable')
+        candidates, bands = candidates[order], bands[order]
+        starts = np.searchsorted(bands, np.arange(self.n_bands + 1))
+
+        for band, edge_ids in enumerate(self.bands):
+            pts = candidates[starts[band]:starts[band + 1]]
+            if not len(pts) or not len(edge_ids):
+                continue
+            x1, y1, x2, y2 = (self.edges[edge_ids, k][None, :] for k in range(4))
+            y = py[pts][:, None]
+            x = px[pts][:, None]
+            spans = (y1 > y) != (y2 > y)
+            with np.errstate(divide='ignore', invalid='ignore'):
+                x_cross = x1 + (y - y1) * (x2 - x1) / (y2 - y1)
+            crossings = spans & (x < x_cross)
+            # Crossings per polygon; odd = inside
+            counts = np.zeros((len(pts), self.n_polygons), dtype=np.int64)
+            np.add.at(counts, (slice(None), self.owners[edge_ids]), crossings.astype(np.int64))
+            inside = counts % 2 == 1
+            hit = inside.any(axis=1)
+            result[pts[hit]] = inside[hit].argmax(axis=1)
+        return result
+
+    def names_for(self, lats, lngs):
+        return self.names[self.locate(lats, lngs)]
+
+_INDEXES = {}
+
+def load_index(path, name_keys):
+    """
+    PolygonIndex of a boundary file, built once per file version (path and mtime).
+    Returns None if the file does not exist.
+    """
+    try:
+        mtime = os.stat(path).st_mtime_ns
+    except OSError:
+        return None
+    key = (os.path.abspath(path), tuple(name_keys))
+    cached = _INDEXES.get(key)
+    if cached is None or cached[0] != mtime:
+        _INDEXES[key] = (mtime, PolygonIndex.from_geojson(path, name_keys))
+    return _INDEXES[key][1]
+
+def locate_areas(lats, lngs, districts_path=DISTRICTS_GEOJSON, bairros_path=BAIRROS_GEOJSON):
+    """
+    Official district / bairro of each point, one column per boundary file found.
+    Points outside every polygon get None. Returns an empty frame if no file exists.
+    """
+    lats = pd.to_numeric(pd.Series(lats), errors='coerce').to_numpy()
+    lngs = pd.to_numeric(pd.Series(lngs), errors='coerce').to_numpy()
+    areas = pd.DataFrame(index=range(len(lats)))
+    for column, path, keys in ((OFFICIAL_DISTRICT_COLUMN, districts_path, DISTRICT_NAME_KEYS),
+                               (OFFICIAL_BAIRRO_COLUMN, bairros_path, BAIRRO_NAME_KEYS)):
+        index = load_index(path, keys)
+        if index is not None:
+            areas[column] = index.names_for(lats, lngs)
+    return areas
+
+def assign_districts(df, lat_col='_Localização_latitude', lng_col='_Localização_longitude'):
+    """
+    Add the official district/bairro columns to `df` (in place) and fill empty
+    answers of the KoBo district question with the official district.
+    Returns the list of columns added.
+    """
+    areas = locate_areas(df[lat_col], df[lng_col])
+    for column in areas.columns:
+        df[column] = areas[column].to_numpy()
+    if OFFICIAL_DISTRICT_COLUMN in areas.columns and DISTRICT_COLUMN in df.columns:
+        answer = df[DISTRICT_COLUMN]
+        empty = answer.isna() | (answer.astype(str).str.strip() == '')
+        df.loc[empty, DISTRICT_COLUMN] = df.loc[empty, OFFICIAL_DISTRICT_COLUMN]
+    return list(areas.columns)
+
+if __name__ == '__main__':
+    # Usage: python districts.py [kobo_export.csv]
+    # Reports how many submissions fall in each official district / bairro.
+    import sys
+    from generate_site import MAP_SOURCE_CSV
+    source = sys.argv[1] if len(sys.argv) > 1 else MAP_SOURCE_CSV
+    if not os.path.exists(source):
+        print(f"Error: {source} not found.")
+        sys.exit(1)
+    df = pd.read_csv(source, delimiter=';', dtype=str,
+                     usecols=['_Localização_latitude', '_Localização_longitude', DISTRICT_COLUMN])
+    added = assign_districts(df)
+    if not added:
+        print(f"Error: no boundary file found ({DISTRICTS_GEOJSON}, {BAIRROS_GEOJSON}).")
+        sys.exit(1)
+    for column in added:
+        print(f"\n{column}:")
+        print(df[column].fillna('(fora dos limites)').value_counts().to_string())
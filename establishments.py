@@ -0,0 +1,158 @@
+import os
+import re
+import sys
+import numpy as np
+import pandas as pd
+from spatial_index import GridIndex, haversine_m
+from checkpoint import submission_keys
+from text_utils import tokenize
+
+# The KoBo export has every version of every submission, and the same stall is
+# often registered more than once by different ACSs with small spelling changes
+# ("Açaí do Zé" / "Acai do Ze"). Nearby records with a similar name or the same
+# phone are grouped into one establishment.
+
+# Configuration
+DUPLICATE_RADIUS_M = 30     # Only records closer than this are compared
+NAME_THRESHOLD = 0.6        # Trigram similarity above which two names are the same stall
+ESTABLISHMENT_COLUMN = 'Estabelecimento_ID'
+CANONICAL_COLUMN = 'Registro_Canonico'
+NAME_COLUMN = 'Nome do ponto de venda ou do proprietário'
+PHONE_COLUMN = 'Telefone de contato'
+# Words present in most stall names; they say nothing about which stall it is
+GENERIC_WORDS = {
+    'acai', 'acaiteria', 'ponto', 'venda', 'batedeira', 'batedor', 'barraca', 'banca',
+    'do', 'da', 'de', 'dos', 'das', 'e', 'o', 'a', 'seu', 'dona', 'sr', 'sra',
+}
+NON_DIGIT_RE = re.compile(r'\D+')
+
+def normalize_name(name):
+    """
+    Accent-folded name without generic words: "Açaí do Zé" -> "ze".
+    """
+    tokens = tokenize(name)
+    specific = [t for t in tokens if t not in GENERIC_WORDS]
+    return ' '.join(specific)
+
+def normalize_phone(phone):
+    """
+    Last 8 digits of the number, so "(91) 99250-5291", "91-992505291" and
+    "+55 91 9250-5291" compare equal. Numbers with fewer than 8 digits are ignored.
+    """
+    if not isinstance(phone, str):
+        return ''
+    digits = NON_DIGIT_RE.sub('', phone)
+    return digits[-8:] if len(digits) >= 8 else ''
+
+def trigrams(text):
+    padded = f"  {text} "
+    return {padded[i:i + 3] for i in range(len(padded) - 2)}
+
+def name_similarity(a, b):
+    """
+    Jaccard similarity of the character trigrams of two trigram sets.
+    """
+    if not a or not b:
+        return 0.0
+    return len(a & b) / len(a | b)
+
+class _UnionFind:
+    def __init__(self, n):
+        self.parent = np.arange(n)
+
+    def find(self, i):
+        root = i
+        while self.parent[root] != root:
+            root = self.parent[root]
+        while self.parent[i] != root:
+            self.parent[i], i = root, self.parent[i]
+        return root
+
+    def union(self, i, j):
+        ri, rj = self.find(i), self.find(j)
+        if ri != rj:
+            self.parent[max(ri, rj)] = min(ri, rj)
+
+def is_same_establishment(name_a, name_b, phone_a, phone_b, threshold=NAME_THRESHOLD):
+    """
+    Same phone -> same stall. Different phones veto unless the names are
+    identical; otherwise the (non-generic) names must be similar enough.
+    """
+    if phone_a and phone_a == phone_b:
+        return True
+    names_equal = bool(name_a[0]) and name_a[0] == name_b[0]
+    if phone_a and phone_b:
+        return names_equal
+    return names_equal or name_similarity(name_a[1], name_b[1]) >= threshold
+
+def find_establishments(df, radius_m=DUPLICATE_RADIUS_M, threshold=NAME_THRESHOLD):
+    """
+    Group the rows of a KoBo DataFrame into establishments.
+    Only pairs within `radius_m` (found through a grid index) are compared, so
+    the cost grows with n times the local density rather than n^2.
+    Returns an array with, for every row position, the position of the
+    canonical record of its establishment (the most recent submission).
+    """
+    n = len(df)
+    lats = pd.to_numeric(df['_Localização_latitude'], errors='coerce').to_numpy()
+    lngs = pd.to_numeric(df['_Localização_longitude'], errors='coerce').to_numpy()
+    valid = ~np.isnan(lats) & ~np.isnan(lngs) & ~((lats == 0) & (lngs == 0))
+
+    raw_names = df[NAME_COLUMN] if NAME_COLUMN in df.columns else pd.Series('', index=df.index)
+    raw_phones = df[PHONE_COLUMN] if PHONE_COLUMN in df.columns else pd.Series('', index=df.index)
+    names = [normalize_name(v) for v in raw_names.tolist()]
+    name_keys = [(name, trigrams(name) if name else set()) for name in names]
+    phones = [normalize_phone(v) for v in raw_phones.tolist()]
+
+    groups = _UnionFind(n)
+    grid = GridIndex(radius_m)
+    for i in np.nonzero(valid)[0].tolist():
+        lat, lng = lats[i], lngs[i]
+        for j in grid.nearby(lat, lng):
+            if (haversine_m(lat, lng, lats[j], lngs[j]) <= radius_m
+                    and is_same_establishment(name_keys[i], name_keys[j], phones[i], phones[j], threshold)):
+                groups.union(i, j)
+        grid.insert(lat, lng, i)
+
+    roots = np.array([groups.find(i) for i in range(n)])
+
+    # Canonical record: latest submission of the group (first row on ties/missing dates)
+    if '_submission_time' in df.columns:
+        times = pd.to_datetime(df['_submission_time'], errors='coerce').to_numpy()
+        recency = np.argsort(np.argsort(times, kind='stable'), kind='stable')  # NaT sorts last
+        recency[pd.isna(times)] = -1
+    else:
+        recency = np.zeros(n, dtype=np.int64)
+    order = np.lexsort((np.arange(n), -recency, roots))  # by group, newest first
+    first = np.ones(n, dtype=bool)
+    first[1:] = roots[order][1:] != roots[order][:-1]
+    canonical_of_root = dict(zip(roots[order][first].tolist(), order[first].tolist()))
+    return np.array([canonical_of_root[r] for r in roots.tolist()], dtype=np.int64)
+
+def tag_establishments(df, canonical):
+    """
+    Add the establishment id (submission key of the canonical record) and the
+    canonical flag to `df` in place.
+    """
+    records = np.unique(canonical)
+    key_of = dict(zip(records.tolist(), submission_keys(df.iloc[records])))
+    df[ESTABLISHMENT_COLUMN] = [key_of[c] for c in canonical.tolist()]
+    df[CANONICAL_COLUMN] = canonical == np.arange(len(df))
+
+if __name__ == '__main__':
+    # Usage: python establishments.py [kobo_export.csv]
+    # Reports the duplicate groups found in the KoBo export.
+    from process_locations import INPUT_CSV
+    source = sys.argv[1] if len(sys.argv) > 1 else INPUT_CSV
+    if not os.path.exists(source):
+        print(f"Error: {source} not found.")
+        sys.exit(1)
+    df = pd.read_csv(source, delimiter=';', dtype=str)
+    canonical = find_establishments(df)
+    tag_establishments(df, canonical)
+    sizes = df[ESTABLISHMENT_COLUMN].value_counts()
+    print(f"{len(df)} submissions -> {len(sizes)} establishments "
+          f"({int((sizes > 1).sum())} registered more than once, {len(df) - len(sizes)} duplicate records).")
+    for key in sizes[sizes > 1].index[:15]:
+        group = df[df[ESTABLISHMENT_COLUMN] == key]
+        print(f"  {len(group)}x " + " | ".join(group[NAME_COLUMN].fillna('').astype(str).unique()[:4]))
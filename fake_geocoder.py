@@ -0,0 +1,87 @@
+import time
+import random
+import threading
+from googlemaps.exceptions import ApiError, Timeout, TransportError
+
+# Street/neighbourhood names used to build plausible Belém addresses
+STREETS = [
+    ("Tv.", "dos Tupinambás"), ("Av.", "Roberto Camelier"), ("R.", "São Miguel"),
+    ("Tv.", "Monte Alegre"), ("Av.", "Almirante Barroso"), ("Psg.", "São Pedro"),
+    ("R.", "dos Mundurucus"), ("Av.", "Pedro Miranda"), ("Tv.", "Padre Eutíquio"),
+    ("R.", "Timbiras"), ("Av.", "José Bonifácio"), ("Tv.", "Barão de Mamoré"),
+]
+BAIRROS = [
+    "Jurunas", "Guamá", "Condor", "Cremação", "Terra Firme", "Pedreira",
+    "Marco", "Sacramenta", "Telégrafo", "Batista Campos", "Cidade Velha", "Marambaia",
+]
+
+class FakeGeocodingClient:
+    """
+    Local stand-in for googlemaps.Client used for tests and benchmarks.
+    Responses are deterministic for a given coordinate and shaped like the
+    Google Geocoding API (formatted_address + address_components).
+    A fraction `error_rate` of the calls raises one of the errors the real
+    client raises (quota exceeded, timeout, connection failure).
+    """
+
+    def __init__(self, latency=0.05, seed=0, error_rate=0.0):
+        self.latency = latency
+        self.seed = seed
+        self.error_rate = error_rate
+        self.calls = 0
+        self.errors = 0
+        self.rnd = random.Random(seed)
+        self.lock = threading.Lock()
+
+    def _simulate_call(self):
+        # Count the call, wait `latency` and maybe fail, like a request to the API
+        with self.lock:
+            self.calls += 1
+            fail = self.error_rate and self.rnd.random() < self.error_rate
+            if fail:
+                self.errors += 1
+                error = self.rnd.choice([ApiError("OVER_QUERY_LIMIT"), Timeout(), TransportError("connection reset")])
+        if self.latency:
+            time.sleep(self.latency)
+        if fail:
+            raise error
+
+    def reverse_geocode(self, latlng, **kwargs):
+        self._simulate_call()
+        lat, lng = latlng
+        return [build_result(lat, lng, self.seed)]
+
+    def geocode(self, address, **kwargs):
+        """
+        Forward geocode: a deterministic point in Belém for each address
+        (case and spacing ignored), or no result for an empty one.
+        """
+        self._simulate_call()
+        text = ' '.join(str(address).casefold().split())
+        if not text:
+            return []
+        rnd = random.Random(f"{self.seed}:{text}")
+        lat = round(rnd.uniform(-1.48, -1.35), 6)
+        lng = round(rnd.uniform(-48.50, -48.42), 6)
+        return [build_result(lat, lng, self.seed)]
+
+def build_result(lat, lng, seed=0):
+    rnd = random.Random(f"{seed}:{round(lat, 6)}:{round(lng, 6)}")
+    prefix, street = rnd.choice(STREETS)
+    bairro = rnd.choice(BAIRROS)
+    number = str(rnd.randint(1, 3000))
+    cep = f"660{rnd.randint(10, 99)}-{rnd.randint(0, 999):03d}"
+    return {
+        "formatted_address": f"{prefix} {street}, {number} - {bairro}, Belém - PA, {cep}, Brazil",
+        "address_components": [
+            {"long_name": number, "short_name": number, "types": ["street_number"]},
+            {"long_name": f"{prefix} {street}", "short_name": f"{prefix} {street}", "types": ["route"]},
+            {"long_name": bairro, "short_name": bairro, "types": ["political", "sublocality", "sublocality_level_1"]},
+            {"long_name": "Belém", "short_name": "Belém", "types": ["administrative_area_level_2", "political"]},
+            {"long_name": "Pará", "short_name": "PA", "types": ["administrative_area_level_1", "political"]},
+            {"long_name": "Brazil", "short_name": "BR", "types": ["country", "political"]},
+            {"long_name": cep, "short_name": cep, "types": ["postal_code"]},
+        ],
+        "geometry": {"location": {"lat": lat, "lng": lng}, "location_type": "ROOFTOP"},
+        "types": ["street_address"],
+    }
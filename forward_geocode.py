@@ -0,0 +1,354 @@
+import os
+import re
+import time
+import uuid
+import argparse
+import numpy as np
+import pandas as pd
+import process_locations
+from process_locations import geocode_addresses, classify_coordinates, LAT_COLUMN, LNG_COLUMN, KOBO_COLUMNS, \
+    COORD_OUT_OF_BOUNDS, COORD_LABELS
+from geocode_cache import GeocodeCache
+from rate_limiter import TokenBucket
+from parse_addresses import parse_address_column
+from gazetteer import CITY_SUFFIX_RE, STREET_TYPES, STREET_TYPE_LABELS, canonical_city, load_gazetteers, street_key
+from establishments import NAME_COLUMN, PHONE_COLUMN
+from spatial_index import haversine_m
+from text_utils import fold_accents
+from metrics import METRICS, METRICS_DIR
+from table_io import find_table, intermediate_path, read_table, write_table
+
+# Forward geocoding (address -> coordinates) for the Visabelem.net
+# self-registrations, which arrive as typed addresses without GPS.
+# Addresses are normalized to the layout Google returns, deduplicated, looked
+# up in bulk and written in the layout of the process_locations output, so
+# parse_addresses.py and generate_site.py read them like the KoBo points.
+# Points far from the centroid of their CEP are flagged for checking.
+# Usage: python forward_geocode.py cadastros.csv --address-column Endereço [--append]
+
+# Configuration
+FORWARD_INPUT = 'cadastros_visabelem.csv'      # ';'-separated, one registration per row
+ADDRESS_COLUMN = 'Endereço'
+FORWARD_OUTPUT = intermediate_path('output_enderecos_cadastro')
+DEFAULT_CITY = 'Belém'
+CENTROID_SOURCE = find_table('output_enderecos')   # Reverse-geocoded points with a known CEP
+CEP_CENTROIDS_FILE = 'cep_centroides.csv'          # Optional "cep;lat;lng" reference, overrides the above
+CEP_MAX_DISTANCE_M = 1500      # Farther than this from the centroid of its CEP is suspicious
+SECTOR_MAX_DISTANCE_M = 5000   # Same, when only the 5-digit CEP sector has a centroid
+# Alternative names of the KoBo columns in the registration export
+COLUMN_ALIASES = {
+    NAME_COLUMN: ['Nome', 'Estabelecimento', 'Nome do estabelecimento'],
+    PHONE_COLUMN: ['Telefone', 'Contato'],
+    '_id': ['id', 'ID', 'Protocolo'],
+    '_submission_time': ['Data', 'Data do cadastro'],
+}
+TYPED_COLUMN = 'Endereço_Informado'
+NORMALIZED_COLUMN = 'Endereço_Normalizado'
+DISTANCE_COLUMN = 'Distancia_CEP_m'
+ALERT_COLUMN = 'Alerta_Localizacao'
+FAR_FROM_CEP = "Far from CEP centroid"
+
+CEP_RE = re.compile(r'(?:\bCEP\b[:.\s]*)?\b(\d{2})\.?(\d{3})[-\s]?(\d{3})\b', flags=re.IGNORECASE)
+STATE_TAIL_RE = re.compile(r'[\s,/-]+(?:PA|Par[aá])$', flags=re.IGNORECASE)
+COUNTRY_TAIL_RE = re.compile(r'[\s,-]*\bBra[sz]il$', flags=re.IGNORECASE)
+NUMBER_RE = re.compile(r'^(?:n[º°o]?\.?\s*)?(\d+[A-Za-z]?|s/?n)$', flags=re.IGNORECASE)
+NUMBER_TAIL_RE = re.compile(r'^(.*?)[\s,]+(?:n[º°o]?\.?\s*)?(\d+[A-Za-z]?|s/?n)$', flags=re.IGNORECASE)
+# A number after these words (or after a street type, "Rua 5") is not the house number
+NOT_HOUSE_NUMBER = {'km', 'quadra', 'qd', 'lote', 'lt', 'casa', 'bloco', 'bl', 'apto', 'ap'}
+PARTICLES = {'de', 'da', 'do', 'das', 'dos', 'e'}
+SEPARATORS = ' ,-'
+
+def smart_case(text, inner=False):
+    """
+    "TRAVESSA DOS TUPINAMBAS" / "travessa dos tupinambas" -> "Travessa dos Tupinambas".
+    Mixed-case text is kept as typed. With `inner`, `text` continues a name
+    (the words after the street type), so a leading particle stays lower case too.
+    """
+    if not (text.isupper() or text.islower()):
+        return text
+    words = text.lower().split()
+    return ' '.join(w if (i or inner) and w in PARTICLES else w[:1].upper() + w[1:] for i, w in enumerate(words))
+
+def split_house_number(text):
+    """
+    "Rua X 10" -> ("Rua X", "10"); (text, None) when it does not end in a
+    house number ("Rua 5", "Rodovia BR-316 km 5").
+    """
+    match = NUMBER_TAIL_RE.match(text)
+    before = fold_accents(match.group(1).split()[-1]).strip('.:') if match and match.group(1) else ''
+    if match and before not in NOT_HOUSE_NUMBER and before not in STREET_TYPES:
+        return match.group(1), match.group(2)
+    return text, None
+
+def normalize_street(street, gazetteer):
+    tokens = street.split()
+    if not tokens:
+        return street
+    street_type = STREET_TYPES.get(fold_accents(tokens[0]).rstrip('.:'))
+    if street_type is not None:
+        street = ' '.join([STREET_TYPE_LABELS[street_type], smart_case(' '.join(tokens[1:]), inner=True)]).strip()
+    else:
+        street = smart_case(street)
+    return gazetteer.lookup(street) or street
+
+def normalize_address(text, default_city=DEFAULT_CITY):
+    """
+    Split a typed address into the parse_address fields and rebuild it in the
+    layout Google uses ("Tv. Mauriti, 1020 - Marco, Belém - PA, 66093-180").
+    Street types are abbreviated like Google does, names are mapped to the
+    gazetteer spelling and the CEP is written as 00000-000.
+    Returns (query, fields), or (None, None) for an empty address.
+    """
+    if not isinstance(text, str) or not text.strip():
+        return None, None
+    rest = COUNTRY_TAIL_RE.sub('', ' '.join(text.split()))
+
+    cep = None
+    match = CEP_RE.search(rest)
+    if match:
+        cep = f"{match[1]}{match[2]}-{match[3]}"
+        rest = (rest[:match.start()] + ' ' + rest[match.end():]).strip(SEPARATORS)
+    rest = STATE_TAIL_RE.sub('', rest).strip(SEPARATORS)
+
+    city = default_city
+    match = CITY_SUFFIX_RE.search(rest)
+    if match and match.start() > 0:
+        city = canonical_city(match.group(0))
+        rest = rest[:match.start()].strip(SEPARATORS)
+
+    bairro = None
+    if ' - ' in rest:
+        rest, bairro = (part.strip(SEPARATORS) for part in rest.rsplit(' - ', 1))
+    parts = [part.strip() for part in rest.split(',') if part.strip()]
+    number = None
+    if len(parts) >= 3 and bairro is None and not NUMBER_RE.match(parts[-1]):
+        bairro = parts.pop()             # "Rua X, 10, Marco"
+    if len(parts) >= 2 and NUMBER_RE.match(parts[1]):
+        street, number = parts[0], NUMBER_RE.match(parts[1]).group(1)
+    else:
+        street, number = split_house_number(parts[0])
+        if number is not None:
+            if bairro is None and len(parts) > 1:
+                bairro = parts[-1]       # "Rua X 10, Marco"
+        else:
+            street, number = split_house_number(', '.join(parts))
+    if number is not None and number.lower().replace('/', '') == 'sn':
+        number = 's/n'
+
+    gazetteers = load_gazetteers()
+    street = normalize_street(street, gazetteers['Logradouro'])
+    if bairro:
+        bairro = gazetteers['Bairro'].lookup(bairro) or smart_case(bairro)
+
+    query = street + (f", {number}" if number else '') + (f" - {bairro}" if bairro else '')
+    query += f", {city} - PA" + (f", {cep}" if cep else '')
+    fields = {'Logradouro': street, 'Número': number, 'Bairro': bairro, 'Município': city,
+              'Estado': 'PA', 'CEP': cep, 'País': None}
+    return query, fields
+
+def cep_digits(values):
+    """
+    8-digit CEP strings ("66093-180" -> "66093180"); None where there is no full CEP.
+    """
+    digits = pd.Series(values, dtype=object).astype(str).str.replace(r'\D', '', regex=True)
+    return digits.where(digits.str.len() == 8)
+
+def load_cep_centroids(source=CENTROID_SOURCE, reference=CEP_CENTROIDS_FILE):
+    """
+    Median position of the known points of each CEP and of each 5-digit CEP
+    sector: {cep: (lat, lng)}, {sector: (lat, lng)}.
+    Points come from the reverse-geocoded output (CEP parsed from the Google
+    address) and from the optional reference file, which takes precedence.
+    """
+    frames = []
+    if source and os.path.exists(source):
+        df = read_table(source, columns=[LAT_COLUMN, LNG_COLUMN, 'Endereço_Google'])
+        frames.append(pd.DataFrame({
+            'lat': pd.to_numeric(df[LAT_COLUMN], errors='coerce'),
+            'lng': pd.to_numeric(df[LNG_COLUMN], errors='coerce'),
+            'cep': cep_digits(parse_address_column(df['Endereço_Google'])['CEP']),
+        }))
+    if reference and os.path.exists(reference):
+        ref = pd.read_csv(reference, delimiter=';', dtype=str)
+        ref.columns = [c.strip().lower() for c in ref.columns]
+        frames = [f[~f['cep'].isin(cep_digits(ref['cep']))] for f in frames]
+        frames.append(pd.DataFrame({
+            'lat': pd.to_numeric(ref['lat'], errors='coerce'),
+            'lng': pd.to_numeric(ref['lng'], errors='coerce'),
+            'cep': cep_digits(ref['cep']),
+        }))
+    if not frames:
+        return {}, {}
+
+    points = pd.concat(frames, ignore_index=True).dropna()
+    by_cep = points.groupby('cep')[['lat', 'lng']].median()
+    by_sector = points.groupby(points['cep'].str[:5])[['lat', 'lng']].median()
+    return ({k: tuple(v) for k, v in zip(by_cep.index, by_cep.to_numpy())},
+            {k: tuple(v) for k, v in zip(by_sector.index, by_sector.to_numpy())})
+
+def cep_distances(lats, lngs, ceps, by_cep, by_sector):
+    """
+    Distance in metres from each point to the centroid of its CEP (or of its
+    CEP sector), and whether it exceeds the limit for that level.
+    NaN distance where no centroid is known.
+    """
+    ceps = cep_digits(ceps).tolist()
+    n = len(ceps)
+    ref = np.full((n, 2), np.nan)
+    limit = np.full(n, np.nan)
+    for i, cep in enumerate(ceps):
+        if not isinstance(cep, str):
+            continue
+        if cep in by_cep:
+            ref[i], limit[i] = by_cep[cep], CEP_MAX_DISTANCE_M
+        elif cep[:5] in by_sector:
+            ref[i], limit[i] = by_sector[cep[:5]], SECTOR_MAX_DISTANCE_M
+    distance = haversine_m(np.asarray(lats, dtype=float), np.asarray(lngs, dtype=float), ref[:, 0], ref[:, 1])
+    with np.errstate(invalid='ignore'):
+        far = distance > limit
+    return distance, far
+
+def _column(df, name):
+    for candidate in [name] + COLUMN_ALIASES.get(name, []):
+        if candidate in df.columns:
+            return df[candidate]
+    return None
+
+def forward_frame(df, gmaps, address_column=ADDRESS_COLUMN, cache=None, limiter=None,
+                  workers=process_locations.WORKERS, centroids=None):
+    """
+    Forward geocode the registrations of `df` and return them in the column
+    layout of the process_locations output (KoBo columns + 'Endereço_Google'),
+    plus the typed and normalized address, the distance to the CEP centroid
+    and an alert column.
+    """
+    with METRICS.timer('forward.normalize'):
+        normalized = [normalize_address(a) for a in df[address_column].tolist()]
+        queries = [query for query, _ in normalized]
+        keys = [street_key(q) if q else None for q in queries]
+        # One lookup per distinct normalized address; the first spelling is the one sent
+        first_query = {}
+        for key, query in zip(keys, queries):
+            if key is not None:
+                first_query.setdefault(key, query)
+    distinct = list(first_query)
+    valid = sum(k is not None for k in keys)
+    print(f"{len(df)} registrations, {valid} with an address -> {len(distinct)} distinct after normalization "
+          f"({valid - len(distinct)} API calls saved).")
+    METRICS.count('forward_dedup_saved', valid - len(distinct))
+
+    with METRICS.timer('forward.lookups'):
+        results = geocode_addresses(gmaps, [first_query[k] for k in distinct], cache, workers, limiter)
+    by_key = dict(zip(distinct, results))
+    found = [by_key.get(k, (None, None, "Empty Address")) for k in keys]
+
+    out = pd.DataFrame(None, index=df.index, columns=KOBO_COLUMNS, dtype=object)
+    for column in KOBO_COLUMNS:
+        values = _column(df, column)
+        if values is not None:
+            out[column] = values
+    lats = np.array([np.nan if lat is None else lat for lat, _, _ in found], dtype=float)
+    lngs = np.array([np.nan if lng is None else lng for _, lng, _ in found], dtype=float)
+    out[LAT_COLUMN] = lats
+    out[LNG_COLUMN] = lngs
+    located = ~np.isnan(lats)
+    out['Localização'] = [f"{lat} {lng} 0 0" if ok else '' for lat, lng, ok in zip(lats, lngs, located)]
+    # Stable ids, so a re-run replaces the same rows instead of adding new ones
+    missing_uuid = out['_uuid'].isna() | (out['_uuid'].astype(str) == '')
+    out.loc[missing_uuid, '_uuid'] = [
+        str(uuid.uuid5(uuid.NAMESPACE_URL, f"visabelem:{name}|{phone}|{address}"))
+        for name, phone, address in zip(out.loc[missing_uuid, NAME_COLUMN], out.loc[missing_uuid, PHONE_COLUMN],
+                                        df.loc[missing_uuid, address_column])
+    ]
+    out['Endereço_Google'] = [addr for _, _, addr in found]
+    out[TYPED_COLUMN] = df[address_column]
+    out[NORMALIZED_COLUMN] = queries
+
+    with METRICS.timer('forward.check'):
+        by_cep, by_sector = centroids if centroids is not None else load_cep_centroids()
+        # The typed CEP is checked first; without one, the CEP Google returned
+        typed_cep = pd.Series([f['CEP'] if f else None for _, f in normalized], index=df.index)
+        google_cep = parse_address_column(out['Endereço_Google'])['CEP']
+        distance, far = cep_distances(lats, lngs, typed_cep.fillna(google_cep), by_cep, by_sector)
+        _, _, status = classify_coordinates(lats, lngs)
+    out[DISTANCE_COLUMN] = np.round(distance, 0)
+    alerts = np.where(far, FAR_FROM_CEP, '').astype(object)
+    alerts[located & (status == COORD_OUT_OF_BOUNDS)] = COORD_LABELS[COORD_OUT_OF_BOUNDS]
+    out[ALERT_COLUMN] = alerts
+    METRICS.count('forward_far_from_cep', int(far.sum()))
+    METRICS.count_rows(out['Endereço_Google'])
+    return out
+
+def append_to_output(rows, output_file=process_locations.OUTPUT_FILE):
+    """
+    Add the geocoded registrations to the process_locations output, replacing
+    rows with the same _uuid from a previous run.
+    """
+    if os.path.exists(output_file):
+        existing = read_table(output_file)
+        existing = existing[~existing['_uuid'].astype(str).isin(set(rows['_uuid'].astype(str)))]
+        rows = rows.copy()
+        for column in rows.columns.intersection(existing.columns):
+            # Keep the column types of the KoBo export (the columnar formats are typed)
+            if pd.api.types.is_numeric_dtype(existing[column]) and not pd.api.types.is_bool_dtype(existing[column]):
+                rows[column] = pd.to_numeric(rows[column], errors='coerce')
+        rows = pd.concat([existing, rows], ignore_index=True)
+    write_table(rows, output_file)
+    return len(rows)
+
+def main(input_file=FORWARD_INPUT, address_column=ADDRESS_COLUMN, output_file=FORWARD_OUTPUT,
+         append=False, workers=process_locations.WORKERS, qps=process_locations.QPS):
+    if not os.path.exists(input_file):
+        print(f"Error: Input file '{input_file}' not found.")
+        return
+
+    stage_start = time.perf_counter()
+    with METRICS.timer('forward.read'):
+        df = read_table(input_file) if not input_file.endswith('.csv') else \
+            pd.read_csv(input_file, delimiter=';', dtype=str)
+    if address_column not in df.columns:
+        print(f"Error: address column '{address_column}' not found.")
+        print(f"Available columns: {df.columns.tolist()}")
+        return
+
+    gmaps = process_locations.create_client()
+    if gmaps is None:
+        print("Please set GOOGLE_MAPS_API_KEY in .env")
+        return
+
+    cache = GeocodeCache() if process_locations.USE_CACHE else None
+    out = forward_frame(df, gmaps, address_column, cache, TokenBucket(qps), workers)
+    if cache is not None:
+        print(cache.stats())
+        cache.close()
+    METRICS.set_rows('forward', len(out))
+
+    located = out[LAT_COLUMN].notna()
+    alerts = out[ALERT_COLUMN].value_counts()
+    print(f"{int(located.sum())} of {len(out)} registrations located; "
+          f"{int(alerts.get(FAR_FROM_CEP, 0))} far from their CEP, "
+          f"{int(alerts.get(COORD_LABELS[COORD_OUT_OF_BOUNDS], 0))} outside the Belém area.")
+
+    with METRICS.timer('forward.write'):
+        write_table(out, output_file)
+        print(f"Saved {output_file}.")
+        if append:
+            total = append_to_output(out)
+            print(f"Appended to {process_locations.OUTPUT_FILE} ({total} rows); run parse_addresses.py and generate_site.py next.")
+
+    METRICS.add_duration('forward', time.perf_counter() - stage_start)
+    report = METRICS.write_reports('forward_geocode')
+    print(f"{report['cost']['billable_calls']} billable API calls, estimated cost ${report['cost']['estimated_usd']:.2f} "
+          f"(run report in {METRICS_DIR}/).")
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description="Forward geocode typed addresses (Visabelem.net self-registrations).")
+    parser.add_argument('input', nargs='?', default=FORWARD_INPUT, help="';'-separated CSV or a table file")
+    parser.add_argument('--address-column', default=ADDRESS_COLUMN)
+    parser.add_argument('--output', default=FORWARD_OUTPUT)
+    parser.add_argument('--append', action='store_true',
+                        help=f"also add the rows to {process_locations.OUTPUT_FILE} for the site and map")
+    parser.add_argument('--workers', type=int, default=process_locations.WORKERS)
+    parser.add_argument('--qps', type=float, default=process_locations.QPS)
+    args = parser.parse_args()
+    main(args.input, args.address_column, args.output, args.append, args.workers, args.qps)
@@ -0,0 +1,258 @@
+import os
+import re
+import csv
+from difflib import SequenceMatcher
+from collections import Counter, defaultdict
+from text_utils import fold_accents, tokenize
+
+# Reference names for the Belém metropolitan area. Parsed address fields are
+# mapped to one canonical spelling so "SAO BRAS", "Sao Bras" and "São Brás"
+# are counted as the same bairro.
+
+# Configuration
+GAZETTEER_FILE = 'gazetteer.csv'  # Optional extra names: "tipo;nome" (tipo = bairro, municipio or logradouro)
+FUZZY_THRESHOLD = 0.85            # difflib ratio needed for a fuzzy match (first words must also agree)
+FUZZY_CANDIDATES = 5              # Names sharing the most trigrams that are compared in full
+MIN_FUZZY_LENGTH = 5              # Shorter keys only match exactly
+DIGITS_RE = re.compile(r'\d+')
+
+CITIES = [
+    "Belém", "Ananindeua", "Marituba", "Benevides", "Santa Bárbara do Pará",
+    "Santa Izabel do Pará", "Castanhal", "Barcarena",
+    # Districts of Belém that Google sometimes returns in the city position
+    "Outeiro", "Icoaraci", "Mosqueiro",
+]
+
+BAIRROS = [
+    # Belém (continent)
+    "Aurá", "Água Boa", "Águas Lindas", "Barreiro", "Batista Campos", "Bengui", "Cabanagem",
+    "Campina", "Canudos", "Castanheira", "Cidade Velha", "Condor", "Coqueiro", "Cremação",
+    "Curió-Utinga", "Fátima", "Guamá", "Jurunas", "Mangueirão", "Marambaia", "Marco",
+    "Maracangalha", "Miramar", "Montese", "Terra Firme", "Nazaré", "Parque Verde", "Pedreira",
+    "Reduto", "Sacramenta", "São Brás", "São Clemente", "Souza", "Tapanã", "Telégrafo",
+    "Umarizal", "Una", "Universitário", "Val-de-Cans", "Mata Fome", "Pratinha",
+    "Parque Guajará",
+    # Icoaraci
+    "Agulha", "Campina de Icoaraci", "Cruzeiro", "Maracacuera", "Paracuri", "Ponta Grossa",
+    "Tenoné", "Águas Negras",
+    # Outeiro / Caratateua and Cotijuba
+    "Brasília", "Itaiteua", "São João do Outeiro", "Cotijuba",
+    # Mosqueiro
+    "Aeroporto", "Ariramba", "Baía do Sol", "Bonfim", "Carananduba", "Chapéu Virado", "Farol",
+    "Maracajá", "Marahu", "Mangueiras", "Murubira", "Natal do Murubira", "Paraíso",
+    "Porto Arthur", "Praia Grande", "São Francisco", "Sucurijuquara", "Vila",
+    # Ananindeua and Marituba
+    "Águas Brancas", "Atalaia", "Centro", "Cidade Nova", "Curuçambá",
+    "Distrito Industrial", "Geraldo Palmeira", "Guajará", "Guanabara", "Heliolândia",
+    "Icuí-Guajará", "Icuí-Laranjeira", "Jaderlândia", "Júlia Seffer", "Levilândia", "Maguari",
+    "PAAR", "Providência", "Jiboia Branca", "40 Horas", "Decouville", "Dom Aristides",
+]
+
+# Main streets, in the short form Google returns them in
+STREETS = [
+    "Av. Almirante Barroso", "Av. Augusto Montenegro", "Av. Pedro Miranda", "Av. Senador Lemos",
+    "Av. Duque de Caxias", "Av. Gov. José Malcher", "Av. Nazaré", "Av. Magalhães Barata",
+    "Av. Presidente Vargas", "Av. Visconde de Souza Franco", "Av. José Bonifácio",
+    "Av. Conselheiro Furtado", "Av. Gentil Bittencourt", "Av. Roberto Camelier",
+    "Av. Bernardo Sayão", "Av. Perimetral", "Av. João Paulo II", "Av. Pedro Álvares Cabral",
+    "Av. Júlio César", "Av. Marquês de Herval", "Av. Rômulo Maiorana", "Av. Centenário",
+    "Av. Dr. Freitas", "Av. Arthur Bernardes", "Av. Mário Covas", "Rod. BR-316",
+    "Rod. Mário Covas", "Rod. Arthur Bernardes", "Tv. Mauriti", "Tv. Humaitá", "Tv. Angustura",
+    "Tv. Lomas Valentinas", "Tv. Dr. Enéas Pinheiro", "Tv. Padre Eutíquio", "Tv. 14 de Março",
+    "Tv. Castelo Branco", "Tv. Barão do Triunfo", "Tv. Alferes Costa", "Tv. We-31",
+    "R. dos Mundurucus", "R. dos Pariquis", "R. dos Timbiras", "R. Bernal do Couto",
+    "R. Boaventura da Silva", "R. Antônio Barreto", "R. João Balbi", "R. Domingos Marreiros",
+    "R. Oliveira Belo", "R. Diogo Moia", "R. Curuçá", "R. Cônego Jerônimo Pimentel",
+]
+
+# Street type and title abbreviations, mapped to one form for the lookup key
+STREET_TYPES = {
+    'avenida': 'av', 'av': 'av', 'rua': 'r', 'r': 'r', 'travessa': 'tv', 'trav': 'tv', 'tv': 'tv',
+    'passagem': 'psg', 'pass': 'psg', 'psg': 'psg', 'rodovia': 'rod', 'rod': 'rod',
+    'alameda': 'al', 'al': 'al', 'estrada': 'estr', 'estr': 'estr', 'vila': 'vl', 'vl': 'vl',
+    'conjunto': 'conj', 'conj': 'conj', 'praca': 'pca', 'pca': 'pca',
+}
+# Form Google writes each street type in (keys are the STREET_TYPES values)
+STREET_TYPE_LABELS = {
+    'av': 'Av.', 'r': 'R.', 'tv': 'Tv.', 'psg': 'Psg.', 'rod': 'Rod.', 'al': 'Al.',
+    'estr': 'Estr.', 'vl': 'Vila', 'conj': 'Conj.', 'pca': 'Pç.',
+}
+TITLES = {
+    'gov': 'governador', 'pres': 'presidente', 'sen': 'senador', 'dr': 'doutor', 'cel': 'coronel',
+    'alm': 'almirante', 'gen': 'general', 'mal': 'marechal', 'cons': 'conselheiro',
+    'prof': 'professor', 'pe': 'padre', 'dep': 'deputado', 'visc': 'visconde', 'cap': 'capitao',
+}
+
+def name_key(text):
+    """
+    Lookup key for bairros and cities: accent-folded alphanumeric tokens.
+    """
+    return ' '.join(tokenize(text))
+
+def street_key(text):
+    """
+    Lookup key for streets: like name_key, with the street type and titles
+    abbreviated the same way ("Avenida Governador José Malcher" == "Av. Gov. José Malcher").
+    """
+    tokens = tokenize(text)
+    if tokens and tokens[0] in STREET_TYPES:
+        tokens[0] = STREET_TYPES[tokens[0]]
+    return ' '.join(TITLES.get(t, t) for t in tokens)
+
+def head_token(key):
+    """
+    First word of a lookup key, after the street type if there is one.
+    """
+    tokens = key.split()
+    if len(tokens) > 1 and tokens[0] in STREET_TYPE_LABELS:
+        tokens = tokens[1:]
+    return tokens[0] if tokens else ''
+
+def trigrams(key):
+    padded = f"  {key} "
+    return {padded[i:i + 3] for i in range(len(padded) - 2)}
+
+class Gazetteer:
+    """
+    Canonical names indexed for exact, accent-folded and fuzzy (trigram) lookup.
+    Results are memoized, so a repeated string costs one dict lookup.
+    """
+
+    def __init__(self, names=(), key=name_key, fuzzy_threshold=FUZZY_THRESHOLD):
+        self.key = key
+        self.fuzzy_threshold = fuzzy_threshold
+        self.exact = {}                 # name as written -> canonical
+        self.by_key = {}                # folded key -> canonical
+        self.grams = defaultdict(set)   # trigram -> keys containing it
+        self.memo = {}
+        for name in names:
+            self.add(name)
+
+    def add(self, name):
+        key = self.key(name)
+        if not key or key in self.by_key:
+            return
+        self.exact[name] = name
+        self.by_key[key] = name
+        for gram in trigrams(key):
+            self.grams[gram].add(key)
+        self.memo.clear()
+
+    def __len__(self):
+        return len(self.by_key)
+
+    def lookup(self, text):
+        """
+        Canonical name for `text`, or None if nothing in the gazetteer matches.
+        """
+        if not isinstance(text, str):
+            return None
+        if text in self.memo:
+            return self.memo[text]
+        found = self.exact.get(text)
+        if found is None:
+            key = self.key(text)
+            found = self.by_key.get(key)
+            if found is None and len(key) >= MIN_FUZZY_LENGTH:
+                found = self._fuzzy(key)
+        self.memo[text] = found
+        return found
+
+    def _fuzzy(self, key):
+        # The trigram index narrows the gazetteer down to a few candidates,
+        # which are then scored with difflib. Only later words may differ:
+        # "Marcos" is a different place from "Marco", not a typo of it
+        shared = Counter()
+        for gram in trigrams(key):
+            shared.update(self.grams.get(gram, ()))
+        best, best_score = None, self.fuzzy_threshold
+        numbers = DIGITS_RE.findall(key)
+        head = head_token(key)
+        for candidate, _ in shared.most_common(FUZZY_CANDIDATES):
+            if DIGITS_RE.findall(candidate) != numbers:
+                continue  # "Cidade Nova 6" is not "Cidade Nova"
+            if head_token(candidate) != head:
+                continue
+            score = SequenceMatcher(None, key, candidate).ratio()
+            if score >= best_score:
+                best, best_score = candidate, score
+        return self.by_key[best] if best is not None else None
+
+    def canonicalize(self, values, collapse=True):
+        """
+        Map a Series to canonical names in one pass over its unique values.
+        With `collapse`, values outside the gazetteer that share a folded key
+        collapse to the spelling used most often in the batch (so the result
+        depends on the whole batch); without it they are kept as they are.
+        Empty values are kept.
+        """
+        counts = values[values.notna() & (values.astype(str).str.strip() != '')].value_counts()
+        mapping = {}
+        unknown = defaultdict(list)  # key -> [(count, spelling)]
+        for value, count in counts.items():
+            canonical = self.lookup(value)
+            if canonical is not None:
+                mapping[value] = canonical
+            elif collapse:
+                unknown[self.key(value)].append((count, value))
+        for spellings in unknown.values():
+            preferred = max(spellings, key=lambda s: s[0])[1]
+            for _, value in spellings:
+                mapping[value] = preferred
+        return values.map(lambda v: mapping.get(v, v))
+
+def accent_insensitive(name):
+    """
+    Regex source matching `name` with or without accents (use with re.IGNORECASE).
+    """
+    pattern = []
+    for ch in name:
+        base = fold_accents(ch)
+        pattern.append(f"[{ch}{base}]" if base and base != ch.lower() else re.escape(ch))
+    return ''.join(pattern)
+
+# Known cities at the end of an address, as whole words (accents and case ignored)
+CITY_SUFFIX_RE = re.compile(r'(?<![\w])(?:' + '|'.join(accent_insensitive(c) for c in CITIES) + ')$', flags=re.IGNORECASE)
+CITY_SPLIT_RE = re.compile(r'^(.*?)(' + CITY_SUFFIX_RE.pattern + ')', flags=re.IGNORECASE | re.DOTALL)
+
+def _load_extra(path):
+    extra = defaultdict(list)
+    if path and os.path.exists(path):
+        with open(path, 'r', encoding='utf-8') as f:
+            for row in csv.reader(f, delimiter=';'):
+                if len(row) >= 2 and row[1].strip():
+                    extra[fold_accents(row[0]).strip()].append(row[1].strip())
+    return extra
+
+_GAZETTEERS = {}
+
+def load_gazetteers(path=GAZETTEER_FILE):
+    """
+    Gazetteers for the parsed columns ({column: Gazetteer}), built once per file.
+    """
+    if path not in _GAZETTEERS:
+        extra = _load_extra(path)
+        _GAZETTEERS[path] = {
+            'Bairro': Gazetteer(BAIRROS + extra['bairro']),
+            'Município': Gazetteer(CITIES + extra['municipio']),
+            'Logradouro': Gazetteer(STREETS + extra['logradouro'], key=street_key, fuzzy_threshold=0.9),
+        }
+    return _GAZETTEERS[path]
+
+CITY_GAZETTEER = load_gazetteers()['Município']
+
+def canonical_city(text):
+    """
+    Canonical spelling of a city name matched by CITY_SUFFIX_RE.
+    """
+    return CITY_GAZETTEER.lookup(text) or text
+
+def canonicalize_columns(parsed, path=GAZETTEER_FILE, collapse=True):
+    """
+    Replace the Bairro, Município and Logradouro columns of a parsed frame
+    with their canonical spellings (in place). Returns the frame.
+    """
+    for column, gazetteer in load_gazetteers(path).items():
+        if column in parsed.columns:
+            parsed[column] = gazetteer.canonicalize(parsed[column], collapse)
+    return parsed
@@ -1,67 +1,444 @@
 import pandas as pd
+import numpy as np
 import markdown
 import os
+import sys
+import time
 import json
+import gzip
+import inspect
+import argparse
+import shutil
+from text_utils import tokenize
+from table_io import find_table, read_table, table_columns
+from map_tiles import build_tiles, TILES_DIR
+from density import build_density, EXPECTED_FILE
+from districts import assign_districts, DISTRICTS_GEOJSON, BAIRROS_GEOJSON
+from establishments import find_establishments, CANONICAL_COLUMN
+from build_cache import BuildCache
+from publish import publish_site
+from metrics import METRICS
 
 # Configuration
 MARKDOWN_FILE = 'Relatorio_Projeto_Acai.md'
-EXCEL_FILE = 'output_enderecos_tratado.xlsx'
+DATA_FILE = find_table('output_enderecos_tratado')
 OUTPUT_HTML = 'index.html'
+TABLE_DIR = 'table'          # Output of the sharded table mode
+TABLE_PAGE_SIZE = 500        # Rows per table shard
+EXPORT_FILE = 'output_enderecos_tratado.xlsx'
+MAP_SOURCE_CSV = 'Açaí_no_ponto_-_all_versions_-_labels_-_2025-11-26-17-29-38.csv'
+MAP_EXTRA_SOURCE = find_table('output_enderecos_cadastro')  # Forward-geocoded registrations (forward_geocode.py)
+MAP_DATA_JS = 'data.js'
+DENSITY_JS = 'density.js'  # Hexagon heatmap layers for maps.html (density.py)
 
-def generate_html():
-    # 1. Read and Convert Markdown
+# Generator code: a change in any of these files invalidates the build cache
+CODE_FILES = sorted({os.path.abspath(__file__)} | {inspect.getfile(fn) for fn in (
+    tokenize, build_tiles, build_density, assign_districts, find_establishments, read_table)})
+MAP_PRECISION = 5  # Decimal places kept for coordinates (~1 m)
+
+# Columns shown in the table (Bairro/CEP also feed the KPIs and chart)
+TABLE_COLUMNS = [
+    'Nome do ponto de venda ou do proprietário', 
+    'Telefone de contato', 
+    'Logradouro', 
+    'Número', 
+    'Bairro', 
+    'Município',
+    'CEP'
+]
+
+# Columns covered by the prebuilt search index (sharded table mode)
+SEARCH_COLUMNS = ['Nome do ponto de venda ou do proprietário', 'Logradouro', 'Bairro', 'CEP']
+
+# Client side of the sharded table: DataTables server-side mode backed by static
+# JSON shards and the per-letter inverted index written by write_table_shards.
+SHARDED_TABLE_JS = """
+        function shardedTableSource(base) {
+            const cache = new Map();
+            const getJSON = url => {
+                if (!cache.has(url)) cache.set(url, fetch(url).then(r => r.ok ? r.json() : {}));
+                return cache.get(url);
+            };
+            const meta = getJSON(`${base}/meta.json`);
+            const fold = s => s.normalize('NFD').replace(/[\\u0300-\\u036f]/g, '').toLowerCase();
+            const tokens = s => fold(s).split(/[^a-z0-9]+/).filter(Boolean);
+
+            // Row ids whose indexed tokens start with every search term
+            function matchIds(query, m) {
+                const terms = tokens(query);
+                if (!terms.length) return Promise.resolve(null);
+                return Promise.all(terms.map(t => {
+                    if (!m.searchShards.includes(t[0])) return Promise.resolve(new Set());
+                    return getJSON(`${base}/search/${t[0]}.json`).then(index => {
+                        const ids = new Set();
+                        for (const token in index) {
+                            if (token.startsWith(t)) index[token].forEach(i => ids.add(i));
+                        }
+                        return ids;
+                    });
+                })).then(sets => {
+                    let ids = [...sets[0]];
+                    sets.slice(1).forEach(s => { ids = ids.filter(i => s.has(i)); });
+                    return ids.sort((a, b) => a - b);
+                });
+            }
+
+            function rowsFor(ids, m) {
+                const pages = [...new Set(ids.map(i => Math.floor(i / m.pageSize)))];
+                return Promise.all(pages.map(p => getJSON(`${base}/${m.pages[p]}`))).then(loaded => {
+                    const byPage = {};
+                    pages.forEach((p, k) => { byPage[p] = loaded[k]; });
+                    return ids.map(i => {
+                        const row = byPage[Math.floor(i / m.pageSize)][i % m.pageSize];
+                        const record = {};
+                        m.columns.forEach((c, k) => { record[c] = row[k]; });
+                        return record;
+                    });
+                });
+            }
+
+            return function (data, callback) {
+                meta.then(m => {
+                    const query = ((data.search && data.search.value) || '').trim();
+                    matchIds(query, m).then(ids => {
+                        const total = ids ? ids.length : m.total;
+                        const end = data.length < 0 ? total : Math.min(total, data.start + data.length);
+                        const slice = [];
+                        for (let i = data.start; i < end; i++) slice.push(ids ? ids[i] : i);
+                        return rowsFor(slice, m).then(rows => callback({
+                            draw: data.draw, recordsTotal: m.total, recordsFiltered: total, data: rows
+                        }));
+                    });
+                });
+            };
+        }
+"""
+
+# Map popup fields: short key in data.js -> KoBo CSV column
+MAP_FIELDS = {
+    'name': 'Nome do ponto de venda ou do proprietário',
+    'professional': 'Nome do profissional de saúde',
+    'phone': 'Telefone de contato',
+    'district': 'Qual o distrito de saúde?',
+    'date': '_submission_time',
+}
+# Columns of the KoBo export the map is built from
+MAP_COLUMNS = ['_Localização_latitude', '_Localização_longitude', '_uuid', '_id'] + list(MAP_FIELDS.values())
+
+def encode_column(values):
+    """
+    Dictionary-encode a column ({"values": [...], "codes": [...]}) when it has
+    repeated values; mostly-unique columns are kept as a plain list.
+    """
+    codes, uniques = pd.factorize(pd.Series(values, dtype=object), use_na_sentinel=False)
+    if len(uniques) > len(values) / 2:
+        return list(values)
+    return {"values": uniques.tolist(), "codes": codes.tolist()}
+
+def build_map_data(df):
+    """
+    Columnar map payload: coordinate arrays plus (dictionary-encoded) popup fields,
+    one entry per point with valid coordinates.
+    """
+    lats = pd.to_numeric(df['_Localização_latitude'], errors='coerce')
+    lngs = pd.to_numeric(df['_Localização_longitude'], errors='coerce')
+    valid = lats.notna() & lngs.notna() & ~((lats == 0) & (lngs == 0))
+    df = df[valid]
+
+    data = {
+        "count": int(valid.sum()),
+        "lat": lats[valid].round(MAP_PRECISION).tolist(),
+        "lng": lngs[valid].round(MAP_PRECISION).tolist(),
+    }
+    for key, col in MAP_FIELDS.items():
+        values = df[col].fillna('') if col in df.columns else pd.Series('', index=df.index)
+        if key == 'district':
+            # Multi-select answers ("DAGUA DASAC") keep the first district
+            values = values.str.split().str[0].fillna('')
+        elif key == 'date':
+            values = values.str[:10]
+        data[key] = encode_column(values.tolist())
+    return data
+
+def map_inputs():
+    """
+    Files the map points are built from (see load_map_points).
+    """
+    return [MAP_SOURCE_CSV, MAP_EXTRA_SOURCE, DISTRICTS_GEOJSON, BAIRROS_GEOJSON]
+
+def write_js_payload(path, variable, obj):
+    """
+    Write `obj` as a script assigning it to window.<variable> (loads from file:// too).
+    """
+    with open(path, 'w', encoding='utf-8') as f:
+        f.write(f"window.{variable} = ")
+        json.dump(obj, f, ensure_ascii=False, separators=(',', ':'))
+        f.write(";\n")
+
+def read_js_payload(path):
+    with open(path, 'r', encoding='utf-8') as f:
+        text = f.read()
+    return json.loads(text[text.index('=') + 1:].rstrip().rstrip(';'))
+
+def load_map_points(stage='map', df=None):
+    """
+    Points plotted on the map: the KoBo export plus the located registrations,
+    one row per establishment, with the official districts filled in.
+    `df` holds the MAP_COLUMNS of the export when the caller already has them
+    (pipeline.py collects them from its chunks); otherwise they are read from
+    MAP_SOURCE_CSV. Returns None if the export is missing.
+    """
+    if df is None and not os.path.exists(MAP_SOURCE_CSV):
+        print(f"Error: {MAP_SOURCE_CSV} not found.")
+        return None
+
+    with METRICS.timer(f'{stage}.read'):
+        if df is None:
+            df = pd.read_csv(MAP_SOURCE_CSV, delimiter=';', dtype=str, usecols=lambda c: c in MAP_COLUMNS)
+        if os.path.exists(MAP_EXTRA_SOURCE):
+            # Same columns as the KoBo export; only the located registrations are plotted
+            extra = read_table(MAP_EXTRA_SOURCE, columns=[c for c in MAP_COLUMNS if c in table_columns(MAP_EXTRA_SOURCE)])
+            extra = extra[extra['_Localização_latitude'].notna()]
+            df = pd.concat([df, extra], ignore_index=True)
+    METRICS.set_rows(stage, len(df))
+    # One marker per establishment (the latest registration of each stall)
+    with METRICS.timer(f'{stage}.establishments'):
+        canonical = find_establishments(df)
+    df = df[canonical == np.arange(len(df))]
+    # Unanswered district questions are filled from the official boundaries, if present
+    if assign_districts(df) and stage == 'map':
+        print(f"Assigned official districts from {DISTRICTS_GEOJSON}.")
+    return df
+
+def map_data_loader(stage='map', points=None):
+    """
+    Callable returning the map payload (build_map_data of load_map_points),
+    built on its first call only. generate_density and generate_map_data take
+    one so a build reads the export and finds the establishments once, and not
+    at all when both outputs are up to date. `points` is passed on to
+    load_map_points. The payload is None if the export is missing.
+    """
+    loaded = []
+
+    def load():
+        if not loaded:
+            df = load_map_points(stage, points)
+            loaded.append(None if df is None else build_map_data(df))
+        return loaded[0]
+    return load
+
+def generate_map_data(tiles=True, cache=None, map_data=None):
+    """
+    Write data.js and, with `tiles`, the tile pyramid. With a BuildCache the
+    step is skipped when the map inputs and the generator code are unchanged.
+    `map_data` is a map_data_loader() shared with generate_density.
+    """
+    outputs = [MAP_DATA_JS] + ([os.path.join(TILES_DIR, 'meta.json')] if tiles else [])
+    key = cache.key(map_inputs() + CODE_FILES, tiles=tiles) if cache is not None else None
+    if cache is not None and cache.fresh('map', key, outputs):
+        print(f"{MAP_DATA_JS}{' and ' + TILES_DIR + '/' if tiles else ''} are up to date.")
+        return
+
+    stage_start = time.perf_counter()
+    data = (map_data or map_data_loader())()
+    if data is None:
+        return
+    with METRICS.timer('map.encode'):
+        write_js_payload(MAP_DATA_JS, 'mapData', data)
+
+    print(f"Successfully generated {MAP_DATA_JS} ({data['count']} points, {os.path.getsize(MAP_DATA_JS) / 1024:.0f} KB).")
+
+    if tiles:
+        # Clustered tile pyramid; maps.html falls back to data.js when it can't fetch it
+        with METRICS.timer('map.tiles'):
+            written = build_tiles(data, TILES_DIR)
+        print(f"Successfully generated {written} map tiles in {TILES_DIR}/.")
+    METRICS.add_duration('map', time.perf_counter() - stage_start)
+    if cache is not None:
+        cache.record('map', key)
+
+def generate_density(cache=None, map_data=None):
+    """
+    Bin the map points into hexagons (density.py) and write DENSITY_JS.
+    Returns the density payload, whose 'coverage' tables go into the report,
+    or None if the KoBo export is missing. With a BuildCache an up-to-date
+    DENSITY_JS is read back instead of being rebuilt. `map_data` is a
+    map_data_loader() shared with generate_map_data.
+    """
+    key = cache.key(map_inputs() + [EXPECTED_FILE] + CODE_FILES) if cache is not None else None
+    if cache is not None and cache.fresh('density', key, [DENSITY_JS]):
+        print(f"{DENSITY_JS} is up to date.")
+        return read_js_payload(DENSITY_JS)
+
+    stage_start = time.perf_counter()
+    data = (map_data or map_data_loader('density'))()
+    if data is None:
+        return None
+    with METRICS.timer('density.bin'):
+        density = build_density(data)
+    with METRICS.timer('density.write'):
+        write_js_payload(DENSITY_JS, 'densityData', density)
+    METRICS.add_duration('density', time.perf_counter() - stage_start)
+    if cache is not None:
+        cache.record('density', key)
+
+    cells = ', '.join(f"{len(density['layers'][str(s)]['count'])} × {s} m" for s in density['sizes'])
+    print(f"Successfully generated {DENSITY_JS} ({cells} cells, {os.path.getsize(DENSITY_JS) / 1024:.0f} KB).")
+    return density
+
+def _fmt(n):
+    """
+    Integer with Brazilian thousands separator (8.000).
+    """
+    return f"{n:,}".replace(',', '.')
+
+def _pct(value):
+    return '–' if value is None else f"{value:.1f}%".replace('.', ',')
+
+def render_coverage(coverage):
+    """
+    HTML of the coverage tables (density.coverage_tables): one row per district
+    and one per submission month, against the estimated number of establishments.
+    """
+    if not coverage:
+        return ''
+    districts = coverage['districts']
+    has_area = any('area_covered' in row for row in districts)
+    has_expected = any('expected' in row for row in districts)
+
+    head = ['Distrito', 'Pontos', '% do total', f"Hexágonos com pontos ({coverage['cellSize']} m)"]
+    if has_area:
+        head += ['Área (km²)', '% da área com pontos']
+    if has_expected:
+        head += ['Estimativa', 'Cobertura']
+    rows = []
+    for row in districts:
+        if not row['points'] and 'area_covered' not in row and 'expected' not in row:
+            continue
+        name = 'Não informado' if row['district'] == coverage['groups'][-1] else row['district']
+        cells = [name, _fmt(row['points']), _pct(row['share']), _fmt(row['cells'])]
+        if has_area:
+            cells += [str(row.get('area_km2', '–')).replace('.', ','), _pct(row.get('area_covered'))]
+        if has_expected:
+            cells += [_fmt(row['expected']) if 'expected' in row else '–', _pct(row.get('coverage'))]
+        rows.append(cells)
+
+    month_head = ['Mês'] + [('Não inf.' if g == coverage['groups'][-1] else g) for g in coverage['groups']] + \
+        ['Total', 'Acumulado', '% da estimativa']
+    month_rows = [[m['month'][5:] + '/' + m['month'][:4]] + [_fmt(n) for n in m['counts']] +
+                  [_fmt(m['total']), _fmt(m['cumulative']), _pct(m['coverage'])] for m in coverage['months']]
+
+    def table(header, body):
+        ths = ''.join(f"<th>{h}</th>" for h in header)
+        trs = ''.join('<tr>' + ''.join(f"<td>{c}</td>" for c in cells) + '</tr>' for cells in body)
+        return f'<div class="table-responsive"><table class="table table-sm coverage-table"><thead><tr>{ths}</tr></thead><tbody>{trs}</tbody></table></div>'
+
+    undated = f" {_fmt(coverage['undated'])} registros sem data de envio." if coverage['undated'] else ''
+    return f"""
+        <div class="table-box">
+            <h4 class="mb-3">Cobertura</h4>
+            <p>{_fmt(coverage['total'])} pontos registrados de cerca de {_fmt(coverage['expected'])} estimados
+               ({_pct(coverage['coverage'])}); faltam aproximadamente {_fmt(coverage['missing'])}.
+               A densidade por hexágono está no <a href="maps.html">mapa</a>.</p>
+            <h6>Por distrito</h6>
+            {table(head, rows)}
+            <h6>Por mês de envio</h6>
+            {table(month_head, month_rows)}
+            <small class="text-muted">Um ponto por estabelecimento (cadastros repetidos contados uma vez).{undated}</small>
+        </div>"""
+
+def write_precompressed_json(path, obj):
+    """
+    Write `path` and a gzip-compressed copy next to it (`path.gz`) for static hosting.
+    """
+    payload = json.dumps(obj, ensure_ascii=False, separators=(',', ':')).encode('utf-8')
+    with open(path, 'wb') as f:
+        f.write(payload)
+    with open(path + '.gz', 'wb') as f:
+        f.write(gzip.compress(payload, compresslevel=9))
+
+def build_search_index(df):
+    """
+    Inverted index {token: [row ids]} over SEARCH_COLUMNS, accent-folded.
+    CEPs are also indexed without the hyphen.
+    """
+    index = {}
+    cols = [c for c in SEARCH_COLUMNS if c in df.columns]
+    for row_id, values in enumerate(df[cols].itertuples(index=False, name=None)):
+        tokens = set()
+        for col, value in zip(cols, values):
+            text = str(value)
+            tokens.update(tokenize(text))
+            if col == 'CEP':
+                digits = ''.join(ch for ch in text if ch.isdigit())
+                if digits:
+                    tokens.add(digits)
+        for token in tokens:
+            index.setdefault(token, []).append(row_id)
+    return index
+
+def write_table_shards(df, columns, out_dir=TABLE_DIR, page_size=TABLE_PAGE_SIZE):
+    """
+    Write the table as fixed-size JSON pages plus a search index sharded by the
+    first character of each token, all with precompressed .gz copies.
+    """
+    if os.path.isdir(out_dir):
+        shutil.rmtree(out_dir)
+    os.makedirs(os.path.join(out_dir, 'search'))
+
+    rows = df[columns].to_dict(orient='split')['data']
+    pages = []
+    for start in range(0, len(rows), page_size):
+        name = f"page-{start // page_size:04d}.json"
+        write_precompressed_json(os.path.join(out_dir, name), rows[start:start + page_size])
+        pages.append(name)
+
+    shards = {}
+    for token, ids in build_search_index(df).items():
+        shards.setdefault(token[0], {})[token] = ids
+    for first, shard in shards.items():
+        write_precompressed_json(os.path.join(out_dir, 'search', f"{first}.json"), shard)
+
+    write_precompressed_json(os.path.join(out_dir, 'meta.json'), {
+        "columns": columns, "total": len(rows), "pageSize": page_size,
+        "pages": pages, "searchShards": sorted(shards),
+    })
+    return len(pages), len(shards)
+
+def render_report():
     if not os.path.exists(MARKDOWN_FILE):
         print(f"Error: {MARKDOWN_FILE} not found.")
-        return
+        return None
     
     with open(MARKDOWN_FILE, 'r', encoding='utf-8') as f:
         md_content = f.read()
     
-    html_content = markdown.markdown(md_content, extensions=['tables'])
-
-    # 2. Read Data
-    if not os.path.exists(EXCEL_FILE):
-        print(f"Error: {EXCEL_FILE} not found.")
-        return
+    return markdown.markdown(md_content, extensions=['tables'])
 
-    df = pd.read_excel(EXCEL_FILE).fillna('')
-    
-    # --- Analytics & Data Prep ---
-    total_records = len(df)
-    unique_bairros = df['Bairro'].nunique() if 'Bairro' in df.columns else 0
-    unique_ceps = df['CEP'].nunique() if 'CEP' in df.columns else 0
+def build_page(html_content, total_records, unique_bairros, unique_ceps, chart_labels, chart_values,
+               columns, table_data_js, table_dir=None, coverage_html=''):
+    """
+    Render index.html. `table_data_js` is inserted verbatim as the tableData literal,
+    `coverage_html` (render_coverage) is placed between the chart and the table.
+    With `table_dir` the table is instead loaded page by page from the shards
+    written by write_table_shards, and the HTML size no longer depends on the data.
+    """
+    columns_json = json.dumps([{"data": c, "title": c} for c in columns])
 
-    # Chart Data
-    if 'Bairro' in df.columns:
-        bairros_counts = df[df['Bairro'] != '']['Bairro'].value_counts().head(10)
-        chart_bairros_labels = bairros_counts.index.tolist()
-        chart_bairros_data = bairros_counts.values.tolist()
+    if table_dir:
+        table_data_js = 'null'
+        table_source_js = SHARDED_TABLE_JS
+        table_options = f"""serverSide: true,
+                ordering: false,
+                searchDelay: 300,
+                ajax: shardedTableSource('{table_dir}'),"""
+        export_button = f"{{ text: 'Baixar Excel', className: 'btn btn-success btn-sm', action: () => {{ window.location = '{EXPORT_FILE}'; }} }}"
     else:
-        chart_bairros_labels = []
-        chart_bairros_data = []
+        table_source_js = ''
+        table_options = 'data: tableData,'
+        export_button = "{ extend: 'excel', text: 'Exportar Excel', className: 'btn btn-success btn-sm' }"
 
-    # --- JSON Table Data ---
-    cols_to_keep = []
-    potential_cols = [
-        'Nome do ponto de venda ou do proprietário', 
-        'Telefone de contato', 
-        'Logradouro', 
-        'Número', 
-        'Bairro', 
-        'Município',
-        'CEP'
-    ]
-    for c in potential_cols:
-        if c in df.columns:
-            cols_to_keep.append(c)
-    if not cols_to_keep:
-        cols_to_keep = df.columns[:5].tolist()
-
-    table_data_json = df[cols_to_keep].to_dict(orient='records')
-    columns_json = json.dumps([{"data": c, "title": c} for c in cols_to_keep])
-
-    # 3. Build HTML
-    full_html = f"""
+    return f"""
 <!DOCTYPE html>
 <html lang="pt-BR">
 <head>
@@ -142,6 +519,11 @@ def generate_html():
             background-color: #6f42c1;
             color: white;
         }}
+        .coverage-table td, .coverage-table th {{
+            text-align: right;
+            white-space: nowrap;
+        }}
+        .coverage-table td:first-child, .coverage-table th:first-child {{ text-align: left; }}
         #dataTable td {{
             white-space: nowrap;
             overflow: hidden;
@@ -204,6 +586,8 @@ def generate_html():
             </div>
         </div>
 
+        <!-- Coverage -->{coverage_html}
+
         <!-- Table -->
         <div class="table-box">
             <h4 class="mb-3">Dados Detalhados</h4>
@@ -219,7 +603,7 @@ def generate_html():
     <!-- JS Libs -->
     <script src="https://code.jquery.com/jquery-3.7.0.min.js"></script>
     <script src="https://cdn.jsdelivr.net/npm/bootstrap@5.3.0/dist/js/bootstrap.bundle.min.js"></script>
-    <script src="https://cdn.jsdelivr.net/npm/chart.js"></script>
+    <script src="https://cdn.jsdelivr.net/npm/chart.js@4.4.0/dist/chart.umd.js"></script>
     
     <!-- DataTables -->
     <script src="https://cdn.datatables.net/1.13.4/js/jquery.dataTables.min.js"></script>
@@ -229,25 +613,25 @@ def generate_html():
     <script src="https://cdnjs.cloudflare.com/ajax/libs/jszip/3.10.1/jszip.min.js"></script>
     <script src="https://cdn.datatables.net/buttons/2.3.6/js/buttons.html5.min.js"></script>
 
-    <script>
+    <script>{table_source_js}
         // Data passed from Python
-        const tableData = {json.dumps(table_data_json)};
+        const tableData = {table_data_js};
         const tableCols = {columns_json};
-        const chartLabels = {json.dumps(chart_bairros_labels)};
-        const chartValues = {json.dumps(chart_bairros_data)};
+        const chartLabels = {json.dumps(chart_labels)};
+        const chartValues = {json.dumps(chart_values)};
 
         $(document).ready(function() {{
             // Init Table with JSON data (Client-side)
             $('#dataTable').DataTable({{
-                data: tableData,
+                {table_options}
                 columns: tableCols,
-                language: {{ "url": "//cdn.datatables.net/plug-ins/1.13.4/i18n/pt-BR.json" }},
+                language: {{ "url": "https://cdn.datatables.net/plug-ins/1.13.4/i18n/pt-BR.json" }},
                 pageLength: 25,
                 scrollX: true,
                 deferRender: true,
                 dom: 'Bfrtip',
                 buttons: [
-                    {{ extend: 'excel', text: 'Exportar Excel', className: 'btn btn-success btn-sm' }}
+                    {export_button}
                 ]
             }});
 
@@ -276,10 +660,102 @@ def generate_html():
 </html>
     """
 
-    with open(OUTPUT_HTML, 'w', encoding='utf-8') as f:
-        f.write(full_html)
+def generate_html(sharded=False, density=None, cache=None):
+    """
+    Render index.html. The coverage tables come from `density` (generate_density),
+    which is computed here when not given. With a BuildCache the page is only
+    rebuilt when the report, the data, the map inputs or the code changed.
+    """
+    outputs = [OUTPUT_HTML] + ([os.path.join(TABLE_DIR, 'meta.json')] if sharded else [])
+    inputs = [MARKDOWN_FILE, DATA_FILE] + map_inputs() + [EXPECTED_FILE] + CODE_FILES
+    key = cache.key(inputs, sharded=sharded) if cache is not None else None
+    if cache is not None and cache.fresh('html', key, outputs):
+        print(f"{OUTPUT_HTML} is up to date.")
+        return
+
+    if density is None:
+        density = generate_density(cache)
+    stage_start = time.perf_counter()
+    # 1. Read and Convert Markdown
+    html_content = render_report()
+    if html_content is None:
+        return
+
+    # 2. Read Data
+    if not os.path.exists(DATA_FILE):
+        print(f"Error: {DATA_FILE} not found.")
+        return
+
+    # Only the columns shown on the page are loaded
+    read_start = time.perf_counter()
+    available = table_columns(DATA_FILE)
+    cols_to_keep = [c for c in TABLE_COLUMNS if c in available] or available[:5]
+    if CANONICAL_COLUMN in available:
+        # One row per establishment: repeated registrations are left out of the counts and table
+        df = read_table(DATA_FILE, columns=cols_to_keep + [CANONICAL_COLUMN])
+        df = df[df[CANONICAL_COLUMN].fillna(True).astype(bool)][cols_to_keep].reset_index(drop=True)
+        df = df.fillna('')
+    else:
+        df = read_table(DATA_FILE, columns=cols_to_keep).fillna('')
+    METRICS.add_duration('site.read', time.perf_counter() - read_start)
+    
+    # --- Analytics & Data Prep ---
+    total_records = len(df)
+    unique_bairros = df['Bairro'].nunique() if 'Bairro' in df.columns else 0
+    unique_ceps = df['CEP'].nunique() if 'CEP' in df.columns else 0
+
+    # Chart Data
+    if 'Bairro' in df.columns:
+        bairros_counts = df[df['Bairro'] != '']['Bairro'].value_counts().head(10)
+        chart_bairros_labels = bairros_counts.index.tolist()
+        chart_bairros_data = bairros_counts.values.tolist()
+    else:
+        chart_bairros_labels = []
+        chart_bairros_data = []
+
+    # --- JSON Table Data ---
+    table_start = time.perf_counter()
+    if sharded:
+        n_pages, n_shards = write_table_shards(df, cols_to_keep)
+        print(f"Wrote {n_pages} table pages and {n_shards} search index shards to {TABLE_DIR}/.")
+        table_data_js = None
+    else:
+        table_data_json = df[cols_to_keep].to_dict(orient='records')
+        table_data_js = json.dumps(table_data_json)
+    METRICS.add_duration('site.table', time.perf_counter() - table_start)
+
+    # 3. Build HTML
+    with METRICS.timer('site.render'):
+        full_html = build_page(html_content, total_records, unique_bairros, unique_ceps,
+                               chart_bairros_labels, chart_bairros_data, cols_to_keep,
+                               table_data_js, table_dir=TABLE_DIR if sharded else None,
+                               coverage_html=render_coverage(density['coverage'] if density else None))
+
+        with open(OUTPUT_HTML, 'w', encoding='utf-8') as f:
+            f.write(full_html)
     
+    METRICS.add_duration('site', time.perf_counter() - stage_start)
+    METRICS.set_rows('site', total_records)
     print(f"Successfully generated {OUTPUT_HTML} (Centered & Limited).")
+    if cache is not None:
+        cache.record('html', key)
 
 if __name__ == "__main__":
-    generate_html()
+    parser = argparse.ArgumentParser(description="Generate index.html, data.js, density.js, the map tiles and the public/ copy of the site.")
+    parser.add_argument('--sharded', action='store_true',
+                        help=f"load the table from paged JSON shards and a prebuilt search index in {TABLE_DIR}/ instead of inlining it")
+    parser.add_argument('--force', action='store_true', help="rebuild everything, ignoring the build cache")
+    parser.add_argument('--no-publish', dest='publish', action='store_false',
+                        help="don't write the self-contained copy of the site (public/)")
+    parser.add_argument('--allow-cdn', action='store_true',
+                        help="publish even if some libraries are not vendored (the pages load them from the CDN)")
+    args = parser.parse_args()
+    cache = BuildCache(force=args.force)
+    map_data = map_data_loader()
+    density = generate_density(cache, map_data)
+    generate_html(sharded=args.sharded, density=density, cache=cache)
+    generate_map_data(cache=cache, map_data=map_data)
+    published = publish_site(cache=cache, allow_cdn=args.allow_cdn) if args.publish else True
+    METRICS.write_reports('generate_site')
+    if not published:
+        sys.exit(1)
@@ -0,0 +1,194 @@
+import os
+import sys
+import time
+import sqlite3
+import threading
+import pandas as pd
+from table_io import find_table, read_table
+from text_utils import tokenize
+
+# Configuration
+CACHE_FILE = 'geocode_cache.sqlite'
+CACHE_PRECISION = 6     # Decimal places kept in the key (~0.1 m at the equator)
+CACHE_TTL_DAYS = 180    # Entries older than this are treated as misses and evicted
+PREWARM_FILE = find_table('output_enderecos')
+
+def coord_key(lat, lng, precision=CACHE_PRECISION):
+    """
+    Normalize a coordinate pair to a fixed-precision string key.
+    """
+    return f"{round(float(lat), precision):.{precision}f},{round(float(lng), precision):.{precision}f}"
+
+def address_key(address):
+    """
+    Normalize an address for the forward-geocode cache: accent-folded,
+    lower-case alphanumeric tokens ("Tv. Mauriti, 1020" == "TV MAURITI 1020").
+    """
+    return ' '.join(tokenize(address))
+
+class GeocodeCache:
+    """
+    Persistent reverse-geocode cache backed by SQLite.
+    Keys are coordinates rounded to `precision` decimal places.
+    Safe to share between the worker threads of process_locations.
+    """
+
+    def __init__(self, path=CACHE_FILE, precision=CACHE_PRECISION, ttl_days=CACHE_TTL_DAYS):
+        self.path = path
+        self.precision = precision
+        self.ttl_seconds = ttl_days * 86400 if ttl_days else None
+        self.hits = 0
+        self.misses = 0
+        self.writes = 0
+        self.lock = threading.Lock()
+        self.conn = sqlite3.connect(path, check_same_thread=False)
+        self.conn.execute(
+            "CREATE TABLE IF NOT EXISTS geocode ("
+            " key TEXT PRIMARY KEY,"
+            " address TEXT NOT NULL,"
+            " created_at REAL NOT NULL)"
+        )
+        # Forward lookups (address -> coordinates), keyed by address_key()
+        self.conn.execute(
+            "CREATE TABLE IF NOT EXISTS forward ("
+            " key TEXT PRIMARY KEY,"
+            " lat REAL NOT NULL,"
+            " lng REAL NOT NULL,"
+            " address TEXT NOT NULL,"
+            " created_at REAL NOT NULL)"
+        )
+        self.conn.commit()
+
+    def key(self, lat, lng):
+        return coord_key(lat, lng, self.precision)
+
+    def get(self, lat, lng):
+        with self.lock:
+            row = self.conn.execute(
+                "SELECT address, created_at FROM geocode WHERE key = ?", (self.key(lat, lng),)
+            ).fetchone()
+            if row is None or self._expired(row[1]):
+                self.misses += 1
+                return None
+            self.hits += 1
+            return row[0]
+
+    def put(self, lat, lng, address, created_at=None):
+        with self.lock:
+            self.conn.execute(
+                "INSERT OR REPLACE INTO geocode (key, address, created_at) VALUES (?, ?, ?)",
+                (self.key(lat, lng), address, created_at or time.time())
+            )
+            self.conn.commit()
+            self.writes += 1
+
+    def get_forward(self, address):
+        """
+        (lat, lng, formatted_address) cached for an address, or None.
+        """
+        with self.lock:
+            row = self.conn.execute(
+                "SELECT lat, lng, address, created_at FROM forward WHERE key = ?", (address_key(address),)
+            ).fetchone()
+            if row is None or self._expired(row[3]):
+                self.misses += 1
+                return None
+            self.hits += 1
+            return row[0], row[1], row[2]
+
+    def put_forward(self, address, lat, lng, formatted_address, created_at=None):
+        with self.lock:
+            self.conn.execute(
+                "INSERT OR REPLACE INTO forward (key, lat, lng, address, created_at) VALUES (?, ?, ?, ?, ?)",
+                (address_key(address), lat, lng, formatted_address, created_at or time.time())
+            )
+            self.conn.commit()
+            self.writes += 1
+
+    def _expired(self, created_at):
+        return self.ttl_seconds is not None and time.time() - created_at > self.ttl_seconds
+
+    def evict_expired(self):
+        """
+        Delete entries older than the TTL. Returns the number of rows removed.
+        """
+        if self.ttl_seconds is None:
+            return 0
+        cutoff = time.time() - self.ttl_seconds
+        removed = 0
+        with self.lock:
+            for table in ('geocode', 'forward'):
+                removed += self.conn.execute(f"DELETE FROM {table} WHERE created_at < ?", (cutoff,)).rowcount
+            self.conn.commit()
+        return removed
+
+    def __len__(self):
+        with self.lock:
+            return sum(self.conn.execute(f"SELECT COUNT(*) FROM {table}").fetchone()[0]
+                       for table in ('geocode', 'forward'))
+
+    def prewarm_from_output(self, path=PREWARM_FILE):
+        """
+        Seed the cache from a previous process_locations output (.xlsx or columnar).
+        Only rows with a real Google address are imported.
+        """
+        columns = ["_Localização_latitude", "_Localização_longitude", "Endereço_Google"]
+        try:
+            df = read_table(path, columns=columns)
+        except (KeyError, ValueError):
+            print(f"Error: {path} has no coordinate/address columns to prewarm from.")
+            return 0
+
+        lats = pd.to_numeric(df["_Localização_latitude"], errors='coerce')
+        lngs = pd.to_numeric(df["_Localização_longitude"], errors='coerce')
+        rows = []
+        now = time.time()
+        for lat, lng, addr in zip(lats, lngs, df["Endereço_Google"]):
+            if pd.isna(lat) or pd.isna(lng) or not is_cacheable(addr):
+                continue
+            rows.append((self.key(lat, lng), addr, now))
+
+        with self.lock:
+            self.conn.executemany(
+                "INSERT OR REPLACE INTO geocode (key, address, created_at) VALUES (?, ?, ?)", rows
+            )
+            self.conn.commit()
+            self.writes += len(rows)
+        return len(rows)
+
+    def stats(self):
+        lookups = self.hits + self.misses
+        rate = (self.hits / lookups * 100) if lookups else 0.0
+        return f"Cache: {self.hits} hits, {self.misses} misses ({rate:.1f}% hit rate), {self.writes} writes, {len(self)} entries"
+
+    def close(self):
+        with self.lock:
+            self.conn.close()
+
+def is_cacheable(addr):
+    """
+    Only real addresses are cached; errors and placeholders must be retried.
+    """
+    if not isinstance(addr, str) or not addr:
+        return False
+    if addr in ("No results", "No address found", "API_KEY_ERROR"):
+        return False
+    return not addr.startswith("Error") and "Mock Address" not in addr
+
+if __name__ == '__main__':
+    # Usage:
+    #   python geocode_cache.py prewarm [output_enderecos.parquet|.xlsx]
+    #   python geocode_cache.py evict
+    #   python geocode_cache.py stats
+    command = sys.argv[1] if len(sys.argv) > 1 else 'stats'
+    cache = GeocodeCache()
+    if command == 'prewarm':
+        source = sys.argv[2] if len(sys.argv) > 2 else PREWARM_FILE
+        if not os.path.exists(source):
+            print(f"Error: {source} not found.")
+        else:
+            print(f"Prewarmed {cache.prewarm_from_output(source)} entries from {source}.")
+    elif command == 'evict':
+        print(f"Evicted {cache.evict_expired()} expired entries.")
+    print(cache.stats())
+    cache.close()
@@ -0,0 +1,280 @@
+import json
+import asyncio
+import argparse
+from functools import lru_cache
+from urllib.parse import urlsplit, parse_qs
+from concurrent.futures import ThreadPoolExecutor
+import process_locations
+from process_locations import get_address, get_coordinates, classify_point, COORD_VALID, COORD_LABELS
+from geocode_cache import GeocodeCache, coord_key, address_key
+from rate_limiter import TokenBucket
+from parse_addresses import parse_address, PARSED_COL_NAMES
+from gazetteer import load_gazetteers
+from metrics import METRICS, row_status
+
+# Local HTTP service for Visabelem.net: address <-> coordinates lookups for the
+# self-registration and field-inspection forms. Built on asyncio streams (no
+# extra dependency). The blocking googlemaps calls run in a thread pool that
+# shares the SQLite cache, the rate limiter and the circuit breaker of
+# process_locations, and concurrent identical lookups are coalesced into one
+# API call, so many clients asking for the same point cost a single request.
+#
+# Endpoints (JSON):
+#   GET  /reverse?lat=-1.45&lng=-48.50
+#   GET  /forward?address=Tv.+Mauriti,+1020,+Belém
+#   POST /bulk      {"reverse": [[lat, lng], ...], "forward": ["address", ...]}
+#   GET  /health    counters and circuit breaker state
+#   GET  /metrics   Prometheus text format
+# Usage: python geocode_service.py --port 8765 [--fake]
+
+# Configuration
+HOST = '127.0.0.1'
+PORT = 8765
+MAX_BULK = 500            # Lookups per /bulk request
+MAX_BODY = 1 << 20        # Bytes
+REASONS = {200: 'OK', 400: 'Bad Request', 404: 'Not Found', 405: 'Method Not Allowed',
+           413: 'Payload Too Large', 422: 'Unprocessable Entity', 500: 'Internal Server Error'}
+
+class RequestError(Exception):
+    def __init__(self, status, message):
+        super().__init__(message)
+        self.status = status
+
+@lru_cache(maxsize=65536)
+def _address_fields(addr):
+    values = dict(zip(PARSED_COL_NAMES, parse_address(addr).tolist()))
+    for column, gazetteer in load_gazetteers().items():
+        if values.get(column):
+            values[column] = gazetteer.lookup(values[column]) or values[column]
+    return values
+
+def address_fields(addr):
+    """
+    Structured fields of a formatted address (parse_address), with bairro,
+    city and street in their gazetteer spelling.
+    """
+    return dict(_address_fields(addr))
+
+def result_status(addr):
+    return {'success': 'ok', 'no_result': 'no_result'}.get(row_status(addr), 'error')
+
+class GeocodeService:
+    """
+    Reverse and forward geocoding with request coalescing.
+    All lookups for the same key share one in-flight future, so the API is
+    called once however many clients ask at the same time.
+    """
+
+    def __init__(self, gmaps, cache=None, limiter=None, breaker=None, workers=process_locations.WORKERS):
+        self.gmaps = gmaps
+        self.cache = cache
+        self.limiter = limiter
+        self.breaker = breaker
+        self.executor = ThreadPoolExecutor(max_workers=workers)
+        self.inflight = {}      # lookup key -> asyncio future
+        self.requests = 0
+        self.lookups = 0        # Lookups actually started (cache or API)
+        self.coalesced = 0      # Lookups served by another caller's in-flight future
+
+    async def _coalesce(self, key, fn, *args):
+        future = self.inflight.get(key)
+        if future is not None:
+            self.coalesced += 1
+        else:
+            future = asyncio.get_running_loop().run_in_executor(self.executor, fn, *args)
+            self.inflight[key] = future
+            future.add_done_callback(lambda _: self.inflight.pop(key, None))
+            self.lookups += 1
+        # A client that disconnects must not cancel the lookup of the others
+        return await asyncio.shield(future)
+
+    async def reverse(self, lat, lng):
+        lat, lng, status = classify_point(lat, lng)
+        if status != COORD_VALID:
+            raise RequestError(422, COORD_LABELS[status])
+        addr = await self._coalesce(('reverse', coord_key(lat, lng)), get_address, self.gmaps, lat, lng,
+                                    self.cache, self.limiter, None, self.breaker)
+        ok = result_status(addr) == 'ok'
+        return {
+            'lat': lat, 'lng': lng, 'status': result_status(addr),
+            'formatted_address': addr if ok else None,
+            'error': None if ok else addr,
+            'fields': address_fields(addr) if ok else None,
+        }
+
+    async def forward(self, address):
+        if not isinstance(address, str) or not address_key(address):
+            raise RequestError(400, "empty address")
+        lat, lng, found = await self._coalesce(('forward', address_key(address)), get_coordinates, self.gmaps,
+                                               address, self.cache, self.limiter, self.breaker)
+        ok = lat is not None
+        return {
+            'query': address, 'status': 'ok' if ok else result_status(found),
+            'lat': lat, 'lng': lng,
+            'formatted_address': found if ok else None,
+            'error': None if ok else found,
+            'fields': address_fields(found) if ok else None,
+        }
+
+    async def bulk(self, payload):
+        """
+        Run the lookups of a /bulk request concurrently; results keep the request order.
+        Items that fail validation get a status of "invalid" instead of failing the batch.
+        """
+        if not isinstance(payload, dict):
+            raise RequestError(400, "expected a JSON object")
+        reverse = payload.get('reverse') or []
+        forward = payload.get('forward') or []
+        if not isinstance(reverse, list) or not isinstance(forward, list):
+            raise RequestError(400, "'reverse' and 'forward' must be lists")
+        if len(reverse) + len(forward) > MAX_BULK:
+            raise RequestError(413, f"at most {MAX_BULK} lookups per request")
+
+        async def one(coro_fn, *args):
+            try:
+                return await coro_fn(*args)
+            except RequestError as e:
+                return {'status': 'invalid', 'error': str(e)}
+
+        def point(item):
+            if isinstance(item, dict):
+                return item.get('lat'), item.get('lng')
+            if isinstance(item, (list, tuple)) and len(item) == 2:
+                return item
+            return None, None
+
+        results = await asyncio.gather(*[one(self.reverse, *point(item)) for item in reverse],
+                                       *[one(self.forward, item) for item in forward])
+        return {'reverse': results[:len(reverse)], 'forward': results[len(reverse):]}
+
+    def health(self):
+        breaker = self.breaker or process_locations.CIRCUIT_BREAKER
+        return {
+            'status': 'ok' if breaker.state == 'closed' else 'degraded',
+            'circuit': breaker.state,
+            'requests': self.requests,
+            'lookups': self.lookups,
+            'coalesced': self.coalesced,
+            'inflight': len(self.inflight),
+            'billable_calls': METRICS.billable_calls(),
+            'cache_hits': METRICS.counters.get('cache_hits', 0),
+        }
+
+    async def dispatch(self, method, target, body):
+        url = urlsplit(target)
+        query = {k: v[-1] for k, v in parse_qs(url.query).items()}
+        routes = {
+            '/reverse': ('GET', lambda: self.reverse(query.get('lat'), query.get('lng'))),
+            '/forward': ('GET', lambda: self.forward(query.get('address'))),
+            '/bulk': ('POST', lambda: self.bulk(json.loads(body or b'null'))),
+        }
+        if url.path == '/health':
+            return 200, self.health()
+        if url.path == '/metrics':
+            return 200, METRICS.prometheus('geocode_service')
+        if url.path not in routes:
+            raise RequestError(404, f"unknown endpoint {url.path}")
+        expected, handler = routes[url.path]
+        if method != expected:
+            raise RequestError(405, f"use {expected} for {url.path}")
+        try:
+            return 200, await handler()
+        except json.JSONDecodeError:
+            raise RequestError(400, "invalid JSON body")
+
+    async def handle(self, reader, writer):
+        """
+        One HTTP/1.1 connection (keep-alive supported).
+        """
+        try:
+            while True:
+                request_line = await reader.readline()
+                if not request_line.strip():
+                    break
+                method, target, version = request_line.decode('latin-1').split()
+                headers = {}
+                while True:
+                    line = await reader.readline()
+                    if line in (b'\r\n', b'\n', b''):
+                        break
+                    name, _, value = line.decode('latin-1').partition(':')
+                    headers[name.strip().lower()] = value.strip()
+
+                self.requests += 1
+                length = int(headers.get('content-length') or 0)
+                try:
+                    if length > MAX_BODY:
+                        raise RequestError(413, "request body too large")
+                    body = await reader.readexactly(length) if length else b''
+                    status, payload = await self.dispatch(method, target, body)
+                except RequestError as e:
+                    status, payload = e.status, {'error': str(e)}
+                except Exception as e:
+                    status, payload = 500, {'error': f"{type(e).__name__}: {e}"}
+
+                if isinstance(payload, str):
+                    data, content_type = payload.encode('utf-8'), 'text/plain; version=0.0.4'
+                else:
+                    data, content_type = json.dumps(payload, ensure_ascii=False).encode('utf-8'), 'application/json'
+                close = headers.get('connection', '').lower() == 'close' or version == 'HTTP/1.0' or length > MAX_BODY
+                writer.write(
+                    f"HTTP/1.1 {status} {REASONS[status]}\r\n"
+                    f"Content-Type: {content_type}; charset=utf-8\r\n"
+                    f"Content-Length: {len(data)}\r\n"
+                    f"{'Connection: close' if close else 'Connection: keep-alive'}\r\n\r\n".encode('latin-1') + data
+                )
+                await writer.drain()
+                if close:
+                    break
+        except (ConnectionError, asyncio.IncompleteReadError, ValueError):
+            pass  # Client went away or sent something that isn't HTTP
+        finally:
+            writer.close()
+
+    def close(self):
+        self.executor.shutdown(wait=True)
+
+async def start_server(service, host=HOST, port=PORT):
+    """
+    Start listening; port 0 picks a free port (see server.sockets[0].getsockname()).
+    """
+    return await asyncio.start_server(service.handle, host, port)
+
+async def serve(service, host=HOST, port=PORT):
+    server = await start_server(service, host, port)
+    host, port = server.sockets[0].getsockname()[:2]
+    print(f"Geocoding service listening on http://{host}:{port} (Ctrl+C to stop).")
+    async with server:
+        await server.serve_forever()
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description="Local HTTP geocoding service (reverse, forward and bulk lookups).")
+    parser.add_argument('--host', default=HOST)
+    parser.add_argument('--port', type=int, default=PORT)
+    parser.add_argument('--workers', type=int, default=process_locations.WORKERS, help="concurrent API calls")
+    parser.add_argument('--qps', type=float, default=process_locations.QPS,
+                        help="maximum requests per second to the API, across all clients")
+    parser.add_argument('--fake', action='store_true', help="answer with the local stub geocoder (no API key needed)")
+    parser.add_argument('--fake-latency', type=float, default=0.05)
+    args = parser.parse_args()
+
+    if args.fake:
+        from fake_geocoder import FakeGeocodingClient
+        gmaps = FakeGeocodingClient(latency=args.fake_latency)
+    else:
+        gmaps = process_locations.create_client()
+        if gmaps is None:
+            print("Please set GOOGLE_MAPS_API_KEY in .env (or use --fake).")
+            raise SystemExit(1)
+
+    cache = GeocodeCache() if process_locations.USE_CACHE else None
+    service = GeocodeService(gmaps, cache, TokenBucket(args.qps), workers=args.workers)
+    try:
+        asyncio.run(serve(service, args.host, args.port))
+    except KeyboardInterrupt:
+        pass
+    finally:
+        service.close()
+        if cache is not None:
+            print(cache.stats())
+            cache.close()
@@ -0,0 +1,123 @@
+import os
+import json
+import shutil
+import numpy as np
+
+# Precomputed point clustering for maps.html, written as static per-tile JSON:
+#   tiles/meta.json                 zoom range, districts, bounds
+#   tiles/{z}/{x}/{y}.json          clusters (z < POINT_ZOOM) or single points (z == POINT_ZOOM)
+#   tiles/popups/{shard}.json       popup fields, fetched only when a point is clicked
+
+# Configuration
+TILES_DIR = 'tiles'
+MIN_ZOOM = 8
+POINT_ZOOM = 16      # From this zoom on, tiles hold individual points
+TILE_SIZE = 256
+CLUSTER_CELL_PX = 64 # Cluster grid cell in screen pixels (divides TILE_SIZE, so cells nest across zooms)
+POPUP_SHARD = 256    # Points per popup file
+DISTRICTS = ['DAENT', 'DAGUA', 'DASAC', 'DAICO', 'DABEL', 'DABEN', 'DAOUT', 'DAMOS']
+POPUP_FIELDS = ['name', 'professional', 'phone', 'district', 'date']
+
+def project(lats, lngs, zoom):
+    """
+    Web Mercator pixel coordinates at a zoom level (same as Leaflet's map.project).
+    """
+    scale = TILE_SIZE * 2 ** zoom
+    lat_rad = np.radians(np.clip(lats, -85.05112878, 85.05112878))
+    x = (lngs + 180.0) / 360.0 * scale
+    y = (1.0 - np.log(np.tan(lat_rad) + 1.0 / np.cos(lat_rad)) / np.pi) / 2.0 * scale
+    return x, y
+
+def decode_column(data, name):
+    col = data.get(name)
+    if col is None:
+        return [''] * data['count']
+    if isinstance(col, list):
+        return col
+    values = col['values']
+    return [values[c] for c in col['codes']]
+
+def cluster_level(lats, lngs, district_idx, zoom):
+    """
+    Grid clustering at one zoom: points in the same CLUSTER_CELL_PX cell are merged.
+    Returns {(tile_x, tile_y): [[lat, lng, [count per district..., others]], ...]}.
+    """
+    x, y = project(lats, lngs, zoom)
+    cx = (x // CLUSTER_CELL_PX).astype(np.int64)
+    cy = (y // CLUSTER_CELL_PX).astype(np.int64)
+    cells, inverse = np.unique(np.stack([cx, cy], axis=1), axis=0, return_inverse=True)
+    inverse = inverse.ravel()
+
+    n_cells = len(cells)
+    counts = np.bincount(inverse, minlength=n_cells)
+    mean_lat = np.bincount(inverse, weights=lats, minlength=n_cells) / counts
+    mean_lng = np.bincount(inverse, weights=lngs, minlength=n_cells) / counts
+    n_groups = len(DISTRICTS) + 1
+    by_district = np.zeros((n_cells, n_groups), dtype=np.int64)
+    np.add.at(by_district, (inverse, district_idx), 1)
+
+    per_tile = TILE_SIZE // CLUSTER_CELL_PX
+    tiles = {}
+    for i, (cell_x, cell_y) in enumerate(cells):
+        key = (int(cell_x // per_tile), int(cell_y // per_tile))
+        tiles.setdefault(key, []).append(
+            [round(float(mean_lat[i]), 5), round(float(mean_lng[i]), 5), by_district[i].tolist()])
+    return tiles
+
+def point_level(lats, lngs, district_idx, zoom):
+    """
+    Individual points at POINT_ZOOM: [[lat, lng, id, district index], ...] per tile.
+    """
+    x, y = project(lats, lngs, zoom)
+    tx = (x // TILE_SIZE).astype(np.int64)
+    ty = (y // TILE_SIZE).astype(np.int64)
+    tiles = {}
+    for i in range(len(lats)):
+        tiles.setdefault((int(tx[i]), int(ty[i])), []).append(
+            [float(lats[i]), float(lngs[i]), i, int(district_idx[i])])
+    return tiles
+
+def write_json(path, obj):
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    with open(path, 'w', encoding='utf-8') as f:
+        json.dump(obj, f, ensure_ascii=False, separators=(',', ':'))
+
+def build_tiles(data, out_dir=TILES_DIR):
+    """
+    Write the tile pyramid for a columnar map payload (generate_site.build_map_data).
+    Returns the number of tile files written.
+    """
+    lats = np.asarray(data['lat'], dtype=float)
+    lngs = np.asarray(data['lng'], dtype=float)
+    districts = decode_column(data, 'district')
+    lookup = {d: i for i, d in enumerate(DISTRICTS)}
+    district_idx = np.array([lookup.get(d, len(DISTRICTS)) for d in districts], dtype=np.int64)
+
+    # Start from a clean directory so tiles of removed points don't linger
+    if os.path.isdir(out_dir):
+        shutil.rmtree(out_dir)
+
+    written = 0
+    tile_index = {}
+    for zoom in range(MIN_ZOOM, POINT_ZOOM + 1):
+        level = point_level if zoom == POINT_ZOOM else cluster_level
+        tiles = level(lats, lngs, district_idx, zoom) if len(lats) else {}
+        for (tx, ty), items in tiles.items():
+            write_json(os.path.join(out_dir, str(zoom), str(tx), f"{ty}.json"), items)
+            written += 1
+        # Listed in meta.json so the page never requests empty tiles
+        tile_index[str(zoom)] = sorted(f"{tx}/{ty}" for tx, ty in tiles)
+
+    fields = {name: decode_column(data, name) for name in POPUP_FIELDS}
+    for start in range(0, data['count'], POPUP_SHARD):
+        shard = [[fields[name][i] for name in POPUP_FIELDS]
+                 for i in range(start, min(start + POPUP_SHARD, data['count']))]
+        write_json(os.path.join(out_dir, 'popups', f"{start // POPUP_SHARD}.json"), shard)
+
+    bounds = [[float(lats.min()), float(lngs.min())], [float(lats.max()), float(lngs.max())]] if len(lats) else None
+    write_json(os.path.join(out_dir, 'meta.json'), {
+        "minZoom": MIN_ZOOM, "pointZoom": POINT_ZOOM, "tileSize": TILE_SIZE,
+        "districts": DISTRICTS, "popupShard": POPUP_SHARD, "popupFields": POPUP_FIELDS,
+        "count": data['count'], "bounds": bounds, "tiles": tile_index,
+    })
+    return written
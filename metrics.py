@@ -0,0 +1,211 @@
+import os
+import json
+import time
+import bisect
+import threading
+from contextlib import contextmanager
+
+# Run instrumentation shared by the pipeline scripts: stage/phase timers,
+# latency histograms of the Geocoding API calls (one per operation: reverse_geocode
+# for coordinates -> address, geocode for address -> coordinates), row outcome counters and
+# an estimate of the billable API calls and their cost.
+# Each script appends a JSON report to metrics/run_reports.jsonl and writes a
+# Prometheus textfile (metrics/acai_<script>.prom, for node_exporter's textfile collector).
+
+# Configuration
+METRICS_DIR = 'metrics'
+RUN_LOG = os.path.join(METRICS_DIR, 'run_reports.jsonl')
+# Google Geocoding API: USD per 1000 requests, and the monthly credit mentioned in the report (section 4)
+PRICE_PER_1000 = 5.00
+MONTHLY_FREE_CREDIT = 200.00
+LATENCY_BUCKETS = [0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0]  # seconds
+ROW_STATUSES = ('success', 'no_result', 'error', 'skipped')
+
+def row_status(addr):
+    """
+    Outcome of one row of the 'Endereço_Google' column.
+    """
+    if not isinstance(addr, str) or not addr:
+        return 'skipped'
+    if addr in ("No results", "No address found"):
+        return 'no_result'
+    if addr.startswith("Error") or addr == "API_KEY_ERROR":
+        return 'error'
+    if addr in ("Invalid Coordinates", "Empty/Zero Coordinates", "Out of Bounds Coordinates",
+                "DRY_RUN_SKIPPED", "Skipped", "Empty Address") or "Mock Address" in addr:
+        return 'skipped'
+    return 'success'
+
+class RunMetrics:
+    """
+    Thread-safe collector for one run of a script.
+    """
+
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.reset()
+
+    def reset(self):
+        with self.lock:
+            self.started = time.time()
+            self.durations = {}    # stage or "stage.phase" -> seconds
+            self.rows = {}         # stage -> rows processed
+            self.counters = {}
+            self.latencies = {}    # operation -> [seconds]
+
+    @contextmanager
+    def timer(self, name):
+        """
+        Time a stage ("geocode") or a phase of it ("geocode.lookups").
+        Repeated timers with the same name add up.
+        """
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.add_duration(name, time.perf_counter() - start)
+
+    def add_duration(self, name, seconds):
+        with self.lock:
+            self.durations[name] = self.durations.get(name, 0.0) + seconds
+
+    def set_rows(self, stage, n):
+        with self.lock:
+            self.rows[stage] = self.rows.get(stage, 0) + int(n)
+
+    def count(self, name, n=1):
+        with self.lock:
+            self.counters[name] = self.counters.get(name, 0) + n
+
+    def count_rows(self, addresses):
+        """
+        Count the outcome of every row of a geocoded column.
+        """
+        totals = dict.fromkeys(ROW_STATUSES, 0)
+        for addr in addresses:
+            totals[row_status(addr)] += 1
+        for status, n in totals.items():
+            self.count(f'rows_{status}', n)
+
+    def observe_latency(self, seconds, operation='reverse_geocode'):
+        with self.lock:
+            self.latencies.setdefault(operation, []).append(seconds)
+
+    @staticmethod
+    def _latency_summary(latencies):
+        ordered = sorted(latencies)
+        counts = [0] * (len(LATENCY_BUCKETS) + 1)
+        for seconds in ordered:
+            counts[bisect.bisect_left(LATENCY_BUCKETS, seconds)] += 1
+        cumulative, buckets = 0, {}
+        for bound, n in zip(LATENCY_BUCKETS + ['+Inf'], counts):
+            cumulative += n
+            buckets[str(bound)] = cumulative
+        total = sum(ordered)
+
+        def percentile(q):
+            return ordered[min(len(ordered) - 1, int(q * len(ordered)))]
+
+        return {
+            "count": len(ordered),
+            "sum_s": round(total, 3),
+            "mean_s": round(total / len(ordered), 4),
+            "p50_s": percentile(0.5),
+            "p95_s": percentile(0.95),
+            "p99_s": percentile(0.99),
+            "max_s": ordered[-1],
+            "buckets": buckets,
+        }
+
+    def billable_calls(self):
+        # Google bills requests that return OK or ZERO_RESULTS, not the failed ones
+        return self.counters.get('api_success', 0) + self.counters.get('api_no_result', 0)
+
+    def report(self, script):
+        with self.lock:
+            billable = self.billable_calls()
+            cost = billable / 1000 * PRICE_PER_1000
+            stages = {}
+            for name, seconds in self.durations.items():
+                if '.' in name:
+                    continue
+                rows = self.rows.get(name)
+                stages[name] = {
+                    "seconds": round(seconds, 3),
+                    "rows": rows,
+                    "rows_per_s": round(rows / seconds, 1) if rows and seconds else None,
+                }
+            return {
+                "script": script,
+                "started": time.strftime('%Y-%m-%dT%H:%M:%S%z', time.localtime(self.started)),
+                "stages": stages,
+                "phases": {k: round(v, 3) for k, v in self.durations.items() if '.' in k},
+                "counters": dict(self.counters),
+                "api_latency": {op: self._latency_summary(values)
+                                for op, values in self.latencies.items() if values},
+                "cost": {
+                    "billable_calls": billable,
+                    "price_per_1000_usd": PRICE_PER_1000,
+                    "estimated_usd": round(cost, 2),
+                    "share_of_monthly_credit": round(cost / MONTHLY_FREE_CREDIT, 4),
+                },
+            }
+
+    def prometheus(self, script):
+        """
+        The report in the Prometheus text exposition format.
+        """
+        report = self.report(script)
+        label = f'script="{script}"'
+        lines = [
+            "# HELP acai_stage_duration_seconds Wall time of each pipeline stage in the last run.",
+            "# TYPE acai_stage_duration_seconds gauge",
+        ]
+        lines += [f'acai_stage_duration_seconds{{{label},stage="{s}"}} {v["seconds"]}' for s, v in report["stages"].items()]
+        lines += ["# HELP acai_stage_rows Rows processed by each stage in the last run.",
+                  "# TYPE acai_stage_rows gauge"]
+        lines += [f'acai_stage_rows{{{label},stage="{s}"}} {v["rows"]}' for s, v in report["stages"].items() if v["rows"] is not None]
+        lines += ["# HELP acai_phase_duration_seconds Wall time of each phase in the last run.",
+                  "# TYPE acai_phase_duration_seconds gauge"]
+        lines += [f'acai_phase_duration_seconds{{{label},phase="{p}"}} {v}' for p, v in report["phases"].items()]
+        lines += ["# HELP acai_events Counters of the last run (row outcomes, API calls, cache hits).",
+                  "# TYPE acai_events gauge"]
+        lines += [f'acai_events{{{label},name="{k}"}} {v}' for k, v in sorted(report["counters"].items())]
+
+        lines += ["# HELP acai_geocode_latency_seconds Latency of the Geocoding API calls in the last run, by operation.",
+                  "# TYPE acai_geocode_latency_seconds histogram"]
+        for op, latency in report["api_latency"].items():
+            op_label = f'{label},operation="{op}"'
+            lines += [f'acai_geocode_latency_seconds_bucket{{{op_label},le="{le}"}} {n}' for le, n in latency["buckets"].items()]
+            lines += [f'acai_geocode_latency_seconds_sum{{{op_label}}} {latency["sum_s"]}',
+                      f'acai_geocode_latency_seconds_count{{{op_label}}} {latency["count"]}']
+
+        lines += ["# HELP acai_geocode_billable_calls Billable Geocoding API calls in the last run.",
+                  "# TYPE acai_geocode_billable_calls gauge",
+                  f'acai_geocode_billable_calls{{{label}}} {report["cost"]["billable_calls"]}',
+                  "# HELP acai_geocode_estimated_cost_usd Estimated Geocoding API cost of the last run.",
+                  "# TYPE acai_geocode_estimated_cost_usd gauge",
+                  f'acai_geocode_estimated_cost_usd{{{label}}} {report["cost"]["estimated_usd"]}',
+                  "# HELP acai_last_run_timestamp_seconds When the last run finished.",
+                  "# TYPE acai_last_run_timestamp_seconds gauge",
+                  f'acai_last_run_timestamp_seconds{{{label}}} {time.time():.0f}']
+        return '\n'.join(lines) + '\n'
+
+    def write_reports(self, script, metrics_dir=METRICS_DIR):
+        """
+        Append the JSON report to the run log and rewrite the script's Prometheus textfile.
+        """
+        os.makedirs(metrics_dir, exist_ok=True)
+        report = self.report(script)
+        with open(os.path.join(metrics_dir, os.path.basename(RUN_LOG)), 'a', encoding='utf-8') as f:
+            f.write(json.dumps(report, ensure_ascii=False) + '\n')
+
+        # Write then rename, so the collector never reads a half-written file
+        prom_path = os.path.join(metrics_dir, f'acai_{script}.prom')
+        with open(prom_path + '.tmp', 'w', encoding='utf-8') as f:
+            f.write(self.prometheus(script))
+        os.replace(prom_path + '.tmp', prom_path)
+        return report
+
+# Shared by every module of a run, like process_locations.RATE_LIMITER
+METRICS = RunMetrics()
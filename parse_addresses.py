@@ -1,9 +1,42 @@
 import pandas as pd
 import re
 import os
+import time
+import argparse
+from geocode_cache import coord_key
+from raw_store import RawResponseStore
+from districts import locate_areas, OFFICIAL_BAIRRO_COLUMN
+from establishments import ESTABLISHMENT_COLUMN, CANONICAL_COLUMN
+from gazetteer import CITY_SUFFIX_RE, CITY_SPLIT_RE, canonical_city, canonicalize_columns
+from metrics import METRICS
+from table_io import find_table, intermediate_path, read_table, write_table
 
-INPUT_FILE = 'output_enderecos.xlsx'
-OUTPUT_FILE = 'output_enderecos_tratado.xlsx'
+INPUT_FILE = find_table('output_enderecos')
+OUTPUT_FILE = intermediate_path('output_enderecos_tratado')
+EXPORT_FILE = 'output_enderecos_tratado.xlsx'  # Final spreadsheet for the team
+
+CANONICALIZE = True  # Map parsed names to the gazetteer spelling (gazetteer.py)
+
+PARSED_COL_NAMES = ['Logradouro', 'Número', 'Bairro', 'Município', 'Estado', 'CEP', 'País']
+
+# Precompiled patterns (shared by the row-wise and the vectorized parser)
+ZIP_RE = re.compile(r'(\d{5}[-\s]?\d{3})$')
+STATE_RE = re.compile(r'[\s,-]+([A-Z]{2})$')
+# Same patterns with a lazy prefix group, so str.extract also yields the text before the match
+ZIP_SPLIT_RE = re.compile(r'^(.*?)(\d{5}[-\s]?\d{3})$', flags=re.DOTALL)
+STATE_SPLIT_RE = re.compile(r'^(.*?)[\s,-]+([A-Z]{2})$', flags=re.DOTALL)
+
+# Google address_components types for each parsed column, in order of preference,
+# and which name to keep ('long_name' or 'short_name')
+COMPONENT_TYPES = {
+    'Logradouro': (['route'], 'short_name'),
+    'Número': (['street_number'], 'long_name'),
+    'Bairro': (['sublocality_level_1', 'sublocality', 'neighborhood'], 'long_name'),
+    'Município': (['administrative_area_level_2', 'locality'], 'long_name'),
+    'Estado': (['administrative_area_level_1'], 'short_name'),
+    'CEP': (['postal_code'], 'long_name'),
+    'País': (['country'], 'long_name'),
+}
 
 def parse_address(addr):
     if not isinstance(addr, str) or addr == "No address found" or addr.startswith("Error") or "Mock Address" in addr:
@@ -44,7 +77,7 @@ def parse_address(addr):
     # 2. PEEL OFF ZIP CODE (CEP)
     # Regex for Zip: \d{5}-?\d{3} at the end
     # We search at end of string
-    zip_match = re.search(r'(\d{5}[-\s]?\d{3})$', clean_addr)
+    zip_match = ZIP_RE.search(clean_addr)
     if zip_match:
         cep = zip_match.group(1)
         clean_addr = clean_addr[:zip_match.start()].strip().strip(",").strip("-").strip()
@@ -52,7 +85,7 @@ def parse_address(addr):
     # 3. PEEL OFF STATE (UF)
     # Usually " - PA" or ", PA" or "State of Pará" at the end.
     # Check for 2-letter state code first
-    state_match = re.search(r'[\s,-]+([A-Z]{2})$', clean_addr)
+    state_match = STATE_RE.search(clean_addr)
     if state_match:
         estado = state_match.group(1)
         clean_addr = clean_addr[:state_match.start()].strip()
@@ -94,25 +127,11 @@ def parse_address(addr):
              # We can assume if the string is short/alpha, it's the city.
              pass 
         
-        # Fallback: check against known cities list (Belém, Ananindeua, Marituba) to be safe
-        known_cities = ["Belém", "Ananindeua", "Marituba", "Outeiro", "Icoaraci", "Mosqueiro"]
-        clean_addr_lower = clean_addr.lower()
-        found_city = False
-        for city in known_cities:
-            if clean_addr_lower.endswith(city.lower()):
-                municipio = city # Use the known casing
-                # Remove city from end
-                # Use regex to replace from end
-                clean_addr = re.sub(f'{city}$', '', clean_addr, flags=re.IGNORECASE).strip().strip(",").strip("-").strip()
-                found_city = True
-                break
-        
-        if not found_city:
-             # If we haven't found a city yet, and we are left with something like "Belém", just take it.
-             # But if we are left with "Rua X", and City is missing/implicit?
-             # Let's leave Municipio None if we can't find separation.
-             # Exception: if clean_addr is ONLY the city.
-             pass
+        # Fallback: a known city of the gazetteer at the end (accents and case ignored)
+        city_match = CITY_SUFFIX_RE.search(clean_addr)
+        if city_match:
+            municipio = canonical_city(city_match.group(0))
+            clean_addr = clean_addr[:city_match.start()].strip().strip(",").strip("-").strip()
 
     # 5. PEEL OFF NEIGHBORHOOD (Bairro)
     # Remaining: "Street, Num - Hood" or "Street - Hood" or "Street, Num".
@@ -143,22 +162,127 @@ def parse_address(addr):
 
     return pd.Series([logradouro, numero, bairro, municipio, estado, cep, pais])
 
-def main():
-    if not os.path.exists(INPUT_FILE):
-        print(f"Error: {INPUT_FILE} not found.")
-        return
+def _strip_seps(s):
+    return s.str.strip().str.strip(",").str.strip("-").str.strip()
 
-    print(f"Reading {INPUT_FILE}...")
-    try:
-        df = pd.read_excel(INPUT_FILE)
-    except Exception as e:
-        print(f"Error reading excel: {e}")
-        return
+def parse_address_column(addresses):
+    """
+    Vectorized equivalent of `addresses.apply(parse_address)`.
+    Each field is peeled off the whole column at once with pandas .str
+    operations, in the same order and with the same rules as parse_address.
+    """
+    out = pd.DataFrame(None, index=addresses.index, columns=PARSED_COL_NAMES, dtype=object)
+
+    is_str = addresses.map(lambda a: isinstance(a, str))
+    text = addresses[is_str].astype(object)
+    valid = (text != "No address found") & ~text.str.startswith("Error") & ~text.str.contains("Mock Address", regex=False)
+    clean = text[valid].str.strip()
+    if clean.empty:
+        return out
+
+    # 1. Country
+    lower = clean.str.lower()
+    is_brazil = lower.str.endswith("brazil")
+    is_brasil = ~is_brazil & lower.str.endswith("brasil")
+    has_country = is_brazil | is_brasil
+    out.loc[is_brazil[is_brazil].index, 'País'] = "Brazil"
+    out.loc[is_brasil[is_brasil].index, 'País'] = "Brasil"
+    clean[has_country] = clean[has_country].str[:-6].str.strip().str.strip(",").str.strip()
+
+    # 2. CEP
+    zip_parts = clean.str.extract(ZIP_SPLIT_RE)
+    has_zip = zip_parts[1].notna()
+    out.loc[has_zip[has_zip].index, 'CEP'] = zip_parts.loc[has_zip, 1]
+    clean[has_zip] = _strip_seps(zip_parts.loc[has_zip, 0])
+
+    # 3. State (UF), with the "State of Pará" fallback
+    state_parts = clean.str.extract(STATE_SPLIT_RE)
+    has_state = state_parts[1].notna()
+    out.loc[has_state[has_state].index, 'Estado'] = state_parts.loc[has_state, 1]
+    clean[has_state] = state_parts.loc[has_state, 0].str.strip()
+    state_of_para = ~has_state & clean.str.contains("State of Pará", regex=False)
+    out.loc[state_of_para[state_of_para].index, 'Estado'] = "PA"
+    clean[state_of_para] = _strip_seps(clean[state_of_para].str.replace("State of Pará", "", regex=False))
+
+    # 4. City: text after the last comma, else a known city (gazetteer) at the end
+    has_comma = clean.str.contains(",", regex=False)
+    city_parts = clean[has_comma].str.rsplit(",", n=1, expand=True)
+    if not city_parts.empty:
+        out.loc[city_parts.index, 'Município'] = city_parts[1].str.strip()
+        clean[has_comma] = city_parts[0].str.strip()
+    city_parts = clean[~has_comma].str.extract(CITY_SPLIT_RE)
+    found = city_parts[1].notna()
+    idx = found[found].index
+    if len(idx):
+        out.loc[idx, 'Município'] = city_parts.loc[found, 1].map(canonical_city)
+        clean[idx] = _strip_seps(city_parts.loc[found, 0])
+
+    # 5. Bairro
+    has_hood = clean.str.contains(" - ", regex=False)
+    hood_parts = clean[has_hood].str.rsplit(" - ", n=1, expand=True)
+    if not hood_parts.empty:
+        out.loc[hood_parts.index, 'Bairro'] = hood_parts[1].str.strip()
+        clean[has_hood] = hood_parts[0].str.strip()
+
+    # 6. Street and number
+    has_num = clean.str.contains(",", regex=False)
+    num_parts = clean[has_num].str.rsplit(",", n=1, expand=True)
+    out.loc[clean.index, 'Logradouro'] = clean
+    if not num_parts.empty:
+        out.loc[num_parts.index, 'Logradouro'] = num_parts[0].str.strip()
+        out.loc[num_parts.index, 'Número'] = num_parts[1].str.strip()
+
+    return out
+
+def parse_address_components(results):
+    """
+    Read the parsed columns straight from the structured address_components
+    of a raw reverse-geocode response (no string heuristics).
+    """
+    if not results:
+        return [None] * len(PARSED_COL_NAMES)
 
+    by_type = {}
+    for comp in results[0].get('address_components', []):
+        for t in comp.get('types', []):
+            by_type.setdefault(t, comp)
+
+    values = []
+    for col in PARSED_COL_NAMES:
+        types, name = COMPONENT_TYPES[col]
+        comp = next((by_type[t] for t in types if t in by_type), None)
+        values.append(comp.get(name) if comp else None)
+    return values
+
+def parse_raw_responses(lats, lngs, responses):
+    """
+    Parse rows from a {coord_key: results} mapping (see raw_store.RawResponseStore.load).
+    Returns the parsed DataFrame and a mask of the rows that had a stored response.
+    """
+    rows, found = [], []
+    for lat, lng in zip(lats, lngs):
+        results = None
+        if not pd.isna(lat) and not pd.isna(lng):
+            results = responses.get(coord_key(lat, lng))
+        found.append(results is not None)
+        rows.append(parse_address_components(results))
+    parsed = pd.DataFrame(rows, index=lats.index, columns=PARSED_COL_NAMES, dtype=object)
+    return parsed, pd.Series(found, index=lats.index)
+
+def parse_frame(df, responses=None, verbose=True, canonical=CANONICALIZE, collapse_variants=True):
+    """
+    Build the treated table (columns N, O, P, the Google address and the parsed
+    fields) from a process_locations output. If `responses` ({coord_key: results})
+    is given, fields are read from address_components where a response exists.
+    With `canonical`, Bairro/Município/Logradouro are mapped through the gazetteer,
+    and with `collapse_variants` spellings of names outside it are unified too
+    (by frequency in `df`, so only for a whole table, not for chunks of one).
+    Returns None if the frame doesn't have the expected columns.
+    """
     feature_cols_indices = [13, 14, 15] # N, O, P
     if len(df.columns) <= max(feature_cols_indices):
         print("Error: DataFrame columns issue.")
-        return
+        return None
 
     cols_n_o_p = df.iloc[:, feature_cols_indices]
     
@@ -170,17 +294,84 @@ def main():
     new_df = cols_n_o_p.copy()
     new_df[addr_col_name] = address_series
 
+    with METRICS.timer('parse.fields'):
+        parsed_data = parse_address_column(new_df[addr_col_name])
+
+    if responses is not None:
+        if "_Localização_latitude" not in df.columns:
+            print("Error: coordinate columns not found; cannot match raw responses.")
+            return None
+        lats = pd.to_numeric(df["_Localização_latitude"], errors='coerce')
+        lngs = pd.to_numeric(df["_Localização_longitude"], errors='coerce')
+        with METRICS.timer('parse.raw_components'):
+            raw_parsed, found = parse_raw_responses(lats, lngs, responses)
+        # Rows without a stored response keep the string-parsed fields
+        parsed_data.loc[found] = raw_parsed.loc[found]
+        if verbose:
+            print(f"{int(found.sum())} rows parsed from address_components, {int((~found).sum())} from the formatted address.")
+
+    if canonical:
+        # One spelling per bairro/city/street, so the site doesn't count variants separately
+        with METRICS.timer('parse.gazetteer'):
+            canonicalize_columns(parsed_data, collapse=collapse_variants)
+
+    result = pd.concat([new_df, parsed_data], axis=1)
+    for column in (ESTABLISHMENT_COLUMN, CANONICAL_COLUMN):
+        if column in df.columns:
+            result[column] = df[column]
+    if "_Localização_latitude" in df.columns:
+        # Official district/bairro by point-in-polygon, when boundary files are available
+        with METRICS.timer('parse.districts'):
+            areas = locate_areas(df["_Localização_latitude"], df["_Localização_longitude"])
+        for column in areas.columns:
+            result[column] = areas[column].to_numpy()
+        if OFFICIAL_BAIRRO_COLUMN in areas.columns:
+            missing = result['Bairro'].isna() | (result['Bairro'] == '')
+            result.loc[missing, 'Bairro'] = result.loc[missing, OFFICIAL_BAIRRO_COLUMN]
+    return result
+
+def main(from_raw=False, export_excel=True):
+    if not os.path.exists(INPUT_FILE):
+        print(f"Error: {INPUT_FILE} not found.")
+        return
+
+    stage_start = time.perf_counter()
+    print(f"Reading {INPUT_FILE}...")
+    try:
+        with METRICS.timer('parse.read'):
+            df = read_table(INPUT_FILE)
+    except Exception as e:
+        print(f"Error reading {INPUT_FILE}: {e}")
+        return
+
+    responses = None
+    if from_raw:
+        store = RawResponseStore()
+        responses = store.load()
+        print(f"Loaded {len(responses)} raw responses from {store.path}.")
+
     print("Parsing addresses with robust logic...")
-    parsed_col_names = ['Logradouro', 'Número', 'Bairro', 'Município', 'Estado', 'CEP', 'País']
-    
-    parsed_data = new_df[addr_col_name].apply(parse_address)
-    parsed_data.columns = parsed_col_names
-    
-    final_df = pd.concat([new_df, parsed_data], axis=1)
+    final_df = parse_frame(df, responses)
+    if final_df is None:
+        return
 
     print(f"Saving to {OUTPUT_FILE}...")
-    final_df.to_excel(OUTPUT_FILE, index=False)
+    with METRICS.timer('parse.write'):
+        write_table(final_df, OUTPUT_FILE)
+    if export_excel and OUTPUT_FILE != EXPORT_FILE:
+        print(f"Exporting {EXPORT_FILE}...")
+        with METRICS.timer('parse.excel'):
+            final_df.to_excel(EXPORT_FILE, index=False)
+    METRICS.add_duration('parse', time.perf_counter() - stage_start)
+    METRICS.set_rows('parse', len(final_df))
+    METRICS.write_reports('parse_addresses')
     print("Done successfully.")
 
 if __name__ == "__main__":
-    main()
+    parser = argparse.ArgumentParser(description="Split Google addresses into structured columns.")
+    parser.add_argument('--from-raw', action='store_true',
+                        help="read fields from the stored address_components (geocode_raw.jsonl.gz) instead of the address string")
+    parser.add_argument('--no-excel', action='store_true',
+                        help=f"skip the {EXPORT_FILE} export (the columnar output is still written)")
+    args = parser.parse_args()
+    main(from_raw=args.from_raw, export_excel=not args.no_excel)
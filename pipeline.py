@@ -0,0 +1,269 @@
+import os
+import json
+import time
+import queue
+import argparse
+import tempfile
+import threading
+from collections import Counter
+import pandas as pd
+import process_locations
+import parse_addresses
+import generate_site
+from rate_limiter import TokenBucket
+from table_io import ChunkedTableWriter, intermediate_path
+from establishments import CANONICAL_COLUMN
+from build_cache import BuildCache
+from publish import publish_site
+from metrics import METRICS
+
+# Single streaming command: KoBo CSV -> geocode -> parse -> index.html (+ data.js and density.js for the map).
+# The CSV is read in chunks and each stage runs in its own thread, connected by
+# bounded queues, so chunk N is parsed while chunk N+1 is being geocoded.
+# Memory: full rows are only held a few chunks at a time (table rows are
+# spooled to disk), but two things still grow with the number of records:
+# the establishment groups need the coordinates, name, phone and date of every
+# row before the first chunk is geocoded (a pre-pass over those columns only),
+# and the map columns of every row are collected from the chunks for data.js
+# and density.js, instead of reading the CSV again.
+
+# Configuration
+CHUNK_SIZE = 500
+QUEUE_DEPTH = 2  # Chunks buffered between two stages
+QUEUE_TIMEOUT = 0.2  # Seconds between checks of the cancel flag while a queue is full or empty
+PARSED_OUTPUT = intermediate_path('output_enderecos_tratado')  # Same file parse_addresses.py writes
+
+_DONE = object()
+
+def _put(q, item, cancel):
+    """
+    Put `item` on a bounded queue, giving up once the run is cancelled.
+    Returns False if the item was not queued.
+    """
+    while not cancel.is_set():
+        try:
+            q.put(item, timeout=QUEUE_TIMEOUT)
+            return True
+        except queue.Full:
+            pass
+    return False
+
+def _discard(q):
+    while True:
+        try:
+            q.get_nowait()
+        except queue.Empty:
+            return
+
+def _stage(name, work, in_q, out_q, errors, cancel):
+    """
+    Run a stage body in a thread; always signal the next stage when it ends.
+    A failing stage cancels the run and empties its input queue, so the
+    stage feeding it is never left blocked on a full queue.
+    """
+    def run():
+        try:
+            work()
+        except BaseException as e:
+            errors.append((name, e))
+            cancel.set()
+            if in_q is not None:
+                _discard(in_q)
+        finally:
+            _put(out_q, _DONE, cancel)
+    thread = threading.Thread(target=run, name=name, daemon=True)
+    thread.start()
+    return thread
+
+def _drain(q, cancel):
+    """
+    Items of a queue up to the end marker; stops early when the run is cancelled.
+    """
+    while not cancel.is_set():
+        try:
+            item = q.get(timeout=QUEUE_TIMEOUT)
+        except queue.Empty:
+            continue
+        if item is _DONE:
+            return
+        yield item
+
+class SiteAggregator:
+    """
+    Running totals for generate_site. Table rows are spooled to a temporary
+    file as JSON so only the counters live in memory.
+    """
+
+    def __init__(self):
+        self.total_records = 0
+        self.bairros = set()
+        self.ceps = set()
+        self.bairro_counts = Counter()
+        self.columns = None
+        self.spool = tempfile.TemporaryFile(mode='w+', encoding='utf-8')
+
+    def add(self, df):
+        if CANONICAL_COLUMN in df.columns:
+            # Repeated registrations of a stall are not counted or listed
+            df = df[df[CANONICAL_COLUMN].fillna(True).astype(bool)]
+        df = df.fillna('')
+        if self.columns is None:
+            self.columns = [c for c in generate_site.TABLE_COLUMNS if c in df.columns] or df.columns[:5].tolist()
+        self.total_records += len(df)
+        if 'Bairro' in df.columns:
+            self.bairros.update(df['Bairro'])
+            self.bairro_counts.update(df.loc[df['Bairro'] != '', 'Bairro'])
+        if 'CEP' in df.columns:
+            self.ceps.update(df['CEP'])
+        for record in df[self.columns].to_dict(orient='records'):
+            self.spool.write(json.dumps(record) + '\n')
+
+    def write_html(self, path, html_content, coverage_html=''):
+        top = self.bairro_counts.most_common(10)
+        marker = '__TABLE_DATA__'
+        page = generate_site.build_page(
+            html_content, self.total_records, len(self.bairros), len(self.ceps),
+            [b for b, _ in top], [n for _, n in top], self.columns or [], marker,
+            coverage_html=coverage_html)
+        head, tail = page.split(marker, 1)
+
+        self.spool.seek(0)
+        with open(path, 'w', encoding='utf-8') as f:
+            f.write(head)
+            # Same layout as json.dumps(list_of_records)
+            f.write('[')
+            for i, line in enumerate(self.spool):
+                if i:
+                    f.write(', ')
+                f.write(line.rstrip('\n'))
+            f.write(']')
+            f.write(tail)
+        self.spool.close()
+
+def run_pipeline(chunk_size=CHUNK_SIZE, workers=process_locations.WORKERS, qps=process_locations.QPS,
+                 dedup_radius=process_locations.DEDUP_RADIUS_M, write_parsed=True, allow_cdn=False):
+    input_csv = process_locations.INPUT_CSV
+    if not os.path.exists(input_csv):
+        print(f"Error: Input file '{input_csv}' not found.")
+        return
+
+    html_content = generate_site.render_report()
+    if html_content is None:
+        return
+
+    gmaps = process_locations.create_client()
+    if gmaps is None and not process_locations.DRY_RUN:
+        print("WARNING: Valid Google Maps API Key not found in .env file.")
+        print("Please set GOOGLE_MAPS_API_KEY in .env")
+        return
+
+    cache, journal, raw_store = process_locations.open_stores()
+    limiter = TokenBucket(qps)
+    limit = 5 if process_locations.DRY_RUN else None
+
+    started = time.perf_counter()
+    establishments = None
+    if process_locations.MERGE_DUPLICATES:
+        # Repeated registrations of a stall can fall in different chunks, so the
+        # groups are found once over the whole file (only a few columns are read)
+        with METRICS.timer('geocode.establishments'):
+            establishments = process_locations.find_all_establishments(input_csv)
+    # Read everything as text so every chunk has the same dtypes
+    chunks = pd.read_csv(input_csv, delimiter=';', dtype=str, chunksize=chunk_size)
+    geocoded_q = queue.Queue(maxsize=QUEUE_DEPTH)
+    parsed_q = queue.Queue(maxsize=QUEUE_DEPTH)
+    errors = []
+    cancel = threading.Event()
+
+    map_parts = []  # Map columns of every chunk, for load_map_points
+
+    def geocode():
+        for n, chunk in enumerate(chunks):
+            if cancel.is_set():
+                return
+            if "_Localização_latitude" not in chunk.columns or "_Localização_longitude" not in chunk.columns:
+                raise ValueError("Latitude/Longitude columns not found.")
+            print(f"[geocode] chunk {n + 1}: rows {chunk.index[0] + 1}-{chunk.index[-1] + 1}")
+            with METRICS.timer('geocode'):
+                process_locations.geocode_frame(chunk, gmaps, cache, journal, raw_store, limiter,
+                                                workers, dedup_radius, limit, establishments=establishments)
+            METRICS.set_rows('geocode', len(chunk))
+            map_parts.append(chunk[[c for c in chunk.columns if c in generate_site.MAP_COLUMNS]])
+            if not _put(geocoded_q, chunk, cancel):
+                return
+
+    writer = ChunkedTableWriter(PARSED_OUTPUT) if write_parsed else None
+
+    def parse():
+        for chunk in _drain(geocoded_q, cancel):
+            with METRICS.timer('parse'):
+                # Spelling variants outside the gazetteer are unified by frequency, which
+                # needs the whole table: per chunk only the gazetteer is applied
+                parsed = parse_addresses.parse_frame(chunk, collapse_variants=False)
+            METRICS.set_rows('parse', len(chunk))
+            if parsed is None:
+                raise ValueError("Unexpected CSV layout.")
+            if writer is not None:
+                writer.write(parsed)
+            if not _put(parsed_q, parsed, cancel):
+                return
+
+    threads = [_stage('geocode', geocode, None, geocoded_q, errors, cancel),
+               _stage('parse', parse, geocoded_q, parsed_q, errors, cancel)]
+
+    aggregator = SiteAggregator()
+    try:
+        for parsed in _drain(parsed_q, cancel):
+            with METRICS.timer('site'):
+                aggregator.add(parsed)
+            print(f"[render] {aggregator.total_records} records aggregated")
+    except Exception as e:
+        errors.append(('render', e))
+        cancel.set()
+        _discard(parsed_q)
+    except BaseException:
+        cancel.set()
+        raise
+
+    for thread in threads:
+        thread.join()
+    process_locations.close_stores(cache, journal, raw_store)
+    if writer is not None:
+        writer.close()
+        print(f"Wrote {writer.rows} parsed rows to {PARSED_OUTPUT}.")
+
+    if errors:
+        name, error = errors[0]
+        print(f"Error in {name} stage: {error}")
+        return
+
+    cache = BuildCache()
+    points = pd.concat(map_parts, ignore_index=True) if map_parts else None
+    map_parts.clear()
+    map_data = generate_site.map_data_loader(points=points)
+    density = generate_site.generate_density(cache, map_data)
+    with METRICS.timer('site'):
+        coverage_html = generate_site.render_coverage(density['coverage'] if density else None)
+        aggregator.write_html(generate_site.OUTPUT_HTML, html_content, coverage_html)
+    METRICS.set_rows('site', aggregator.total_records)
+    print(f"Successfully generated {generate_site.OUTPUT_HTML} from {aggregator.total_records} records.")
+    generate_site.generate_map_data(cache=cache, map_data=map_data)
+    publish_site(cache=cache, allow_cdn=allow_cdn)
+
+    # Stage times are busy time per thread; they overlap, so 'pipeline' is the wall time
+    METRICS.add_duration('pipeline', time.perf_counter() - started)
+    report = METRICS.write_reports('pipeline')
+    print(f"{report['cost']['billable_calls']} billable API calls, estimated cost ${report['cost']['estimated_usd']:.2f}.")
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description="Stream the KoBo CSV through geocoding, parsing and site generation.")
+    parser.add_argument('--chunk-size', type=int, default=CHUNK_SIZE, help="CSV rows per chunk")
+    parser.add_argument('--workers', type=int, default=process_locations.WORKERS)
+    parser.add_argument('--qps', type=float, default=process_locations.QPS)
+    parser.add_argument('--dedup-radius', type=float, default=process_locations.DEDUP_RADIUS_M)
+    parser.add_argument('--no-parsed-output', action='store_true',
+                        help=f"don't write {PARSED_OUTPUT}")
+    parser.add_argument('--allow-cdn', action='store_true',
+                        help="publish even if some libraries are not vendored (the pages load them from the CDN)")
+    args = parser.parse_args()
+    run_pipeline(args.chunk_size, args.workers, args.qps, args.dedup_radius, not args.no_parsed_output, args.allow_cdn)
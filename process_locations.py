@@ -1,53 +1,471 @@
 import os
 import time
+import argparse
+import numpy as np
 import pandas as pd
 import googlemaps
+from concurrent.futures import ThreadPoolExecutor
 from dotenv import load_dotenv
+from geocode_cache import GeocodeCache, is_cacheable, CACHE_PRECISION
+from rate_limiter import TokenBucket
+from spatial_index import bucket_points
+from checkpoint import GeocodeJournal, submission_keys
+from establishments import find_establishments, tag_establishments, NAME_COLUMN, PHONE_COLUMN, \
+    ESTABLISHMENT_COLUMN, CANONICAL_COLUMN
+from metrics import METRICS, METRICS_DIR
+from raw_store import RawResponseStore
+from retry import CircuitBreaker, CircuitOpen, call_with_retry, error_result, is_failed, CIRCUIT_OPEN_ERROR
+from table_io import intermediate_path, read_table, write_table
 
 # Load environment variables
 load_dotenv()
 
 # Configuration
 INPUT_CSV = 'Açaí_no_ponto_-_all_versions_-_labels_-_2025-11-26-17-29-38.csv'
-OUTPUT_FILE = 'output_enderecos.xlsx'
+OUTPUT_FILE = intermediate_path('output_enderecos')
+DELTA_OUTPUT_FILE = intermediate_path('output_enderecos_delta')
 API_KEY = os.getenv('GOOGLE_MAPS_API_KEY')
 DRY_RUN = False  # Set to True to test without API calls or limit records
+USE_CACHE = True  # Reuse addresses stored in geocode_cache.sqlite by previous runs
+WORKERS = 8       # Concurrent geocoding threads (1 = serial)
+QPS = 10          # Requests per second shared by all workers (Google quota)
+DEDUP_RADIUS_M = 10  # Points closer than this share one lookup (0 disables)
+USE_JOURNAL = True   # Checkpoint every result to geocode_journal.jsonl (resumable runs)
+USE_RAW_STORE = True # Keep full API responses in geocode_raw.jsonl.gz for offline re-parsing
+MERGE_DUPLICATES = True  # Repeated registrations of the same stall reuse one lookup (see establishments.py)
+LAT_COLUMN = '_Localização_latitude'
+LNG_COLUMN = '_Localização_longitude'
+# Columns needed to geocode (the pipeline reads only these to find the establishments up front)
+INGEST_COLUMNS = [LAT_COLUMN, LNG_COLUMN, '_id', '_uuid', '_submission_time', NAME_COLUMN, PHONE_COLUMN]
+# Every column of the KoBo "all versions" export, in order
+KOBO_COLUMNS = [
+    "start", "end", "Org", "Nome do profissional de saúde", "Qual o distrito de saúde?",
+    "Qual o distrito de saúde?/DABEL", "Qual o distrito de saúde?/DABEN", "Qual o distrito de saúde?/DAENT",
+    "Qual o distrito de saúde?/DAGUA", "Qual o distrito de saúde?/DAICO", "Qual o distrito de saúde?/DAMOS",
+    "Qual o distrito de saúde?/DAOUT", "Qual o distrito de saúde?/DASAC",
+    "Nome do ponto de venda ou do proprietário", "Telefone de contato", "Localização",
+    "_Localização_latitude", "_Localização_longitude", "_Localização_altitude", "_Localização_precision",
+    "_id", "_uuid", "_submission_time", "_validation_status", "_notes", "_status", "_submitted_by",
+    "__version__", "_tags", "_index",
+]
+# Belém metropolitan area incl. Mosqueiro and the islands (lat_min, lat_max, lng_min, lng_max).
+# Points outside it are GPS errors and are not sent to the API (None disables the check)
+BBOX = (-1.60, -0.95, -48.70, -48.10)
 
-def get_address(gmaps, lat, lng):
+# Outcome of the coordinate validation, per row
+COORD_VALID, COORD_INVALID, COORD_EMPTY, COORD_OUT_OF_BOUNDS = 0, 1, 2, 3
+COORD_LABELS = {
+    COORD_INVALID: "Invalid Coordinates",
+    COORD_EMPTY: "Empty/Zero Coordinates",
+    COORD_OUT_OF_BOUNDS: "Out of Bounds Coordinates",
+}
+
+# Shared across all threads so the total request rate never exceeds QPS
+RATE_LIMITER = TokenBucket(QPS)
+# Shared too, so all workers stop calling the API when it is down (see retry.py)
+CIRCUIT_BREAKER = CircuitBreaker()
+
+def classify_coordinates(raw_lats, raw_lngs, bbox=BBOX):
+    """
+    Validate two coordinate columns in one vectorized pass.
+    Returns (lats, lngs, status): float arrays (NaN where unusable) and a
+    COORD_* code per row. Text that is not a number is COORD_INVALID; missing
+    or 0, 0 (GPS not acquired) is COORD_EMPTY; outside `bbox`, COORD_OUT_OF_BOUNDS.
+    """
+    raw_lats, raw_lngs = pd.Series(raw_lats), pd.Series(raw_lngs)
+    lats = pd.to_numeric(raw_lats, errors='coerce').to_numpy(dtype=float)
+    lngs = pd.to_numeric(raw_lngs, errors='coerce').to_numpy(dtype=float)
+
+    status = np.full(len(lats), COORD_VALID, dtype=np.int8)
+    missing = np.isnan(lats) | np.isnan(lngs)
+    status[missing | ((lats == 0) & (lngs == 0))] = COORD_EMPTY
+    # Present but not parsed as a number (the only case where to_numeric returns NaN for a non-NaN input)
+    unparsed = (raw_lats.notna().to_numpy() & np.isnan(lats)) | (raw_lngs.notna().to_numpy() & np.isnan(lngs))
+    status[unparsed] = COORD_INVALID
+    if bbox is not None:
+        lat_min, lat_max, lng_min, lng_max = bbox
+        with np.errstate(invalid='ignore'):
+            outside = ~((lats >= lat_min) & (lats <= lat_max) & (lngs >= lng_min) & (lngs <= lng_max))
+        status[(status == COORD_VALID) & outside] = COORD_OUT_OF_BOUNDS
+    return lats, lngs, status
+
+def classify_point(lat, lng, bbox=BBOX):
+    """
+    classify_coordinates for a single point, without pandas (for the HTTP service).
+    Returns (lat, lng, status).
+    """
+    try:
+        lat, lng = float(lat), float(lng)
+    except (TypeError, ValueError):
+        return None, None, (COORD_EMPTY if lat is None or lng is None else COORD_INVALID)
+    if np.isnan(lat) or np.isnan(lng) or (lat == 0 and lng == 0):
+        return lat, lng, COORD_EMPTY
+    if bbox is not None and not (bbox[0] <= lat <= bbox[1] and bbox[2] <= lng <= bbox[3]):
+        return lat, lng, COORD_OUT_OF_BOUNDS
+    return lat, lng, COORD_VALID
+
+def read_ingest(path, columns=INGEST_COLUMNS):
+    """
+    Read only the columns needed to geocode the KoBo CSV (every column with
+    columns=None), with the coordinates parsed as floats by the C parser. If
+    some coordinate is not a number they are read as text instead, so
+    classify_coordinates can flag those rows.
+    """
+    header = pd.read_csv(path, delimiter=';', nrows=0).columns
+    usecols = [c for c in columns if c in header] if columns is not None else None
+    ingest = [c for c in INGEST_COLUMNS if c in header]
+    text = {c: str for c in ingest if c not in (LAT_COLUMN, LNG_COLUMN, '_id')}
+    coords = [c for c in (LAT_COLUMN, LNG_COLUMN) if c in ingest]
+    try:
+        return pd.read_csv(path, delimiter=';', usecols=usecols, dtype=dict(text, **{c: 'float64' for c in coords}))
+    except ValueError:
+        return pd.read_csv(path, delimiter=';', usecols=usecols, dtype=dict(text, **{c: str for c in coords}))
+
+def get_address(gmaps, lat, lng, cache=None, limiter=None, raw_store=None, breaker=None):
     """
     Reverse geocode a set of coordinates.
     Returns the first formatted address found.
+    If a cache is given it is checked first and filled with new results.
+    If a raw store is given the full API response is saved in it.
+    Retryable API errors are retried with backoff (see retry.py); a final
+    failure is returned as an "Error: ..." string.
     """
-    if not API_KEY or API_KEY == 'your_api_key_here':
+    if cache is not None:
+        cached = cache.get(lat, lng)
+        if cached is not None:
+            METRICS.count('cache_hits')
+            return cached
+
+    if gmaps is None:
         return "API_KEY_ERROR"
 
+    def call():
+        # Rate limiting: token bucket shared by every worker thread, retries included.
+        (limiter or RATE_LIMITER).acquire()
+        start = time.perf_counter()
+        try:
+            return gmaps.reverse_geocode((lat, lng))
+        finally:
+            METRICS.observe_latency(time.perf_counter() - start, 'reverse_geocode')
+
     try:
-        # Rate limiting: simple sleep. 
-        # Free tier is generous but good practice to not hammer.
-        time.sleep(0.1) 
-        
-        results = gmaps.reverse_geocode((lat, lng))
+        results = call_with_retry(call, breaker or CIRCUIT_BREAKER, on_retry=lambda attempt, e: METRICS.count('api_retries'))
+        METRICS.count('api_success' if results else 'api_no_result')
+        if raw_store is not None:
+            raw_store.put(lat, lng, results)
         if results:
-            return results[0].get('formatted_address', 'No address found')
+            addr = results[0].get('formatted_address', 'No address found')
+            if cache is not None and is_cacheable(addr):
+                cache.put(lat, lng, addr)
+            return addr
         return "No results"
+    except CircuitOpen:
+        METRICS.count('circuit_open_skips')
+        return CIRCUIT_OPEN_ERROR
     except Exception as e:
-        return f"Error: {str(e)}"
+        METRICS.count('api_error')
+        return error_result(e)
+
+def get_coordinates(gmaps, address, cache=None, limiter=None, breaker=None):
+    """
+    Forward geocode an address, biased to the Belém area (BBOX).
+    Returns (lat, lng, formatted_address); on failure lat and lng are None
+    and the third item is "No results" or an "Error: ..." string, as in get_address.
+    """
+    if cache is not None:
+        cached = cache.get_forward(address)
+        if cached is not None:
+            METRICS.count('cache_hits')
+            return cached
+
+    if gmaps is None:
+        return None, None, "API_KEY_ERROR"
+
+    bounds = None
+    if BBOX is not None:
+        lat_min, lat_max, lng_min, lng_max = BBOX
+        bounds = {'southwest': (lat_min, lng_min), 'northeast': (lat_max, lng_max)}
+
+    def call():
+        (limiter or RATE_LIMITER).acquire()
+        start = time.perf_counter()
+        try:
+            return gmaps.geocode(address, components={'country': 'BR'}, bounds=bounds, region='br')
+        finally:
+            METRICS.observe_latency(time.perf_counter() - start, 'geocode')
+
+    try:
+        results = call_with_retry(call, breaker or CIRCUIT_BREAKER, on_retry=lambda attempt, e: METRICS.count('api_retries'))
+        METRICS.count('api_success' if results else 'api_no_result')
+        if not results:
+            return None, None, "No results"
+        location = results[0]['geometry']['location']
+        found = (location['lat'], location['lng'], results[0].get('formatted_address', 'No address found'))
+        if cache is not None and is_cacheable(found[2]):
+            cache.put_forward(address, *found)
+        return found
+    except CircuitOpen:
+        METRICS.count('circuit_open_skips')
+        return None, None, CIRCUIT_OPEN_ERROR
+    except Exception as e:
+        METRICS.count('api_error')
+        return None, None, error_result(e)
+
+def geocode_coordinates(gmaps, coords, cache=None, workers=WORKERS, limiter=None, on_result=None,
+                        raw_store=None):
+    """
+    Reverse geocode a list of (lat, lng) pairs using a pool of worker threads.
+    The returned list is in the same order as `coords`.
+    `on_result(i, address)` is called from the worker as soon as item i finishes.
+    """
+    total = len(coords)
+
+    def task(item):
+        i, (lat, lng) = item
+        # Single write so lines from concurrent workers don't interleave
+        print(f"Geocoding {i+1}/{total}: ({lat}, {lng})\n", end='')
+        addr = get_address(gmaps, lat, lng, cache, limiter, raw_store)
+        if on_result is not None:
+            on_result(i, addr)
+        return addr
+
+    if workers <= 1:
+        return [task(item) for item in enumerate(coords)]
+
+    # executor.map yields results in submission order
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        return list(executor.map(task, enumerate(coords)))
+
+def geocode_addresses(gmaps, addresses, cache=None, workers=WORKERS, limiter=None):
+    """
+    Forward geocode a list of addresses using a pool of worker threads.
+    Returns get_coordinates() tuples in the same order as `addresses`.
+    """
+    total = len(addresses)
+
+    def task(item):
+        i, address = item
+        print(f"Geocoding {i+1}/{total}: {address}\n", end='')
+        return get_coordinates(gmaps, address, cache, limiter)
+
+    if workers <= 1:
+        return [task(item) for item in enumerate(addresses)]
+
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        return list(executor.map(task, enumerate(addresses)))
+
+def unique_buckets(coords, radius_m):
+    """
+    bucket_points on a list of (lat, lng), with exact repeats (at the cache
+    precision) collapsed first so the greedy bucketing only sees each point once.
+    Same result contract as bucket_points: indices into `coords`.
+    """
+    if not coords:
+        return bucket_points([], [], radius_m)
+    points = np.asarray(coords, dtype=float)
+    _, first, inverse = np.unique(np.round(points, CACHE_PRECISION), axis=0, return_index=True, return_inverse=True)
+    # Keep the input order, like bucket_points does
+    order = np.argsort(first, kind='stable')
+    firsts = first[order]
+    rank = np.empty_like(order)
+    rank[order] = np.arange(len(order))
+    labels, reps = bucket_points(points[firsts, 0], points[firsts, 1], radius_m)
+    return firsts[labels[rank[inverse.ravel()]]], firsts[reps]
+
+def find_all_establishments(path):
+    """
+    Establishments of every row of the KoBo CSV, found over the whole file
+    from the few columns they need. Returns (establishment ids, position of
+    the canonical record), both indexed by row number.
+    """
+    df = read_ingest(path)
+    canonical = find_establishments(df)
+    tag_establishments(df, canonical)
+    return df[ESTABLISHMENT_COLUMN].to_numpy(), canonical
+
+def chunk_establishments(df, ids, canonical):
+    """
+    Tag a chunk of the CSV (indexed by row number) with the establishments
+    of the whole file. Returns the canonical position of each row within the
+    chunk; a row whose canonical record is in another chunk is its own.
+    """
+    rows = df.index.to_numpy()
+    df[ESTABLISHMENT_COLUMN] = ids[rows]
+    df[CANONICAL_COLUMN] = canonical[rows] == rows
+    position = {row: pos for pos, row in enumerate(rows.tolist())}
+    return np.array([position.get(c, pos) for pos, c in enumerate(canonical[rows].tolist())], dtype=np.int64)
+
+def geocode_frame(df, gmaps, cache=None, journal=None, raw_store=None, limiter=None,
+                  workers=WORKERS, dedup_radius=DEDUP_RADIUS_M, limit=None, merge_duplicates=MERGE_DUPLICATES,
+                  establishments=None):
+    """
+    Validate and reverse geocode the rows of a KoBo DataFrame, adding the
+    'Endereço_Google' column in place. Rows with an index >= limit are skipped.
+    With merge_duplicates, the establishment columns are added too and
+    duplicate registrations take the address of their canonical record.
+    `establishments` is the output of find_all_establishments() when `df` is
+    one chunk of the file: the groups then span the whole file instead of
+    being found inside the chunk.
+    Returns the positions of the rows geocoded by this call.
+    """
+    # Validate every row in one vectorized pass; valid rows are queued for geocoding
+    total = len(df)
+    phase_start = time.perf_counter()
+    missing = pd.Series('', index=df.index)  # A missing column makes every row invalid
+    lats, lngs, status = classify_coordinates(df.get(LAT_COLUMN, missing), df.get(LNG_COLUMN, missing))
+    addresses = [COORD_LABELS.get(code) for code in status.tolist()]
+    skipped = np.zeros(total, dtype=bool)
+    if limit is not None:
+        skipped = df.index.to_numpy() >= limit
+        for pos in np.nonzero(skipped)[0].tolist():
+            addresses[pos] = "DRY_RUN_SKIPPED"
+    for name, code in (('coords_invalid', COORD_INVALID), ('coords_empty', COORD_EMPTY),
+                       ('coords_out_of_bounds', COORD_OUT_OF_BOUNDS)):
+        METRICS.count(name, int(((status == code) & ~skipped).sum()))
+
+    pending = []  # (position in addresses, lat, lng, submission key)
+    resumed = set()
+    valid = np.nonzero((status == COORD_VALID) & ~skipped)[0]
+    keys = submission_keys(df.iloc[valid])
+    for pos, lat, lng, key in zip(valid.tolist(), lats[valid].tolist(), lngs[valid].tolist(), keys):
+        journaled = journal.lookup(key, lat, lng) if journal is not None else None
+        if journaled is not None:
+            # Already geocoded by a previous (possibly interrupted) run
+            resumed.add(pos)
+            addresses[pos] = journaled
+        elif gmaps:
+            pending.append((pos, lat, lng, key))
+        else:
+            addresses[pos] = "Mock Address (No API Key)"
+
+    METRICS.add_duration('geocode.validate', time.perf_counter() - phase_start)
+    METRICS.count('journal_resumed', len(resumed))
+
+    if journal is not None:
+        print(f"Resumed {len(resumed)} rows from the journal; {len(pending)} new or moved rows to geocode.")
+
+    # Establishment dedup: a repeated registration of a stall follows its canonical record
+    followers = []  # (pending item, position of the canonical record)
+    if merge_duplicates:
+        with METRICS.timer('geocode.establishments'):
+            if establishments is None:
+                canonical = find_establishments(df)
+                tag_establishments(df, canonical)
+            else:
+                canonical = chunk_establishments(df, *establishments)
+        resolvable = resumed | {pos for pos, _, _, _ in pending}
+        kept = []
+        for item in pending:
+            target = int(canonical[item[0]])
+            if target != item[0] and target in resolvable:
+                followers.append((item, target))
+            else:
+                kept.append(item)
+        if followers:
+            print(f"Duplicate registrations: {len(followers)} rows reuse the address of their establishment.")
+        pending = kept
+        METRICS.count('duplicates_merged', len(followers))
+
+    # Spatial dedup: geocode one representative per bucket of nearby points
+    coords = [(lat, lng) for _, lat, lng, _ in pending]
+    with METRICS.timer('geocode.dedup'):
+        labels, reps = unique_buckets(coords, dedup_radius)
+    METRICS.count('dedup_saved', len(coords) - len(reps))
+    if len(coords):
+        print(f"Spatial dedup (radius {dedup_radius} m): {len(coords)} points -> {len(reps)} lookups "
+              f"({len(coords) - len(reps)} API calls saved).")
+
+    members = {}
+    for item, label in zip(pending, labels.tolist()):
+        members.setdefault(label, []).append(item)
+
+    def checkpoint(i, addr):
+        # Journal every row sharing this representative as soon as it is resolved.
+        # The raw store is written first, so it is never behind the journal
+        # (a journaled row is not geocoded again on the next run)
+        if raw_store is not None:
+            raw_store.flush()
+        for _, lat, lng, key in members[int(reps[i])]:
+            journal.record(key, lat, lng, addr)
+
+    with METRICS.timer('geocode.lookups'):
+        results = geocode_coordinates(gmaps, [coords[i] for i in reps], cache, workers, limiter,
+                                      on_result=checkpoint if journal is not None else None,
+                                      raw_store=raw_store)
+    by_rep = dict(zip(reps.tolist(), results))
+    for i, ((pos, lat, lng, _), label) in enumerate(zip(pending, labels.tolist())):
+        addresses[pos] = by_rep[label]
+        if raw_store is not None and label != i:
+            # Point the merged row at its representative's raw response
+            raw_store.alias(lat, lng, *coords[label])
+
+    located = {pos: (lat, lng) for pos, lat, lng, _ in pending}
+    for (pos, lat, lng, key), target in followers:
+        addresses[pos] = addresses[target]
+        if journal is not None:
+            journal.record(key, lat, lng, addresses[pos])
+        if raw_store is not None and target in located:
+            raw_store.alias(lat, lng, *located[target])
+
+    # Assign column
+    df['Endereço_Google'] = addresses
+    METRICS.count_rows(addresses)
+    return sorted([pos for pos, _, _, _ in pending] + [item[0] for item, _ in followers])
+
+def create_client():
+    """
+    Google Maps client, or None if no valid API key is configured.
+    """
+    if API_KEY and API_KEY != 'your_api_key_here':
+        # Quota errors are raised to get_address, which backs off across all workers
+        return googlemaps.Client(key=API_KEY, retry_over_query_limit=False)
+    return None
+
+def open_stores(use_journal=USE_JOURNAL):
+    """
+    Open the cache, checkpoint journal and raw response store enabled in the configuration.
+    """
+    cache = GeocodeCache() if USE_CACHE else None
+    if cache is not None:
+        evicted = cache.evict_expired()
+        print(f"Using geocode cache '{cache.path}' ({len(cache)} entries, {evicted} expired evicted).")
+
+    journal = GeocodeJournal() if use_journal else None
+    if journal is not None:
+        print(f"Using checkpoint journal '{journal.path}' ({len(journal)} submissions).")
+
+    raw_store = RawResponseStore() if USE_RAW_STORE else None
+    return cache, journal, raw_store
 
-def process_data():
+def close_stores(cache, journal, raw_store):
+    # The raw responses were paid for: they are written even if closing the others fails
+    try:
+        if cache is not None:
+            print(cache.stats())
+            cache.close()
+        if journal is not None:
+            journal.close()
+    finally:
+        if raw_store is not None:
+            raw_store.close()
+
+def process_data(workers=WORKERS, qps=QPS, dedup_radius=DEDUP_RADIUS_M, delta=False):
     if not os.path.exists(INPUT_CSV):
         print(f"Error: Input file '{INPUT_CSV}' not found.")
         return
 
+    stage_start = time.perf_counter()
     print("Loading CSV...")
     try:
-        df = pd.read_csv(INPUT_CSV, delimiter=';') # CSV seems to use semicolon based on view_file output
+        # The output keeps every column of the export (parse_addresses reads some
+        # by position), so all of them are read here, in the same single pass
+        with METRICS.timer('geocode.read'):
+            df = read_ingest(INPUT_CSV, columns=None)
     except Exception as e:
         print(f"Error reading CSV: {e}")
         return
 
-    # Check if necessary columns exist
-    # Based on file inspection: "_Localização_latitude", "_Localização_longitude"
-    if "_Localização_latitude" not in df.columns or "_Localização_longitude" not in df.columns:
+    if LAT_COLUMN not in df.columns or LNG_COLUMN not in df.columns:
         print("Error: Latitude/Longitude columns not found.")
         print(f"Available columns: {df.columns.tolist()}")
         return
@@ -62,59 +480,116 @@ def process_data():
              return
 
     # Initialize Google Maps client
-    gmaps = None
-    if API_KEY and API_KEY != 'your_api_key_here':
-        gmaps = googlemaps.Client(key=API_KEY)
+    gmaps = create_client()
 
-    # List to store addresses
-    addresses = []
-    
-    # Iterate and geocode
-    total = len(df)
-    limit = 5 if DRY_RUN else total
-    
-    print(f"Processing {limit} records (DRY_RUN={DRY_RUN})...")
+    cache, journal, raw_store = open_stores(use_journal=USE_JOURNAL or delta)
 
-    for index, row in df.iterrows():
-        if index >= limit:
-            addresses.append("DRY_RUN_SKIPPED")
-            continue
+    limit = 5 if DRY_RUN else len(df)
+    print(f"Processing {limit} records (DRY_RUN={DRY_RUN}, workers={workers}, qps={qps})...")
+    geocoded = geocode_frame(df, gmaps, cache, journal, raw_store, TokenBucket(qps), workers, dedup_radius, limit)
 
-        lat = row.get('_Localização_latitude')
-        lng = row.get('_Localização_longitude')
+    close_stores(cache, journal, raw_store)
+    METRICS.set_rows('geocode', len(df))
 
-        # Basic validation
-        try:
-            lat = float(lat)
-            lng = float(lng)
-        except (ValueError, TypeError):
-             addresses.append("Invalid Coordinates")
-             continue
-        
-        if pd.isna(lat) or pd.isna(lng) or (lat == 0 and lng == 0):
-             addresses.append("Empty/Zero Coordinates")
-        else:
-            if gmaps:
-                print(f"Geocoding {index+1}/{limit}: ({lat}, {lng})")
-                addr = get_address(gmaps, lat, lng)
-                addresses.append(addr)
-            else:
-                addresses.append("Mock Address (No API Key)")
-
-    # Assign column
-    # Ensure length matches if we cut short (should be handled by loop logic above but let's be safe)
-    if len(addresses) < total:
-        addresses.extend(["Skipped"] * (total - len(addresses)))
-    
-    df['Endereço_Google'] = addresses
+    output_file = OUTPUT_FILE
+    if delta:
+        # Only the submissions geocoded in this run
+        df = df.iloc[geocoded]
+        output_file = DELTA_OUTPUT_FILE
 
     # Save output
-    print(f"Saving to {OUTPUT_FILE}...")
+    print(f"Saving {len(df)} rows to {output_file}...")
     try:
-        df.to_excel(OUTPUT_FILE, index=False)
+        with METRICS.timer('geocode.write'):
+            write_table(df, output_file)
         print("Done!")
     except Exception as e:
-        print(f"Error saving to Excel: {e}")
+        print(f"Error saving {output_file}: {e}")
+
+    report_failures(df['Endereço_Google'])
+    METRICS.add_duration('geocode', time.perf_counter() - stage_start)
+    report = METRICS.write_reports('process_locations')
+    print(f"{report['cost']['billable_calls']} billable API calls, estimated cost ${report['cost']['estimated_usd']:.2f} "
+          f"(run report in {METRICS_DIR}/).")
+
+def report_failures(addresses):
+    failed = int(addresses.map(is_failed).sum())
+    if CIRCUIT_BREAKER.trips:
+        print(f"WARNING: the API looked unavailable; the circuit breaker opened {CIRCUIT_BREAKER.trips} time(s).")
+    if failed:
+        print(f"{failed} rows failed with retryable errors. Run 'python process_locations.py --retry-failed' "
+              "to geocode only those rows again.")
+
+def retry_failed(output_file=OUTPUT_FILE, workers=WORKERS, qps=QPS, dedup_radius=DEDUP_RADIUS_M):
+    """
+    Geocode again only the rows of an existing output whose lookup failed with
+    a retryable error (quota, timeout, circuit open), and rewrite the output in place.
+    Duplicate registrations take the new address of their canonical record.
+    """
+    if not os.path.exists(output_file):
+        print(f"Error: '{output_file}' not found. Run process_locations.py first.")
+        return
+
+    gmaps = create_client()
+    if gmaps is None:
+        print("Please set GOOGLE_MAPS_API_KEY in .env")
+        return
+
+    stage_start = time.perf_counter()
+    with METRICS.timer('geocode.read'):
+        df = read_table(output_file)
+    failed = df['Endereço_Google'].map(is_failed).to_numpy()
+    if CANONICAL_COLUMN in df.columns:
+        follower = ~df[CANONICAL_COLUMN].fillna(True).astype(bool).to_numpy()
+    else:
+        follower = np.zeros(len(df), dtype=bool)
+    todo = np.nonzero(failed & ~follower)[0]
+    print(f"{int(failed.sum())} failed rows in {output_file}; {len(todo)} to geocode again.")
+    if not failed.any():
+        return
+
+    cache, journal, raw_store = open_stores()
+    subset = df.iloc[todo][[c for c in INGEST_COLUMNS if c in df.columns]].copy()
+    geocode_frame(subset, gmaps, cache, journal, raw_store, TokenBucket(qps), workers, dedup_radius,
+                  merge_duplicates=False)
+    addresses = df['Endereço_Google'].to_numpy(dtype=object).copy()
+    addresses[todo] = subset['Endereço_Google'].to_numpy()
+
+    followers = np.nonzero(failed & follower)[0]
+    if len(followers):
+        canonical = df[CANONICAL_COLUMN].fillna(True).astype(bool).to_numpy()
+        by_establishment = dict(zip(df[ESTABLISHMENT_COLUMN][canonical], addresses[canonical]))
+        lats, lngs, _ = classify_coordinates(df[LAT_COLUMN].iloc[followers], df[LNG_COLUMN].iloc[followers])
+        keys = submission_keys(df.iloc[followers])
+        for pos, key, lat, lng in zip(followers.tolist(), keys, lats.tolist(), lngs.tolist()):
+            addresses[pos] = by_establishment.get(df[ESTABLISHMENT_COLUMN].iat[pos], addresses[pos])
+            if journal is not None:
+                journal.record(key, lat, lng, addresses[pos])
+    close_stores(cache, journal, raw_store)
+
+    df['Endereço_Google'] = addresses
+    METRICS.set_rows('geocode', len(todo))
+    print(f"Saving {len(df)} rows to {output_file}...")
+    with METRICS.timer('geocode.write'):
+        write_table(df, output_file)
+
+    report_failures(df['Endereço_Google'])
+    METRICS.add_duration('geocode', time.perf_counter() - stage_start)
+    report = METRICS.write_reports('process_locations')
+    print(f"{report['cost']['billable_calls']} billable API calls, estimated cost ${report['cost']['estimated_usd']:.2f}.")
 
 if __name__ == '__main__':
-    process_data()
+    parser = argparse.ArgumentParser(description="Reverse geocode the KoBo CSV with the Google Maps API.")
+    parser.add_argument('--workers', type=int, default=WORKERS, help="concurrent geocoding threads (1 = serial)")
+    parser.add_argument('--qps', type=float, default=QPS, help="maximum requests per second across all workers")
+    parser.add_argument('--dedup-radius', type=float, default=DEDUP_RADIUS_M,
+                        help="metres within which points share one reverse-geocode call (0 disables)")
+    parser.add_argument('--delta', action='store_true',
+                        help=f"only write the new/moved submissions of this export to {DELTA_OUTPUT_FILE}")
+    parser.add_argument('--retry-failed', action='store_true',
+                        help=f"geocode again only the rows of {OUTPUT_FILE} that failed with a retryable error")
+    args = parser.parse_args()
+    if args.retry_failed:
+        retry_failed(workers=args.workers, qps=args.qps, dedup_radius=args.dedup_radius)
+    else:
+        process_data(workers=args.workers, qps=args.qps, dedup_radius=args.dedup_radius, delta=args.delta)
@@ -0,0 +1,337 @@
+import os
+import re
+import gzip
+import shutil
+import hashlib
+import inspect
+from vendor import VENDOR_LIBS, vendor_path, check_all, sri
+from metrics import METRICS
+
+# brotli is optional: without it only the .gz copies are written
+try:
+    import brotli
+    HAS_BROTLI = True
+except ImportError:
+    HAS_BROTLI = False
+
+# Self-contained copy of the site for static hosting, in PUBLIC_DIR:
+#   index.html, maps.html           small pages, revalidated on every visit
+#   assets/<name>.<hash>.<ext>      inline CSS/JS, data.js, density.js and the
+#                                   vendored libraries, minified and named by
+#                                   content hash, so they can be cached forever
+#   tiles/, table/                  runtime JSON fetched by fixed paths
+# Every text file gets precompressed .gz (and .br) copies, and _headers holds
+# the cache rules for hosts that read it (Netlify, Cloudflare Pages).
+
+# Configuration
+PUBLIC_DIR = 'public'
+ASSETS_DIR = 'assets'
+PAGES = ['index.html', 'maps.html']
+DATA_FILES = ['data.js', 'density.js', 'output_enderecos_tratado.xlsx']  # Referenced by name from the pages
+COPY_DIRS = ['tiles', 'table']
+HASH_LENGTH = 10
+COMPRESS_EXTENSIONS = {'.html', '.js', '.css', '.json', '.svg', '.txt'}
+MIN_COMPRESS_SIZE = 512   # Bytes; smaller files are not worth a compressed copy
+HEADERS = """/assets/*
+  Cache-Control: public, max-age=31536000, immutable
+/
+  Cache-Control: no-cache
+/index.html
+  Cache-Control: no-cache
+/maps.html
+  Cache-Control: no-cache
+/tiles/*
+  Cache-Control: public, max-age=300
+/table/*
+  Cache-Control: public, max-age=300
+"""
+
+STYLE_RE = re.compile(r'<style>(.*?)</style>', re.S)
+INLINE_SCRIPT_RE = re.compile(r'<script>(.*?)</script>', re.S)
+CSS_URL_RE = re.compile(r'url\(\s*([\'"]?)([^\'")]+)\1\s*\)')
+CSS_COMMENT_RE = re.compile(r'/\*.*?\*/', re.S)
+CSS_SPACE_RE = re.compile(r'\s*([{};,>])\s*')
+# <link>/<script> tags with a Subresource Integrity hash
+INTEGRITY_TAG_RE = re.compile(r'<(?:link|script)\b[^>]*\bintegrity="[^"]*"[^>]*>', re.S)
+INTEGRITY_RE = re.compile(r'\bintegrity="([^"]*)"')
+TAG_URL_RE = re.compile(r'\b(?:href|src)="([^"]*)"')
+
+def minify_css(text):
+    """
+    Drop comments and the whitespace around punctuation. Whitespace before ':'
+    is kept, since it is significant in selectors (".a :hover").
+    """
+    text = CSS_COMMENT_RE.sub('', text)
+    text = re.sub(r'\s+', ' ', text)
+    text = CSS_SPACE_RE.sub(r'\1', text)
+    text = re.sub(r':\s+', ':', text)
+    return text.replace(';}', '}').strip()
+
+def minify_js(text):
+    """
+    Conservative minification of our own scripts: indentation, blank lines and
+    whole-line // comments are removed, line breaks are kept so automatic
+    semicolon insertion behaves exactly as before.
+    """
+    lines = (line.strip() for line in text.splitlines())
+    return '\n'.join(line for line in lines if line and not line.startswith('//'))
+
+def write_compressed(path, data):
+    """
+    Write precompressed copies of a text file next to it (path.gz, path.br).
+    Returns the number of copies written.
+    """
+    if os.path.splitext(path)[1] not in COMPRESS_EXTENSIONS or len(data) < MIN_COMPRESS_SIZE:
+        return 0
+    written = 0
+    # mtime=0 keeps the .gz identical across builds of the same content
+    packed = gzip.compress(data, compresslevel=9, mtime=0)
+    if len(packed) < len(data):
+        with open(path + '.gz', 'wb') as f:
+            f.write(packed)
+        written += 1
+    if HAS_BROTLI:
+        packed = brotli.compress(data, quality=11)
+        if len(packed) < len(data):
+            with open(path + '.br', 'wb') as f:
+                f.write(packed)
+            written += 1
+    return written
+
+class AssetWriter:
+    """
+    Content-addressed files in PUBLIC_DIR/assets. A file that already exists
+    under its hash is not written (nor compressed) again.
+    """
+
+    def __init__(self, out_dir=PUBLIC_DIR):
+        self.dir = os.path.join(out_dir, ASSETS_DIR)
+        os.makedirs(self.dir, exist_ok=True)
+        self.used = set()
+        self.written = 0
+        self.reused = 0
+
+    def add(self, name, data):
+        """
+        Store `data` as <stem>.<hash><ext> and return its URL relative to the pages.
+        """
+        if isinstance(data, str):
+            data = data.encode('utf-8')
+        stem, ext = os.path.splitext(os.path.basename(name))
+        digest = hashlib.sha256(data).hexdigest()[:HASH_LENGTH]
+        filename = f"{stem}.{digest}{ext}"
+        path = os.path.join(self.dir, filename)
+        if os.path.exists(path):
+            self.reused += 1
+        else:
+            with open(path, 'wb') as f:
+                f.write(data)
+            write_compressed(path, data)
+            self.written += 1
+        self.used.add(filename)
+        return f"{ASSETS_DIR}/{filename}"
+
+    def add_vendor(self, name):
+        """
+        Publish a vendored file. url() references of vendored stylesheets are
+        published too and rewritten to their hashed names.
+        """
+        path = vendor_path(name)
+        with open(path, 'rb') as f:
+            data = f.read()
+        if name.endswith('.css'):
+            base = os.path.dirname(path)
+
+            def rewrite(match):
+                ref = match.group(2)
+                if ref.startswith(('data:', 'http:', 'https:', '//', '#')):
+                    return match.group(0)
+                target = os.path.normpath(os.path.join(base, ref.split('?')[0].split('#')[0]))
+                local = os.path.relpath(target, vendor_path('')).replace(os.sep, '/')
+                if local not in VENDOR_LIBS or not os.path.exists(target):
+                    return match.group(0)
+                # Assets share one directory, so the bare file name is enough
+                return f"url({self.add_vendor(local).split('/')[-1]})"
+
+            data = CSS_URL_RE.sub(rewrite, data.decode('utf-8')).encode('utf-8')
+        return self.add(name, data)
+
+    def prune(self):
+        """
+        Remove assets of earlier builds that no page references any more.
+        """
+        removed = 0
+        for filename in os.listdir(self.dir):
+            base = filename[:-3] if filename.endswith(('.gz', '.br')) else filename
+            if base not in self.used:
+                os.remove(os.path.join(self.dir, filename))
+                removed += 1
+        return removed
+
+def vendored_urls(assets, pages, exclude=()):
+    """
+    {CDN URL: local asset URL} for the libraries present in vendor/ that the
+    pages (list of HTML texts) reference.
+    """
+    urls = {}
+    for name, url in VENDOR_LIBS.items():
+        if name not in exclude and os.path.exists(vendor_path(name)) and any(url in html for html in pages):
+            urls[url] = assets.add_vendor(name)
+    return urls
+
+def local_integrity(html, out_dir):
+    """
+    (tag, URL, integrity in the tag, hash of the published file) for every tag
+    of a page with an integrity attribute that loads one of our assets.
+    """
+    found = []
+    for match in INTEGRITY_TAG_RE.finditer(html):
+        tag = match.group(0)
+        url = TAG_URL_RE.search(tag)
+        if url is None or not url.group(1).startswith(ASSETS_DIR + '/'):
+            continue  # CDN files are checked by the browser against the published hash
+        path = os.path.join(out_dir, *url.group(1).split('/'))
+        if os.path.exists(path):
+            with open(path, 'rb') as f:
+                actual = sri(f.read())
+        else:
+            actual = None
+        found.append((tag, url.group(1), INTEGRITY_RE.search(tag).group(1), actual))
+    return found
+
+def check_integrity(out_dir=PUBLIC_DIR):
+    """
+    Verify that the integrity attribute of every local asset in the published
+    pages matches the file it points to. Returns the list of errors.
+    """
+    errors = []
+    for page in sorted(os.listdir(out_dir)):
+        if not page.endswith('.html'):
+            continue
+        with open(os.path.join(out_dir, page), 'r', encoding='utf-8') as f:
+            html = f.read()
+        for _, url, expected, actual in local_integrity(html, out_dir):
+            if actual is None:
+                errors.append(f"{page}: {url} not found")
+            elif actual != expected:
+                errors.append(f"{page}: integrity of {url} does not match the file")
+    return errors
+
+def rewrite_page(html, assets, urls, stem):
+    """
+    Point the page at the hashed assets: CDN URLs and data file names are
+    replaced, inline <style> and <script> blocks become minified asset files
+    named after the page (`stem`). The integrity hash of a CDN file is
+    recomputed for the published copy, whose bytes can differ (vendored
+    stylesheets get their url() references rewritten).
+    """
+    for url, local in urls.items():
+        html = html.replace(url, local)
+    out_dir = os.path.dirname(assets.dir)
+    for tag, _, expected, actual in local_integrity(html, out_dir):
+        if actual is not None and actual != expected:
+            html = html.replace(tag, INTEGRITY_RE.sub(f'integrity="{actual}"', tag))
+    html = STYLE_RE.sub(
+        lambda m: f'<link rel="stylesheet" href="{assets.add(stem + ".css", minify_css(m.group(1)))}">', html)
+    return INLINE_SCRIPT_RE.sub(
+        lambda m: f'<script src="{assets.add(stem + ".js", minify_js(m.group(1)))}"></script>', html)
+
+def publish_site(out_dir=PUBLIC_DIR, cache=None, allow_cdn=False):
+    """
+    Build the self-contained copy of the site in `out_dir`. With a BuildCache
+    the step is skipped when no page, data file, tile or library changed.
+    Refuses to publish while a library is missing from vendor/ or does not
+    match vendor/lock.json, unless `allow_cdn` (the pages then load it from
+    the CDN). Returns True if `out_dir` is up to date.
+    """
+    pages = [p for p in PAGES if os.path.exists(p)]
+    if not pages:
+        print("Error: no page to publish (run generate_site.py first).")
+        return False
+    with METRICS.timer('publish.hash'):
+        inputs = pages + [p for p in DATA_FILES if os.path.exists(p)]
+        inputs += [vendor_path(name) for name in VENDOR_LIBS]
+        for directory in COPY_DIRS:
+            for root, _, files in os.walk(directory):
+                inputs += sorted(os.path.join(root, f) for f in files)
+        code = [os.path.abspath(__file__), os.path.abspath(inspect.getfile(check_all))]
+        key = cache.key(inputs + code, out_dir=out_dir, brotli=HAS_BROTLI) if cache is not None else None
+    if cache is not None and cache.fresh('publish', key, [os.path.join(out_dir, p) for p in pages]):
+        print(f"{out_dir}/ is up to date.")
+        return True
+
+    missing, errors = check_all()
+    if (missing or errors) and not allow_cdn:
+        for name in missing:
+            print(f"Error: {vendor_path(name)} not found.")
+        for error in errors:
+            print(f"Error: {error}.")
+        print(f"Error: {out_dir}/ not published, its pages would load {len(missing) + len(errors)} libraries "
+              f"from the CDN (run vendor.py with internet access and commit vendor/, or use --allow-cdn).")
+        return False
+    for error in errors:
+        print(f"WARNING: {error}; the pages load it from the CDN.")
+    if missing:
+        print(f"WARNING: {len(missing)} libraries not vendored, the pages load them from the CDN (run vendor.py).")
+
+    with METRICS.timer('publish.assets'):
+        assets = AssetWriter(out_dir)
+        sources = {}
+        for page in pages:
+            with open(page, 'r', encoding='utf-8') as f:
+                sources[page] = f.read()
+        urls = vendored_urls(assets, sources.values(), exclude={error.split(':', 1)[0] for error in errors})
+        for name in DATA_FILES:
+            # Referenced as a quoted literal: script.src = 'data.js'
+            quoted = [q + name + q for q in ("'", '"')]
+            if os.path.exists(name) and any(q in html for q in quoted for html in sources.values()):
+                with open(name, 'rb') as f:
+                    local = assets.add(name, f.read())
+                for q in ("'", '"'):
+                    urls[q + name + q] = q + local + q
+
+        for page, html in sources.items():
+            html = rewrite_page(html, assets, urls, os.path.splitext(page)[0]).strip() + '\n'
+            data = html.encode('utf-8')
+            target = os.path.join(out_dir, page)
+            with open(target, 'wb') as f:
+                f.write(data)
+            for ext in ('.gz', '.br'):
+                if os.path.exists(target + ext):
+                    os.remove(target + ext)
+            write_compressed(target, data)
+
+    with METRICS.timer('publish.copy'):
+        copied = 0
+        for directory in COPY_DIRS:
+            target = os.path.join(out_dir, directory)
+            if os.path.isdir(target):
+                shutil.rmtree(target)
+            if not os.path.isdir(directory):
+                continue
+            for root, _, files in os.walk(directory):
+                dest = os.path.join(out_dir, root)
+                os.makedirs(dest, exist_ok=True)
+                for filename in files:
+                    if filename.endswith(('.gz', '.br')):
+                        continue  # Recompressed below
+                    with open(os.path.join(root, filename), 'rb') as f:
+                        data = f.read()
+                    with open(os.path.join(dest, filename), 'wb') as f:
+                        f.write(data)
+                    write_compressed(os.path.join(dest, filename), data)
+                    copied += 1
+        with open(os.path.join(out_dir, '_headers'), 'w', encoding='utf-8') as f:
+            f.write(HEADERS)
+
+    removed = assets.prune()
+    for error in check_integrity(out_dir):
+        print(f"Error: {error}; browsers will refuse to load it.")
+    METRICS.count('publish_assets_written', assets.written)
+    METRICS.count('publish_assets_reused', assets.reused)
+    if cache is not None:
+        cache.record('publish', key)
+    print(f"Published {len(pages)} pages to {out_dir}/: {assets.written} new assets, {assets.reused} unchanged, "
+          f"{removed} stale files removed, {copied} tile/table files"
+          f"{'' if HAS_BROTLI else ' (no .br copies: brotli not installed)'}.")
+    return True
@@ -0,0 +1,87 @@
+import os
+import gzip
+import json
+import time
+import atexit
+import threading
+from geocode_cache import coord_key
+
+# Configuration
+RAW_STORE_FILE = 'geocode_raw.jsonl.gz'
+FLUSH_EVERY = 200  # Records buffered before a new gzip member is appended (see also flush())
+
+class RawResponseStore:
+    """
+    Compressed, append-only store of full Google reverse-geocode responses,
+    keyed by normalized coordinates (same key as the geocode cache).
+
+    The file is a sequence of gzip members, each holding JSON lines:
+        {"key": "-1.464571,-48.489958", "results": [...], "ts": ...}
+        {"key": "-1.464580,-48.489950", "ref": "-1.464571,-48.489958"}
+    "ref" lines point a coordinate at the response of a nearby point
+    (rows merged by the spatial dedup pass).
+    Buffered records are also written when the interpreter exits (Ctrl+C,
+    uncaught error), so responses already paid for are not lost.
+    """
+
+    def __init__(self, path=RAW_STORE_FILE):
+        self.path = path
+        self.lock = threading.Lock()
+        self.buffer = []
+        atexit.register(self.flush)
+
+    def put(self, lat, lng, results):
+        self._append({'key': coord_key(lat, lng), 'results': results, 'ts': time.time()})
+
+    def alias(self, lat, lng, ref_lat, ref_lng):
+        key, ref = coord_key(lat, lng), coord_key(ref_lat, ref_lng)
+        if key != ref:
+            self._append({'key': key, 'ref': ref})
+
+    def _append(self, record):
+        with self.lock:
+            self.buffer.append(json.dumps(record, ensure_ascii=False))
+            if len(self.buffer) >= FLUSH_EVERY:
+                self._flush_locked()
+
+    def _flush_locked(self):
+        if not self.buffer:
+            return
+        data = ('\n'.join(self.buffer) + '\n').encode('utf-8')
+        with open(self.path, 'ab') as f:
+            f.write(gzip.compress(data))
+        self.buffer = []
+
+    def flush(self):
+        with self.lock:
+            self._flush_locked()
+
+    def close(self):
+        self.flush()
+        atexit.unregister(self.flush)
+
+    def load(self):
+        """
+        Read the whole store into {key: results}, resolving "ref" lines.
+        A truncated trailing member (interrupted run) is ignored.
+        """
+        responses, refs = {}, {}
+        if not os.path.exists(self.path):
+            return responses
+        try:
+            with gzip.open(self.path, 'rt', encoding='utf-8') as f:
+                for line in f:
+                    try:
+                        record = json.loads(line)
+                    except json.JSONDecodeError:
+                        continue
+                    if 'ref' in record:
+                        refs[record['key']] = record['ref']
+                    else:
+                        responses[record['key']] = record['results']
+        except (EOFError, gzip.BadGzipFile):
+            pass
+        for key, ref in refs.items():
+            if ref in responses:
+                responses.setdefault(key, responses[ref])
+        return responses
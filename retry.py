@@ -0,0 +1,148 @@
+import time
+import random
+import threading
+from googlemaps.exceptions import ApiError, HTTPError, Timeout, TransportError
+
+# Failure handling for the Geocoding API calls: errors are classified as
+# retryable (quota, timeouts, connection and 5xx errors) or permanent (denied
+# key, invalid request), retryable ones are retried with jittered exponential
+# backoff, and a circuit breaker stops calling the API while it is clearly down.
+
+# Configuration
+MAX_ATTEMPTS = 5          # Calls per coordinate, including the first one
+BASE_DELAY = 0.5          # Seconds; the backoff ceiling doubles on every attempt
+MAX_DELAY = 30.0          # Upper bound of a single wait
+BREAKER_THRESHOLD = 10    # Consecutive retryable failures that open the circuit
+BREAKER_COOLDOWN = 60.0   # Seconds the circuit stays open before a probe call is let through
+
+# API statuses worth retrying; everything else returned by the API is permanent
+RETRYABLE_STATUSES = {'OVER_QUERY_LIMIT', 'UNKNOWN_ERROR', 'RESOURCE_EXHAUSTED'}
+PERMANENT_PREFIX = "Error (permanent)"
+CIRCUIT_OPEN_ERROR = "Error: circuit open (API unavailable)"
+
+def is_retryable(exc):
+    """
+    True if the call that raised `exc` may succeed when repeated.
+    """
+    if isinstance(exc, ApiError):
+        return exc.status in RETRYABLE_STATUSES
+    if isinstance(exc, HTTPError):
+        return exc.status_code == 429 or exc.status_code >= 500
+    return isinstance(exc, (Timeout, TransportError, ConnectionError, TimeoutError))
+
+def error_result(exc):
+    """
+    Text stored in 'Endereço_Google' for a failed lookup.
+    Permanent errors get their own prefix so they are not retried by --retry-failed.
+    """
+    message = str(exc) or type(exc).__name__  # Timeout() has no message
+    return f"Error: {message}" if is_retryable(exc) else f"{PERMANENT_PREFIX}: {message}"
+
+def is_failed(addr):
+    """
+    Rows worth geocoding again: retryable errors and the circuit breaker's skips.
+    """
+    return isinstance(addr, str) and addr.startswith("Error") and not addr.startswith(PERMANENT_PREFIX)
+
+def backoff_delay(attempt, base=BASE_DELAY, cap=MAX_DELAY, rnd=random):
+    """
+    "Full jitter" backoff: a random wait between 0 and base * 2**attempt (at most `cap`),
+    so workers that failed together don't retry together.
+    """
+    return rnd.uniform(0, min(cap, base * 2 ** attempt))
+
+class CircuitOpen(Exception):
+    """Raised instead of calling the API while the circuit breaker is open."""
+
+class CircuitBreaker:
+    """
+    Thread-safe circuit breaker shared by the geocoding workers.
+    After `threshold` consecutive retryable failures the circuit opens and
+    calls fail immediately; after `cooldown` seconds one probe call is allowed
+    (half-open), and its success closes the circuit again. A permanent error
+    counts as a success here: the API answered.
+    """
+
+    def __init__(self, threshold=BREAKER_THRESHOLD, cooldown=BREAKER_COOLDOWN):
+        self.threshold = threshold
+        self.cooldown = cooldown
+        self.failures = 0
+        self.opened_at = None
+        self.probing = False
+        self.trips = 0
+        self.lock = threading.Lock()
+
+    @property
+    def state(self):
+        with self.lock:
+            if self.opened_at is None:
+                return 'closed'
+            return 'half_open' if time.monotonic() - self.opened_at >= self.cooldown else 'open'
+
+    def allow(self):
+        with self.lock:
+            if self.opened_at is None:
+                return True
+            if time.monotonic() - self.opened_at >= self.cooldown and not self.probing:
+                self.probing = True
+                return True
+            return False
+
+    def record_success(self):
+        with self.lock:
+            self.failures = 0
+            self.opened_at = None
+            self.probing = False
+
+    def release_probe(self):
+        """
+        End a probe call that ended without an answer (interrupted), so
+        the next caller can probe again.
+        """
+        with self.lock:
+            self.probing = False
+
+    def record_failure(self):
+        with self.lock:
+            self.failures += 1
+            if self.probing or (self.opened_at is None and self.failures >= self.threshold):
+                # A failed probe restarts the cooldown
+                if self.opened_at is None:
+                    self.trips += 1
+                self.opened_at = time.monotonic()
+                self.probing = False
+
+def call_with_retry(fn, breaker=None, max_attempts=MAX_ATTEMPTS, on_retry=None, sleep=time.sleep):
+    """
+    Call fn() until it succeeds, raises a permanent error or `max_attempts`
+    calls were made; waits backoff_delay() between attempts.
+    Raises CircuitOpen without calling fn while the breaker is open.
+    `on_retry(attempt, exc)` is called before each wait.
+    """
+    for attempt in range(max_attempts):
+        if breaker is not None and not breaker.allow():
+            raise CircuitOpen()
+        try:
+            result = fn()
+        except Exception as e:
+            if not is_retryable(e):
+                # A permanent error (denied key, invalid request) is still an
+                # answer: the API is reachable, so it closes the circuit
+                if breaker is not None:
+                    breaker.record_success()
+                raise
+            if breaker is not None:
+                breaker.record_failure()
+            if attempt + 1 >= max_attempts:
+                raise
+            if on_retry is not None:
+                on_retry(attempt, e)
+            sleep(backoff_delay(attempt))
+        except BaseException:
+            if breaker is not None:
+                breaker.release_probe()
+            raise
+        else:
+            if breaker is not None:
+                breaker.record_success()
+            return result
@@ -0,0 +1,366 @@
+import os
+import math
+import argparse
+import numpy as np
+import pandas as pd
+from spatial_index import haversine_m
+from districts import locate_areas, OFFICIAL_DISTRICT_COLUMN, OFFICIAL_BAIRRO_COLUMN
+from parse_addresses import parse_address_column
+from table_io import find_table, read_table
+from text_utils import fold_accents
+
+# Inspection routes (Roteirização): split the points of a district/bairro into
+# daily routes of at most STOPS_PER_ROUTE stops per inspector and order each
+# route to keep the walked/driven distance short.
+
+# Configuration
+ROUTE_SOURCE = find_table('output_enderecos')
+ROUTES_FILE = 'rotas_inspecao.xlsx'
+STOPS_PER_ROUTE = 20   # Capacity: inspections per inspector per day
+INSPECTORS = 4         # Inspectors working in parallel (routes per day)
+DENSE_LIMIT = 3000     # Up to this many points the full distance matrix is kept in memory
+K_NEAREST = 10         # Neighbour candidates per point for moves between routes
+DEPOT = None           # (lat, lng) where routes start and end; None = stop closest to the centroid
+DISTRICT_COLUMN = 'Qual o distrito de saúde?'
+NAME_COLUMN = 'Nome do ponto de venda ou do proprietário'
+PHONE_COLUMN = 'Telefone de contato'
+EPS = 1e-6
+
+def distance_matrix(lats, lngs):
+    """
+    Dense haversine distance matrix in metres, computed with one broadcast.
+    """
+    lats = np.asarray(lats, dtype=float)
+    lngs = np.asarray(lngs, dtype=float)
+    return haversine_m(lats[:, None], lngs[:, None], lats[None, :], lngs[None, :])
+
+def nearest_neighbors(lats, lngs, k, chunk=1024):
+    """
+    Sparse k-nearest-neighbour graph: an (n, k) array of neighbour positions,
+    nearest first. Neighbours are ranked on an equirectangular projection
+    (same order as haversine at city scale, without the trigonometry) and rows
+    are computed in chunks so memory stays O(chunk * n).
+    """
+    lats = np.asarray(lats, dtype=float)
+    lngs = np.asarray(lngs, dtype=float)
+    n = len(lats)
+    k = min(k, n - 1)
+    x = lngs * math.cos(math.radians(lats.mean()))
+    y = lats
+    neighbors = np.empty((n, k), dtype=np.int64)
+    for start in range(0, n, chunk):
+        rows = np.arange(start, min(start + chunk, n))
+        d = (x[rows, None] - x[None, :]) ** 2 + (y[rows, None] - y[None, :]) ** 2
+        d[np.arange(len(rows)), rows] = np.inf
+        part = np.argpartition(d, k - 1, axis=1)[:, :k]
+        order = np.argsort(np.take_along_axis(d, part, axis=1), axis=1)
+        neighbors[rows] = np.take_along_axis(part, order, axis=1)
+    return neighbors
+
+class DistanceOracle:
+    """
+    Distances between points (the depot is the last position). Small sets keep
+    the full matrix; large ones compute route sub-matrices on demand and only
+    keep the k-nearest-neighbour graph.
+    """
+
+    def __init__(self, lats, lngs, dense_limit=DENSE_LIMIT, k=K_NEAREST):
+        self.lats = np.asarray(lats, dtype=float)
+        self.lngs = np.asarray(lngs, dtype=float)
+        n = len(self.lats)
+        self.matrix = None
+        if n <= dense_limit:
+            self.matrix = distance_matrix(self.lats, self.lngs)
+            k = min(k, n - 1)
+            d = self.matrix.copy()
+            np.fill_diagonal(d, np.inf)
+            self.neighbors = np.argsort(d, axis=1)[:, :k] if k > 0 else np.empty((n, 0), dtype=np.int64)
+        else:
+            self.neighbors = nearest_neighbors(self.lats, self.lngs, k)
+
+    def submatrix(self, nodes):
+        nodes = np.asarray(nodes)
+        if self.matrix is not None:
+            return self.matrix[np.ix_(nodes, nodes)]
+        return distance_matrix(self.lats[nodes], self.lngs[nodes])
+
+    def pair(self, i, j):
+        if self.matrix is not None:
+            return self.matrix[i, j]
+        return float(haversine_m(self.lats[i], self.lngs[i], self.lats[j], self.lngs[j]))
+
+def sweep_partition(lats, lngs, depot, capacity):
+    """
+    Sweep construction: sort the points by angle around the depot and cut the
+    circle into ceil(n / capacity) groups of (nearly) equal size. The sweep
+    starts at the widest angular gap so no natural cluster is split at 0°.
+    """
+    dy = np.asarray(lats, dtype=float) - depot[0]
+    dx = (np.asarray(lngs, dtype=float) - depot[1]) * math.cos(math.radians(depot[0]))
+    angles = np.arctan2(dy, dx)
+    order = np.argsort(angles, kind='stable')
+    if len(order) > 1:
+        sorted_angles = angles[order]
+        gaps = np.diff(np.append(sorted_angles, sorted_angles[0] + 2 * np.pi))
+        order = np.roll(order, -(int(np.argmax(gaps)) + 1))
+    n_routes = max(1, math.ceil(len(order) / capacity))
+    return [group for group in np.array_split(order, n_routes) if len(group)]
+
+def nearest_neighbor_tour(D):
+    """
+    Closed tour over the nodes of D starting and ending at node 0 (the depot).
+    """
+    m = len(D)
+    visited = np.zeros(m, dtype=bool)
+    visited[0] = True
+    tour = [0]
+    for _ in range(m - 1):
+        row = np.where(visited, np.inf, D[tour[-1]])
+        nxt = int(np.argmin(row))
+        visited[nxt] = True
+        tour.append(nxt)
+    tour.append(0)
+    return np.asarray(tour)
+
+def two_opt(tour, D):
+    """
+    2-opt: reverse tour[i:j+1] whenever it shortens the tour. For each i the
+    gains of every j are evaluated at once. Returns (tour, improved).
+    """
+    improved = False
+    n = len(tour)
+    i = 1
+    while i < n - 2:
+        a, b = tour[i - 1], tour[i]
+        c = tour[i + 1:n - 1]
+        d = tour[i + 2:n]
+        delta = D[a, c] + D[b, d] - D[a, b] - D[c, d]
+        j = int(np.argmin(delta))
+        if delta[j] < -EPS:
+            j += i + 1
+            tour[i:j + 1] = tour[i:j + 1][::-1].copy()
+            improved = True
+        else:
+            i += 1
+    return tour, improved
+
+def or_opt(tour, D, max_segment=3):
+    """
+    Or-opt: move a segment of 1..max_segment stops (possibly reversed) to the
+    cheapest other position in the tour. Returns (tour, improved).
+    """
+    improved = False
+    for length in range(1, max_segment + 1):
+        i = 1
+        while i + length < len(tour):
+            seg = tour[i:i + length]
+            prev, nxt = tour[i - 1], tour[i + length]
+            saving = D[prev, seg[0]] + D[seg[-1], nxt] - D[prev, nxt]
+            rest = np.concatenate([tour[:i], tour[i + length:]])
+            u, v = rest[:-1], rest[1:]
+            forward = D[u, seg[0]] + D[seg[-1], v] - D[u, v]
+            backward = D[u, seg[-1]] + D[seg[0], v] - D[u, v]
+            best_fwd, best_bwd = int(np.argmin(forward)), int(np.argmin(backward))
+            if forward[best_fwd] <= backward[best_bwd]:
+                pos, cost, piece = best_fwd, forward[best_fwd], seg
+            else:
+                pos, cost, piece = best_bwd, backward[best_bwd], seg[::-1]
+            if cost < saving - EPS:
+                tour = np.concatenate([rest[:pos + 1], piece, rest[pos + 1:]])
+                improved = True
+            else:
+                i += 1
+    return tour, improved
+
+def tour_length(tour, D):
+    return float(D[tour[:-1], tour[1:]].sum())
+
+def improve_tour(tour, D, max_rounds=50):
+    for _ in range(max_rounds):
+        tour, a = two_opt(tour, D)
+        tour, b = or_opt(tour, D)
+        if not (a or b):
+            break
+    return tour
+
+def order_route(stops, depot_node, oracle, improve=True):
+    """
+    Visit order for one route. Returns (ordered stops, distance in metres).
+    """
+    nodes = np.concatenate([[depot_node], stops])
+    D = oracle.submatrix(nodes)
+    tour = nearest_neighbor_tour(D)
+    if improve:
+        tour = improve_tour(tour, D)
+    return nodes[tour[1:-1]], tour_length(tour, D)
+
+def relocate_between_routes(routes, depot_node, oracle, capacity):
+    """
+    Move single stops to a neighbouring route (from the k-nearest graph) when
+    inserting them next to their neighbour costs less than they cost in their
+    own route. Routes are ordered stop lists; returns the set of changed routes.
+    """
+    route_of = {}
+    for r, stops in enumerate(routes):
+        for s in stops:
+            route_of[s] = r
+    changed = set()
+    for p in list(route_of):
+        src = routes[route_of[p]]
+        if len(src) <= 1:
+            continue
+        i = src.index(p)
+        prev = src[i - 1] if i > 0 else depot_node
+        nxt = src[i + 1] if i + 1 < len(src) else depot_node
+        saving = oracle.pair(prev, p) + oracle.pair(p, nxt) - oracle.pair(prev, nxt)
+        best = None
+        for q in oracle.neighbors[p]:
+            r = route_of.get(int(q))
+            if r is None or r == route_of[p] or len(routes[r]) >= capacity:
+                continue
+            dst = routes[r]
+            j = dst.index(int(q))
+            for pos in (j, j + 1):  # before or after the neighbour
+                u = dst[pos - 1] if pos > 0 else depot_node
+                v = dst[pos] if pos < len(dst) else depot_node
+                cost = oracle.pair(u, p) + oracle.pair(p, v) - oracle.pair(u, v)
+                if cost < saving - EPS and (best is None or cost < best[0]):
+                    best = (cost, r, pos)
+        if best is not None:
+            _, r, pos = best
+            changed.update((route_of[p], r))
+            src.remove(p)
+            routes[r].insert(pos, p)
+            route_of[p] = r
+    return changed
+
+def plan_routes(lats, lngs, depot=None, capacity=STOPS_PER_ROUTE, improve=True,
+                dense_limit=DENSE_LIMIT, k=K_NEAREST):
+    """
+    Capacitated routes over the given points. Returns a list of
+    (ordered positions into lats/lngs, distance in metres), in sweep order.
+    """
+    lats = np.asarray(lats, dtype=float)
+    lngs = np.asarray(lngs, dtype=float)
+    if not len(lats):
+        return []
+    if depot is None:
+        centre = np.argmin(haversine_m(lats, lngs, lats.mean(), lngs.mean()))
+        depot = (lats[centre], lngs[centre])
+
+    depot_node = len(lats)
+    oracle = DistanceOracle(np.append(lats, depot[0]), np.append(lngs, depot[1]), dense_limit, k)
+    groups = sweep_partition(lats, lngs, depot, capacity)
+    routes = [order_route(g, depot_node, oracle, improve)[0].tolist() for g in groups]
+
+    if improve and len(routes) > 1:
+        for r in relocate_between_routes(routes, depot_node, oracle, capacity):
+            if routes[r]:
+                routes[r] = order_route(np.asarray(routes[r]), depot_node, oracle)[0].tolist()
+
+    planned = []
+    for stops in routes:
+        if not stops:
+            continue
+        nodes = [depot_node] + stops + [depot_node]
+        distance = sum(oracle.pair(a, b) for a, b in zip(nodes[:-1], nodes[1:]))
+        planned.append((np.asarray(stops, dtype=np.int64), float(distance)))
+    return planned
+
+def load_points(path=ROUTE_SOURCE, district=None, bairro=None):
+    """
+    Geocoded rows with valid coordinates, optionally filtered by health district
+    (official boundary if available, else the KoBo answer) and/or bairro
+    (official boundary if available, else parsed from the Google address).
+    """
+    df = read_table(path)
+    lats = pd.to_numeric(df['_Localização_latitude'], errors='coerce')
+    lngs = pd.to_numeric(df['_Localização_longitude'], errors='coerce')
+    valid = lats.notna() & lngs.notna() & ~((lats == 0) & (lngs == 0))
+    df = df[valid].copy()
+    df['lat'] = lats[valid]
+    df['lng'] = lngs[valid]
+
+    areas = locate_areas(df['lat'], df['lng'])
+    if OFFICIAL_DISTRICT_COLUMN in areas.columns:
+        df['Distrito'] = areas[OFFICIAL_DISTRICT_COLUMN].fillna('').to_numpy()
+    else:
+        df['Distrito'] = df.get(DISTRICT_COLUMN, pd.Series('', index=df.index)).fillna('')
+    if OFFICIAL_BAIRRO_COLUMN in areas.columns:
+        df['Bairro'] = areas[OFFICIAL_BAIRRO_COLUMN].fillna('').to_numpy()
+    else:
+        df['Bairro'] = parse_address_column(df['Endereço_Google'])['Bairro'].fillna('').to_numpy()
+
+    if district:
+        # Multi-select answers ("DAGUA DASAC") match any of their districts
+        df = df[df['Distrito'].astype(str).str.upper().str.split().apply(lambda ds: district.upper() in ds)]
+    if bairro:
+        df = df[df['Bairro'].astype(str).map(fold_accents) == fold_accents(bairro)]
+    return df
+
+def build_schedule(df, routes, inspectors=INSPECTORS):
+    """
+    One row per stop: routes are handed out to inspectors day by day.
+    """
+    rows = []
+    for r, (stops, distance) in enumerate(routes):
+        day, inspector = divmod(r, inspectors)
+        prev = None
+        for order, pos in enumerate(stops, start=1):
+            point = df.iloc[pos]
+            leg = 0.0 if prev is None else float(haversine_m(prev['lat'], prev['lng'], point['lat'], point['lng']))
+            rows.append({
+                'Dia': day + 1,
+                'Inspetor': inspector + 1,
+                'Rota': r + 1,
+                'Ordem': order,
+                NAME_COLUMN: point.get(NAME_COLUMN, ''),
+                PHONE_COLUMN: point.get(PHONE_COLUMN, ''),
+                'Endereço_Google': point.get('Endereço_Google', ''),
+                'Bairro': point['Bairro'],
+                'Distrito': point['Distrito'],
+                'Latitude': point['lat'],
+                'Longitude': point['lng'],
+                'Distância_do_anterior_m': round(leg),
+                'Distância_da_rota_km': round(distance / 1000, 2),
+            })
+            prev = point
+    return pd.DataFrame(rows)
+
+def main(district=None, bairro=None, capacity=STOPS_PER_ROUTE, inspectors=INSPECTORS, depot=DEPOT):
+    if not os.path.exists(ROUTE_SOURCE):
+        print(f"Error: {ROUTE_SOURCE} not found.")
+        return
+
+    df = load_points(ROUTE_SOURCE, district, bairro)
+    if df.empty:
+        print("Error: no geocoded points match the filter.")
+        return
+
+    print(f"Planning routes for {len(df)} points ({capacity} stops per route, {inspectors} inspectors)...")
+    routes = plan_routes(df['lat'].to_numpy(), df['lng'].to_numpy(), depot, capacity)
+    schedule = build_schedule(df, routes, inspectors)
+
+    for r, (stops, distance) in enumerate(routes):
+        day, inspector = divmod(r, inspectors)
+        print(f"Route {r + 1:3d} (day {day + 1}, inspector {inspector + 1}): {len(stops):3d} stops, {distance / 1000:6.1f} km")
+    total = sum(distance for _, distance in routes)
+    days = math.ceil(len(routes) / inspectors)
+    print(f"{len(routes)} routes over {days} days, {total / 1000:.1f} km in total.")
+
+    schedule.to_excel(ROUTES_FILE, index=False)
+    print(f"Saved {ROUTES_FILE}.")
+
+def parse_depot(value):
+    lat, lng = (float(v) for v in value.split(','))
+    return lat, lng
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description="Plan daily inspection routes over the geocoded points.")
+    parser.add_argument('--district', help="health district, e.g. DAGUA")
+    parser.add_argument('--bairro', help="bairro name (accents and case are ignored)")
+    parser.add_argument('--stops', type=int, default=STOPS_PER_ROUTE, help="maximum stops per route")
+    parser.add_argument('--inspectors', type=int, default=INSPECTORS, help="routes run in parallel each day")
+    parser.add_argument('--depot', type=parse_depot, default=DEPOT, help="start/end point as 'lat,lng'")
+    args = parser.parse_args()
+    main(args.district, args.bairro, args.stops, args.inspectors, args.depot)
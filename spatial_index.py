@@ -0,0 +1,76 @@
+import math
+import numpy as np
+
+EARTH_RADIUS_M = 6371008.8
+METERS_PER_DEG_LAT = 111320.0
+
+def haversine_m(lat1, lng1, lat2, lng2):
+    """
+    Great-circle distance in metres. Accepts scalars or NumPy arrays (broadcasts).
+    """
+    lat1, lng1, lat2, lng2 = map(np.radians, (lat1, lng1, lat2, lng2))
+    a = np.sin((lat2 - lat1) / 2) ** 2 + np.cos(lat1) * np.cos(lat2) * np.sin((lng2 - lng1) / 2) ** 2
+    return 2 * EARTH_RADIUS_M * np.arcsin(np.sqrt(a))
+
+class GridIndex:
+    """
+    Uniform lat/lng grid with roughly square cells of `cell_m` metres.
+    Longitude is scaled by cos(ref_lat), which is accurate enough for a
+    metropolitan area such as Belém.
+    """
+
+    def __init__(self, cell_m, ref_lat=-1.45):
+        self.cell_m = float(cell_m)
+        self.dlat = self.cell_m / METERS_PER_DEG_LAT
+        self.dlng = self.cell_m / (METERS_PER_DEG_LAT * math.cos(math.radians(ref_lat)))
+        self.cells = {}
+
+    def cell_of(self, lat, lng):
+        return (int(math.floor(lat / self.dlat)), int(math.floor(lng / self.dlng)))
+
+    def cells_of(self, lats, lngs):
+        """
+        Vectorized cell coordinates for arrays of points.
+        """
+        rows = np.floor(np.asarray(lats, dtype=float) / self.dlat).astype(np.int64)
+        cols = np.floor(np.asarray(lngs, dtype=float) / self.dlng).astype(np.int64)
+        return rows, cols
+
+    def insert(self, lat, lng, item):
+        self.cells.setdefault(self.cell_of(lat, lng), []).append(item)
+
+    def nearby(self, lat, lng):
+        """
+        Items in the point's cell and its 8 neighbours, i.e. every item
+        within `cell_m` metres (plus some further away).
+        """
+        row, col = self.cell_of(lat, lng)
+        for dr in (-1, 0, 1):
+            for dc in (-1, 0, 1):
+                yield from self.cells.get((row + dr, col + dc), ())
+
+def bucket_points(lats, lngs, radius_m):
+    """
+    Greedy leader clustering: each point joins the first representative found
+    within `radius_m` metres, otherwise it becomes a new representative.
+    Returns (labels, representatives) where labels[i] is the position of the
+    representative of point i in the input.
+    """
+    lats = np.asarray(lats, dtype=float)
+    lngs = np.asarray(lngs, dtype=float)
+    labels = np.arange(len(lats))
+    if radius_m <= 0:
+        return labels, labels.copy()
+
+    grid = GridIndex(radius_m)
+    reps = []
+    for i in range(len(lats)):
+        lat, lng = lats[i], lngs[i]
+        for j in grid.nearby(lat, lng):
+            if haversine_m(lat, lng, lats[j], lngs[j]) <= radius_m:
+                labels[i] = j
+                break
+        else:
+            grid.insert(lat, lng, i)
+            reps.append(i)
+    return labels, np.asarray(reps, dtype=np.int64)
@@ -0,0 +1,130 @@
+import csv
+import uuid
+import argparse
+import numpy as np
+import pandas as pd
+from process_locations import KOBO_COLUMNS
+
+# Synthetic KoBo exports with the same columns and formats as the real
+# "all versions" CSV: Belém-area coordinates clustered around markets and
+# ports, Portuguese stall/owner names, repeated registrations of the same
+# stall and a share of missing or zero coordinates.
+# Usage: python synthetic_kobo.py --rows 100000 --output synthetic.csv
+
+DISTRICTS = ['DABEL', 'DABEN', 'DAENT', 'DAGUA', 'DAICO', 'DAMOS', 'DAOUT', 'DASAC']
+FIRST_NAMES = [
+    "José", "João", "Maria", "Ana", "Antônio", "Francisco", "Raimundo", "Sebastião", "Joana",
+    "Conceição", "Luiz", "Carlos", "Paulo", "Pedro", "Lúcia", "Rosa", "Benedito", "Márcia",
+    "Zé", "Negão", "Davi", "Mateus", "Cláudia", "Fátima", "Elson", "Ivaneide", "Jorge",
+]
+SURNAMES = [
+    "Silva", "Santos", "Souza", "Oliveira", "Pereira", "Lima", "Costa", "Ferreira", "Rodrigues",
+    "Almeida", "Nascimento", "Gonçalves", "Barbosa", "Cardoso", "Moraes", "Pinheiro", "Wanzeler",
+]
+STALL_PATTERNS = ["Açaí do {}", "Açaí da {}", "Ponto do {}", "Batedeira do {}", "Açaí {} ", "{} {}"]
+ACS_NAMES = ["Carlos Lima", "Ana Paula Souza", "Joana Ferreira", "Raimundo Costa", "Márcia Pinheiro"]
+# Activity hotspots (lat, lng): Ver-o-Peso, Guamá, Jurunas, Pedreira, Marambaia, Icoaraci, Outeiro, Mosqueiro
+HOTSPOTS = np.array([
+    (-1.4525, -48.5030), (-1.4690, -48.4650), (-1.4700, -48.4900), (-1.4300, -48.4700),
+    (-1.3950, -48.4550), (-1.2950, -48.4800), (-1.2700, -48.4700), (-1.1600, -48.4000),
+])
+INVALID_SHARE = 0.03    # Rows without coordinates
+ZERO_SHARE = 0.01       # Rows with 0, 0 (GPS not acquired)
+DUPLICATE_SHARE = 0.08  # Rows re-registering an earlier stall a few metres away
+
+ACCENTS = str.maketrans("áàâãéêíóôõúçÁÉÍÓÚÇ", "aaaaeeioooucAEIOUC")
+
+def strip_accents(text):
+    return text.translate(ACCENTS)
+
+def generate_chunk(n, start_id, rng):
+    """
+    DataFrame of `n` synthetic submissions; _id/_index start at `start_id`.
+    """
+    # Coordinates: 75% around hotspots, the rest spread over the city
+    which = rng.integers(0, len(HOTSPOTS), n)
+    around = HOTSPOTS[which] + rng.normal(0, 0.006, size=(n, 2))
+    spread = np.column_stack([rng.uniform(-1.48, -1.35, n), rng.uniform(-48.50, -48.42, n)])
+    coords = np.where((rng.random(n) < 0.75)[:, None], around, spread)
+
+    first = rng.choice(FIRST_NAMES, n)
+    last = rng.choice(SURNAMES, n)
+    pattern = rng.integers(0, len(STALL_PATTERNS), n)
+    names = [STALL_PATTERNS[p].format(f, l) if p == len(STALL_PATTERNS) - 1 else STALL_PATTERNS[p].format(f).strip()
+             for p, f, l in zip(pattern.tolist(), first.tolist(), last.tolist())]
+    phones = [f"91-9{p:08d}" for p in rng.integers(0, 10 ** 8, n).tolist()]
+
+    # Re-registrations: copy an earlier row of the chunk, move it a few metres, vary the spelling
+    dup = np.nonzero(rng.random(n) < DUPLICATE_SHARE)[0]
+    dup = dup[dup > 0]
+    source = (rng.random(len(dup)) * dup).astype(np.int64)
+    coords[dup] = coords[source] + rng.normal(0, 0.00005, size=(len(dup), 2))
+    for d, s in zip(dup.tolist(), source.tolist()):
+        names[d] = strip_accents(names[s]) if rng.random() < 0.5 else names[s].lower()
+        phones[d] = phones[s]
+
+    lat = np.round(coords[:, 0], 6).astype(str).astype(object)
+    lng = np.round(coords[:, 1], 6).astype(str).astype(object)
+    roll = rng.random(n)
+    lat[roll < INVALID_SHARE] = ''
+    lng[roll < INVALID_SHARE] = ''
+    zero = (roll >= INVALID_SHARE) & (roll < INVALID_SHARE + ZERO_SHARE)
+    lat[zero] = '0.0'
+    lng[zero] = '0.0'
+    location = np.where(lat == '', '', lat + ' ' + lng + ' 0 0')
+
+    district_idx = rng.integers(0, len(DISTRICTS), n)
+    submitted = pd.Timestamp('2025-03-01') + pd.to_timedelta(rng.integers(0, 240 * 86400, n), unit='s')
+    ids = np.arange(start_id, start_id + n)
+    raw = rng.bytes(16 * n)
+    uuids = [str(uuid.UUID(bytes=raw[i:i + 16], version=4)) for i in range(0, 16 * n, 16)]
+
+    df = pd.DataFrame({
+        "start": (submitted - pd.Timedelta(minutes=5)).strftime('%Y-%m-%d %H:%M:%S.000000-03:00'),
+        "end": submitted.strftime('%Y-%m-%d %H:%M:%S.000000-03:00'),
+        "Org": '',
+        "Nome do profissional de saúde": rng.choice(ACS_NAMES, n),
+        "Qual o distrito de saúde?": np.array(DISTRICTS)[district_idx],
+    })
+    for i, district in enumerate(DISTRICTS):
+        df[f"Qual o distrito de saúde?/{district}"] = np.where(district_idx == i, '1', '0')
+    df["Nome do ponto de venda ou do proprietário"] = names
+    df["Telefone de contato"] = phones
+    df["Localização"] = location
+    df["_Localização_latitude"] = lat
+    df["_Localização_longitude"] = lng
+    df["_Localização_altitude"] = '0'
+    df["_Localização_precision"] = '0'
+    df["_id"] = ids + 453000000
+    df["_uuid"] = uuids
+    df["_submission_time"] = submitted.strftime('%Y-%m-%d %H:%M:%S')
+    for col in ("_validation_status", "_notes", "_submitted_by", "_tags"):
+        df[col] = ''
+    df["_status"] = 'submitted_via_web'
+    df["__version__"] = 'vreXFtC8vF5hwsau2wtS5v'
+    df["_index"] = ids + 1
+    return df[KOBO_COLUMNS]
+
+def generate_kobo_csv(path, rows, seed=0, chunk_size=100000):
+    """
+    Write a synthetic KoBo export of `rows` submissions to `path`, in chunks
+    so 1M rows don't need to be held in memory at once.
+    """
+    rng = np.random.default_rng(seed)
+    written = 0
+    while written < rows:
+        n = min(chunk_size, rows - written)
+        chunk = generate_chunk(n, written, rng)
+        chunk.to_csv(path, sep=';', index=False, quoting=csv.QUOTE_ALL,
+                     mode='w' if written == 0 else 'a', header=written == 0)
+        written += n
+    return written
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description="Generate a synthetic KoBo CSV export.")
+    parser.add_argument('--rows', type=int, default=10000)
+    parser.add_argument('--seed', type=int, default=0)
+    parser.add_argument('--output', default='synthetic_kobo.csv')
+    args = parser.parse_args()
+    generate_kobo_csv(args.output, args.rows, args.seed)
+    print(f"Wrote {args.rows} synthetic submissions to {args.output}.")
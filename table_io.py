@@ -0,0 +1,130 @@
+import os
+import pandas as pd
+
+# pyarrow is optional: without it every stage falls back to Excel files
+try:
+    import pyarrow as pa
+    import pyarrow.feather as feather
+    import pyarrow.ipc as ipc
+    import pyarrow.parquet as parquet
+    HAS_PYARROW = True
+except ImportError:
+    HAS_PYARROW = False
+
+# Intermediate format handed between the pipeline stages: 'parquet', 'arrow' or 'xlsx'.
+# Override with the ACAI_INTERMEDIATE_FORMAT environment variable.
+INTERMEDIATE_FORMAT = os.getenv('ACAI_INTERMEDIATE_FORMAT', 'parquet' if HAS_PYARROW else 'xlsx')
+
+EXTENSIONS = {'parquet': '.parquet', 'arrow': '.arrow', 'xlsx': '.xlsx'}
+
+def intermediate_path(stem, fmt=None):
+    """
+    File name for a stage output, e.g. 'output_enderecos' -> 'output_enderecos.parquet'.
+    """
+    fmt = fmt or INTERMEDIATE_FORMAT
+    if fmt not in EXTENSIONS:
+        raise ValueError(f"Unknown intermediate format {fmt!r} (ACAI_INTERMEDIATE_FORMAT); "
+                         f"use one of: {', '.join(EXTENSIONS)}.")
+    if fmt != 'xlsx' and not HAS_PYARROW:
+        print(f"WARNING: pyarrow not installed, writing {stem}.xlsx instead of {fmt}.")
+        fmt = 'xlsx'
+    return stem + EXTENSIONS[fmt]
+
+def find_table(stem):
+    """
+    Existing file for a stage output, preferring the configured format,
+    then any columnar file, then Excel. Returns the preferred name if none exist.
+    """
+    preferred = intermediate_path(stem)
+    candidates = [preferred] + [stem + ext for ext in EXTENSIONS.values()]
+    for path in candidates:
+        if os.path.exists(path):
+            return path
+    return preferred
+
+def _ext(path):
+    return os.path.splitext(path)[1].lower()
+
+def table_columns(path):
+    """
+    Column names without loading the data.
+    """
+    ext = _ext(path)
+    if ext == '.parquet':
+        return parquet.read_schema(path).names
+    if ext in ('.arrow', '.feather'):
+        return ipc.open_file(pa.memory_map(path)).schema.names
+    return pd.read_excel(path, nrows=0).columns.tolist()
+
+def read_table(path, columns=None):
+    """
+    Read a stage output. Columnar files are memory-mapped and, when `columns`
+    is given, only those columns are read from disk.
+    """
+    ext = _ext(path)
+    if ext == '.parquet':
+        return pd.read_parquet(path, columns=columns, memory_map=True)
+    if ext in ('.arrow', '.feather'):
+        return feather.read_table(path, columns=columns, memory_map=True).to_pandas()
+    return pd.read_excel(path, usecols=columns)
+
+def write_table(df, path):
+    ext = _ext(path)
+    if ext == '.parquet':
+        df.to_parquet(path, index=False)
+    elif ext in ('.arrow', '.feather'):
+        feather.write_feather(df.reset_index(drop=True), path, compression='zstd')
+    else:
+        df.to_excel(path, index=False)
+
+class ChunkedTableWriter:
+    """
+    Append DataFrame chunks to a single stage output without holding them all
+    in memory. Parquet and Arrow files are written batch by batch; the schema
+    is taken from the first chunk, with all-null columns typed as strings so
+    later chunks with values still fit. Excel rows are streamed by openpyxl's
+    write-only workbook.
+    """
+
+    def __init__(self, path):
+        self.path = path
+        self.ext = _ext(path)
+        if self.ext != '.xlsx' and not HAS_PYARROW:
+            raise RuntimeError(f"pyarrow is required for chunked {self.ext} output")
+        self.schema = None
+        self.writer = None
+        self.rows = 0
+
+    def write(self, df):
+        if self.ext == '.xlsx':
+            self._write_excel(df)
+        else:
+            table = pa.Table.from_pandas(df, preserve_index=False)
+            if self.writer is None:
+                self.schema = pa.schema([
+                    f.with_type(pa.string()) if pa.types.is_null(f.type) else f for f in table.schema
+                ])
+                if self.ext == '.parquet':
+                    self.writer = parquet.ParquetWriter(self.path, self.schema)
+                else:
+                    self.writer = ipc.new_file(self.path, self.schema,
+                                               options=ipc.IpcWriteOptions(compression='zstd'))
+            self.writer.write_table(table.cast(self.schema))
+        self.rows += len(df)
+
+    def _write_excel(self, df):
+        if self.writer is None:
+            from openpyxl import Workbook
+            self.writer = Workbook(write_only=True)
+            self.sheet = self.writer.create_sheet()
+            self.sheet.append([str(c) for c in df.columns])
+        for row in df.astype(object).where(df.notna(), None).itertuples(index=False):
+            self.sheet.append(list(row))
+
+    def close(self):
+        if self.writer is None:
+            return
+        if self.ext == '.xlsx':
+            self.writer.save(self.path)
+        else:
+            self.writer.close()
@@ -0,0 +1,58 @@
+import pandas as pd
+from checkpoint import GeocodeJournal, submission_key, submission_keys
+
+def test_journal_resumes_final_results(tmp_path):
+    path = str(tmp_path / 'journal.jsonl')
+    journal = GeocodeJournal(path)
+    journal.record('uuid-1', -1.45, -48.49, 'Tv. Mauriti, 1020')
+    journal.record('uuid-2', -1.46, -48.48, 'Error: Timeout')
+    journal.close()
+
+    journal = GeocodeJournal(path)
+    assert len(journal) == 2
+    assert journal.lookup('uuid-1', -1.45, -48.49) == 'Tv. Mauriti, 1020'
+    assert journal.lookup('uuid-2', -1.46, -48.48) is None   # Failed: geocoded again
+    assert journal.lookup('uuid-3', -1.45, -48.49) is None   # New submission
+    assert journal.lookup('uuid-1', -1.4501, -48.49) is None  # Moved point
+    journal.close()
+
+def test_permanent_errors_are_final_across_a_resume(tmp_path):
+    path = str(tmp_path / 'journal.jsonl')
+    journal = GeocodeJournal(path)
+    journal.record('uuid-1', -1.45, -48.49, 'Error (permanent): INVALID_REQUEST')
+    journal.record('uuid-2', -1.46, -48.48, 'Error: OVER_QUERY_LIMIT')
+    journal.record('uuid-3', -1.47, -48.47, 'API_KEY_ERROR')
+    journal.close()
+
+    journal = GeocodeJournal(path)
+    assert journal.lookup('uuid-1', -1.45, -48.49) == 'Error (permanent): INVALID_REQUEST'
+    assert journal.lookup('uuid-2', -1.46, -48.48) is None
+    assert journal.lookup('uuid-3', -1.47, -48.47) is None
+    journal.close()
+
+def test_later_records_override_earlier_ones(tmp_path):
+    path = str(tmp_path / 'journal.jsonl')
+    journal = GeocodeJournal(path)
+    journal.record('uuid-1', -1.45, -48.49, 'Error: Timeout')
+    journal.record('uuid-1', -1.45, -48.49, 'Tv. Mauriti, 1020')
+    journal.close()
+    assert GeocodeJournal(path).lookup('uuid-1', -1.45, -48.49) == 'Tv. Mauriti, 1020'
+
+def test_truncated_last_line_is_ignored(tmp_path):
+    path = tmp_path / 'journal.jsonl'
+    journal = GeocodeJournal(str(path))
+    journal.record('uuid-1', -1.45, -48.49, 'Tv. Mauriti, 1020')
+    journal.close()
+    with open(path, 'a', encoding='utf-8') as f:
+        f.write('{"key": "uuid-2", "lat"')
+
+    journal = GeocodeJournal(str(path))
+    journal.record('uuid-3', -1.46, -48.48, 'R. dos Mundurucus, 100')
+    journal.close()
+    journal = GeocodeJournal(str(path))
+    assert sorted(journal.entries) == ['uuid-1', 'uuid-3']
+
+def test_submission_keys_prefer_uuid_then_id():
+    df = pd.DataFrame({'_id': [101.0, None, 103.0], '_uuid': ['a-b', None, '']}, index=[0, 1, 2])
+    assert submission_keys(df) == ['a-b', 'row:1', '103']
+    assert [submission_key(row, i) for i, row in df.iterrows()] == ['a-b', 'row:1', '103']
@@ -0,0 +1,38 @@
+import numpy as np
+from density import (hex_cells, hex_centres, density_layer, load_expected, coverage_tables,
+                     EXPECTED_FILE, COVERAGE_SIZE_M, OTHER)
+from map_tiles import DISTRICTS
+
+def test_hex_centres_fall_in_their_own_cell():
+    rng = np.random.default_rng(2)
+    lats = -1.45 + rng.uniform(-0.1, 0.1, 500)
+    lngs = -48.48 + rng.uniform(-0.1, 0.1, 500)
+    for size in (250, 1000):
+        q, r = hex_cells(lats, lngs, size)
+        centre_lat, centre_lng = hex_centres(q, r, size)
+        q2, r2 = hex_cells(centre_lat, centre_lng, size)
+        assert np.array_equal(q, q2) and np.array_equal(r, r2)
+
+def test_density_layer_counts_points_per_cell_district_and_month():
+    lats = np.array([-1.4500, -1.4501, -1.4800])
+    lngs = np.array([-48.4800, -48.4801, -48.4800])
+    district_idx = np.array([0, 1, len(DISTRICTS)])
+    month_idx = np.array([0, 0, -1])
+    layer = density_layer(lats, lngs, district_idx, month_idx, 250)
+    assert sorted(layer['count']) == [1, 2]
+    shared = layer['count'].index(2)
+    assert layer['district'][shared][:2] == [1, 1]
+    assert layer['month'] == [[shared, 0, 2]]
+
+def test_expected_file_is_semicolon_separated(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    (tmp_path / EXPECTED_FILE).write_text("distrito;estimativa\ndagua ;1200\nDASAC;x\n", encoding='utf-8')
+    assert load_expected() == {'DAGUA': 1200}
+
+    tables = coverage_tables(np.array([-1.45, -1.46]), np.array([-48.48, -48.49]),
+                             np.array([1, 1]), np.array([0, 0]), ['2025-01'], expected_total=10)
+    dagua = tables['districts'][DISTRICTS.index('DAGUA')]
+    assert (dagua['points'], dagua['expected'], dagua['coverage']) == (2, 1200, 0.2)
+    assert tables['groups'][-1] == OTHER
+    assert (tables['coverage'], tables['missing'], tables['cellSize']) == (20.0, 8, COVERAGE_SIZE_M)
+    assert tables['months'][0]['cumulative'] == 2
@@ -0,0 +1,50 @@
+import os
+import json
+import pandas as pd
+import districts
+
+def write_square(path, name, x0, y0, x1, y1):
+    feature = {'type': 'Feature', 'properties': {'sigla': name},
+               'geometry': {'type': 'Polygon', 'coordinates': [[[x0, y0], [x1, y0], [x1, y1], [x0, y1], [x0, y0]]]}}
+    path.write_text(json.dumps({'type': 'FeatureCollection', 'features': [feature]}), encoding='utf-8')
+
+def test_load_index_is_memoized_until_the_file_changes(tmp_path):
+    path = tmp_path / 'distritos.geojson'
+    write_square(path, 'DAGUA', -48.50, -1.48, -48.46, -1.44)
+    first = districts.load_index(str(path), districts.DISTRICT_NAME_KEYS)
+    assert districts.load_index(str(path), districts.DISTRICT_NAME_KEYS) is first
+    assert list(first.names_for([-1.46], [-48.48])) == ['DAGUA']
+
+    write_square(path, 'DASAC', -48.50, -1.48, -48.46, -1.44)
+    stat = os.stat(path)
+    os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+    second = districts.load_index(str(path), districts.DISTRICT_NAME_KEYS)
+    assert second is not first
+    assert list(second.names_for([-1.46], [-48.48])) == ['DASAC']
+
+def test_missing_boundary_file(tmp_path):
+    assert districts.load_index(str(tmp_path / 'missing.geojson'), districts.DISTRICT_NAME_KEYS) is None
+
+def test_locate_handles_holes_and_multipolygons():
+    outer = [[0, 0], [4, 0], [4, 4], [0, 4]]
+    hole = [[1, 1], [3, 1], [3, 3], [1, 3]]
+    index = districts.PolygonIndex(['RING', 'PAIR'], [
+        [outer, hole],
+        [[[10, 0], [11, 0], [11, 1], [10, 1]], [[20, 0], [21, 0], [21, 1], [20, 1]]],
+    ])
+    lats = [0.5, 2.0, 0.5, 0.5, 0.5, 9.0, float('nan')]
+    lngs = [0.5, 2.0, 10.5, 20.5, 15.0, 0.5, 0.5]
+    assert list(index.locate(lats, lngs)) == [0, -1, 1, 1, -1, -1, -1]
+    assert list(index.names_for(lats, lngs)) == ['RING', None, 'PAIR', 'PAIR', None, None, None]
+
+def test_assign_districts_fills_only_empty_answers(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    write_square(tmp_path / districts.DISTRICTS_GEOJSON, 'DAGUA', -48.50, -1.48, -48.46, -1.44)
+    df = pd.DataFrame({
+        '_Localização_latitude': ['-1.46', '-1.46', '-1.30'],
+        '_Localização_longitude': ['-48.48', '-48.48', '-48.48'],
+        districts.DISTRICT_COLUMN: ['', 'DASAC', None],
+    })
+    assert districts.assign_districts(df) == [districts.OFFICIAL_DISTRICT_COLUMN]
+    assert df[districts.OFFICIAL_DISTRICT_COLUMN].fillna('').tolist() == ['DAGUA', 'DAGUA', '']
+    assert df[districts.DISTRICT_COLUMN].fillna('').tolist() == ['DAGUA', 'DASAC', '']
@@ -0,0 +1,50 @@
+import numpy as np
+import pandas as pd
+from establishments import (normalize_name, normalize_phone, trigrams, is_same_establishment,
+                            find_establishments, tag_establishments, _UnionFind,
+                            NAME_COLUMN, PHONE_COLUMN, ESTABLISHMENT_COLUMN, CANONICAL_COLUMN)
+
+def key(name):
+    name = normalize_name(name)
+    return name, trigrams(name) if name else set()
+
+def test_phone_keeps_the_last_eight_digits():
+    assert normalize_phone('(91) 99250-5291') == '92505291'
+    assert normalize_phone('91-992505291') == '92505291'
+    assert normalize_phone('+55 91 9250-5291') == '92505291'
+    assert normalize_phone('5291') == ''
+    assert normalize_phone(None) == ''
+
+def test_generic_words_and_accents_are_ignored():
+    assert normalize_name('Açaí do Zé') == 'ze'
+    assert normalize_name('Ponto de venda') == ''
+
+def test_phone_decides_before_names():
+    assert is_same_establishment(key('Açaí do Zé'), key('Barraca da Maria'), '92505291', '92505291')
+    assert not is_same_establishment(key('Açaí da Maria'), key('Acai da Mariana'), '92505291', '88881111')
+    assert is_same_establishment(key('Açaí da Maria'), key('Acai da Maria'), '92505291', '88881111')
+    assert is_same_establishment(key('Açaí da Mariazinha'), key('Acai da Mariazinha B'), '', '')
+    assert not is_same_establishment(key('Açaí'), key('Ponto'), '', '')
+
+def test_union_find_merges_transitively():
+    groups = _UnionFind(5)
+    groups.union(3, 4)
+    groups.union(1, 3)
+    assert [int(groups.find(i)) for i in range(5)] == [0, 1, 2, 1, 1]
+
+def test_find_establishments_groups_nearby_duplicates():
+    df = pd.DataFrame({
+        '_Localização_latitude': ['-1.45500', '-1.45510', '-1.45520', '-1.46500', '', '-1.45500'],
+        '_Localização_longitude': ['-48.48000', '-48.48010', '-48.48000', '-48.48000', '', '-48.48000'],
+        NAME_COLUMN: ['Açaí do Zé', 'Acai do Ze', 'Batedeira X', 'Açaí do Zé', 'Açaí do Zé', 'Barraca Y'],
+        PHONE_COLUMN: ['', '', '(91) 99250-5291', '', '', '91 992505291'],
+        '_submission_time': ['2025-01-01', '2025-03-01', '2025-02-01', '2025-01-01', '2025-01-01', '2025-04-01'],
+        '_uuid': ['a', 'b', 'c', 'd', 'e', 'f'],
+    })
+    canonical = find_establishments(df)
+    # Zé twice nearby (newest wins), X/Y share a phone, the far and unlocated Zé stay alone
+    assert canonical.tolist() == [1, 1, 5, 3, 4, 5]
+    tag_establishments(df, canonical)
+    assert df[ESTABLISHMENT_COLUMN].tolist() == ['b', 'b', 'f', 'd', 'e', 'f']
+    assert df[CANONICAL_COLUMN].tolist() == [False, True, False, True, True, True]
+    assert np.array_equal(find_establishments(df.drop(columns='_submission_time')), [0, 0, 2, 3, 4, 2])
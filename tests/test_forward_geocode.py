@@ -0,0 +1,27 @@
+import pytest
+from forward_geocode import normalize_address
+
+@pytest.mark.parametrize('text, street, number, bairro, cep', [
+    ('TRAVESSA MAURITI 1020, MARCO, BELEM PA 66093180', 'Tv. Mauriti', '1020', 'Marco', '66093-180'),
+    ('Travessa Mauriti 1020 - Marco, Belém/PA CEP 66.093-180', 'Tv. Mauriti', '1020', 'Marco', '66093-180'),
+    ('Tv. Mauriti, 1020, Marco, Belém - PA, 66093-180', 'Tv. Mauriti', '1020', 'Marco', '66093-180'),
+    ('Rua Oliveira Belo 300, Umarizal', 'R. Oliveira Belo', '300', 'Umarizal', None),
+    ('Rua dos Mundurucus, 100 - Jurunas', 'R. dos Mundurucus', '100', 'Jurunas', None),
+    ('RUA DA MARINHA 12', 'R. da Marinha', '12', None, None),
+    ('rua dos mundurucus', 'R. dos Mundurucus', None, None, None),
+    ('Passagem São Pedro, s/n, Guamá', 'Psg. São Pedro', 's/n', 'Guamá', None),
+    ('Av. Pedro Miranda, 500', 'Av. Pedro Miranda', '500', None, None),
+    ('Rodovia BR-316 km 5', 'Rod. BR-316 km 5', None, None, None),
+])
+def test_normalize_address(text, street, number, bairro, cep):
+    _, fields = normalize_address(text)
+    assert (fields['Logradouro'], fields['Número'], fields['Bairro'], fields['CEP']) == (street, number, bairro, cep)
+    assert fields['Município'] == 'Belém'
+
+def test_normalize_address_query_layout():
+    query, _ = normalize_address('TRAVESSA MAURITI 1020, MARCO, BELEM PA 66093180')
+    assert query == 'Tv. Mauriti, 1020 - Marco, Belém - PA, 66093-180'
+
+@pytest.mark.parametrize('text', [None, '', '   '])
+def test_normalize_empty_address(text):
+    assert normalize_address(text) == (None, None)
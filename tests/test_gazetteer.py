@@ -0,0 +1,31 @@
+import pandas as pd
+from gazetteer import Gazetteer, CITY_SUFFIX_RE, load_gazetteers
+
+def test_unknown_spellings_collapse_only_within_a_whole_batch():
+    gazetteer = Gazetteer(['Marco', 'Jurunas'])
+    values = pd.Series(['marco', 'VILA NOVA', 'Vila Nova', 'Vila Nova', ''])
+    assert gazetteer.canonicalize(values).tolist() == ['Marco', 'Vila Nova', 'Vila Nova', 'Vila Nova', '']
+    # Per chunk the most frequent spelling is unknown, so variants are left as they are
+    assert gazetteer.canonicalize(values, collapse=False).tolist() == ['Marco', 'VILA NOVA', 'Vila Nova', 'Vila Nova', '']
+
+def test_lookup_folds_accents_and_street_abbreviations():
+    gazetteers = load_gazetteers()
+    assert gazetteers['Bairro'].lookup('SAO BRAS') == 'São Brás'
+    assert gazetteers['Município'].lookup('belem') == 'Belém'
+    assert gazetteers['Logradouro'].lookup('Avenida Governador José Malcher') == 'Av. Gov. José Malcher'
+    assert gazetteers['Bairro'].lookup(None) is None
+
+def test_fuzzy_fixes_typos_but_not_near_miss_names():
+    bairros = load_gazetteers()['Bairro']
+    assert bairros.lookup('Batista Campo') == 'Batista Campos'
+    assert bairros.lookup('Cidade Velhaa') == 'Cidade Velha'
+    assert bairros.lookup('Marcos') is None
+    assert bairros.lookup('Cidade Nova 6') is None
+    assert bairros.lookup('Una') == 'Una'
+    assert bairros.lookup('Unas') is None
+    assert load_gazetteers()['Logradouro'].lookup('Av. Almirante Barrozo') == 'Av. Almirante Barroso'
+
+def test_city_suffix_matches_whole_words_only():
+    assert CITY_SUFFIX_RE.search('Tv. Mauriti - Marco, BELEM').group(0) == 'BELEM'
+    assert CITY_SUFFIX_RE.search('Conj. Parbelém') is None
+    assert CITY_SUFFIX_RE.search('Rua Abelém') is None
@@ -0,0 +1,19 @@
+import pandas as pd
+import generate_site
+
+def test_map_points_are_loaded_once(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    calls = []
+
+    def load_map_points(stage='map', df=None):
+        calls.append(stage)
+        return pd.DataFrame({'_Localização_latitude': ['-1.45', '-1.46'], '_Localização_longitude': ['-48.49', '-48.48'],
+                             '_submission_time': ['2025-10-01T10:00:00', '2025-11-02T09:00:00']})
+    monkeypatch.setattr(generate_site, 'load_map_points', load_map_points)
+
+    map_data = generate_site.map_data_loader()
+    density = generate_site.generate_density(map_data=map_data)
+    generate_site.generate_map_data(tiles=False, map_data=map_data)
+    assert calls == ['map']
+    assert density['coverage']['total'] == 2
+    assert generate_site.read_js_payload(generate_site.MAP_DATA_JS)['count'] == 2
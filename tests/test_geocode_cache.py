@@ -0,0 +1,67 @@
+import time
+import threading
+from geocode_cache import GeocodeCache, coord_key, is_cacheable
+
+def test_keys_are_rounded_to_the_cache_precision(tmp_path):
+    cache = GeocodeCache(str(tmp_path / 'cache.sqlite'))
+    cache.put(-1.4558231, -48.4902117, 'Tv. Mauriti, 1020')
+    assert cache.get(-1.45582309, -48.49021171) == 'Tv. Mauriti, 1020'
+    assert cache.get(-1.455824, -48.490212) is None
+    assert (cache.hits, cache.misses, cache.writes) == (1, 1, 1)
+    assert coord_key(-1.5, -48) == '-1.500000,-48.000000'
+    cache.close()
+
+def test_expired_entries_are_misses_and_evicted(tmp_path):
+    cache = GeocodeCache(str(tmp_path / 'cache.sqlite'), ttl_days=1)
+    cache.put(-1.45, -48.49, 'old', created_at=time.time() - 2 * 86400)
+    cache.put(-1.46, -48.48, 'new')
+    cache.put_forward('Tv. Mauriti, 1020', -1.45, -48.49, 'old', created_at=time.time() - 2 * 86400)
+    assert cache.get(-1.45, -48.49) is None
+    assert cache.get_forward('TV MAURITI 1020') is None
+    assert len(cache) == 3
+    assert cache.evict_expired() == 2
+    assert len(cache) == 1
+    assert cache.get(-1.46, -48.48) == 'new'
+    cache.close()
+
+def test_no_ttl_keeps_everything(tmp_path):
+    cache = GeocodeCache(str(tmp_path / 'cache.sqlite'), ttl_days=None)
+    cache.put(-1.45, -48.49, 'old', created_at=1.0)
+    assert cache.get(-1.45, -48.49) == 'old'
+    assert cache.evict_expired() == 0
+    cache.close()
+
+def test_entries_survive_reopening(tmp_path):
+    path = str(tmp_path / 'cache.sqlite')
+    cache = GeocodeCache(path)
+    cache.put(-1.45, -48.49, 'Tv. Mauriti, 1020')
+    cache.close()
+    cache = GeocodeCache(path)
+    assert cache.get(-1.45, -48.49) == 'Tv. Mauriti, 1020'
+    cache.close()
+
+def test_concurrent_use_from_threads(tmp_path):
+    cache = GeocodeCache(str(tmp_path / 'cache.sqlite'))
+    errors = []
+
+    def work(n):
+        try:
+            for i in range(50):
+                cache.put(-1.4 - n / 100, -48.4 - i / 1000, f"{n}-{i}")
+                len(cache)
+                cache.evict_expired()
+        except Exception as e:
+            errors.append(e)
+    threads = [threading.Thread(target=work, args=(n,)) for n in range(8)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    assert errors == []
+    assert len(cache) == 400
+    cache.close()
+
+def test_only_real_addresses_are_cacheable():
+    assert is_cacheable('Tv. Mauriti, 1020 - Marco, Belém - PA')
+    for addr in (None, '', 'No results', 'API_KEY_ERROR', 'Error: Timeout', 'Mock Address (No API Key)'):
+        assert not is_cacheable(addr)
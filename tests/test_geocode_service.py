@@ -0,0 +1,55 @@
+import asyncio
+import pytest
+from fake_geocoder import FakeGeocodingClient
+from rate_limiter import TokenBucket
+from retry import CircuitBreaker
+from geocode_service import GeocodeService, RequestError
+
+def run_service(client, lookups):
+    service = GeocodeService(client, limiter=TokenBucket(1e9), breaker=CircuitBreaker(), workers=4)
+
+    async def main():
+        return await asyncio.gather(*[lookup(service) for lookup in lookups])
+
+    try:
+        return service, asyncio.run(main())
+    finally:
+        service.close()
+
+def test_identical_concurrent_lookups_share_one_call():
+    client = FakeGeocodingClient(latency=0.05)
+    service, results = run_service(client, [lambda s: s.reverse(-1.4558, -48.4902)] * 20)
+    assert client.calls == 1
+    assert (service.lookups, service.coalesced, len(service.inflight)) == (1, 19, 0)
+    assert all(r == results[0] for r in results)
+    assert results[0]['status'] == 'ok'
+
+def test_forward_lookups_coalesce_on_the_normalized_address():
+    client = FakeGeocodingClient(latency=0.05)
+    service, results = run_service(client, [
+        lambda s: s.forward("Tv. Mauriti, 1020, Belém"),
+        lambda s: s.forward("tv mauriti 1020 belem"),
+        lambda s: s.forward("R. dos Mundurucus, 100"),
+    ])
+    assert client.calls == 2
+    assert service.coalesced == 1
+    assert results[0]['lat'] == results[1]['lat']
+
+def test_bulk_keeps_order_and_flags_invalid_items():
+    client = FakeGeocodingClient(latency=0.01)
+    service, (result,) = run_service(client, [lambda s: s.bulk({
+        'reverse': [[-1.4558, -48.4902], {'lat': 'x', 'lng': 1}, [-1.4558, -48.4902], [0, 0]],
+        'forward': ["", "Tv. Mauriti, 1020"],
+    })])
+    statuses = [r['status'] for r in result['reverse']] + [r['status'] for r in result['forward']]
+    assert statuses == ['ok', 'invalid', 'ok', 'invalid', 'invalid', 'ok']
+    assert client.calls == 2
+
+def test_out_of_bounds_point_is_rejected():
+    service = GeocodeService(FakeGeocodingClient(latency=0))
+    try:
+        with pytest.raises(RequestError) as e:
+            asyncio.run(service.reverse(-23.55, -46.63))
+        assert e.value.status == 422
+    finally:
+        service.close()
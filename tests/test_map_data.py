@@ -0,0 +1,26 @@
+import pandas as pd
+from generate_site import build_map_data, encode_column
+from map_tiles import decode_column
+
+def test_repeated_values_are_dictionary_encoded():
+    encoded = encode_column(['DAGUA', 'DAGUA', 'DASAC', 'DAGUA'])
+    assert encoded == {'values': ['DAGUA', 'DASAC'], 'codes': [0, 0, 1, 0]}
+    assert decode_column({'count': 4, 'district': encoded}, 'district') == ['DAGUA', 'DAGUA', 'DASAC', 'DAGUA']
+    # Mostly unique columns stay plain lists
+    assert encode_column(['a', 'b', 'c']) == ['a', 'b', 'c']
+
+def test_map_payload_keeps_only_located_points():
+    df = pd.DataFrame({
+        '_Localização_latitude': ['-1.4558231', '', '0', '-1.46'],
+        '_Localização_longitude': ['-48.4902117', '-48.49', '0', '-48.48'],
+        'Nome do ponto de venda ou do proprietário': ['Açaí do Zé', 'x', 'y', None],
+        'Qual o distrito de saúde?': ['DAGUA DASAC', 'DAGUA', 'DAGUA', None],
+        '_submission_time': ['2025-10-01T10:00:00.000', None, None, '2025-11-02T09:00:00'],
+    })
+    data = build_map_data(df)
+    assert data['count'] == 2
+    assert data['lat'] == [-1.45582, -1.46]   # MAP_PRECISION decimals
+    assert decode_column(data, 'name') == ['Açaí do Zé', '']
+    assert decode_column(data, 'district') == ['DAGUA', '']   # First of a multi-select answer
+    assert decode_column(data, 'date') == ['2025-10-01', '2025-11-02']
+    assert decode_column(data, 'phone') == ['', '']
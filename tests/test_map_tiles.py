@@ -0,0 +1,36 @@
+import json
+import numpy as np
+from map_tiles import project, cluster_level, point_level, build_tiles, MIN_ZOOM, POINT_ZOOM, DISTRICTS
+
+def test_projection_matches_leaflet():
+    x, y = project(np.array([0.0]), np.array([0.0]), 0)
+    assert (x[0], y[0]) == (128.0, 128.0)
+    x, y = project(np.array([0.0]), np.array([180.0]), 1)
+    assert x[0] == 512.0
+
+def test_clusters_keep_every_point_and_district():
+    rng = np.random.default_rng(1)
+    lats = -1.45 + rng.normal(0, 0.02, 300)
+    lngs = -48.48 + rng.normal(0, 0.02, 300)
+    district_idx = rng.integers(0, len(DISTRICTS) + 1, 300)
+    for zoom in range(MIN_ZOOM, POINT_ZOOM):
+        clusters = [c for items in cluster_level(lats, lngs, district_idx, zoom).values() for c in items]
+        counts = np.sum([c[2] for c in clusters], axis=0)
+        assert counts.tolist() == np.bincount(district_idx, minlength=len(DISTRICTS) + 1).tolist()
+    points = [p for items in point_level(lats, lngs, district_idx, POINT_ZOOM).values() for p in items]
+    assert sorted(p[2] for p in points) == list(range(300))
+
+def test_build_tiles_lists_every_written_tile(tmp_path):
+    data = {'count': 3, 'lat': [-1.45, -1.46, -1.30], 'lng': [-48.49, -48.48, -48.47],
+            'district': {'values': ['DAGUA', ''], 'codes': [0, 0, 1]}, 'name': ['a', 'b', 'c']}
+    out = tmp_path / 'tiles'
+    written = build_tiles(data, str(out))
+    meta = json.loads((out / 'meta.json').read_text(encoding='utf-8'))
+    assert meta['count'] == 3
+    assert written == sum(len(tiles) for tiles in meta['tiles'].values())
+    for zoom, tiles in meta['tiles'].items():
+        for tile in tiles:
+            assert (out / zoom / f"{tile}.json").exists()
+    popups = json.loads((out / 'popups' / '0.json').read_text(encoding='utf-8'))
+    assert [p[0] for p in popups] == ['a', 'b', 'c']
+    assert [p[3] for p in popups] == ['DAGUA', 'DAGUA', '']
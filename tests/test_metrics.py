@@ -0,0 +1,32 @@
+from metrics import RunMetrics, row_status
+
+def test_row_status_classifies_every_placeholder():
+    assert row_status("Tv. Mauriti, 100 - Marco, Belém - PA, 66095-000, Brazil") == 'success'
+    assert row_status("No results") == 'no_result'
+    assert row_status("No address found") == 'no_result'
+    assert row_status("Error (permanent): REQUEST_DENIED") == 'error'
+    assert row_status("API_KEY_ERROR") == 'error'
+    for placeholder in ("Empty Address", "Invalid Coordinates", "Empty/Zero Coordinates",
+                        "Out of Bounds Coordinates", "DRY_RUN_SKIPPED", "Skipped",
+                        "Mock Address for -1.4, -48.4", "", None):
+        assert row_status(placeholder) == 'skipped'
+
+def test_count_rows_adds_up_per_status():
+    metrics = RunMetrics()
+    metrics.count_rows(["Rua A, Belém", "No results", "Empty Address", None, "Error: timeout"])
+    metrics.count_rows(["Rua B, Belém"])
+    assert metrics.counters == {'rows_success': 2, 'rows_no_result': 1, 'rows_error': 1, 'rows_skipped': 2}
+
+def test_latency_is_reported_per_operation():
+    metrics = RunMetrics()
+    for seconds in (0.01, 0.2, 0.3):
+        metrics.observe_latency(seconds, 'reverse_geocode')
+    metrics.observe_latency(3.0, 'geocode')
+    latency = metrics.report('test')['api_latency']
+    assert latency['reverse_geocode']['count'] == 3
+    assert latency['reverse_geocode']['buckets']['0.025'] == 1
+    assert latency['reverse_geocode']['buckets']['+Inf'] == 3
+    assert latency['geocode']['p50_s'] == 3.0
+    prom = metrics.prometheus('test')
+    assert 'acai_geocode_latency_seconds_count{script="test",operation="geocode"} 1' in prom
+    assert 'acai_geocode_latency_seconds_count{script="test",operation="reverse_geocode"} 3' in prom
@@ -0,0 +1,19 @@
+import pandas as pd
+from parse_addresses import parse_address, parse_address_column, PARSED_COL_NAMES
+from benchmark_parse import ODD_ADDRESSES, synthetic_addresses, normalized
+
+def test_vectorized_parser_matches_the_row_parser():
+    addresses = pd.concat([synthetic_addresses(2000), pd.Series(ODD_ADDRESSES, dtype=object)], ignore_index=True)
+    rowwise = addresses.apply(parse_address)
+    rowwise.columns = PARSED_COL_NAMES
+    assert normalized(rowwise).equals(normalized(parse_address_column(addresses)))
+
+def test_google_address_fields():
+    parsed = parse_address_column(pd.Series(['Tv. Mauriti, 1020 - Marco, Belém - PA, 66093-180, Brazil']))
+    assert parsed.iloc[0].to_dict() == {
+        'Logradouro': 'Tv. Mauriti', 'Número': '1020', 'Bairro': 'Marco', 'Município': 'Belém',
+        'Estado': 'PA', 'CEP': '66093-180', 'País': 'Brazil'}
+
+def test_placeholders_parse_to_nothing():
+    parsed = parse_address_column(pd.Series(['Error: OVER_QUERY_LIMIT', 'Mock Address (No API Key)', None]))
+    assert parsed.isna().all().all()
@@ -0,0 +1,55 @@
+import threading
+import numpy as np
+import pytest
+import parse_addresses
+import pipeline
+import generate_site
+import process_locations
+from fake_geocoder import FakeGeocodingClient
+from synthetic_kobo import generate_kobo_csv
+
+@pytest.fixture
+def workdir(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    generate_kobo_csv(process_locations.INPUT_CSV, 400, seed=0)
+    (tmp_path / 'Relatorio_Projeto_Acai.md').write_text('# Relatório', encoding='utf-8')
+    monkeypatch.setattr(process_locations, 'API_KEY', 'test')
+    monkeypatch.setattr(process_locations, 'create_client', lambda: FakeGeocodingClient(latency=0))
+    return tmp_path
+
+def run_with_timeout(timeout=60, **kwargs):
+    thread = threading.Thread(target=pipeline.run_pipeline, kwargs=dict(qps=1e9, **kwargs), daemon=True)
+    thread.start()
+    thread.join(timeout)
+    return not thread.is_alive()
+
+@pytest.mark.parametrize('failing', ['parse', 'render'])
+def test_failing_stage_ends_the_run(workdir, monkeypatch, capsys, failing):
+    def boom(*args, **kwargs):
+        raise RuntimeError('boom')
+    if failing == 'parse':
+        monkeypatch.setattr(parse_addresses, 'parse_frame', boom)
+    else:
+        monkeypatch.setattr(pipeline.SiteAggregator, 'add', boom)
+
+    assert run_with_timeout(chunk_size=50), "pipeline did not return after a stage failed"
+    assert f"Error in {failing} stage: boom" in capsys.readouterr().out
+    assert not (workdir / 'index.html').exists()
+
+def test_pipeline_completes(workdir, capsys):
+    assert run_with_timeout(chunk_size=100, write_parsed=False)
+    assert "Successfully generated index.html from" in capsys.readouterr().out
+
+def test_establishments_span_chunks(workdir, capsys):
+    # Registrations of a stall in different chunks are still one establishment
+    _, canonical = process_locations.find_all_establishments(process_locations.INPUT_CSV)
+    expected = int((canonical == np.arange(len(canonical))).sum())
+    assert expected < len(canonical)
+    assert run_with_timeout(chunk_size=30, write_parsed=False)
+    assert f"Successfully generated index.html from {expected} records." in capsys.readouterr().out
+
+def test_map_points_come_from_the_chunks(workdir, monkeypatch):
+    assert run_with_timeout(chunk_size=70, write_parsed=False)
+    streamed = generate_site.read_js_payload(generate_site.MAP_DATA_JS)
+    # Same points as generate_site, which reads them from the CSV
+    assert streamed == generate_site.build_map_data(generate_site.load_map_points())
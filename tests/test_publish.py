@@ -0,0 +1,63 @@
+import os
+import re
+import vendor
+from publish import publish_site, check_integrity, PUBLIC_DIR
+
+LEAFLET_CSS = b'.leaflet-control-layers-toggle{background-image:url(images/layers.png)}\n'
+PAGE = """<html><head>
+<link rel="stylesheet" href="https://unpkg.com/leaflet@1.9.4/dist/leaflet.css"
+    integrity="{css}" crossorigin="" />
+<script src="https://unpkg.com/leaflet@1.9.4/dist/leaflet.js"
+    integrity="{js}" crossorigin=""></script>
+</head><body></body></html>
+"""
+
+def write_vendor(files):
+    for name in vendor.VENDOR_LIBS:
+        os.makedirs(os.path.dirname(vendor.vendor_path(name)), exist_ok=True)
+        with open(vendor.vendor_path(name), 'wb') as f:
+            f.write(files.get(name, b'/* ' + name.encode() + b' */\n'))
+
+def test_rewritten_assets_get_a_matching_integrity(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    files = {'leaflet/leaflet.css': LEAFLET_CSS, 'leaflet/leaflet.js': b'window.L = {};\n',
+             'leaflet/images/layers.png': b'\x89PNG'}
+    write_vendor(files)
+    known = {name: vendor.sri(files[name]) for name in ('leaflet/leaflet.css', 'leaflet/leaflet.js')}
+    monkeypatch.setattr(vendor, 'KNOWN_SRI', known)
+    (tmp_path / 'maps.html').write_text(
+        PAGE.format(css=known['leaflet/leaflet.css'], js=known['leaflet/leaflet.js']), encoding='utf-8')
+
+    assert publish_site()
+    html = (tmp_path / PUBLIC_DIR / 'maps.html').read_text(encoding='utf-8')
+    assert 'unpkg.com' not in html
+    # The stylesheet was rewritten, so its published hash differs from the CDN one
+    assert known['leaflet/leaflet.css'] not in html
+    assert known['leaflet/leaflet.js'] in html
+    assert len(re.findall(r'integrity="', html)) == 2
+    assert check_integrity() == []
+
+def test_check_integrity_reports_a_stale_hash(tmp_path):
+    assets = tmp_path / 'assets'
+    assets.mkdir()
+    (assets / 'leaflet.0123456789.css').write_bytes(LEAFLET_CSS)
+    (tmp_path / 'maps.html').write_text(
+        PAGE.format(css='sha256-stale', js='sha256-x').replace(
+            'https://unpkg.com/leaflet@1.9.4/dist/leaflet.css', 'assets/leaflet.0123456789.css'), encoding='utf-8')
+    assert check_integrity(str(tmp_path)) == ["maps.html: integrity of assets/leaflet.0123456789.css does not match the file"]
+
+def test_missing_vendored_library_stops_the_publish(tmp_path, monkeypatch, capsys):
+    monkeypatch.chdir(tmp_path)
+    write_vendor({})
+    os.remove(vendor.vendor_path('leaflet/leaflet.js'))
+    monkeypatch.setattr(vendor, 'KNOWN_SRI', {})
+    (tmp_path / 'maps.html').write_text(PAGE.format(css='sha256-a', js='sha256-b'), encoding='utf-8')
+
+    assert not publish_site()
+    assert not (tmp_path / PUBLIC_DIR / 'maps.html').exists()
+    assert vendor.vendor_path('leaflet/leaflet.js') + " not found" in capsys.readouterr().out
+
+    assert publish_site(allow_cdn=True)
+    html = (tmp_path / PUBLIC_DIR / 'maps.html').read_text(encoding='utf-8')
+    assert 'https://unpkg.com/leaflet@1.9.4/dist/leaflet.js' in html
+    assert 'https://unpkg.com/leaflet@1.9.4/dist/leaflet.css' not in html
@@ -0,0 +1,39 @@
+import time
+import threading
+import pytest
+import process_locations
+from fake_geocoder import FakeGeocodingClient
+from rate_limiter import TokenBucket
+
+def test_burst_up_to_capacity_then_rate():
+    bucket = TokenBucket(rate=50, capacity=5)
+    start = time.monotonic()
+    for _ in range(5):
+        bucket.acquire()
+    assert time.monotonic() - start < 0.05
+    for _ in range(10):
+        bucket.acquire()
+    assert time.monotonic() - start >= 10 / 50 * 0.9
+
+def test_rate_is_shared_between_threads():
+    bucket = TokenBucket(rate=100, capacity=1)
+    bucket.acquire()
+    start = time.monotonic()
+    threads = [threading.Thread(target=lambda: [bucket.acquire() for _ in range(5)]) for _ in range(4)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    assert time.monotonic() - start >= 20 / 100 * 0.9
+
+def test_rate_must_be_positive():
+    with pytest.raises(ValueError):
+        TokenBucket(0)
+
+def test_concurrent_geocoding_keeps_input_order():
+    coords = [(-1.40 - i / 1000, -48.45 - i / 1000) for i in range(40)]
+    client = FakeGeocodingClient(latency=0.001)
+    serial = process_locations.geocode_coordinates(client, coords, workers=1, limiter=TokenBucket(1e9))
+    parallel = process_locations.geocode_coordinates(client, coords, workers=8, limiter=TokenBucket(1e9))
+    assert parallel == serial
+    assert client.calls == 80
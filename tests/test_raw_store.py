@@ -0,0 +1,44 @@
+import numpy as np
+import pandas as pd
+import process_locations
+from checkpoint import GeocodeJournal
+from fake_geocoder import FakeGeocodingClient
+from geocode_cache import coord_key
+from raw_store import RawResponseStore
+from rate_limiter import TokenBucket
+
+def test_responses_and_aliases_survive_reopening(tmp_path):
+    path = str(tmp_path / 'raw.jsonl.gz')
+    store = RawResponseStore(path)
+    store.put(-1.45, -48.49, [{'formatted_address': 'Tv. Mauriti, 1020'}])
+    store.alias(-1.45001, -48.49, -1.45, -48.49)
+    assert RawResponseStore(path).load() == {}   # Still buffered
+    store.close()
+    responses = RawResponseStore(path).load()
+    assert responses[coord_key(-1.45, -48.49)] == [{'formatted_address': 'Tv. Mauriti, 1020'}]
+    assert responses[coord_key(-1.45001, -48.49)] == responses[coord_key(-1.45, -48.49)]
+
+def test_truncated_member_is_ignored(tmp_path):
+    path = tmp_path / 'raw.jsonl.gz'
+    store = RawResponseStore(str(path))
+    store.put(-1.45, -48.49, [])
+    store.close()
+    with open(path, 'ab') as f:
+        f.write(b'\x1f\x8b\x08\x00')
+    assert list(RawResponseStore(str(path)).load()) == [coord_key(-1.45, -48.49)]
+
+def test_raw_store_is_never_behind_the_journal(tmp_path):
+    n = 30
+    df = pd.DataFrame({process_locations.LAT_COLUMN: -1.40 - np.arange(n) / 1000,
+                       process_locations.LNG_COLUMN: np.full(n, -48.45),
+                       '_uuid': [f"uuid-{i}" for i in range(n)]})
+    journal = GeocodeJournal(str(tmp_path / 'journal.jsonl'))
+    store = RawResponseStore(str(tmp_path / 'raw.jsonl.gz'))
+    process_locations.geocode_frame(df, FakeGeocodingClient(latency=0), None, journal, store, TokenBucket(1e9),
+                                    workers=4, dedup_radius=0, merge_duplicates=False)
+    # Without close(): what a crash right now would leave on disk
+    responses = RawResponseStore(store.path).load()
+    assert len(journal) == n
+    assert all(coord_key(e['lat'], e['lng']) in responses for e in journal.entries.values())
+    journal.close()
+    store.close()
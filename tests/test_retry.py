@@ -0,0 +1,42 @@
+import pytest
+from googlemaps.exceptions import ApiError, Timeout
+from retry import CircuitBreaker, CircuitOpen, call_with_retry
+
+def raise_(exc):
+    def fn():
+        raise exc
+    return fn
+
+def tripped_breaker():
+    # Opens after one failure; with no cooldown the next call is a probe
+    breaker = CircuitBreaker(threshold=1, cooldown=0)
+    with pytest.raises(Timeout):
+        call_with_retry(raise_(Timeout()), breaker, max_attempts=1)
+    assert breaker.opened_at is not None
+    return breaker
+
+def test_permanent_error_on_probe_closes_the_circuit():
+    breaker = tripped_breaker()
+    with pytest.raises(ApiError):
+        call_with_retry(raise_(ApiError('REQUEST_DENIED')), breaker, max_attempts=1)
+    assert breaker.state == 'closed'
+    assert not breaker.probing
+    assert call_with_retry(lambda: 'ok', breaker) == 'ok'
+
+def test_interrupted_probe_lets_the_next_call_probe():
+    breaker = tripped_breaker()
+    with pytest.raises(KeyboardInterrupt):
+        call_with_retry(raise_(KeyboardInterrupt()), breaker, max_attempts=1)
+    assert not breaker.probing
+    assert call_with_retry(lambda: 'ok', breaker) == 'ok'
+    assert breaker.state == 'closed'
+
+def test_failed_probe_reopens_the_circuit():
+    breaker = tripped_breaker()
+    breaker.cooldown = 60
+    breaker.opened_at -= 60
+    with pytest.raises(Timeout):
+        call_with_retry(raise_(Timeout()), breaker, max_attempts=1)
+    assert not breaker.probing
+    with pytest.raises(CircuitOpen):
+        call_with_retry(lambda: 'ok', breaker)
@@ -0,0 +1,44 @@
+import numpy as np
+from routing import (plan_routes, sweep_partition, nearest_neighbor_tour, two_opt, tour_length,
+                     distance_matrix, DistanceOracle)
+
+def city_points(n, seed=0):
+    rng = np.random.default_rng(seed)
+    return -1.45 + rng.normal(0, 0.02, n), -48.48 + rng.normal(0, 0.02, n)
+
+def test_routes_respect_capacity_and_visit_every_point_once():
+    lats, lngs = city_points(95)
+    routes = plan_routes(lats, lngs, capacity=20)
+    assert len(routes) == 5
+    assert all(len(stops) <= 20 for stops, _ in routes)
+    assert sorted(np.concatenate([stops for stops, _ in routes]).tolist()) == list(range(95))
+
+def test_sweep_partition_is_balanced():
+    lats, lngs = city_points(45)
+    groups = sweep_partition(lats, lngs, (-1.45, -48.48), 10)
+    assert [len(g) for g in groups] == [9, 9, 9, 9, 9]
+
+def test_two_opt_removes_a_crossing():
+    # Square visited corner-to-corner: 0 -> 2 -> 1 -> 3 crosses itself
+    pts = np.array([[0, 0], [0, 1], [1, 1], [1, 0]], dtype=float)
+    D = np.linalg.norm(pts[:, None] - pts[None, :], axis=2)
+    crossed = np.array([0, 2, 1, 3, 0])
+    tour, improved = two_opt(crossed.copy(), D)
+    assert improved
+    assert tour_length(tour, D) == 4.0 < tour_length(crossed, D)
+
+def test_improvement_never_lengthens_a_route():
+    lats, lngs = city_points(60, seed=3)
+    D = distance_matrix(lats, lngs)
+    start = nearest_neighbor_tour(D)
+    tour, _ = two_opt(start.copy(), D)
+    assert tour_length(tour, D) <= tour_length(start, D)
+    assert sorted(tour[:-1].tolist()) == list(range(60))
+
+def test_sparse_oracle_gives_the_same_routes():
+    lats, lngs = city_points(80, seed=5)
+    dense = plan_routes(lats, lngs, capacity=15)
+    sparse = plan_routes(lats, lngs, capacity=15, dense_limit=10)
+    assert [s.tolist() for s, _ in dense] == [s.tolist() for s, _ in sparse]
+    all_lats, all_lngs = np.append(lats, 0), np.append(lngs, 0)
+    assert DistanceOracle(all_lats, all_lngs, dense_limit=10).matrix is None
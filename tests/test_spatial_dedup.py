@@ -0,0 +1,41 @@
+import numpy as np
+from spatial_index import bucket_points, haversine_m, GridIndex
+from process_locations import unique_buckets
+
+def test_haversine_metres():
+    # 0.001 degree of latitude is about 111 m
+    assert abs(haversine_m(-1.450, -48.49, -1.451, -48.49) - 111.2) < 0.5
+    assert haversine_m(-1.45, -48.49, -1.45, -48.49) == 0
+
+def test_points_within_radius_share_a_representative():
+    lats = [-1.45000, -1.45005, -1.46000, -1.45003]   # 5.6 m, 1.1 km, 3.3 m from the first
+    lngs = [-48.49000, -48.49000, -48.49000, -48.49000]
+    labels, reps = bucket_points(lats, lngs, 10)
+    assert labels.tolist() == [0, 0, 2, 0]
+    assert reps.tolist() == [0, 2]
+
+def test_zero_radius_keeps_every_point():
+    labels, reps = bucket_points([-1.45, -1.45], [-48.49, -48.49], 0)
+    assert labels.tolist() == [0, 1]
+    assert reps.tolist() == [0, 1]
+
+def test_every_point_is_close_to_its_representative():
+    rng = np.random.default_rng(0)
+    lats = -1.45 + rng.normal(0, 0.001, 500)
+    lngs = -48.49 + rng.normal(0, 0.001, 500)
+    labels, reps = bucket_points(lats, lngs, 25)
+    assert len(reps) < 500
+    assert set(labels.tolist()) == set(reps.tolist())
+    assert all(haversine_m(lats[i], lngs[i], lats[j], lngs[j]) <= 25 for i, j in enumerate(labels.tolist()))
+
+def test_exact_repeats_collapse_even_without_radius():
+    coords = [(-1.45, -48.49), (-1.46, -48.48), (-1.45, -48.49), (-1.4500000001, -48.49)]
+    labels, reps = unique_buckets(coords, 0)
+    assert labels.tolist() == [0, 1, 0, 0]
+    assert reps.tolist() == [0, 1]
+
+def test_grid_finds_neighbours_across_cells():
+    grid = GridIndex(10)
+    grid.insert(-1.45, -48.49, 7)
+    assert 7 in list(grid.nearby(-1.45008, -48.49))
+    assert 7 not in list(grid.nearby(-1.46, -48.49))
@@ -0,0 +1,22 @@
+import pytest
+import pandas as pd
+from table_io import ChunkedTableWriter, intermediate_path, read_table
+
+@pytest.mark.parametrize('fmt', ['parquet', 'arrow', 'xlsx'])
+def test_chunked_writer_matches_a_single_write(tmp_path, fmt):
+    path = str(tmp_path / intermediate_path('tratado', fmt))
+    chunks = [pd.DataFrame({'Bairro': ['Marco', 'Jurunas'], 'CEP': [None, None], 'n': [1, 2]}),
+              pd.DataFrame({'Bairro': ['Guamá'], 'CEP': ['66075-110'], 'n': [3]})]
+    writer = ChunkedTableWriter(path)
+    for chunk in chunks:
+        writer.write(chunk)
+    writer.close()
+    assert writer.rows == 3
+    df = read_table(path)
+    assert df['Bairro'].tolist() == ['Marco', 'Jurunas', 'Guamá']
+    assert df['CEP'].isna().tolist() == [True, True, False]
+    assert df['n'].tolist() == [1, 2, 3]
+
+def test_unknown_intermediate_format():
+    with pytest.raises(ValueError, match='parquet'):
+        intermediate_path('tratado', 'csv')
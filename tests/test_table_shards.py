@@ -0,0 +1,47 @@
+import gzip
+import json
+import pandas as pd
+from generate_site import build_search_index, write_table_shards, SEARCH_COLUMNS
+
+NAME, STREET, DISTRICT, CEP = SEARCH_COLUMNS
+
+def sample_table(rows=5):
+    return pd.DataFrame({
+        NAME: [f"Açaí do Zé {i}" for i in range(rows)],
+        STREET: ['Travessa Mauriti'] * rows,
+        DISTRICT: ['Marco', 'Jurunas', 'Marco', 'Guamá', 'Pedreira'][:rows],
+        CEP: ['66095-000'] * rows,
+    })
+
+def test_search_index_is_accent_folded_and_indexes_bare_cep():
+    index = build_search_index(sample_table())
+    assert index['acai'] == [0, 1, 2, 3, 4]
+    assert index['guama'] == [3]
+    assert index['marco'] == [0, 2]
+    assert index['66095000'] == [0, 1, 2, 3, 4]
+    assert 'Açaí' not in index
+
+def test_shards_cover_every_row_and_token(tmp_path):
+    df = sample_table()
+    out = tmp_path / 'table'
+    write_table_shards(df, list(df.columns), out_dir=str(out), page_size=2)
+
+    meta = json.loads((out / 'meta.json').read_text(encoding='utf-8'))
+    assert meta['total'] == 5
+    assert meta['pages'] == ['page-0000.json', 'page-0001.json', 'page-0002.json']
+    rows = [row for page in meta['pages']
+            for row in json.loads((out / page).read_text(encoding='utf-8'))]
+    assert rows == df.values.tolist()
+
+    merged = {}
+    for first in meta['searchShards']:
+        shard = json.loads((out / 'search' / f"{first}.json").read_text(encoding='utf-8'))
+        assert all(token[0] == first for token in shard)
+        merged.update(shard)
+    assert merged == build_search_index(df)
+
+def test_shards_have_matching_gzip_copies(tmp_path):
+    out = tmp_path / 'table'
+    write_table_shards(sample_table(), SEARCH_COLUMNS, out_dir=str(out))
+    for path in out.rglob('*.json'):
+        assert gzip.decompress((path.parent / (path.name + '.gz')).read_bytes()) == path.read_bytes()
@@ -0,0 +1,20 @@
+import re
+import unicodedata
+
+TOKEN_SPLIT_RE = re.compile(r'[^a-z0-9]+')
+
+def fold_accents(text):
+    """
+    Lowercase and strip diacritics: "Açaí do Zé" -> "acai do ze".
+    Matches the JS fold used by the site: s.normalize('NFD').replace(/[\\u0300-\\u036f]/g, '').toLowerCase()
+    """
+    if not isinstance(text, str):
+        return ''
+    decomposed = unicodedata.normalize('NFD', text)
+    return ''.join(ch for ch in decomposed if not unicodedata.combining(ch)).lower()
+
+def tokenize(text):
+    """
+    Accent-folded alphanumeric tokens.
+    """
+    return [t for t in TOKEN_SPLIT_RE.split(fold_accents(text)) if t]
@@ -0,0 +1,140 @@
+import os
+import sys
+import json
+import base64
+import hashlib
+import argparse
+import urllib.request
+
+# Third-party browser libraries served from our own origin (publish.py) instead
+# of the CDNs. Fetch them once with network access and commit vendor/: every
+# file is pinned by version and its SHA-256 is kept in vendor/lock.json, so a
+# later fetch that returns different bytes is refused.
+# Usage: python vendor.py [--check]
+
+# Configuration
+VENDOR_DIR = 'vendor'
+LOCK_FILE = os.path.join(VENDOR_DIR, 'lock.json')
+TIMEOUT = 30
+
+# Local path inside VENDOR_DIR -> URL the pages use when the file is not vendored
+VENDOR_LIBS = {
+    'bootstrap/bootstrap.min.css': 'https://cdn.jsdelivr.net/npm/bootstrap@5.3.0/dist/css/bootstrap.min.css',
+    'bootstrap/bootstrap.bundle.min.js': 'https://cdn.jsdelivr.net/npm/bootstrap@5.3.0/dist/js/bootstrap.bundle.min.js',
+    'jquery/jquery-3.7.0.min.js': 'https://code.jquery.com/jquery-3.7.0.min.js',
+    'chartjs/chart.umd.js': 'https://cdn.jsdelivr.net/npm/chart.js@4.4.0/dist/chart.umd.js',
+    'jszip/jszip.min.js': 'https://cdnjs.cloudflare.com/ajax/libs/jszip/3.10.1/jszip.min.js',
+    'datatables/dataTables.bootstrap5.min.css': 'https://cdn.datatables.net/1.13.4/css/dataTables.bootstrap5.min.css',
+    'datatables/jquery.dataTables.min.js': 'https://cdn.datatables.net/1.13.4/js/jquery.dataTables.min.js',
+    'datatables/dataTables.bootstrap5.min.js': 'https://cdn.datatables.net/1.13.4/js/dataTables.bootstrap5.min.js',
+    'datatables/pt-BR.json': 'https://cdn.datatables.net/plug-ins/1.13.4/i18n/pt-BR.json',
+    'datatables/buttons.bootstrap5.min.css': 'https://cdn.datatables.net/buttons/2.3.6/css/buttons.bootstrap5.min.css',
+    'datatables/dataTables.buttons.min.js': 'https://cdn.datatables.net/buttons/2.3.6/js/dataTables.buttons.min.js',
+    'datatables/buttons.bootstrap5.min.js': 'https://cdn.datatables.net/buttons/2.3.6/js/buttons.bootstrap5.min.js',
+    'datatables/buttons.html5.min.js': 'https://cdn.datatables.net/buttons/2.3.6/js/buttons.html5.min.js',
+    'leaflet/leaflet.css': 'https://unpkg.com/leaflet@1.9.4/dist/leaflet.css',
+    'leaflet/leaflet.js': 'https://unpkg.com/leaflet@1.9.4/dist/leaflet.js',
+    # Referenced by leaflet.css (layer control and default markers)
+    'leaflet/images/layers.png': 'https://unpkg.com/leaflet@1.9.4/dist/images/layers.png',
+    'leaflet/images/layers-2x.png': 'https://unpkg.com/leaflet@1.9.4/dist/images/layers-2x.png',
+    'leaflet/images/marker-icon.png': 'https://unpkg.com/leaflet@1.9.4/dist/images/marker-icon.png',
+    'leaflet/images/marker-icon-2x.png': 'https://unpkg.com/leaflet@1.9.4/dist/images/marker-icon-2x.png',
+    'leaflet/images/marker-shadow.png': 'https://unpkg.com/leaflet@1.9.4/dist/images/marker-shadow.png',
+}
+
+# Published Subresource Integrity hashes (the same as in maps.html)
+KNOWN_SRI = {
+    'leaflet/leaflet.css': 'sha256-p4NxAoJBhIIN+hmNHrzRCf9tD/miZyoHS5obTRR9BMY=',
+    'leaflet/leaflet.js': 'sha256-20nQCchB9co0qIjJZRGuk2/Z9VM+kNiyxNV1lvTlZBo=',
+}
+
+def vendor_path(name, vendor_dir=VENDOR_DIR):
+    return os.path.join(vendor_dir, *name.split('/'))
+
+def sri(data):
+    return 'sha256-' + base64.b64encode(hashlib.sha256(data).digest()).decode('ascii')
+
+def load_lock(path=LOCK_FILE):
+    if not os.path.exists(path):
+        return {}
+    with open(path, 'r', encoding='utf-8') as f:
+        return json.load(f)
+
+def save_lock(lock, path=LOCK_FILE):
+    with open(path, 'w', encoding='utf-8') as f:
+        json.dump(lock, f, indent=1, sort_keys=True)
+        f.write('\n')
+
+def check_file(name, data, lock):
+    """
+    Error message if `data` does not match the lock file or the published SRI hash, else None.
+    """
+    expected = lock.get(name, {}).get('sha256')
+    if expected and hashlib.sha256(data).hexdigest() != expected:
+        return f"{name}: content differs from {LOCK_FILE}"
+    if name in KNOWN_SRI and sri(data) != KNOWN_SRI[name]:
+        return f"{name}: integrity hash differs from the published one"
+    return None
+
+def fetch_all(vendor_dir=VENDOR_DIR, refetch=False):
+    """
+    Download the missing libraries (all of them with `refetch`) and record
+    their hashes. Returns the list of errors.
+    """
+    lock = load_lock()
+    errors = []
+    for name, url in VENDOR_LIBS.items():
+        path = vendor_path(name, vendor_dir)
+        if os.path.exists(path) and not refetch:
+            continue
+        try:
+            with urllib.request.urlopen(url, timeout=TIMEOUT) as response:
+                data = response.read()
+        except OSError as e:
+            errors.append(f"{name}: {e}")
+            continue
+        problem = check_file(name, data, lock)
+        if problem:
+            errors.append(problem)
+            continue
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        with open(path, 'wb') as f:
+            f.write(data)
+        lock[name] = {"url": url, "sha256": hashlib.sha256(data).hexdigest()}
+        print(f"Fetched {name} ({len(data) / 1024:.0f} KB).")
+    os.makedirs(vendor_dir, exist_ok=True)
+    save_lock(lock)
+    return errors
+
+def check_all(vendor_dir=VENDOR_DIR):
+    """
+    Verify the vendored files against the lock file. Returns (missing, errors).
+    """
+    lock = load_lock()
+    missing, errors = [], []
+    for name in VENDOR_LIBS:
+        path = vendor_path(name, vendor_dir)
+        if not os.path.exists(path):
+            missing.append(name)
+            continue
+        with open(path, 'rb') as f:
+            problem = check_file(name, f.read(), lock)
+        if problem:
+            errors.append(problem)
+    return missing, errors
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description="Download the browser libraries into vendor/ for self-hosting.")
+    parser.add_argument('--check', action='store_true', help="only verify the vendored files, without downloading")
+    parser.add_argument('--refetch', action='store_true', help="download every file again (checked against the lock)")
+    args = parser.parse_args()
+
+    if args.check:
+        missing, errors = check_all()
+        for name in missing:
+            print(f"Missing: {name}")
+    else:
+        errors = fetch_all(refetch=args.refetch)
+    for error in errors:
+        print(f"Error: {error}")
+    sys.exit(1 if errors else 0)